@@ -193,6 +193,12 @@ public:
     t.register_stdp_connection( t_lastspike_ - get_delay(), get_delay() );
   }
 
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
@@ -121,6 +121,12 @@ public:
   using ConnectionBase::set_delay_steps;
 
   //! Used by ConnectorModel::add_connection() for fast initialization
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
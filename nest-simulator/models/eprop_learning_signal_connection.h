@@ -188,6 +188,12 @@ public:
   void set_status( const DictionaryDatum& d, ConnectorModel& cm );
 
   //! Set the synaptic weight to the provided value.
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( const double w )
   {
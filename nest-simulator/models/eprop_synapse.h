@@ -301,6 +301,12 @@ public:
   void check_connection( Node& s, Node& t, size_t receptor_type, const CommonPropertiesType& cp );
 
   //! Set the synaptic weight to the provided value.
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( const double w )
   {
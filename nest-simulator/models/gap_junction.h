@@ -145,6 +145,12 @@ public:
 
   void set_status( const DictionaryDatum& d, ConnectorModel& cm );
 
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
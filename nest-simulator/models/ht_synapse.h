@@ -176,6 +176,12 @@ public:
   }
 
   //! allows efficient initialization from ConnectorModel::add_connection()
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
@@ -207,6 +207,12 @@ public:
    */
   bool send( Event& e, size_t t, const STDPHomCommonProperties& );
 
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
@@ -215,6 +215,12 @@ public:
     ConnectionBase::check_connection_( dummy_target, s, t, receptor_type );
   }
 
+  double
+  get_weight() const
+  {
+    return weight_;
+  }
+
   void
   set_weight( double w )
   {
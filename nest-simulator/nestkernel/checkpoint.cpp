@@ -0,0 +1,708 @@
+/*
+ *  checkpoint.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#include "checkpoint.h"
+
+// C++ includes:
+#include <algorithm>
+#include <cstdint>
+#include <deque>
+#include <fstream>
+#include <map>
+#include <memory>
+#include <tuple>
+#include <vector>
+
+// Includes from libnestutil:
+#include "compose.hpp"
+#include "logging.h"
+#include "numerics.h"
+
+// Includes from nestkernel:
+#include "connection_id.h"
+#include "exceptions.h"
+#include "kernel_manager.h"
+#include "scalar_dictionary.h"
+#include "vp_manager_impl.h"
+
+// Includes from sli:
+#include "booldatum.h"
+#include "dictutils.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
+
+namespace nest
+{
+namespace
+{
+
+const char checkpoint_magic[ 8 ] = { 'N', 'E', 'S', 'T', 'C', 'K', 'P', 'T' };
+const std::uint64_t checkpoint_format_version = 1;
+
+//! find_receptor_type() tests receptor types up to the receptor port plus this offset
+const long max_receptor_offset = 64;
+
+/**
+ * Scalar parameters of nodes of one model or connections of one synapse model.
+ *
+ * Row i holds the node ID of node i, or the source and target node IDs of
+ * connection i, followed by the values of the parameters named in keys.
+ */
+struct CheckpointBlock
+{
+  std::string model;
+  std::vector< std::string > keys;
+  std::vector< std::uint64_t > node_ids;
+  std::vector< double > values;
+};
+
+std::string
+checkpoint_filename( const std::string& path )
+{
+  return String::compose( "%1/rank_%2.nestckpt", path, kernel().mpi_manager.get_rank() );
+}
+
+template < typename T >
+void
+write_value( std::ostream& out, const T value )
+{
+  out.write( reinterpret_cast< const char* >( &value ), sizeof( T ) );
+}
+
+void
+write_string( std::ostream& out, const std::string& value )
+{
+  write_value< std::uint64_t >( out, value.size() );
+  out.write( value.data(), value.size() );
+}
+
+void
+write_strings( std::ostream& out, const std::vector< std::string >& values )
+{
+  write_value< std::uint64_t >( out, values.size() );
+  for ( const auto& value : values )
+  {
+    write_string( out, value );
+  }
+}
+
+template < typename T >
+T
+read_value( std::istream& in )
+{
+  T value = T();
+  in.read( reinterpret_cast< char* >( &value ), sizeof( T ) );
+  return value;
+}
+
+std::string
+read_string( std::istream& in )
+{
+  const auto size = read_value< std::uint64_t >( in );
+  if ( not in.good() )
+  {
+    return std::string();
+  }
+  std::string value( size, '\0' );
+  in.read( &value[ 0 ], size );
+  return value;
+}
+
+std::vector< std::string >
+read_strings( std::istream& in )
+{
+  std::vector< std::string > values( read_value< std::uint64_t >( in ) );
+  for ( auto& value : values )
+  {
+    value = read_string( in );
+  }
+  return values;
+}
+
+void
+write_block( std::ostream& out, const CheckpointBlock& block, const size_t ids_per_row )
+{
+  const size_t n_rows = block.node_ids.size() / ids_per_row;
+  write_string( out, block.model );
+  write_strings( out, block.keys );
+  write_value< std::uint64_t >( out, n_rows );
+  for ( size_t row = 0; row < n_rows; ++row )
+  {
+    out.write( reinterpret_cast< const char* >( &block.node_ids[ row * ids_per_row ] ),
+      ids_per_row * sizeof( std::uint64_t ) );
+    out.write(
+      reinterpret_cast< const char* >( &block.values[ row * block.keys.size() ] ), block.keys.size() * sizeof( double ) );
+  }
+}
+
+std::vector< CheckpointBlock >
+read_blocks( std::istream& in, const size_t ids_per_row )
+{
+  std::vector< CheckpointBlock > blocks( read_value< std::uint64_t >( in ) );
+  for ( auto& block : blocks )
+  {
+    block.model = read_string( in );
+    block.keys = read_strings( in );
+    const auto n_rows = read_value< std::uint64_t >( in );
+    if ( not in.good() )
+    {
+      throw IOError();
+    }
+
+    block.node_ids.resize( n_rows * ids_per_row );
+    block.values.resize( n_rows * block.keys.size() );
+    for ( size_t row = 0; row < n_rows; ++row )
+    {
+      in.read( reinterpret_cast< char* >( &block.node_ids[ row * ids_per_row ] ), ids_per_row * sizeof( std::uint64_t ) );
+      in.read( reinterpret_cast< char* >( &block.values[ row * block.keys.size() ] ),
+        block.keys.size() * sizeof( double ) );
+    }
+  }
+  return blocks;
+}
+
+/**
+ * Convert a boolean, integer or double datum to double.
+ *
+ * @returns false if the token does not hold a scalar value.
+ */
+bool
+scalar_value( const Token& token, double& value )
+{
+  if ( const auto bd = dynamic_cast< BoolDatum* >( token.datum() ) )
+  {
+    value = bd->get() ? 1.0 : 0.0;
+  }
+  else if ( const auto id = dynamic_cast< IntegerDatum* >( token.datum() ) )
+  {
+    value = id->get();
+  }
+  else if ( const auto dd = dynamic_cast< DoubleDatum* >( token.datum() ) )
+  {
+    value = dd->get();
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+
+/**
+ * Return names of the scalar entries of status that are also parameters in defaults.
+ */
+std::vector< std::string >
+scalar_keys( const DictionaryDatum& status, const DictionaryDatum& defaults, const std::vector< Name >& excluded )
+{
+  std::vector< std::string > keys;
+  double value;
+  for ( auto it = status->begin(); it != status->end(); ++it )
+  {
+    if ( std::find( excluded.begin(), excluded.end(), it->first ) == excluded.end() and defaults->known( it->first )
+      and scalar_value( it->second, value ) )
+    {
+      keys.push_back( it->first.toString() );
+    }
+  }
+  return keys;
+}
+
+void
+append_row( CheckpointBlock& block, const DictionaryDatum& status )
+{
+  for ( const auto& key : block.keys )
+  {
+    double value = numerics::nan;
+    scalar_value( status->lookup( key ), value );
+    block.values.push_back( value );
+  }
+}
+
+/**
+ * Collect the state of the nodes of thread tid, in blocks of nodes of the same model.
+ */
+std::vector< CheckpointBlock >
+get_node_blocks( const size_t tid )
+{
+  // Recorded events are not part of the checkpoint, and the number of events can only be reset.
+  const std::vector< Name > excluded = { names::n_events };
+
+  std::map< size_t, DictionaryDatum > model_defaults;
+  std::vector< CheckpointBlock > blocks;
+  for ( const auto& entry : kernel().node_manager.get_local_nodes( tid ) )
+  {
+    Node* node = entry.get_node();
+    const size_t model_id = node->get_model_id();
+    if ( model_defaults.find( model_id ) == model_defaults.end() )
+    {
+      model_defaults[ model_id ] = kernel().model_manager.get_node_model( model_id )->get_status();
+    }
+
+    const DictionaryDatum status = node->get_status_base();
+    const std::string model_name = kernel().model_manager.get_node_model( model_id )->get_name();
+    std::vector< std::string > keys = scalar_keys( status, model_defaults[ model_id ], excluded );
+    if ( blocks.empty() or blocks.back().model != model_name or blocks.back().keys != keys )
+    {
+      blocks.emplace_back();
+      blocks.back().model = model_name;
+      blocks.back().keys = std::move( keys );
+    }
+
+    blocks.back().node_ids.push_back( entry.get_node_id() );
+    append_row( blocks.back(), status );
+  }
+  return blocks;
+}
+
+/**
+ * Return the receptor type with which a connection from source to target was created.
+ *
+ * Connections only store the receptor port returned by the target, which
+ * differs from the receptor type for some models, e.g., ht_neuron. The
+ * receptor type is found by testing which receptor type yields the stored
+ * port, starting with the port itself. Recording devices, such as
+ * multimeters, only connect to receptor type 0, the port is the index of the
+ * device at the target then.
+ *
+ * @throws KernelException if no receptor type yields the port.
+ */
+long
+find_receptor_type( Node& source, Node& target, const synindex syn_id, const long rport )
+{
+  if ( source.get_element_type() == names::recorder )
+  {
+    return 0;
+  }
+
+  const auto yields_rport = [ &source, &target, syn_id, rport ]( const long receptor_type )
+  {
+    try
+    {
+      return static_cast< long >( source.send_test_event( target, receptor_type, syn_id, false ) ) == rport;
+    }
+    catch ( KernelException& )
+    {
+      // The target does not accept events of the source with this receptor type.
+      return false;
+    }
+  };
+
+  if ( yields_rport( rport ) )
+  {
+    return rport;
+  }
+  for ( long receptor_type = 0; receptor_type <= rport + max_receptor_offset; ++receptor_type )
+  {
+    if ( receptor_type != rport and yields_rport( receptor_type ) )
+    {
+      return receptor_type;
+    }
+  }
+
+  throw KernelException( String::compose(
+    "The receptor type of the connection from node %1 to node %2 with receptor port %3 cannot be determined, "
+    "so that the connection cannot be checkpointed.",
+    source.get_node_id(),
+    target.get_node_id(),
+    rport ) );
+}
+
+/**
+ * Collect the state of the connections of one synapse model on thread tid.
+ */
+CheckpointBlock
+get_connection_block( const size_t tid, const synindex syn_id, const std::vector< ConnectionID >& connections )
+{
+  // The connection IDs are stored as node IDs of the rows, and the receptor port is replaced by the receptor type.
+  const std::vector< Name > excluded = {
+    names::source, names::target, names::target_thread, names::synapse_id, names::port, names::rport
+  };
+  const DictionaryDatum defaults = kernel().model_manager.get_connector_defaults( syn_id );
+
+  // The receptor type only depends on the models of source and target and on the port.
+  std::map< std::tuple< size_t, size_t, long >, long > receptor_types;
+
+  CheckpointBlock block;
+  block.model = kernel().model_manager.get_connection_model( syn_id, tid ).get_name();
+  for ( const auto& conn : connections )
+  {
+    DictionaryDatum status = kernel().connection_manager.get_synapse_status(
+      conn.get_source_node_id(), conn.get_target_node_id(), tid, syn_id, conn.get_port() );
+    if ( status->known( names::rport ) )
+    {
+      Node* source = kernel().node_manager.get_node_or_proxy( conn.get_source_node_id(), tid );
+      Node* target = kernel().node_manager.get_node_or_proxy( conn.get_target_node_id(), tid );
+      const long rport = getValue< long >( status, names::rport );
+      const auto key = std::make_tuple( source->get_model_id(), target->get_model_id(), rport );
+      auto receptor_type = receptor_types.find( key );
+      if ( receptor_type == receptor_types.end() )
+      {
+        receptor_type = receptor_types.emplace( key, find_receptor_type( *source, *target, syn_id, rport ) ).first;
+      }
+      def< long >( status, names::receptor_type, receptor_type->second );
+    }
+
+    // All connections of a synapse model have the same parameters.
+    if ( block.node_ids.empty() )
+    {
+      block.keys = scalar_keys( status, defaults, excluded );
+    }
+    block.node_ids.push_back( conn.get_source_node_id() );
+    block.node_ids.push_back( conn.get_target_node_id() );
+    append_row( block, status );
+  }
+  return block;
+}
+
+void
+check_stream( const std::ios& stream, const std::string& filename, const std::string& caller )
+{
+  if ( not stream.good() )
+  {
+    LOG( M_ERROR, caller, String::compose( "I/O error while accessing checkpoint file '%1'.", filename ) );
+    throw IOError();
+  }
+}
+
+template < typename T >
+void
+check_checkpoint_property( const std::string& property, const T& checkpoint_value, const T& kernel_value )
+{
+  if ( checkpoint_value != kernel_value )
+  {
+    throw BadProperty( String::compose(
+      "The checkpoint was written with %1 %2, but the kernel uses %3.", property, checkpoint_value, kernel_value ) );
+  }
+}
+
+/**
+ * Node parameters set from the rows of a block.
+ *
+ * Only parameters that are read by the set_status() function of the model are
+ * set. column[ k ] is the index of the k-th parameter of the dictionary in the
+ * rows of the block.
+ */
+struct BlockSetter
+{
+  std::vector< size_t > columns;
+  std::unique_ptr< ScalarDictionary > dict;
+
+  void
+  set( const CheckpointBlock& block, const size_t row )
+  {
+    for ( size_t k = 0; k < columns.size(); ++k )
+    {
+      dict->set( k, block.values[ row * block.keys.size() + columns[ k ] ] );
+    }
+  }
+};
+
+BlockSetter
+get_node_block_setter( const size_t tid, const CheckpointBlock& block )
+{
+  BlockSetter setter;
+  const size_t model_id = kernel().model_manager.get_node_model_id( block.model );
+  const DictionaryDatum defaults = kernel().model_manager.get_node_model( model_id )->get_status();
+
+  // Find out which parameters the model reads by setting the current values
+  // of the parameters of the first node of the block, which is newly created.
+  Node* node = kernel().node_manager.get_local_nodes( tid ).get_node_by_node_id( block.node_ids[ 0 ] );
+  if ( not node or static_cast< size_t >( node->get_model_id() ) != model_id )
+  {
+    throw BadProperty( String::compose(
+      "Node %1 is not a thread-local node of model %2 as in the checkpoint.", block.node_ids[ 0 ], block.model ) );
+  }
+  const DictionaryDatum status = node->get_status_base();
+  DictionaryDatum probe( new Dictionary );
+  for ( const auto& key : block.keys )
+  {
+    if ( status->known( key ) and defaults->known( key ) )
+    {
+      ( *probe )[ key ] = status->lookup( key );
+    }
+  }
+  probe->clear_access_flags();
+  node->set_status_base( probe );
+
+  std::vector< Name > names;
+  for ( size_t k = 0; k < block.keys.size(); ++k )
+  {
+    if ( probe->known( block.keys[ k ] ) and not probe->known_but_not_accessed( block.keys[ k ] ) )
+    {
+      names.push_back( block.keys[ k ] );
+      setter.columns.push_back( k );
+    }
+  }
+  setter.dict.reset( new ScalarDictionary( names, defaults, block.model ) );
+  return setter;
+}
+
+BlockSetter
+get_connection_block_setter( const CheckpointBlock& block, synindex& syn_id )
+{
+  BlockSetter setter;
+  syn_id = kernel().model_manager.get_synapse_model_id( block.model );
+  const DictionaryDatum defaults = kernel().model_manager.get_connector_defaults( syn_id );
+
+  std::vector< Name > names;
+  for ( size_t k = 0; k < block.keys.size(); ++k )
+  {
+    if ( defaults->known( block.keys[ k ] ) )
+    {
+      names.push_back( block.keys[ k ] );
+      setter.columns.push_back( k );
+    }
+  }
+  setter.dict.reset( new ScalarDictionary( names, defaults, block.model ) );
+  return setter;
+}
+
+} // namespace
+
+void
+write_checkpoint( const std::string& path )
+{
+  const std::string filename = checkpoint_filename( path );
+  std::ofstream file( filename, std::ios::out | std::ios::binary | std::ios::trunc );
+  check_stream( file, filename, "write_checkpoint" );
+
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+
+  file.write( checkpoint_magic, sizeof( checkpoint_magic ) );
+  write_value< std::uint64_t >( file, checkpoint_format_version );
+  write_value< std::uint64_t >( file, kernel().mpi_manager.get_num_processes() );
+  write_value< std::uint64_t >( file, kernel().mpi_manager.get_rank() );
+  write_value< std::uint64_t >( file, num_threads );
+  write_value< double >( file, Time::get_resolution().get_ms() );
+  write_string( file, kernel().random_manager.get_rng_type() );
+  write_strings( file, kernel().random_manager.get_rng_states() );
+
+  const std::vector< modelrange > model_ranges(
+    kernel().modelrange_manager.begin(), kernel().modelrange_manager.end() );
+  write_value< std::uint64_t >( file, model_ranges.size() );
+  for ( const auto& range : model_ranges )
+  {
+    write_string( file, kernel().model_manager.get_node_model( range.get_model_id() )->get_name() );
+    write_value< std::uint64_t >( file, range.get_first_node_id() );
+    write_value< std::uint64_t >( file, range.get_last_node_id() );
+  }
+
+  // Placeholder for the offsets of the thread sections, which are filled in at the end.
+  const auto offset_table_position = file.tellp();
+  std::vector< std::uint64_t > offsets( num_threads, 0 );
+  file.write( reinterpret_cast< const char* >( offsets.data() ), num_threads * sizeof( std::uint64_t ) );
+
+  std::deque< ConnectionID > connections;
+  kernel().connection_manager.get_connections( connections, DictionaryDatum( new Dictionary ) );
+  std::vector< std::map< synindex, std::vector< ConnectionID > > > thread_connections( num_threads );
+  for ( const auto& conn : connections )
+  {
+    thread_connections[ conn.get_target_thread() ][ conn.get_synapse_model_id() ].push_back( conn );
+  }
+  connections.clear();
+
+  // Statuses are collected on the master thread only, as the datum pools must not be used concurrently.
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    offsets[ tid ] = file.tellp();
+
+    const std::vector< CheckpointBlock > node_blocks = get_node_blocks( tid );
+    write_value< std::uint64_t >( file, node_blocks.size() );
+    for ( const auto& block : node_blocks )
+    {
+      write_block( file, block, 1 );
+    }
+
+    write_value< std::uint64_t >( file, thread_connections[ tid ].size() );
+    for ( const auto& syn_connections : thread_connections[ tid ] )
+    {
+      write_block( file, get_connection_block( tid, syn_connections.first, syn_connections.second ), 2 );
+    }
+    check_stream( file, filename, "write_checkpoint" );
+  }
+
+  file.seekp( offset_table_position );
+  file.write( reinterpret_cast< const char* >( offsets.data() ), num_threads * sizeof( std::uint64_t ) );
+  file.close();
+  check_stream( file, filename, "write_checkpoint" );
+}
+
+void
+read_checkpoint( const std::string& path )
+{
+  if ( kernel().node_manager.size() > 0 )
+  {
+    throw KernelException( "A checkpoint can only be restored into a kernel without nodes." );
+  }
+
+  const std::string filename = checkpoint_filename( path );
+  std::ifstream file( filename, std::ios::in | std::ios::binary );
+  check_stream( file, filename, "read_checkpoint" );
+
+  char magic[ sizeof( checkpoint_magic ) ];
+  file.read( magic, sizeof( magic ) );
+  const auto version = read_value< std::uint64_t >( file );
+  if ( not file.good() or not std::equal( magic, magic + sizeof( magic ), checkpoint_magic )
+    or version != checkpoint_format_version )
+  {
+    LOG( M_ERROR,
+      "read_checkpoint",
+      String::compose( "The file '%1' is not a checkpoint written by this version of NEST.", filename ) );
+    throw IOError();
+  }
+
+  const size_t num_processes = read_value< std::uint64_t >( file );
+  const size_t rank = read_value< std::uint64_t >( file );
+  const size_t num_threads = read_value< std::uint64_t >( file );
+  const double resolution = read_value< double >( file );
+  const std::string rng_type = read_string( file );
+  const std::vector< std::string > rng_states = read_strings( file );
+  check_stream( file, filename, "read_checkpoint" );
+
+  check_checkpoint_property( "number of MPI processes", num_processes, kernel().mpi_manager.get_num_processes() );
+  check_checkpoint_property( "rank", rank, kernel().mpi_manager.get_rank() );
+  check_checkpoint_property( "number of threads", num_threads, kernel().vp_manager.get_num_threads() );
+  check_checkpoint_property( "resolution", resolution, Time::get_resolution().get_ms() );
+  check_checkpoint_property( "RNG type", rng_type, kernel().random_manager.get_rng_type() );
+
+  // Nodes are created in the order of their model ranges, so that they get the same node IDs.
+  const auto n_model_ranges = read_value< std::uint64_t >( file );
+  for ( size_t i = 0; i < n_model_ranges; ++i )
+  {
+    const std::string model_name = read_string( file );
+    const auto first_node_id = read_value< std::uint64_t >( file );
+    const auto last_node_id = read_value< std::uint64_t >( file );
+    check_stream( file, filename, "read_checkpoint" );
+
+    kernel().node_manager.add_node(
+      kernel().model_manager.get_node_model_id( model_name ), last_node_id - first_node_id + 1 );
+  }
+  kernel().node_manager.update_thread_local_node_data();
+
+  std::vector< std::uint64_t > offsets( num_threads );
+  file.read( reinterpret_cast< char* >( offsets.data() ), num_threads * sizeof( std::uint64_t ) );
+  check_stream( file, filename, "read_checkpoint" );
+  file.close();
+
+  std::vector< std::vector< CheckpointBlock > > node_blocks( num_threads );
+  std::vector< std::vector< CheckpointBlock > > connection_blocks( num_threads );
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+  const auto rethrow = [ &exceptions_raised, num_threads ]()
+  {
+    for ( size_t tid = 0; tid < num_threads; ++tid )
+    {
+      if ( exceptions_raised.at( tid ).get() )
+      {
+        throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+      }
+    }
+  };
+
+  // Each thread reads its own section of the file.
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      std::ifstream section( filename, std::ios::in | std::ios::binary );
+      section.seekg( offsets[ tid ] );
+      node_blocks[ tid ] = read_blocks( section, 1 );
+      connection_blocks[ tid ] = read_blocks( section, 2 );
+      if ( not section.good() )
+      {
+        throw IOError();
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  rethrow();
+
+  // Dictionaries are created on the master thread, as the datum pools must not be used concurrently.
+  std::vector< std::vector< BlockSetter > > node_setters( num_threads );
+  std::vector< std::vector< BlockSetter > > connection_setters( num_threads );
+  std::vector< std::vector< synindex > > syn_ids( num_threads );
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    for ( const auto& block : node_blocks[ tid ] )
+    {
+      node_setters[ tid ].push_back( get_node_block_setter( tid, block ) );
+    }
+    for ( const auto& block : connection_blocks[ tid ] )
+    {
+      syn_ids[ tid ].push_back( invalid_synindex );
+      connection_setters[ tid ].push_back( get_connection_block_setter( block, syn_ids[ tid ].back() ) );
+    }
+  }
+
+  // Set flag before entering parallel section in case we have fewer connections than ranks.
+  kernel().connection_manager.set_connections_have_changed();
+
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      const SparseNodeArray& local_nodes = kernel().node_manager.get_local_nodes( tid );
+      for ( size_t b = 0; b < node_blocks[ tid ].size(); ++b )
+      {
+        const CheckpointBlock& block = node_blocks[ tid ][ b ];
+        BlockSetter& setter = node_setters[ tid ][ b ];
+        for ( size_t row = 0; row < block.node_ids.size(); ++row )
+        {
+          Node* node = local_nodes.get_node_by_node_id( block.node_ids[ row ] );
+          setter.set( block, row );
+          node->set_status_base( setter.dict->get_dict() );
+        }
+      }
+
+      for ( size_t b = 0; b < connection_blocks[ tid ].size(); ++b )
+      {
+        const CheckpointBlock& block = connection_blocks[ tid ][ b ];
+        BlockSetter& setter = connection_setters[ tid ][ b ];
+        for ( size_t row = 0; row < block.node_ids.size() / 2; ++row )
+        {
+          Node* target = kernel().node_manager.get_node_or_proxy( block.node_ids[ 2 * row + 1 ], tid );
+          setter.set( block, row );
+          kernel().connection_manager.connect(
+            block.node_ids[ 2 * row ], target, tid, syn_ids[ tid ][ b ], setter.dict->get_dict() );
+        }
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  rethrow();
+
+  kernel().random_manager.set_rng_states( rng_states );
+}
+
+} // namespace nest
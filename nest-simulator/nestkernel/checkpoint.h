@@ -0,0 +1,75 @@
+/*
+ *  checkpoint.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef CHECKPOINT_H
+#define CHECKPOINT_H
+
+// C++ includes:
+#include <string>
+
+namespace nest
+{
+
+/**
+ * @brief Write the state of the network to binary files in a directory
+ *
+ * Each MPI process writes one file `rank_<rank>.nestckpt` to the directory
+ * `path`, which must exist. The file holds, in the byte order of the machine:
+ *
+ * - a header with the number of MPI processes and threads, the resolution,
+ *   the RNG type and the states of all random number generators of the process,
+ * - the models and node ID ranges of all nodes in the network,
+ * - an offset table with the position of the section of each thread,
+ * - one section per thread, holding the scalar parameters and state variables
+ *   of the thread-local nodes, and the node IDs and scalar parameters of the
+ *   connections stored on the thread, in blocks of nodes of the same model and
+ *   connections of the same synapse model, respectively.
+ *
+ * Each block lists the names of the parameters once, followed by one row of
+ * values as doubles per node or connection. Recorded events, spatial
+ * properties and array-valued parameters are not written. Connections are
+ * written with the receptor type they were created with, which is determined
+ * from their receptor port by testing the receptor types of the target.
+ *
+ * @throws IOError if the file cannot be written.
+ * @throws KernelException if the receptor type of a connection cannot be determined.
+ */
+void write_checkpoint( const std::string& path );
+
+/**
+ * @brief Restore a network written by write_checkpoint()
+ *
+ * Creates the nodes and connections and restores the states of the nodes,
+ * connections and random number generators. The kernel must not contain any
+ * nodes, and the number of MPI processes, threads, the resolution and the RNG
+ * type must be the same as when the checkpoint was written. Each thread reads
+ * its own section of the file of its process and restores the nodes and
+ * connections of the section.
+ *
+ * @throws IOError if the file cannot be read or is not a checkpoint.
+ * @throws BadProperty if the kernel configuration does not match the checkpoint.
+ */
+void read_checkpoint( const std::string& path );
+
+} // namespace nest
+
+#endif /* CHECKPOINT_H */
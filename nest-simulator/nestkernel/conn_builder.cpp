@@ -755,6 +755,7 @@ nest::ThirdInBuilder::connect_()
 #pragma omp parallel
   {
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
     RngPtr rng = kernel().random_manager.get_vp_specific_rng( tid );
 
     for ( size_t idx = 0; idx < recv_stg.size(); idx += 2 )
@@ -967,6 +968,7 @@ nest::OneToOneBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -1181,6 +1183,7 @@ nest::AllToAllBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -1462,6 +1465,7 @@ nest::FixedInDegreeBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -1665,6 +1669,7 @@ nest::FixedOutDegreeBuilder::connect_()
     {
       // get thread id
       const size_t tid = kernel().vp_manager.get_thread_id();
+      ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
       try
       {
@@ -1805,6 +1810,7 @@ nest::FixedTotalNumberBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -1898,6 +1904,7 @@ nest::BernoulliBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -2016,6 +2023,7 @@ nest::PoissonBuilder::connect_()
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
@@ -2138,6 +2146,7 @@ nest::SymmetricBernoulliBuilder::connect_()
 #pragma omp parallel
   {
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     // Use RNG generating same number sequence on all threads
     RngPtr synced_rng = get_vp_synced_rng( tid );
@@ -2296,6 +2305,7 @@ nest::SPBuilder::connect_( const std::vector< size_t >& sources, const std::vect
   {
     // get thread id
     const size_t tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
 
     try
     {
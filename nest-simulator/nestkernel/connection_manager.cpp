@@ -31,6 +31,7 @@
 #include <cmath>
 #include <iomanip>
 #include <limits>
+#include <map>
 #include <set>
 #include <vector>
 
@@ -56,6 +57,7 @@
 #include "mpi_manager_impl.h"
 #include "nest_names.h"
 #include "node.h"
+#include "scalar_dictionary.h"
 #include "sonata_connector.h"
 #include "stopwatch_impl.h"
 #include "target_table_devices_impl.h"
@@ -77,6 +79,7 @@ nest::ConnectionManager::ConnectionManager()
   , max_delay_( 1 )
   , keep_source_table_( true )
   , connections_have_changed_( false )
+  , connections_change_count_( 0 )
   , get_connections_has_been_called_( false )
   , use_compressed_spikes_( true )
   , has_primary_connections_( false )
@@ -125,6 +128,9 @@ nest::ConnectionManager::initialize( const bool adjust_number_of_threads_or_rng_
     sw_construction_connect.reset();
   }
 
+  // Connections obtained before are invalid, also if only the number of threads changed.
+  ++connections_change_count_;
+
   const size_t num_threads = kernel().vp_manager.get_num_threads();
   connections_.resize( num_threads );
   secondary_recv_buffer_pos_.resize( num_threads );
@@ -155,6 +161,12 @@ nest::ConnectionManager::initialize( const bool adjust_number_of_threads_or_rng_
 
   std::vector< std::vector< size_t > > tmp2( kernel().vp_manager.get_num_threads(), std::vector< size_t >() );
   num_connections_.swap( tmp2 );
+
+  if ( not adjust_number_of_threads_or_rng_only )
+  {
+    construction_log_.set_enabled( false );
+  }
+  construction_log_.initialize( num_threads );
 }
 
 void
@@ -204,6 +216,12 @@ nest::ConnectionManager::set_status( const DictionaryDatum& d )
 
   updateValue< bool >( d, names::use_compressed_spikes, use_compressed_spikes_ );
 
+  bool log_construction;
+  if ( updateValue< bool >( d, names::log_construction, log_construction ) )
+  {
+    construction_log_.set_enabled( log_construction );
+  }
+
   //  Need to update the saved values if we have changed the delay bounds.
   if ( d->known( names::min_delay ) or d->known( names::max_delay ) )
   {
@@ -228,6 +246,7 @@ nest::ConnectionManager::get_status( DictionaryDatum& dict )
   def< long >( dict, names::num_connections, n );
   def< bool >( dict, names::keep_source_table, keep_source_table_ );
   def< bool >( dict, names::use_compressed_spikes, use_compressed_spikes_ );
+  def< bool >( dict, names::log_construction, construction_log_.is_enabled() );
 
   sw_construction_connect.get_status( dict, names::time_construction_connect, names::time_construction_connect_cpu );
 
@@ -334,6 +353,201 @@ nest::ConnectionManager::set_synapse_status( const size_t source_node_id,
   }
 }
 
+void
+nest::ConnectionManager::set_synapse_status_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  const std::vector< std::string >& keys,
+  const double* values )
+{
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+  const size_t num_connection_models = kernel().model_manager.get_num_connection_models();
+
+  // Validate the connection IDs before entering the parallel section, so that
+  // each thread can safely walk the connections it owns.
+  const std::vector< std::vector< size_t > > thread_indices =
+    sort_connection_ids_by_thread( threads, synapse_ids, n );
+  std::vector< bool > syn_id_used( num_connection_models, false );
+  for ( size_t i = 0; i < n; ++i )
+  {
+    syn_id_used[ synapse_ids[ i ] ] = true;
+  }
+
+  // Create one dictionary per thread and synapse model. All datums are allocated
+  // here, as the datum pools must not be used concurrently.
+  const std::vector< Name > names( keys.begin(), keys.end() );
+  std::vector< std::map< synindex, ScalarDictionary > > param_dicts( num_threads );
+  for ( synindex syn_id = 0; syn_id < num_connection_models; ++syn_id )
+  {
+    if ( not syn_id_used[ syn_id ] )
+    {
+      continue;
+    }
+
+    const DictionaryDatum syn_model_defaults = kernel().model_manager.get_connector_defaults( syn_id );
+    const std::string syn_model_name = kernel().model_manager.get_connection_model( syn_id, 0 ).get_name();
+    for ( size_t tid = 0; tid < num_threads; ++tid )
+    {
+      param_dicts[ tid ].emplace( syn_id, ScalarDictionary( names, syn_model_defaults, syn_model_name ) );
+    }
+  }
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      for ( const size_t i : thread_indices[ tid ] )
+      {
+        const synindex syn_id = synapse_ids[ i ];
+        ScalarDictionary& param_dict = param_dicts[ tid ].at( syn_id );
+        for ( size_t k = 0; k < keys.size(); ++k )
+        {
+          param_dict.set( k, values[ k * n + i ] );
+        }
+
+        const DictionaryDatum& dict = param_dict.get_dict();
+        dict->clear_access_flags();
+        set_synapse_status( sources[ i ], targets[ i ], tid, syn_id, ports[ i ], dict );
+        ALL_ENTRIES_ACCESSED2( *dict,
+          "SetStatus",
+          "Unread dictionary entries: ",
+          "Maybe you tried to set common synapse properties through an individual synapse?" );
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  // check if any exceptions have been raised
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+}
+
+void
+nest::ConnectionManager::get_synapse_weight_delay_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  double* weights,
+  double* delays,
+  std::vector< char >& read ) const
+{
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+
+  // Validate the connection IDs before entering the parallel section, so that
+  // each thread can safely walk the connections it owns.
+  const std::vector< std::vector< size_t > > thread_indices =
+    sort_connection_ids_by_thread( threads, synapse_ids, n );
+  read.assign( n, false );
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      for ( const size_t i : thread_indices[ tid ] )
+      {
+        const synindex syn_id = synapse_ids[ i ];
+        const Node* source = kernel().node_manager.get_node_or_proxy( sources[ i ], tid );
+        const Node* target = kernel().node_manager.get_node_or_proxy( targets[ i ], tid );
+
+        // Only synapses from neurons to neurons and from neurons to globally
+        // receiving devices are stored in the connectors, see get_synapse_status().
+        if ( not( source->has_proxies() and connections_[ tid ][ syn_id ]
+               and ( target->has_proxies() or not target->local_receiver() ) ) )
+        {
+          continue;
+        }
+
+        double weight = 0.0;
+        double delay = 0.0;
+        const bool has_weight = connections_[ tid ][ syn_id ]->get_weight_delay( ports[ i ], weight, delay );
+        if ( weights and not has_weight )
+        {
+          continue;
+        }
+
+        if ( weights )
+        {
+          weights[ i ] = weight;
+        }
+        if ( delays )
+        {
+          delays[ i ] = delay;
+        }
+        read[ i ] = true;
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  // check if any exceptions have been raised
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+}
+
+std::vector< std::vector< size_t > >
+nest::ConnectionManager::sort_connection_ids_by_thread( const long* threads,
+  const long* synapse_ids,
+  const size_t n ) const
+{
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+  const size_t num_connection_models = kernel().model_manager.get_num_connection_models();
+
+  std::vector< size_t > num_thread_connections( num_threads, 0 );
+  for ( size_t i = 0; i < n; ++i )
+  {
+    if ( threads[ i ] < 0 or static_cast< size_t >( threads[ i ] ) >= num_threads )
+    {
+      throw UnknownThread( threads[ i ] );
+    }
+    if ( synapse_ids[ i ] < 0 or static_cast< size_t >( synapse_ids[ i ] ) >= num_connection_models )
+    {
+      throw UnknownSynapseType( synapse_ids[ i ] );
+    }
+    ++num_thread_connections[ threads[ i ] ];
+  }
+
+  std::vector< std::vector< size_t > > thread_indices( num_threads );
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    thread_indices[ tid ].reserve( num_thread_connections[ tid ] );
+  }
+  for ( size_t i = 0; i < n; ++i )
+  {
+    // Connections are stored on the thread given in their connection ID.
+    thread_indices[ threads[ i ] ].push_back( i );
+  }
+  return thread_indices;
+}
+
 void
 nest::ConnectionManager::delete_connections_()
 {
@@ -481,10 +695,23 @@ nest::ConnectionManager::connect( NodeCollectionPTR sources,
     ALL_ENTRIES_ACCESSED( *syn_params, "Connect", "Unread dictionary entries in syn_spec: " );
   }
 
+  if ( construction_log_.is_enabled() )
+  {
+    std::vector< std::string > synapse_models;
+    get_synapse_model_names_( syn_specs, synapse_models );
+    construction_log_.begin_connect(
+      rule, synapse_models, sources->size(), targets->size(), get_num_connections_per_thread_() );
+  }
+
   // Set flag before calling cb->connect() in case exception is thrown after some connections have been created.
   set_connections_have_changed();
 
   cb.connect();
+
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.end_connect( get_num_connections_per_thread_() );
+  }
 }
 
 
@@ -616,8 +843,19 @@ nest::ConnectionManager::connect_arrays( long* sources,
   std::vector< std::string >& p_keys,
   double* p_values,
   size_t n,
-  std::string syn_model )
+  std::string syn_model,
+  const std::vector< size_t >& thread_offsets )
 {
+  const bool partitioned = not thread_offsets.empty();
+  if ( partitioned )
+  {
+    if ( thread_offsets.size() != kernel().vp_manager.get_num_threads() + 1 or thread_offsets.back() != n
+      or not std::is_sorted( thread_offsets.begin(), thread_offsets.end() ) )
+    {
+      throw BadProperty( "Thread offsets must be ascending, with one entry per thread and the number of connections." );
+    }
+  }
+
   // only place, where stopwatch sw_construction_connect is needed in addition to nestmodule.cpp
   sw_construction_connect.start();
 
@@ -682,6 +920,11 @@ nest::ConnectionManager::connect_arrays( long* sources,
     }
   };
 
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.begin_connect( "arrays", { syn_model }, n, n, get_num_connections_per_thread_() );
+  }
+
   // Set flag before entering parallel section in case we have fewer connections than ranks.
   set_connections_have_changed();
 
@@ -691,17 +934,21 @@ nest::ConnectionManager::connect_arrays( long* sources,
 #pragma omp parallel
   {
     const auto tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( construction_log_, tid );
     try
     {
-      auto s = sources;
-      auto t = targets;
-      auto w = weights;
-      auto d = delays;
+      const size_t begin = partitioned ? thread_offsets[ tid ] : 0;
+      const size_t end = partitioned ? thread_offsets[ tid + 1 ] : n;
+
+      auto s = sources + begin;
+      auto t = targets + begin;
+      auto w = weights ? weights + begin : weights;
+      auto d = delays ? delays + begin : delays;
       double weight_buffer = numerics::nan;
       double delay_buffer = numerics::nan;
-      int index_counter = 0; // Index of the current connection, for connection parameters
+      size_t index_counter = begin; // Index of the current connection, for connection parameters
 
-      for ( ; s != sources + n; ++s, ++t, ++index_counter )
+      for ( ; s != sources + end; ++s, ++t, ++index_counter )
       {
         if ( 0 >= *s or static_cast< size_t >( *s ) > kernel().node_manager.size() )
         {
@@ -714,9 +961,19 @@ nest::ConnectionManager::connect_arrays( long* sources,
         auto target_node = kernel().node_manager.get_node_or_proxy( *t, tid );
         if ( target_node->is_proxy() )
         {
+          if ( partitioned )
+          {
+            throw BadProperty(
+              String::compose( "Target %1 of connection %2 is not local to thread %3.", *t, index_counter, tid ) );
+          }
           increment_wd( w, d );
           continue;
         }
+        if ( partitioned and not target_node->has_proxies() )
+        {
+          throw BadProperty(
+            String::compose( "Target %1 of connection %2 is replicated on all threads.", *t, index_counter ) );
+        }
 
         // If weights or delays are specified, the buffers are replaced with the values.
         // If not, the buffers will be NaN and replaced by a default value by the connect function.
@@ -782,6 +1039,10 @@ nest::ConnectionManager::connect_arrays( long* sources,
     }
   }
 
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.end_connect( get_num_connections_per_thread_() );
+  }
   sw_construction_connect.stop();
 }
 
@@ -793,10 +1054,20 @@ nest::ConnectionManager::connect_sonata( const DictionaryDatum& graph_specs, con
 
   SonataConnector sonata_connector( graph_specs, hyberslab_size );
 
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.begin_connect( "sonata", {}, 0, 0, get_num_connections_per_thread_() );
+  }
+
   // Set flag before calling sonata_connector.connect() in case exception is thrown after some connections have been
   // created.
   set_connections_have_changed();
   sonata_connector.connect();
+
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.end_connect( get_num_connections_per_thread_() );
+  }
 #else
   throw KernelException( "Cannot use connect_sonata because NEST was compiled without HDF5 support" );
 #endif
@@ -858,10 +1129,29 @@ nest::ConnectionManager::connect_tripartite( NodeCollectionPTR sources,
     }
   }
 
+  if ( construction_log_.is_enabled() )
+  {
+    std::vector< std::string > synapse_models;
+    for ( auto& [ key, syn_spec_array ] : syn_specs )
+    {
+      get_synapse_model_names_( syn_spec_array, synapse_models );
+    }
+    construction_log_.begin_connect( primary_rule + "/" + third_rule,
+      synapse_models,
+      sources->size(),
+      targets->size(),
+      get_num_connections_per_thread_() );
+  }
+
   // Set flag before calling cb->connect() in case exception is thrown after some connections have been created.
   set_connections_have_changed();
 
   cb.connect();
+
+  if ( construction_log_.is_enabled() )
+  {
+    construction_log_.end_connect( get_num_connections_per_thread_() );
+  }
 }
 
 
@@ -1064,6 +1354,33 @@ nest::ConnectionManager::get_num_connections() const
   return num_connections;
 }
 
+std::vector< size_t >
+nest::ConnectionManager::get_num_connections_per_thread_() const
+{
+  std::vector< size_t > num_connections( num_connections_.size(), 0 );
+  for ( size_t t = 0; t < num_connections_.size(); ++t )
+  {
+    for ( size_t s = 0; s < num_connections_[ t ].size(); ++s )
+    {
+      num_connections[ t ] += num_connections_[ t ][ s ];
+    }
+  }
+
+  return num_connections;
+}
+
+void
+nest::ConnectionManager::get_synapse_model_names_( const std::vector< DictionaryDatum >& syn_specs,
+  std::vector< std::string >& synapse_models ) const
+{
+  // The ConnBuilder has ensured that all synapse specifications contain a synapse model.
+  for ( const auto& syn_spec : syn_specs )
+  {
+    const std::string synapse_model = ( *syn_spec )[ names::synapse_model ];
+    synapse_models.push_back( synapse_model );
+  }
+}
+
 size_t
 nest::ConnectionManager::get_num_connections( const synindex syn_id ) const
 {
@@ -1083,13 +1400,132 @@ ArrayDatum
 nest::ConnectionManager::get_connections( const DictionaryDatum& params )
 {
   std::deque< ConnectionID > connectome;
-  const Token& source_t = params->lookup( names::source );
-  const Token& target_t = params->lookup( names::target );
-  const Token& syn_model_t = params->lookup( names::synapse_model );
+  get_connections( connectome, params );
+
+  ArrayDatum result;
+  result.reserve( connectome.size() );
+
+  while ( not connectome.empty() )
+  {
+    result.push_back( ConnectionDatum( connectome.front() ) );
+    connectome.pop_front();
+  }
+
+  return result;
+}
+
+void
+nest::ConnectionManager::get_connections( std::deque< ConnectionID >& connectome, const DictionaryDatum& params )
+{
   NodeCollectionPTR source_a = NodeCollectionPTR( nullptr );
   NodeCollectionPTR target_a = NodeCollectionPTR( nullptr );
+  synindex syn_id_begin = 0;
+  synindex syn_id_end = 0;
+  long synapse_label = UNLABELED_CONNECTION;
+  prepare_get_connections_( params, source_a, target_a, syn_id_begin, syn_id_end, synapse_label );
+
+  for ( synindex syn_id = syn_id_begin; syn_id < syn_id_end; ++syn_id )
+  {
+    get_connections( connectome, source_a, target_a, syn_id, synapse_label );
+  }
 
+  get_connections_has_been_called_ = true;
+}
+
+bool
+nest::ConnectionManager::get_connections_chunk( std::deque< ConnectionID >& connectome,
+  const DictionaryDatum& params,
+  const size_t tid,
+  synindex& syn_id,
+  size_t& lcid,
+  const size_t max_num_connections )
+{
+  NodeCollectionPTR source = NodeCollectionPTR( nullptr );
+  NodeCollectionPTR target = NodeCollectionPTR( nullptr );
+  synindex syn_id_begin = 0;
+  synindex syn_id_end = 0;
   long synapse_label = UNLABELED_CONNECTION;
+  prepare_get_connections_( params, source, target, syn_id_begin, syn_id_end, synapse_label );
+
+  if ( tid >= kernel().vp_manager.get_num_threads() )
+  {
+    throw KernelException( "GetConnections requires a valid thread." );
+  }
+  if ( is_source_table_cleared() )
+  {
+    throw KernelException( "Invalid attempt to access connection information: source table was cleared." );
+  }
+
+  if ( syn_id < syn_id_begin )
+  {
+    syn_id = syn_id_begin;
+    lcid = 0;
+  }
+
+  std::vector< size_t > target_neuron_node_ids;
+  std::vector< size_t > target_device_node_ids;
+  if ( target.get() )
+  {
+    split_to_neuron_device_vectors_( tid, target, target_neuron_node_ids, target_device_node_ids );
+  }
+
+  for ( ; syn_id < syn_id_end and connectome.size() < max_num_connections; ++syn_id, lcid = 0 )
+  {
+    if ( num_connections_[ tid ].size() <= syn_id or num_connections_[ tid ][ syn_id ] == 0 )
+    {
+      continue;
+    }
+
+    const ConnectorBase* connections = connections_[ tid ][ syn_id ];
+    const size_t num_connections_in_thread = connections ? connections->size() : 0;
+    for ( ; lcid < num_connections_in_thread and connectome.size() < max_num_connections; ++lcid )
+    {
+      const size_t source_node_id = source_table_.get_node_id( tid, syn_id, lcid );
+      if ( source.get() and not source->contains( source_node_id ) )
+      {
+        continue;
+      }
+
+      if ( target.get() )
+      {
+        connections->get_connection_with_specified_targets(
+          source_node_id, target_neuron_node_ids, tid, lcid, synapse_label, connectome );
+      }
+      else
+      {
+        // Passing target_node_id = 0 ignores target_node_id while getting connections.
+        connections->get_connection( source_node_id, 0, tid, lcid, synapse_label, connectome );
+      }
+    }
+
+    if ( lcid < num_connections_in_thread )
+    {
+      // The chunk is full, continue with lcid in the next call.
+      break;
+    }
+
+    // The connections from and to devices are not numbered by lcid and are added after all others.
+    get_device_connections_(
+      tid, connectome, source, target, target_neuron_node_ids, target_device_node_ids, syn_id, synapse_label );
+  }
+
+  get_connections_has_been_called_ = true;
+
+  return syn_id >= syn_id_end;
+}
+
+void
+nest::ConnectionManager::prepare_get_connections_( const DictionaryDatum& params,
+  NodeCollectionPTR& source_a,
+  NodeCollectionPTR& target_a,
+  synindex& syn_id_begin,
+  synindex& syn_id_end,
+  long& synapse_label )
+{
+  const Token& source_t = params->lookup( names::source );
+  const Token& target_t = params->lookup( names::target );
+  const Token& syn_model_t = params->lookup( names::synapse_model );
+
   updateValue< long >( params, names::synapse_label, synapse_label );
 
   if ( not source_t.empty() )
@@ -1130,34 +1566,18 @@ nest::ConnectionManager::get_connections( const DictionaryDatum& params )
   }
 
   // We check, whether a synapse model is given. If not, we will iterate all.
-  size_t syn_id = 0;
   if ( not syn_model_t.empty() )
   {
     const std::string synmodel_name = getValue< std::string >( syn_model_t );
     // The following throws UnknownSynapseType for invalid synmodel_name
-    syn_id = kernel().model_manager.get_synapse_model_id( synmodel_name );
-    get_connections( connectome, source_a, target_a, syn_id, synapse_label );
+    syn_id_begin = kernel().model_manager.get_synapse_model_id( synmodel_name );
+    syn_id_end = syn_id_begin + 1;
   }
   else
   {
-    for ( syn_id = 0; syn_id < kernel().model_manager.get_num_connection_models(); ++syn_id )
-    {
-      get_connections( connectome, source_a, target_a, syn_id, synapse_label );
-    }
-  }
-
-  ArrayDatum result;
-  result.reserve( connectome.size() );
-
-  while ( not connectome.empty() )
-  {
-    result.push_back( ConnectionDatum( connectome.front() ) );
-    connectome.pop_front();
+    syn_id_begin = 0;
+    syn_id_end = kernel().model_manager.get_num_connection_models();
   }
-
-  get_connections_has_been_called_ = true;
-
-  return result;
 }
 
 // Helper method which removes ConnectionIDs from input deque and
@@ -1219,7 +1639,8 @@ nest::ConnectionManager::get_connections_( const size_t tid,
     }
   }
 
-  target_table_devices_.get_connections( 0, 0, tid, syn_id, synapse_label, conns_in_thread );
+  get_device_connections_(
+    tid, conns_in_thread, NodeCollectionPTR( nullptr ), NodeCollectionPTR( nullptr ), {}, {}, syn_id, synapse_label );
 }
 
 void
@@ -1248,17 +1669,14 @@ nest::ConnectionManager::get_connections_to_targets_( const size_t tid,
     }
   }
 
-  // Getting connections from devices.
-  for ( auto t_node_id : target_neuron_node_ids )
-  {
-    target_table_devices_.get_connections_from_devices_( 0, t_node_id, tid, syn_id, synapse_label, conns_in_thread );
-  }
-
-  // Getting connections to devices.
-  for ( auto t_device_id : target_device_node_ids )
-  {
-    target_table_devices_.get_connections_to_devices_( 0, t_device_id, tid, syn_id, synapse_label, conns_in_thread );
-  }
+  get_device_connections_( tid,
+    conns_in_thread,
+    NodeCollectionPTR( nullptr ),
+    target,
+    target_neuron_node_ids,
+    target_device_node_ids,
+    syn_id,
+    synapse_label );
 }
 
 void
@@ -1301,34 +1719,54 @@ nest::ConnectionManager::get_connections_from_sources_( const size_t tid,
     }
   }
 
-  NodeCollection::const_iterator s_id = source->begin();
-  for ( ; s_id < source->end(); ++s_id )
+  get_device_connections_(
+    tid, conns_in_thread, source, target, target_neuron_node_ids, target_device_node_ids, syn_id, synapse_label );
+}
+
+void
+nest::ConnectionManager::get_device_connections_( const size_t tid,
+  std::deque< ConnectionID >& conns_in_thread,
+  NodeCollectionPTR source,
+  NodeCollectionPTR target,
+  const std::vector< size_t >& target_neuron_node_ids,
+  const std::vector< size_t >& target_device_node_ids,
+  synindex syn_id,
+  long synapse_label ) const
+{
+  const auto get_connections_from_source = [ & ]( const size_t source_node_id )
   {
-    const size_t source_node_id = ( *s_id ).node_id;
     if ( not target.get() )
     {
       target_table_devices_.get_connections( source_node_id, 0, tid, syn_id, synapse_label, conns_in_thread );
     }
     else
     {
-      for ( std::vector< size_t >::const_iterator t_node_id = target_neuron_node_ids.begin();
-            t_node_id != target_neuron_node_ids.end();
-            ++t_node_id )
+      // target_table_devices_ contains connections both to and from
+      // devices. First we get connections from devices.
+      for ( const size_t t_node_id : target_neuron_node_ids )
       {
-        // target_table_devices_ contains connections both to and from
-        // devices. First we get connections from devices.
         target_table_devices_.get_connections_from_devices_(
-          source_node_id, *t_node_id, tid, syn_id, synapse_label, conns_in_thread );
+          source_node_id, t_node_id, tid, syn_id, synapse_label, conns_in_thread );
       }
-      for ( std::vector< size_t >::const_iterator t_node_id = target_device_node_ids.begin();
-            t_node_id != target_device_node_ids.end();
-            ++t_node_id )
+      // Then, we get connections to devices.
+      for ( const size_t t_node_id : target_device_node_ids )
       {
-        // Then, we get connections to devices.
         target_table_devices_.get_connections_to_devices_(
-          source_node_id, *t_node_id, tid, syn_id, synapse_label, conns_in_thread );
+          source_node_id, t_node_id, tid, syn_id, synapse_label, conns_in_thread );
       }
     }
+  };
+
+  if ( not source.get() )
+  {
+    // Passing source_node_id = 0 ignores source_node_id while getting connections.
+    get_connections_from_source( 0 );
+    return;
+  }
+
+  for ( NodeCollection::const_iterator s_id = source->begin(); s_id < source->end(); ++s_id )
+  {
+    get_connections_from_source( ( *s_id ).node_id );
   }
 }
 
@@ -1761,6 +2199,7 @@ nest::ConnectionManager::set_connections_have_changed()
   }
 
   connections_have_changed_ = true;
+  ++connections_change_count_;
 }
 
 void
@@ -33,6 +33,7 @@
 // Includes from nestkernel:
 #include "conn_builder.h"
 #include "connection_id.h"
+#include "construction_log.h"
 #include "connector_base.h"
 #include "nest_time.h"
 #include "nest_timeconverter.h"
@@ -168,6 +169,15 @@ public:
    */
   bool connect( const size_t snode_id, const size_t target, const DictionaryDatum& params, const synindex syn_id );
 
+  /**
+   * Connect arrays of node IDs one-to-one, see nest::connect_arrays().
+   *
+   * If `thread_offsets` is empty, every thread considers all connections and
+   * creates those to its local targets. Otherwise, thread t only creates the
+   * connections with indices from `thread_offsets[ t ]` to
+   * `thread_offsets[ t + 1 ] - 1`, all of which must have a target local to
+   * the thread that is not replicated on all threads.
+   */
   void connect_arrays( long* sources,
     long* targets,
     double* weights,
@@ -175,7 +185,8 @@ public:
     std::vector< std::string >& p_keys,
     double* p_values,
     size_t n,
-    std::string syn_model );
+    std::string syn_model,
+    const std::vector< size_t >& thread_offsets = std::vector< size_t >() );
 
   /**
    * @brief Connect nodes from SONATA specification.
@@ -229,6 +240,64 @@ public:
     const size_t lcid,
     const DictionaryDatum& dict );
 
+  /**
+   * Set scalar parameters of many connections in one thread-parallel pass.
+   *
+   * The connections are given by the fields of their connection IDs, passed
+   * as arrays of length n. The values of parameter `keys[ k ]` are stored
+   * contiguously starting at `values[ k * n ]`. Each thread sets the
+   * parameters of the connections it owns, reusing one dictionary per
+   * synapse model whose datums are changed in place.
+   *
+   * @throws BadParameter if a synapse model does not have a parameter in
+   * `keys` or an integer or boolean parameter is given a non-integral value.
+   */
+  void set_synapse_status_arrays( const long* sources,
+    const long* targets,
+    const long* threads,
+    const long* synapse_ids,
+    const long* ports,
+    const size_t n,
+    const std::vector< std::string >& keys,
+    const double* values );
+
+  /**
+   * Read weights and delays of many connections in one thread-parallel pass.
+   *
+   * The connections are given as in set_synapse_status_arrays(). Each thread
+   * reads the connections it owns directly from its connectors, without
+   * creating status dictionaries. weights or delays may be nullptr if they
+   * are not requested. read[ i ] is set to false for connections that cannot
+   * be read this way, i.e., connections from or to devices and, if weights are
+   * requested, connections without a weight of their own.
+   *
+   * @throws UnknownThread if a thread does not exist.
+   * @throws UnknownSynapseType if a synapse model does not exist.
+   */
+  void get_synapse_weight_delay_arrays( const long* sources,
+    const long* targets,
+    const long* threads,
+    const long* synapse_ids,
+    const long* ports,
+    const size_t n,
+    double* weights,
+    double* delays,
+    std::vector< char >& read ) const;
+
+  /**
+   * Sort the indices of connection IDs by the thread the connections are stored on.
+   *
+   * Returns for each thread the indices i of its connections, in increasing
+   * order, so that each thread can walk its own connections in a parallel
+   * section.
+   *
+   * @throws UnknownThread if a thread does not exist.
+   * @throws UnknownSynapseType if a synapse model does not exist.
+   */
+  std::vector< std::vector< size_t > > sort_connection_ids_by_thread( const long* threads,
+    const long* synapse_ids,
+    const size_t n ) const;
+
   /**
    * Return connections between pairs of neurons.
    *
@@ -246,12 +315,39 @@ public:
    */
   ArrayDatum get_connections( const DictionaryDatum& params );
 
+  /**
+   * Collect the IDs of the connections selected by params in connectome.
+   *
+   * The params dictionary can have the same entries as for the variant
+   * returning an ArrayDatum, but no datums are created for the connections.
+   */
+  void get_connections( std::deque< ConnectionID >& connectome, const DictionaryDatum& params );
+
   void get_connections( std::deque< ConnectionID >& connectome,
     NodeCollectionPTR source,
     NodeCollectionPTR target,
     synindex syn_id,
     long synapse_label ) const;
 
+  /**
+   * Collect a chunk of the connections of thread tid selected by params in connectome.
+   *
+   * The connections of the thread are visited in the order of synapse model IDs and
+   * local connection IDs, starting at syn_id and lcid, until connectome holds at least
+   * max_num_connections connections. Connections from and to devices are added after
+   * the other connections of their synapse model. On return, syn_id and lcid point to
+   * the first connection not visited, so that repeated calls iterate over all connections
+   * of the thread.
+   *
+   * @returns true if all connections of the thread have been visited
+   */
+  bool get_connections_chunk( std::deque< ConnectionID >& connectome,
+    const DictionaryDatum& params,
+    const size_t tid,
+    synindex& syn_id,
+    size_t& lcid,
+    const size_t max_num_connections );
+
   /**
    * Returns the number of connections in the network.
    */
@@ -411,6 +507,16 @@ public:
    */
   void unset_connections_have_changed();
 
+  /**
+   * Returns the number of times connections have been created or deleted,
+   * or the kernel has been reset, since startup.
+   *
+   * In contrast to connections_have_changed(), the count is not reset when
+   * the connection infrastructure is updated, so that callers can detect
+   * changes between two points in time.
+   */
+  size_t get_connections_change_count() const;
+
   /**
    * Deletes TargetTable and resets processed flags of
    * SourceTable.
@@ -461,6 +567,9 @@ public:
   // start and stop in high-level connect functions in nestmodule.cpp and nest.cpp
   Stopwatch< StopwatchGranularity::Normal, StopwatchParallelism::MasterOnly > sw_construction_connect;
 
+  //! Timing and memory information on the calls to Connect and the updates of the connection infrastructure
+  ConstructionLog& get_construction_log();
+
   const std::vector< SpikeData >& get_compressed_spike_data( const synindex syn_id, const size_t idx );
 
   //! Set iteration_state_ entries for all threads to beginning of compressed_spike_data_map_.
@@ -471,6 +580,13 @@ private:
 
   size_t get_num_connections_( const size_t tid, const synindex syn_id ) const;
 
+  //! Number of connections per thread, for the construction log
+  std::vector< size_t > get_num_connections_per_thread_() const;
+
+  //! Names of the synapse models in the given synapse specifications, for the construction log
+  void get_synapse_model_names_( const std::vector< DictionaryDatum >& syn_specs,
+    std::vector< std::string >& synapse_models ) const;
+
   //! See get_connections()
   void get_connections_( const size_t tid,
     std::deque< ConnectionID >& connectome,
@@ -490,6 +606,27 @@ private:
     NodeCollectionPTR target,
     synindex syn_id,
     long synapse_label ) const;
+  void get_device_connections_( const size_t tid,
+    std::deque< ConnectionID >& connectome,
+    NodeCollectionPTR source,
+    NodeCollectionPTR target,
+    const std::vector< size_t >& target_neuron_node_ids,
+    const std::vector< size_t >& target_device_node_ids,
+    synindex syn_id,
+    long synapse_label ) const;
+
+  /**
+   * Read the selection of connections from params for get_connections().
+   *
+   * Sets [syn_id_begin, syn_id_end) to the IDs of the selected synapse models
+   * and updates the connection infrastructure if connections have changed.
+   */
+  void prepare_get_connections_( const DictionaryDatum& params,
+    NodeCollectionPTR& source,
+    NodeCollectionPTR& target,
+    synindex& syn_id_begin,
+    synindex& syn_id_end,
+    long& synapse_label );
 
   void get_source_node_ids_( const size_t tid,
     const synindex syn_id,
@@ -662,6 +799,8 @@ private:
    */
   std::vector< std::vector< size_t > > num_connections_;
 
+  ConstructionLog construction_log_;
+
   DictionaryDatum connruledict_; //!< Dictionary for connection rules.
 
   //! ConnBuilder factories, indexed by connruledict_ elements.
@@ -683,6 +822,9 @@ private:
   //! simulate.
   bool connections_have_changed_;
 
+  //! Number of changes of the connections since startup, see get_connections_change_count().
+  size_t connections_change_count_;
+
   //! true if GetConnections has been called.
   bool get_connections_has_been_called_;
 
@@ -825,6 +967,12 @@ ConnectionManager::connections_have_changed() const
   return connections_have_changed_;
 }
 
+inline size_t
+ConnectionManager::get_connections_change_count() const
+{
+  return connections_change_count_;
+}
+
 inline void
 ConnectionManager::add_target( const size_t tid, const size_t target_rank, const TargetData& target_data )
 {
@@ -863,6 +1011,12 @@ ConnectionManager::get_num_connections_( const size_t tid, const synindex syn_id
   return connections_[ tid ][ syn_id ]->size();
 }
 
+inline ConstructionLog&
+ConnectionManager::get_construction_log()
+{
+  return construction_log_;
+}
+
 inline size_t
 ConnectionManager::get_source_node_id( const size_t tid, const synindex syn_index, const size_t lcid )
 {
@@ -28,6 +28,7 @@
 
 // C++ includes:
 #include <cstdlib>
+#include <type_traits>
 #include <vector>
 
 // Includes from libnestutil:
@@ -53,6 +54,21 @@
 namespace nest
 {
 
+/**
+ * Whether connections of type ConnectionT have a weight of their own, which
+ * they return by get_weight().
+ */
+template < typename ConnectionT, typename = void >
+struct has_weight_accessor : std::false_type
+{
+};
+
+template < typename ConnectionT >
+struct has_weight_accessor< ConnectionT, std::void_t< decltype( std::declval< const ConnectionT& >().get_weight() ) > >
+  : std::true_type
+{
+};
+
 /**
  * Base class to allow storing Connectors for different synapse types
  * in vectors. We define the interface here to avoid casting.
@@ -93,6 +109,15 @@ public:
    */
   virtual void set_synapse_status( const size_t lcid, const DictionaryDatum& dict, ConnectorModel& cm ) = 0;
 
+  /**
+   * Write weight and delay of the connection at position lcid.
+   *
+   * Unlike get_synapse_status(), this does not create any datums, so that
+   * all threads can read their connections in parallel. Returns false and
+   * leaves weight unchanged if the connection type has no weight of its own.
+   */
+  virtual bool get_weight_delay( const size_t lcid, double& weight, double& delay ) const = 0;
+
   /**
    * Add ConnectionID with given source_node_id and lcid to conns. If
    * target_node_id is given, only add connection if target_node_id matches
@@ -266,6 +291,20 @@ public:
     C_[ lcid ].set_status( dict, static_cast< GenericConnectorModel< ConnectionT >& >( cm ) );
   }
 
+  bool
+  get_weight_delay( const size_t lcid, double& weight, double& delay ) const override
+  {
+    assert( lcid < C_.size() );
+
+    delay = C_[ lcid ].get_delay();
+    if constexpr ( has_weight_accessor< ConnectionT >::value )
+    {
+      weight = C_[ lcid ].get_weight();
+      return true;
+    }
+    return false;
+  }
+
   void
   push_back( const ConnectionT& c )
   {
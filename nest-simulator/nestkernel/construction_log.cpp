@@ -0,0 +1,236 @@
+/*
+ *  construction_log.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#include "construction_log.h"
+
+// C includes:
+#include <unistd.h>
+
+// C++ includes:
+#include <fstream>
+
+// Includes from nestkernel:
+#include "nest_names.h"
+
+// Includes from sli:
+#include "arraydatum.h"
+#include "dictutils.h"
+
+namespace nest
+{
+
+ConstructionLog::ConstructionLog()
+  : enabled_( false )
+  , entries_()
+  , connecting_( false )
+  , current_()
+  , begin_()
+  , memory_begin_( 0 )
+  , connections_begin_()
+  , infrastructure_times_()
+  , io_blocks_()
+{
+}
+
+void
+ConstructionLog::initialize( const size_t num_threads )
+{
+  clear();
+  infrastructure_times_.resize( num_threads );
+}
+
+void
+ConstructionLog::clear()
+{
+  entries_.clear();
+  io_blocks_.clear();
+  connecting_ = false;
+  for ( auto& thread_times : infrastructure_times_ )
+  {
+    thread_times.clear();
+  }
+}
+
+void
+ConstructionLog::set_enabled( const bool enabled )
+{
+  if ( enabled and not enabled_ )
+  {
+    clear();
+  }
+  enabled_ = enabled;
+}
+
+void
+ConstructionLog::begin_connect( const std::string& rule,
+  const std::vector< std::string >& synapse_models,
+  const size_t num_sources,
+  const size_t num_targets,
+  const std::vector< size_t >& num_connections )
+{
+  if ( not enabled_ )
+  {
+    return;
+  }
+
+  current_.rule = rule;
+  current_.synapse_models = synapse_models;
+  current_.num_sources = num_sources;
+  current_.num_targets = num_targets;
+  current_.thread_times.assign( num_connections.size(), 0.0 );
+  connections_begin_ = num_connections;
+  memory_begin_ = get_resident_memory_();
+  begin_ = std::chrono::steady_clock::now();
+  connecting_ = true;
+}
+
+void
+ConstructionLog::end_connect( const std::vector< size_t >& num_connections )
+{
+  if ( not connecting_ )
+  {
+    return;
+  }
+
+  current_.time = std::chrono::duration< double >( std::chrono::steady_clock::now() - begin_ ).count();
+  current_.memory = get_resident_memory_() - memory_begin_;
+  current_.thread_connections.resize( num_connections.size() );
+  for ( size_t tid = 0; tid < num_connections.size(); ++tid )
+  {
+    current_.thread_connections[ tid ] =
+      static_cast< long >( num_connections[ tid ] ) - static_cast< long >( connections_begin_[ tid ] );
+  }
+
+  append_( entries_, current_ );
+  connecting_ = false;
+}
+
+void
+ConstructionLog::add_infrastructure_times( const size_t tid,
+  const std::array< double, NUM_INFRASTRUCTURE_PHASES >& times )
+{
+  if ( enabled_ )
+  {
+    append_( infrastructure_times_[ tid ], times );
+  }
+}
+
+void
+ConstructionLog::add_io_block( const std::string& file,
+  const size_t offset,
+  const size_t size,
+  const double time_read,
+  const double time_wait,
+  const double time_connect )
+{
+  if ( enabled_ )
+  {
+    append_( io_blocks_,
+      IOBlock { file, static_cast< long >( offset ), static_cast< long >( size ), time_read, time_wait, time_connect } );
+  }
+}
+
+void
+ConstructionLog::to_dict( DictionaryDatum& log ) const
+{
+  initialize_property_array( log, names::rule );
+  initialize_property_array( log, "synapse_models" );
+  initialize_property_intvector( log, "num_sources" );
+  initialize_property_intvector( log, "num_targets" );
+  initialize_property_doublevector( log, "time" );
+  initialize_property_intvector( log, "memory" );
+  initialize_property_array( log, "thread_times" );
+  initialize_property_array( log, "thread_connections" );
+
+  for ( const auto& entry : entries_ )
+  {
+    ArrayDatum synapse_models;
+    for ( const auto& synapse_model : entry.synapse_models )
+    {
+      synapse_models.push_back( new LiteralDatum( synapse_model ) );
+    }
+
+    append_property( log, names::rule, LiteralDatum( entry.rule ) );
+    append_property( log, "synapse_models", synapse_models );
+    append_property( log, "num_sources", std::vector< long >( 1, entry.num_sources ) );
+    append_property( log, "num_targets", std::vector< long >( 1, entry.num_targets ) );
+    append_property( log, "time", std::vector< double >( 1, entry.time ) );
+    append_property( log, "memory", std::vector< long >( 1, entry.memory ) );
+    append_property( log, "thread_times", ArrayDatum( entry.thread_times ) );
+    append_property( log, "thread_connections", ArrayDatum( entry.thread_connections ) );
+  }
+
+  // One array per update of the connection infrastructure, holding the times of all threads
+  const std::array< std::string, NUM_INFRASTRUCTURE_PHASES > phase_names = {
+    "time_sort_connections", "time_build_target_tables", "time_gather_target_data"
+  };
+  const size_t num_updates = infrastructure_times_.empty() ? 0 : infrastructure_times_[ 0 ].size();
+
+  DictionaryDatum infrastructure( new Dictionary );
+  for ( size_t phase = 0; phase < NUM_INFRASTRUCTURE_PHASES; ++phase )
+  {
+    initialize_property_array( infrastructure, phase_names[ phase ] );
+    for ( size_t update = 0; update < num_updates; ++update )
+    {
+      std::vector< double > times;
+      for ( const auto& thread_times : infrastructure_times_ )
+      {
+        times.push_back( update < thread_times.size() ? thread_times[ update ][ phase ] : 0.0 );
+      }
+      append_property( infrastructure, phase_names[ phase ], ArrayDatum( times ) );
+    }
+  }
+  ( *log )[ "connection_infrastructure" ] = infrastructure;
+
+  DictionaryDatum io_blocks( new Dictionary );
+  initialize_property_array( io_blocks, "edges_file" );
+  initialize_property_intvector( io_blocks, "offset" );
+  initialize_property_intvector( io_blocks, "size" );
+  initialize_property_doublevector( io_blocks, "time_read" );
+  initialize_property_doublevector( io_blocks, "time_wait" );
+  initialize_property_doublevector( io_blocks, "time_connect" );
+  for ( const auto& block : io_blocks_ )
+  {
+    append_property( io_blocks, "edges_file", LiteralDatum( block.file ) );
+    append_property( io_blocks, "offset", std::vector< long >( 1, block.offset ) );
+    append_property( io_blocks, "size", std::vector< long >( 1, block.size ) );
+    append_property( io_blocks, "time_read", std::vector< double >( 1, block.time_read ) );
+    append_property( io_blocks, "time_wait", std::vector< double >( 1, block.time_wait ) );
+    append_property( io_blocks, "time_connect", std::vector< double >( 1, block.time_connect ) );
+  }
+  ( *log )[ "io_blocks" ] = io_blocks;
+}
+
+long
+ConstructionLog::get_resident_memory_()
+{
+  long size = 0;
+  long resident = 0;
+  std::ifstream statm( "/proc/self/statm" );
+  if ( statm >> size >> resident )
+  {
+    return resident * sysconf( _SC_PAGESIZE );
+  }
+  return 0;
+}
+
+} // namespace nest
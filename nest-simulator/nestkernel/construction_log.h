@@ -0,0 +1,223 @@
+/*
+ *  construction_log.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef CONSTRUCTION_LOG_H
+#define CONSTRUCTION_LOG_H
+
+// C++ includes:
+#include <array>
+#include <chrono>
+#include <deque>
+#include <string>
+#include <vector>
+
+// Includes from sli:
+#include "dictdatum.h"
+
+namespace nest
+{
+
+/**
+ * Collect timing and memory information on network construction.
+ *
+ * The log has one entry per call to Connect with a connection rule or with
+ * arrays, holding the wall-clock time of the call, the time each thread spent
+ * in the parallel sections of the connection rule, the number of connections
+ * each thread created and the growth of the resident memory of the process.
+ * In addition, it holds the time each thread spent on sorting connections,
+ * building target tables and gathering target data for each update of the
+ * connection infrastructure, e.g., in Prepare. For connections read from
+ * SONATA edge files, it holds the times of reading and connecting each block
+ * of edges.
+ *
+ * Nothing is recorded unless the log is enabled by the kernel property
+ * `log_construction`. Each part of the log holds at most `max_entries`
+ * entries, the oldest entries are discarded.
+ *
+ * begin_connect() and end_connect() must be called from the master thread,
+ * thread-specific functions only by thread `tid` for itself.
+ */
+class ConstructionLog
+{
+public:
+  /**
+   * Add the wall-clock time between construction and destruction to the time of thread `tid`.
+   */
+  class ThreadTimer
+  {
+  public:
+    ThreadTimer( ConstructionLog& log, const size_t tid );
+    ~ThreadTimer();
+
+  private:
+    ConstructionLog& log_;
+    const size_t tid_;
+    const std::chrono::steady_clock::time_point begin_;
+  };
+
+  //! Phases of the update of the connection infrastructure
+  enum InfrastructurePhase
+  {
+    SORT_CONNECTIONS = 0,
+    BUILD_TARGET_TABLES,
+    GATHER_TARGET_DATA,
+    NUM_INFRASTRUCTURE_PHASES
+  };
+
+  //! Maximal number of entries of each part of the log
+  static constexpr size_t max_entries = 10000;
+
+  ConstructionLog();
+
+  void initialize( const size_t num_threads );
+  void clear();
+
+  /**
+   * Enable or disable the log, enabling discards previous entries.
+   */
+  void set_enabled( const bool enabled );
+  bool is_enabled() const;
+
+  /**
+   * Start an entry for a call to Connect, `num_connections` holds the connections per thread before the call.
+   */
+  void begin_connect( const std::string& rule,
+    const std::vector< std::string >& synapse_models,
+    const size_t num_sources,
+    const size_t num_targets,
+    const std::vector< size_t >& num_connections );
+
+  /**
+   * Complete the entry, `num_connections` holds the connections per thread after the call.
+   */
+  void end_connect( const std::vector< size_t >& num_connections );
+
+  void add_thread_time( const size_t tid, const double time );
+
+  /**
+   * Record the times of thread `tid` for one update of the connection infrastructure.
+   */
+  void add_infrastructure_times( const size_t tid,
+    const std::array< double, NUM_INFRASTRUCTURE_PHASES >& times );
+
+  /**
+   * Record the times of one block of edges read from a SONATA edge file.
+   *
+   * `time_read` is the time of reading the block, `time_wait` the time spent
+   * waiting for the read before connecting, and `time_connect` the time of
+   * creating the connections of the block.
+   */
+  void add_io_block( const std::string& file,
+    const size_t offset,
+    const size_t size,
+    const double time_read,
+    const double time_wait,
+    const double time_connect );
+
+  void to_dict( DictionaryDatum& ) const;
+
+private:
+  //! Resident memory of the process in bytes, or 0 if it cannot be determined
+  static long get_resident_memory_();
+
+  struct Entry
+  {
+    std::string rule;
+    std::vector< std::string > synapse_models;
+    long num_sources;
+    long num_targets;
+    double time;
+    long memory;
+    std::vector< double > thread_times;
+    std::vector< long > thread_connections;
+  };
+
+  //! Append entry to entries, discarding the oldest entry if the log is full
+  template < typename T >
+  static void append_( std::deque< T >& entries, const T& entry );
+
+  bool enabled_;
+  std::deque< Entry > entries_;
+
+  bool connecting_; //!< true between begin_connect() and end_connect()
+  Entry current_;   //!< entry of the call in progress
+  std::chrono::steady_clock::time_point begin_;
+  long memory_begin_;
+  std::vector< size_t > connections_begin_;
+
+  //! times per thread and update of the connection infrastructure
+  std::vector< std::deque< std::array< double, NUM_INFRASTRUCTURE_PHASES > > > infrastructure_times_;
+
+  struct IOBlock
+  {
+    std::string file;
+    long offset;
+    long size;
+    double time_read;
+    double time_wait;
+    double time_connect;
+  };
+
+  std::deque< IOBlock > io_blocks_;
+};
+
+inline bool
+ConstructionLog::is_enabled() const
+{
+  return enabled_;
+}
+
+template < typename T >
+inline void
+ConstructionLog::append_( std::deque< T >& entries, const T& entry )
+{
+  if ( entries.size() == max_entries )
+  {
+    entries.pop_front();
+  }
+  entries.push_back( entry );
+}
+
+inline void
+ConstructionLog::add_thread_time( const size_t tid, const double time )
+{
+  if ( connecting_ )
+  {
+    current_.thread_times[ tid ] += time;
+  }
+}
+
+inline ConstructionLog::ThreadTimer::ThreadTimer( ConstructionLog& log, const size_t tid )
+  : log_( log )
+  , tid_( tid )
+  , begin_( std::chrono::steady_clock::now() )
+{
+}
+
+inline ConstructionLog::ThreadTimer::~ThreadTimer()
+{
+  log_.add_thread_time( tid_, std::chrono::duration< double >( std::chrono::steady_clock::now() - begin_ ).count() );
+}
+
+} // namespace nest
+
+#endif /* CONSTRUCTION_LOG_H */
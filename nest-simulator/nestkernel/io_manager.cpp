@@ -42,6 +42,7 @@
 #include "kernel_manager.h"
 #include "recording_backend_ascii.h"
 #include "recording_backend_memory.h"
+#include "recording_backend_npy.h"
 #include "recording_backend_screen.h"
 #ifdef HAVE_MPI
 #include "recording_backend_mpi.h"
@@ -76,6 +77,7 @@ IOManager::initialize( const bool adjust_number_of_threads_or_rng_only )
     // so backends from external modules are unloaded
     register_recording_backend< RecordingBackendASCII >( "ascii" );
     register_recording_backend< RecordingBackendMemory >( "memory" );
+    register_recording_backend< RecordingBackendNPY >( "npy" );
     register_recording_backend< RecordingBackendScreen >( "screen" );
 #ifdef HAVE_MPI
     register_recording_backend< RecordingBackendMPI >( "mpi" );
@@ -392,4 +394,18 @@ IOManager::get_recording_backend_device_status( const Name backend_name,
   recording_backends_[ backend_name ]->get_device_status( device, d );
 }
 
+bool
+IOManager::drain_memory_device_events( const size_t node_id, RecordedEvents& events )
+{
+  return static_cast< RecordingBackendMemory* >( recording_backends_[ names::memory ] )
+    ->drain_device_events( node_id, events );
+}
+
+bool
+IOManager::harvest_memory_device_events( const size_t node_id, RecordedEvents& events, const bool discard )
+{
+  return static_cast< RecordingBackendMemory* >( recording_backends_[ names::memory ] )
+    ->harvest_device_events( node_id, events, discard );
+}
+
 } // namespace nest
@@ -35,6 +35,8 @@
 namespace nest
 {
 
+struct RecordedEvents;
+
 /**
  * Manager to handle everything related to input and output.
  *
@@ -148,6 +150,22 @@ public:
   void get_recording_backend_device_defaults( const Name, DictionaryDatum& );
   void get_recording_backend_device_status( const Name, const RecordingDevice&, DictionaryDatum& );
 
+  /**
+   * Hand over the events recorded by a device to the memory backend and clear them there.
+   *
+   * @see RecordingBackendMemory::drain_device_events()
+   * @returns false if the device does not record to the memory backend.
+   */
+  bool drain_memory_device_events( const size_t node_id, RecordedEvents& events );
+
+  /**
+   * Hand over the events recorded by a device to the memory backend since the previous harvest.
+   *
+   * @see RecordingBackendMemory::harvest_device_events()
+   * @returns false if the device does not record to the memory backend.
+   */
+  bool harvest_memory_device_events( const size_t node_id, RecordedEvents& events, const bool discard );
+
 private:
   void set_data_path_prefix_( const DictionaryDatum& );
 
@@ -116,10 +116,20 @@
  data_path                             stringtype  - A path, where all data is written to, defaults to current
                                                      directory.
  data_prefix                           stringtype  - A common prefix for all data files.
+ log_construction                      booltype    - Whether to log the timing and memory of network construction,
+                                                     defaults to false. Enabling discards previous entries. The log
+                                                     holds at most 10000 entries of each kind and is obtained by
+                                                     GetConstructionLog in PyNEST.
  overwrite_files                       booltype    - Whether to overwrite existing data files, defaults to false.
  print_time                            booltype    - Whether to print progress information during the simulation,
                                                      defaults to false.
+ profile_phases                        booltype    - Whether to record the wall-clock time spent by each thread in
+                                                     the phases of each run, defaults to false. Enabling
+                                                     discards previous recordings.
  recording_backends                    arraytype   - List of available backends for recording devices (read only).
+ trace_phases                          booltype    - Whether to record the individual intervals of each update
+                                                     cycle while profile_phases is true, defaults to false. At most
+                                                     1000000 intervals per thread are recorded.
 
  Network information
  connection_rules                      arraytype   - The list of available connection rules (read only).
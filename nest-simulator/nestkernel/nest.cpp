@@ -23,21 +23,282 @@
 #include "nest.h"
 
 // C++ includes:
+#include <algorithm>
 #include <cassert>
+#include <memory>
+
+// Includes from libnestutil:
+#include "compose.hpp"
+#include "numerics.h"
 
 // Includes from nestkernel:
+#include "checkpoint.h"
 #include "exceptions.h"
 #include "kernel_manager.h"
 #include "mpi_manager_impl.h"
 #include "parameter.h"
 
 // Includes from sli:
+#include "allocator.h"
+#include "booldatum.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
 #include "sliexceptions.h"
 #include "token.h"
 
 namespace nest
 {
 
+namespace
+{
+
+/**
+ * Column of scalar values collected from status dictionaries.
+ *
+ * Keeps track of the types of the values stored, so that the column can be
+ * converted to the narrowest type representing all of them.
+ */
+class ScalarColumn
+{
+public:
+  explicit ScalarColumn( const std::string& key )
+    : key_( key )
+    , name_( key )
+  {
+  }
+
+  /**
+   * Store the value of the column's key in dict, if present.
+   *
+   * @throws BadProperty if the value is not a boolean, integer or double.
+   */
+  void
+  store( const DictionaryDatum& dict, double& value )
+  {
+    const Token& tok = dict->lookup( name_ );
+    if ( tok.empty() )
+    {
+      missing_ = true;
+      return;
+    }
+    found_ = true;
+
+    if ( const auto bd = dynamic_cast< BoolDatum* >( tok.datum() ) )
+    {
+      value = bd->get() ? 1.0 : 0.0;
+    }
+    else if ( const auto id = dynamic_cast< IntegerDatum* >( tok.datum() ) )
+    {
+      value = id->get();
+      all_bool_ = false;
+    }
+    else if ( const auto dd = dynamic_cast< DoubleDatum* >( tok.datum() ) )
+    {
+      value = dd->get();
+      all_bool_ = false;
+      all_integer_ = false;
+    }
+    else
+    {
+      throw BadProperty( "Parameter '" + key_ + "' is not a scalar boolean, integer or double value." );
+    }
+  }
+
+  //! Record that a double value was stored without a status dictionary.
+  void
+  stored_double()
+  {
+    found_ = true;
+    all_bool_ = false;
+    all_integer_ = false;
+  }
+
+  //! Record that an integer value was stored without a status dictionary.
+  void
+  stored_integer()
+  {
+    found_ = true;
+    all_bool_ = false;
+  }
+
+  //! Record that a boolean value was stored without a status dictionary.
+  void
+  stored_bool()
+  {
+    found_ = true;
+  }
+
+  //! Record that a value is missing without looking it up in a status dictionary.
+  void
+  stored_missing()
+  {
+    missing_ = true;
+  }
+
+  //! Combine the value types of a column collected in parallel for the same key.
+  void
+  merge( const ScalarColumn& other )
+  {
+    found_ = found_ or other.found_;
+    missing_ = missing_ or other.missing_;
+    all_integer_ = all_integer_ and other.all_integer_;
+    all_bool_ = all_bool_ and other.all_bool_;
+  }
+
+  const Name&
+  name() const
+  {
+    return name_;
+  }
+
+  /**
+   * Return "bool", "long" or "double" as the type of the column.
+   *
+   * @throws KeyError if the key was not found in any dictionary.
+   */
+  std::string
+  value_type( const std::string& operation ) const
+  {
+    if ( not found_ )
+    {
+      throw KeyError( name_, "status dictionary", operation );
+    }
+    // Missing values are represented by NaN, which requires a floating point type.
+    if ( missing_ or not( all_bool_ or all_integer_ ) )
+    {
+      return "double";
+    }
+    return all_bool_ ? "bool" : "long";
+  }
+
+private:
+  std::string key_;
+  Name name_;
+  bool found_ = false;
+  bool missing_ = false;
+  bool all_integer_ = true;
+  bool all_bool_ = true;
+};
+
+/**
+ * Return true if key is a property that the kernel keeps for all nodes.
+ */
+bool
+is_node_property( const Name& key )
+{
+  return key == names::global_id or key == names::model_id or key == names::vp or key == names::local
+    or key == names::thread or key == names::thread_local_id or key == names::frozen or key == names::node_uses_wfr;
+}
+
+/**
+ * Store the value of a property that the kernel keeps for all local nodes.
+ *
+ * The value is read from the node directly, without building its status
+ * dictionary. For other keys, nothing is stored.
+ *
+ * @returns false if key is not such a property.
+ */
+bool
+store_node_property( const Node& node, ScalarColumn& column, double& value )
+{
+  const Name& key = column.name();
+  if ( key == names::global_id )
+  {
+    value = node.get_node_id();
+  }
+  else if ( key == names::model_id )
+  {
+    value = node.get_model_id();
+  }
+  else if ( key == names::vp )
+  {
+    value = node.get_vp();
+  }
+  else if ( key == names::thread )
+  {
+    value = node.get_thread();
+  }
+  else if ( key == names::thread_local_id )
+  {
+    value = node.get_thread_lid();
+  }
+  else if ( key == names::local )
+  {
+    value = 1.0;
+  }
+  else if ( key == names::frozen )
+  {
+    value = node.is_frozen() ? 1.0 : 0.0;
+  }
+  else if ( key == names::node_uses_wfr )
+  {
+    value = node.node_uses_wfr() ? 1.0 : 0.0;
+  }
+  else
+  {
+    return false;
+  }
+
+  if ( key == names::local or key == names::frozen or key == names::node_uses_wfr )
+  {
+    column.stored_bool();
+  }
+  else
+  {
+    column.stored_integer();
+  }
+  return true;
+}
+
+/**
+ * Store the value of a property of a node on another MPI process.
+ *
+ * Only the node ID, the model and the virtual process of such nodes are
+ * known, all other values are missing.
+ */
+void
+store_remote_node_property( const NodeIDTriple& node_id_triple, ScalarColumn& column, double& value )
+{
+  const Name& key = column.name();
+  if ( key == names::global_id )
+  {
+    value = node_id_triple.node_id;
+    column.stored_integer();
+  }
+  else if ( key == names::model_id )
+  {
+    value = node_id_triple.model_id;
+    column.stored_integer();
+  }
+  else if ( key == names::vp )
+  {
+    value = kernel().vp_manager.node_id_to_vp( node_id_triple.node_id );
+    column.stored_integer();
+  }
+  else if ( key == names::local )
+  {
+    value = 0.0;
+    column.stored_bool();
+  }
+  else
+  {
+    column.stored_missing();
+  }
+}
+
+/**
+ * Reset the number of events of a recording device, on all threads.
+ */
+void
+reset_n_events( const size_t node_id )
+{
+  DictionaryDatum dict( new Dictionary );
+  ( *dict )[ names::n_events ] = 0;
+  set_node_status( node_id, dict );
+}
+
+} // namespace
+
 void
 init_nest( int* argc, char** argv[] )
 {
@@ -123,6 +384,230 @@ get_node_status( const size_t node_id )
   return kernel().node_manager.get_status( node_id );
 }
 
+void
+get_node_status_arrays( const Datum* datum,
+  const std::vector< std::string >& keys,
+  std::vector< double >& values,
+  std::vector< std::string >& value_types )
+{
+  const NodeCollectionDatum node_collection = *dynamic_cast< const NodeCollectionDatum* >( datum );
+  if ( not node_collection->valid() )
+  {
+    throw KernelException(
+      "InvalidNodeCollection: note that ResetKernel invalidates all previously created NodeCollections." );
+  }
+
+  const size_t n = node_collection->size();
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+  values.assign( keys.size() * n, numerics::nan );
+
+  for ( const auto& key : keys )
+  {
+    if ( key == names::model.toString() or key == names::element_type.toString() )
+    {
+      throw BadProperty( "Parameter '" + key + "' is not a scalar boolean, integer or double value." );
+    }
+  }
+
+  // The properties the kernel keeps for all nodes are read directly, the status dictionary is only needed for others.
+  const bool needs_status = std::any_of(
+    keys.begin(), keys.end(), []( const std::string& key ) { return not is_node_property( Name( key ) ); } );
+
+  // Columns and dictionaries are created here, as names and datums must not be created concurrently.
+  std::vector< std::vector< ScalarColumn > > columns(
+    num_threads, std::vector< ScalarColumn >( keys.begin(), keys.end() ) );
+  std::vector< DictionaryDatum > status_dicts;
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    status_dicts.emplace_back( new Dictionary );
+  }
+
+  // Constructing the end iterator is costly for composite NodeCollections, so we do it only once.
+  const auto end_it = node_collection->end();
+
+  // Devices are replicated on all threads, so that all threads must visit all their nodes. Otherwise,
+  // each thread only visits its own nodes.
+  const bool has_proxies = node_collection->has_proxies();
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+  // The statuses of the nodes create datums on all threads.
+  sli::pool::set_concurrent( needs_status );
+
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      const SparseNodeArray& local_nodes = kernel().node_manager.get_local_nodes( tid );
+      DictionaryDatum& status = status_dicts[ tid ];
+      for ( auto it = has_proxies ? node_collection->thread_local_begin() : node_collection->begin(); it < end_it;
+            ++it )
+      {
+        const NodeIDTriple node_id_triple = *it;
+        const Node* node = local_nodes.get_node_by_node_id( node_id_triple.node_id );
+
+        // The status of a device is read from its instance on thread 0, as in get_node_status().
+        if ( not node or ( not node->has_proxies() and tid != 0 ) )
+        {
+          continue;
+        }
+
+        if ( needs_status )
+        {
+          status->clear();
+          node->get_status( status );
+        }
+        for ( size_t k = 0; k < keys.size(); ++k )
+        {
+          double& value = values[ k * n + node_id_triple.nc_index ];
+          if ( not store_node_property( *node, columns[ tid ][ k ], value ) )
+          {
+            columns[ tid ][ k ].store( status, value );
+          }
+        }
+      }
+      status->clear();
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  sli::pool::set_concurrent( false );
+
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+
+  // Nodes on other MPI processes are not visited by the threads of this process.
+  if ( kernel().mpi_manager.get_num_processes() > 1 )
+  {
+    for ( auto it = node_collection->begin(); it < end_it; ++it )
+    {
+      const NodeIDTriple node_id_triple = *it;
+      const size_t vp = kernel().vp_manager.node_id_to_vp( node_id_triple.node_id );
+      const size_t tid = kernel().vp_manager.vp_to_thread( vp );
+      if ( kernel().node_manager.get_local_nodes( tid ).get_node_by_node_id( node_id_triple.node_id ) )
+      {
+        continue;
+      }
+      for ( size_t k = 0; k < keys.size(); ++k )
+      {
+        store_remote_node_property( node_id_triple, columns[ 0 ][ k ], values[ k * n + node_id_triple.nc_index ] );
+      }
+    }
+  }
+
+  value_types.clear();
+  for ( size_t k = 0; k < keys.size(); ++k )
+  {
+    for ( size_t tid = 1; tid < num_threads; ++tid )
+    {
+      columns[ 0 ][ k ].merge( columns[ tid ][ k ] );
+    }
+    value_types.push_back( columns[ 0 ][ k ].value_type( "get_node_status_arrays" ) );
+  }
+}
+
+void
+get_node_collection_layout( const Datum* datum,
+  std::vector< long >& firsts,
+  std::vector< long >& counts,
+  long& step )
+{
+  const NodeCollectionDatum node_collection = *dynamic_cast< const NodeCollectionDatum* >( datum );
+  if ( not node_collection->valid() )
+  {
+    throw KernelException(
+      "InvalidNodeCollection: note that ResetKernel invalidates all previously created NodeCollections." );
+  }
+
+  firsts.clear();
+  counts.clear();
+  step = node_collection->stride();
+
+  if ( node_collection->empty() )
+  {
+    return;
+  }
+
+  if ( node_collection->is_range() )
+  {
+    firsts.push_back( ( *node_collection->begin() ).node_id );
+    counts.push_back( node_collection->size() );
+    return;
+  }
+
+  // Constructing the end iterator is costly for composite NodeCollections, so we do it only once.
+  const auto end_it = node_collection->end();
+  for ( auto it = node_collection->begin(); it < end_it; ++it )
+  {
+    const long node_id = ( *it ).node_id;
+    if ( not firsts.empty() and node_id == firsts.back() + counts.back() * step )
+    {
+      ++counts.back();
+    }
+    else
+    {
+      firsts.push_back( node_id );
+      counts.push_back( 1 );
+    }
+  }
+}
+
+void
+get_node_collection_models( const Datum* datum, std::vector< std::string >& models )
+{
+  const NodeCollectionDatum node_collection = *dynamic_cast< const NodeCollectionDatum* >( datum );
+  if ( not node_collection->valid() )
+  {
+    throw KernelException(
+      "InvalidNodeCollection: note that ResetKernel invalidates all previously created NodeCollections." );
+  }
+
+  models.clear();
+
+  // Constructing the end iterator is costly for composite NodeCollections, so we do it only once.
+  const auto end_it = node_collection->end();
+  std::vector< size_t > model_ids;
+  for ( auto it = node_collection->begin(); it < end_it; ++it )
+  {
+    const size_t model_id = ( *it ).model_id;
+    if ( std::find( model_ids.begin(), model_ids.end(), model_id ) == model_ids.end() )
+    {
+      model_ids.push_back( model_id );
+      models.push_back( kernel().model_manager.get_node_model( model_id )->get_name() );
+    }
+  }
+}
+
+void
+set_node_status_arrays( const Datum* datum,
+  const std::vector< std::string >& keys,
+  const double* values,
+  const size_t n )
+{
+  const NodeCollectionDatum node_collection = *dynamic_cast< const NodeCollectionDatum* >( datum );
+  if ( not node_collection->valid() )
+  {
+    throw KernelException(
+      "InvalidNodeCollection: note that ResetKernel invalidates all previously created NodeCollections." );
+  }
+  if ( n != node_collection->size() )
+  {
+    throw DimensionMismatch( node_collection->size(), n );
+  }
+
+  kernel().node_manager.set_status_arrays( node_collection, keys, values );
+}
+
 void
 set_connection_status( const ConnectionDatum& conn, const DictionaryDatum& dict )
 {
@@ -154,6 +639,197 @@ get_connection_status( const ConnectionDatum& conn )
     conn.get_port() );
 }
 
+void
+get_connection_status_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  const std::vector< std::string >& keys,
+  const std::vector< double* >& values,
+  std::vector< std::string >& value_types )
+{
+  assert( values.size() == keys.size() );
+
+  for ( auto value_ptr : values )
+  {
+    std::fill( value_ptr, value_ptr + n, numerics::nan );
+  }
+  std::vector< ScalarColumn > columns( keys.begin(), keys.end() );
+
+  // Weights and delays are read directly from the connectors and the fields of
+  // the connection IDs are taken from the IDs themselves. Only the remaining
+  // keys require a status dictionary per connection.
+  const std::vector< std::pair< Name, const long* > > id_fields = { { names::source, sources },
+    { names::target, targets },
+    { names::target_thread, threads },
+    { names::synapse_id, synapse_ids },
+    { names::port, ports } };
+  double* weights = nullptr;
+  double* delays = nullptr;
+  std::vector< size_t > weight_delay_keys;
+  std::vector< size_t > dict_keys;
+  for ( size_t k = 0; k < keys.size(); ++k )
+  {
+    const Name name( keys[ k ] );
+    const auto id_field = std::find_if(
+      id_fields.begin(), id_fields.end(), [ &name ]( const auto& field ) { return field.first == name; } );
+    if ( name == names::weight and not weights )
+    {
+      weights = values[ k ];
+      weight_delay_keys.push_back( k );
+    }
+    else if ( name == names::delay and not delays )
+    {
+      delays = values[ k ];
+      weight_delay_keys.push_back( k );
+    }
+    else if ( id_field != id_fields.end() )
+    {
+      std::copy( id_field->second, id_field->second + n, values[ k ] );
+      columns[ k ].stored_integer();
+    }
+    else
+    {
+      dict_keys.push_back( k );
+    }
+  }
+
+  std::vector< char > read( n, false );
+  if ( weights or delays )
+  {
+    kernel().connection_manager.get_synapse_weight_delay_arrays(
+      sources, targets, threads, synapse_ids, ports, n, weights, delays, read );
+    if ( std::find( read.begin(), read.end(), true ) != read.end() )
+    {
+      for ( const size_t k : weight_delay_keys )
+      {
+        columns[ k ].stored_double();
+      }
+    }
+  }
+
+  std::vector< size_t > fallback_keys( dict_keys );
+  fallback_keys.insert( fallback_keys.end(), weight_delay_keys.begin(), weight_delay_keys.end() );
+  const bool needs_status = not dict_keys.empty() or std::find( read.begin(), read.end(), false ) != read.end();
+  if ( needs_status )
+  {
+    // The remaining values are read from the status dictionaries of the
+    // connections, on the threads the connections are stored on.
+    const size_t num_threads = kernel().vp_manager.get_num_threads();
+    const std::vector< std::vector< size_t > > thread_indices =
+      kernel().connection_manager.sort_connection_ids_by_thread( threads, synapse_ids, n );
+
+    // Columns are created here, as names must not be created concurrently.
+    std::vector< std::vector< ScalarColumn > > thread_columns( num_threads, columns );
+
+    // Vector for storing exceptions raised by threads.
+    std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+    // The status dictionaries create datums on all threads.
+    sli::pool::set_concurrent( true );
+
+#pragma omp parallel
+    {
+      const size_t tid = kernel().vp_manager.get_thread_id();
+      try
+      {
+        for ( const size_t i : thread_indices[ tid ] )
+        {
+          if ( read[ i ] and dict_keys.empty() )
+          {
+            continue;
+          }
+          const DictionaryDatum dict = kernel().connection_manager.get_synapse_status(
+            sources[ i ], targets[ i ], threads[ i ], synapse_ids[ i ], ports[ i ] );
+          for ( const size_t k : read[ i ] ? dict_keys : fallback_keys )
+          {
+            thread_columns[ tid ][ k ].store( dict, values[ k ][ i ] );
+          }
+        }
+      }
+      catch ( std::exception& err )
+      {
+        // We must create a new exception here, err's lifetime ends at the end of the catch block.
+        exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+      }
+    }
+    sli::pool::set_concurrent( false );
+
+    for ( size_t tid = 0; tid < num_threads; ++tid )
+    {
+      if ( exceptions_raised.at( tid ).get() )
+      {
+        throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+      }
+    }
+
+    for ( size_t k = 0; k < keys.size(); ++k )
+    {
+      for ( size_t tid = 0; tid < num_threads; ++tid )
+      {
+        columns[ k ].merge( thread_columns[ tid ][ k ] );
+      }
+    }
+  }
+
+  value_types.clear();
+  for ( const auto& column : columns )
+  {
+    value_types.push_back( column.value_type( "get_connection_status_arrays" ) );
+  }
+}
+
+void
+set_connection_status_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  const std::vector< std::string >& keys,
+  const double* values )
+{
+  kernel().connection_manager.set_synapse_status_arrays(
+    sources, targets, threads, synapse_ids, ports, n, keys, values );
+}
+
+void
+drain_recorded_events( const size_t node_id, RecordedEvents& events )
+{
+  if ( node_id == 0 or node_id > kernel().node_manager.size() )
+  {
+    throw UnknownNode( node_id );
+  }
+  if ( not kernel().io_manager.drain_memory_device_events( node_id, events ) )
+  {
+    throw BadProperty(
+      String::compose( "Node with ID %1 is not a recording device with record_to set to 'memory'.", node_id ) );
+  }
+
+  reset_n_events( node_id );
+}
+
+void
+harvest_recorded_events( const size_t node_id, RecordedEvents& events, const bool discard )
+{
+  if ( node_id == 0 or node_id > kernel().node_manager.size() )
+  {
+    throw UnknownNode( node_id );
+  }
+  if ( not kernel().io_manager.harvest_memory_device_events( node_id, events, discard ) )
+  {
+    throw BadProperty(
+      String::compose( "Node with ID %1 is not a recording device with record_to set to 'memory'.", node_id ) );
+  }
+
+  if ( discard )
+  {
+    reset_n_events( node_id );
+  }
+}
+
 NodeCollectionPTR
 create( const Name& model_name, const size_t n_nodes )
 {
@@ -206,6 +882,21 @@ connect_arrays( long* sources,
   kernel().connection_manager.connect_arrays( sources, targets, weights, delays, p_keys, p_values, n, syn_model );
 }
 
+void
+connect_arrays_partitioned( long* sources,
+  long* targets,
+  double* weights,
+  double* delays,
+  std::vector< std::string >& p_keys,
+  double* p_values,
+  size_t n,
+  const std::vector< size_t >& thread_offsets,
+  std::string syn_model )
+{
+  kernel().connection_manager.connect_arrays(
+    sources, targets, weights, delays, p_keys, p_values, n, syn_model, thread_offsets );
+}
+
 ArrayDatum
 get_connections( const DictionaryDatum& dict )
 {
@@ -218,6 +909,120 @@ get_connections( const DictionaryDatum& dict )
   return array;
 }
 
+void
+get_connection_adjacency( const Datum* sources,
+  const Datum* targets,
+  const std::string& synapse_model,
+  const bool by_target,
+  std::vector< long >& offsets,
+  std::vector< long >& indices )
+{
+  const NodeCollectionDatum source_nc = *dynamic_cast< const NodeCollectionDatum* >( sources );
+  const NodeCollectionDatum target_nc = *dynamic_cast< const NodeCollectionDatum* >( targets );
+
+  DictionaryDatum params( new Dictionary );
+  def< NodeCollectionDatum >( params, names::source, source_nc );
+  def< NodeCollectionDatum >( params, names::target, target_nc );
+  if ( not synapse_model.empty() )
+  {
+    def< std::string >( params, names::synapse_model, synapse_model );
+  }
+
+  std::deque< ConnectionID > connectome;
+  kernel().connection_manager.get_connections( connectome, params );
+
+  const NodeCollectionPTR rows = by_target ? target_nc : source_nc;
+
+  // Counting sort of the connections by the index of their row node in the NodeCollection
+  std::vector< size_t > row_indices;
+  row_indices.reserve( connectome.size() );
+  offsets.assign( rows->size() + 1, 0 );
+  for ( const auto& conn : connectome )
+  {
+    const long row = rows->get_nc_index( by_target ? conn.get_target_node_id() : conn.get_source_node_id() );
+    assert( row >= 0 );
+    row_indices.push_back( row );
+    ++offsets[ row + 1 ];
+  }
+
+  for ( size_t i = 1; i < offsets.size(); ++i )
+  {
+    offsets[ i ] += offsets[ i - 1 ];
+  }
+
+  indices.resize( connectome.size() );
+  std::vector< long > next( offsets.begin(), offsets.end() - 1 );
+  for ( size_t c = 0; c < connectome.size(); ++c )
+  {
+    const ConnectionID& conn = connectome[ c ];
+    indices[ next[ row_indices[ c ] ]++ ] = by_target ? conn.get_source_node_id() : conn.get_target_node_id();
+  }
+
+  // The order of connections in the connectome depends on the number of threads, so sort within rows.
+  for ( size_t i = 0; i + 1 < offsets.size(); ++i )
+  {
+    std::sort( indices.begin() + offsets[ i ], indices.begin() + offsets[ i + 1 ] );
+  }
+}
+
+void
+get_connections_chunk( const Datum* sources,
+  const Datum* targets,
+  const std::string& synapse_model,
+  const long synapse_label,
+  const size_t tid,
+  long& syn_id,
+  long& lcid,
+  long& change_count,
+  const size_t max_num_connections,
+  std::vector< long >& source_ids,
+  std::vector< long >& target_ids,
+  std::vector< long >& target_threads,
+  std::vector< long >& synapse_ids,
+  std::vector< long >& ports )
+{
+  if ( change_count >= 0
+    and static_cast< size_t >( change_count ) != kernel().connection_manager.get_connections_change_count() )
+  {
+    throw KernelException(
+      "ConnectionsChanged: connections must not be created or deleted while iterating over them." );
+  }
+
+  DictionaryDatum params( new Dictionary );
+  if ( sources )
+  {
+    def< NodeCollectionDatum >( params, names::source, *dynamic_cast< const NodeCollectionDatum* >( sources ) );
+  }
+  if ( targets )
+  {
+    def< NodeCollectionDatum >( params, names::target, *dynamic_cast< const NodeCollectionDatum* >( targets ) );
+  }
+  if ( not synapse_model.empty() )
+  {
+    def< std::string >( params, names::synapse_model, synapse_model );
+  }
+  def< long >( params, names::synapse_label, synapse_label );
+
+  synindex chunk_syn_id = syn_id;
+  size_t chunk_lcid = lcid;
+  std::deque< ConnectionID > connectome;
+  const bool done = kernel().connection_manager.get_connections_chunk(
+    connectome, params, tid, chunk_syn_id, chunk_lcid, max_num_connections );
+
+  syn_id = done ? -1 : chunk_syn_id;
+  lcid = chunk_lcid;
+  change_count = kernel().connection_manager.get_connections_change_count();
+
+  for ( const auto& conn : connectome )
+  {
+    source_ids.push_back( conn.get_source_node_id() );
+    target_ids.push_back( conn.get_target_node_id() );
+    target_threads.push_back( conn.get_target_thread() );
+    synapse_ids.push_back( conn.get_synapse_model_id() );
+    ports.push_back( conn.get_port() );
+  }
+}
+
 void
 disconnect( const ArrayDatum& conns )
 {
@@ -276,6 +1081,30 @@ cleanup()
   kernel().cleanup();
 }
 
+void
+checkpoint( const std::string& path )
+{
+  write_checkpoint( path );
+}
+
+void
+restore( const std::string& path )
+{
+  read_checkpoint( path );
+}
+
+void
+get_phase_profile( PhaseProfile& profile )
+{
+  kernel().simulation_manager.get_phase_profile( profile );
+}
+
+void
+get_construction_log( DictionaryDatum& log )
+{
+  kernel().connection_manager.get_construction_log().to_dict( log );
+}
+
 void
 copy_model( const Name& oldmodname, const Name& newmodname, const DictionaryDatum& dict )
 {
@@ -42,6 +42,9 @@
 namespace nest
 {
 
+struct PhaseProfile;
+struct RecordedEvents;
+
 void init_nest( int* argc, char** argv[] );
 void fail_exit( int exitcode );
 
@@ -75,9 +78,138 @@ DictionaryDatum get_kernel_status();
 void set_node_status( const size_t node_id, const DictionaryDatum& dict );
 DictionaryDatum get_node_status( const size_t node_id );
 
+/**
+ * @brief Get scalar parameters of all nodes in a NodeCollection as flat arrays
+ *
+ * Collects the values of the parameters named in `keys` for all nodes of the
+ * NodeCollection in a single pass, bypassing the construction of per-node
+ * status dictionaries at the SLI level. On return, `values` has size
+ * `keys.size() * n`, where n is the size of the NodeCollection, and the values
+ * of key k are stored contiguously starting at `values[ k * n ]`.
+ *
+ * Nodes that do not have a given parameter, such as nodes of a different model
+ * in a composite NodeCollection or nodes that are not local to this MPI process,
+ * yield NaN. On return, `value_types[ k ]` is "bool" or "long" if all values of
+ * key k are booleans or integers, respectively, and "double" otherwise.
+ *
+ * @throws KeyError if no node in the NodeCollection has a parameter in `keys`.
+ * @throws BadProperty if a parameter is not a boolean, integer or double.
+ */
+void get_node_status_arrays( const Datum* node_collection,
+  const std::vector< std::string >& keys,
+  std::vector< double >& values,
+  std::vector< std::string >& value_types );
+
+/**
+ * @brief Set scalar parameters of all nodes in a NodeCollection from flat arrays
+ *
+ * The values are laid out as in get_node_status_arrays(), i.e., the values of
+ * key k are stored contiguously starting at `values[ k * n ]`, where n is the
+ * size of the NodeCollection. The parameters are set in a single
+ * thread-parallel pass.
+ *
+ * @throws DimensionMismatch if n is not the size of the NodeCollection.
+ * @see NodeManager::set_status_arrays()
+ */
+void set_node_status_arrays( const Datum* node_collection,
+  const std::vector< std::string >& keys,
+  const double* values,
+  const size_t n );
+
+/**
+ * @brief Get the node IDs of a NodeCollection as arithmetic runs
+ *
+ * On return, the node IDs of the NodeCollection are, in order, the node IDs
+ * `firsts[ k ] + j * step` for `j` from 0 to `counts[ k ] - 1` for all runs k.
+ * Primitive NodeCollections form a single run, composite NodeCollections one
+ * run per part at most.
+ */
+void get_node_collection_layout( const Datum* node_collection,
+  std::vector< long >& firsts,
+  std::vector< long >& counts,
+  long& step );
+
+/**
+ * @brief Get the names of the models of the nodes in a NodeCollection
+ *
+ * Each model is listed once, in the order of its first node. The models are
+ * taken from the NodeCollection, so that they are the same on all MPI
+ * processes, also for nodes that are not local.
+ */
+void get_node_collection_models( const Datum* node_collection, std::vector< std::string >& models );
+
 void set_connection_status( const ConnectionDatum& conn, const DictionaryDatum& dict );
 DictionaryDatum get_connection_status( const ConnectionDatum& conn );
 
+/**
+ * @brief Get scalar parameters of connections as flat arrays
+ *
+ * The connections are given by the fields of their connection IDs, passed as
+ * arrays of length n. For each key k, `values[ k ]` must point to an array of
+ * n doubles, which is filled with the values of parameter `keys[ k ]` for all
+ * connections, in the given order. Connections that do not have the parameter
+ * yield NaN. `value_types` is set as in get_node_status_arrays().
+ *
+ * Weights and delays are read directly from the connectors. All other
+ * parameters are read from the status dictionaries of the connections, which
+ * each thread creates for the connections stored on it.
+ *
+ * @throws KeyError if no connection has a parameter in `keys`.
+ * @throws BadProperty if a parameter is not a boolean, integer or double.
+ */
+void get_connection_status_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  const std::vector< std::string >& keys,
+  const std::vector< double* >& values,
+  std::vector< std::string >& value_types );
+
+/**
+ * @brief Set scalar parameters of connections from flat arrays
+ *
+ * The connections are given as in get_connection_status_arrays(). The values of
+ * parameter `keys[ k ]` for all connections are stored contiguously starting at
+ * `values[ k * n ]`. The parameters are set in a single thread-parallel pass.
+ *
+ * @see ConnectionManager::set_synapse_status_arrays()
+ */
+void set_connection_status_arrays( const long* sources,
+  const long* targets,
+  const long* threads,
+  const long* synapse_ids,
+  const long* ports,
+  const size_t n,
+  const std::vector< std::string >& keys,
+  const double* values );
+
+/**
+ * @brief Hand over the events recorded by a device to the memory backend
+ *
+ * The events of the device on all threads are moved into `events` and
+ * cleared in the backend, and the number of events of the device is reset to
+ * zero, as if `n_events` was set to 0.
+ *
+ * @throws UnknownNode if there is no node with the given ID.
+ * @throws BadProperty if the node is not a device recording to the memory backend.
+ */
+void drain_recorded_events( const size_t node_id, RecordedEvents& events );
+
+/**
+ * @brief Hand over the events recorded by a device since the previous harvest
+ *
+ * Only events not handed over by a previous call are moved into `events`. If
+ * `discard` is true, all events of the device are cleared in the backend and
+ * the number of events of the device is reset to zero, as in
+ * drain_recorded_events().
+ *
+ * @throws UnknownNode if there is no node with the given ID.
+ * @throws BadProperty if the node is not a device recording to the memory backend.
+ */
+void harvest_recorded_events( const size_t node_id, RecordedEvents& events, const bool discard );
+
 NodeCollectionPTR create( const Name& model_name, const size_t n );
 
 NodeCollectionPTR get_nodes( const DictionaryDatum& dict, const bool local_only );
@@ -128,8 +260,88 @@ void connect_arrays( long* sources,
   size_t n,
   std::string syn_model );
 
+/**
+ * @brief Connect arrays of node IDs one-to-one, with connections partitioned by thread
+ *
+ * As connect_arrays(), but the connections are ordered by the local thread
+ * of their targets, and thread t only creates the connections with indices
+ * from `thread_offsets[ t ]` to `thread_offsets[ t + 1 ] - 1`, instead of
+ * every thread considering all connections. The arrays only hold the
+ * connections to targets on this MPI process.
+ *
+ * @throws BadProperty if a target is not local to the thread creating the connection,
+ * or if it is replicated on all threads, as devices are.
+ */
+void connect_arrays_partitioned( long* sources,
+  long* targets,
+  double* weights,
+  double* delays,
+  std::vector< std::string >& p_keys,
+  double* p_values,
+  size_t n,
+  const std::vector< size_t >& thread_offsets,
+  std::string syn_model );
+
 ArrayDatum get_connections( const DictionaryDatum& dict );
 
+/**
+ * @brief Get the connections between two NodeCollections as adjacency in compressed sparse row format
+ *
+ * Connections from nodes in `sources` to nodes in `targets` are selected as by
+ * get_connections(), only connections of the given synapse model are selected
+ * unless `synapse_model` is empty. If `by_target` is false, there is one row
+ * for each node in `sources`, holding the node IDs of the targets of its
+ * connections, otherwise one row for each node in `targets`, holding the node
+ * IDs of the sources. The entries of row i are `indices[ offsets[ i ] ]` to
+ * `indices[ offsets[ i + 1 ] - 1 ]`, one per connection, in ascending order.
+ *
+ * As get_connections(), this function only considers connections on the local
+ * MPI process.
+ */
+void get_connection_adjacency( const Datum* sources,
+  const Datum* targets,
+  const std::string& synapse_model,
+  const bool by_target,
+  std::vector< long >& offsets,
+  std::vector< long >& indices );
+
+/**
+ * @brief Get a chunk of the local connections of one thread as arrays of connection IDs
+ *
+ * Connections from nodes in `sources` to nodes in `targets` are selected as by
+ * get_connections(), where a null pointer selects all nodes, only connections of
+ * the given synapse model are selected unless `synapse_model` is empty, and only
+ * connections with the given label unless `synapse_label` is UNLABELED_CONNECTION.
+ * Starting at the position given by `syn_id` and `lcid`, connections of thread
+ * `tid` are collected until there are at least `max_num_connections`, and their
+ * sources, targets, target threads, synapse model IDs and ports are written into
+ * the respective vectors. On return, `syn_id` and `lcid` point to the first
+ * connection not visited. All connections of the thread have been visited if
+ * `syn_id` is negative.
+ *
+ * The position of a chunk refers to the connections as they were when the
+ * previous chunk was obtained. To detect changes in between, `change_count`
+ * must be negative for the first chunk and is set to the number of changes of
+ * the connections on return. For subsequent chunks, it must be passed on.
+ *
+ * @throws KernelException if connections have been created or deleted, or the
+ * kernel has been reset, since the previous chunk was obtained.
+ */
+void get_connections_chunk( const Datum* sources,
+  const Datum* targets,
+  const std::string& synapse_model,
+  const long synapse_label,
+  const size_t tid,
+  long& syn_id,
+  long& lcid,
+  long& change_count,
+  const size_t max_num_connections,
+  std::vector< long >& source_ids,
+  std::vector< long >& target_ids,
+  std::vector< long >& target_threads,
+  std::vector< long >& synapse_ids,
+  std::vector< long >& ports );
+
 void disconnect( const ArrayDatum& conns );
 
 void simulate( const double& t );
@@ -176,6 +388,41 @@ void prepare();
  */
 void cleanup();
 
+/**
+ * @brief Write the state of the network to a checkpoint in the directory `path`
+ *
+ * @see write_checkpoint()
+ */
+void checkpoint( const std::string& path );
+
+/**
+ * @brief Restore the network from a checkpoint in the directory `path`
+ *
+ * @see read_checkpoint()
+ */
+void restore( const std::string& path );
+
+/**
+ * @brief Get the phase timings recorded by the threads of this MPI process
+ *
+ * Times are only recorded while the kernel property `profile_phases` is
+ * true; enabling it discards previous recordings. Individual intervals are
+ * only recorded while the kernel property `trace_phases` is true as well.
+ *
+ * @see PhaseProfiler
+ */
+void get_phase_profile( PhaseProfile& profile );
+
+/**
+ * @brief Get the log of network construction of this MPI process
+ *
+ * Entries are only recorded while the kernel property `log_construction` is
+ * true; enabling it discards previous entries.
+ *
+ * @see ConstructionLog
+ */
+void get_construction_log( DictionaryDatum& log );
+
 void copy_model( const Name& oldmodname, const Name& newmodname, const DictionaryDatum& dict );
 
 void set_model_defaults( const std::string model_name, const DictionaryDatum& );
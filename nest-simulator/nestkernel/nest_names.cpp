@@ -302,6 +302,7 @@ const Name linear_summation( "linear_summation" );
 const Name local( "local" );
 const Name local_num_threads( "local_num_threads" );
 const Name local_spike_counter( "local_spike_counter" );
+const Name log_construction( "log_construction" );
 const Name lookuptable_0( "lookuptable_0" );
 const Name lookuptable_1( "lookuptable_1" );
 const Name lookuptable_2( "lookuptable_2" );
@@ -401,6 +402,7 @@ const Name precision( "precision" );
 const Name prepared( "prepared" );
 const Name primary( "primary" );
 const Name print_time( "print_time" );
+const Name profile_phases( "profile_phases" );
 const Name proximal_curr( "proximal_curr" );
 const Name proximal_exc( "proximal_exc" );
 const Name proximal_inh( "proximal_inh" );
@@ -636,6 +638,7 @@ const Name time_update_cpu( "time_update_cpu" );
 const Name times( "times" );
 const Name to_do( "to_do" );
 const Name total_num_virtual_procs( "total_num_virtual_procs" );
+const Name trace_phases( "trace_phases" );
 const Name type( "type" );
 const Name type_id( "type_id" );
 
@@ -330,6 +330,7 @@ extern const Name linear_summation;
 extern const Name local;
 extern const Name local_num_threads;
 extern const Name local_spike_counter;
+extern const Name log_construction;
 extern const Name lookuptable_0;
 extern const Name lookuptable_1;
 extern const Name lookuptable_2;
@@ -429,6 +430,7 @@ extern const Name precision;
 extern const Name prepared;
 extern const Name primary;
 extern const Name print_time;
+extern const Name profile_phases;
 extern const Name proximal_curr;
 extern const Name proximal_exc;
 extern const Name proximal_inh;
@@ -664,6 +666,7 @@ extern const Name time_update_cpu;
 extern const Name times;
 extern const Name to_do;
 extern const Name total_num_virtual_procs;
+extern const Name trace_phases;
 extern const Name type;
 extern const Name type_id;
 
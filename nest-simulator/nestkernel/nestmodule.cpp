@@ -1976,66 +1976,120 @@ NestModule::Cvdict_MFunction::execute( SLIInterpreter* i ) const
 }
 
 
-void
-NestModule::SelectNodesByMask_g_a_MFunction::execute( SLIInterpreter* i ) const
+namespace
 {
-  i->assert_stack_load( 3 );
-
-  const NodeCollectionDatum layer_nc = getValue< NodeCollectionDatum >( i->OStack.pick( 2 ) );
-  std::vector< double > anchor = getValue< std::vector< double > >( i->OStack.pick( 1 ) );
-  MaskDatum mask = getValue< MaskDatum >( i->OStack.pick( 0 ) );
-
-  std::vector< size_t > mask_node_ids;
-
-  const int dim = anchor.size();
 
-  if ( dim != 2 and dim != 3 )
+/**
+ * Return the IDs of the nodes of a layer inside the mask placed at each anchor.
+ *
+ * The masked layer, and thus the tree of the node positions, is created once
+ * and used for all anchors.
+ */
+template < int D >
+std::vector< std::vector< size_t > >
+select_nodes_by_mask_( const NodeCollectionDatum& layer_nc,
+  const std::vector< std::vector< double > >& anchors,
+  const MaskDatum& mask )
+{
+  Layer< D >* layer = dynamic_cast< Layer< D >* >( get_layer( layer_nc ).get() );
+  if ( not layer )
   {
-    throw BadProperty( "Center must be 2- or 3-dimensional." );
+    throw TypeMismatch( std::to_string( D ) + "D layer", "other type" );
   }
 
-  AbstractLayerPTR abstract_layer = get_layer( layer_nc );
+  MaskedLayer< D > ml = MaskedLayer< D >( *layer, mask, false, layer_nc );
 
-  if ( dim == 2 )
+  std::vector< std::vector< size_t > > mask_node_ids( anchors.size() );
+  for ( size_t k = 0; k < anchors.size(); ++k )
   {
-    Layer< 2 >* layer = dynamic_cast< Layer< 2 >* >( abstract_layer.get() );
-    if ( not layer )
+    if ( anchors[ k ].size() != D )
     {
-      throw TypeMismatch( "2D layer", "other type" );
+      throw BadProperty( "All anchors must have the same dimension." );
     }
-
-    MaskedLayer< 2 > ml = MaskedLayer< 2 >( *layer, mask, false, layer_nc );
-
-    for ( Ntree< 2, size_t >::masked_iterator it = ml.begin( Position< 2 >( anchor[ 0 ], anchor[ 1 ] ) );
-          it != ml.end();
+    for ( typename Ntree< D, size_t >::masked_iterator it = ml.begin( Position< D >( anchors[ k ] ) ); it != ml.end();
           ++it )
     {
-      mask_node_ids.push_back( it->second );
+      mask_node_ids[ k ].push_back( it->second );
     }
   }
-  else
+  return mask_node_ids;
+}
+
+/**
+ * Return the IDs of the nodes of a layer inside the mask placed at each anchor.
+ *
+ * The dimension of the layer is taken from the first anchor.
+ */
+std::vector< std::vector< size_t > >
+select_nodes_by_mask_( const NodeCollectionDatum& layer_nc,
+  const std::vector< std::vector< double > >& anchors,
+  const MaskDatum& mask )
+{
+  if ( anchors.empty() )
   {
-    Layer< 3 >* layer = dynamic_cast< Layer< 3 >* >( abstract_layer.get() );
-    if ( not layer )
-    {
-      throw TypeMismatch( "3D layer", "other type" );
-    }
+    return std::vector< std::vector< size_t > >();
+  }
 
-    MaskedLayer< 3 > ml = MaskedLayer< 3 >( *layer, mask, false, layer_nc );
+  const int dim = anchors[ 0 ].size();
 
-    for ( Ntree< 3, size_t >::masked_iterator it = ml.begin( Position< 3 >( anchor[ 0 ], anchor[ 1 ], anchor[ 2 ] ) );
-          it != ml.end();
-          ++it )
-    {
-      mask_node_ids.push_back( it->second );
-    }
+  if ( dim != 2 and dim != 3 )
+  {
+    throw BadProperty( "Center must be 2- or 3-dimensional." );
+  }
+
+  if ( dim == 2 )
+  {
+    return select_nodes_by_mask_< 2 >( layer_nc, anchors, mask );
   }
+  return select_nodes_by_mask_< 3 >( layer_nc, anchors, mask );
+}
+
+} // namespace
+
+void
+NestModule::SelectNodesByMask_g_a_MFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 3 );
+
+  const NodeCollectionDatum layer_nc = getValue< NodeCollectionDatum >( i->OStack.pick( 2 ) );
+  std::vector< double > anchor = getValue< std::vector< double > >( i->OStack.pick( 1 ) );
+  MaskDatum mask = getValue< MaskDatum >( i->OStack.pick( 0 ) );
+
+  std::vector< size_t > mask_node_ids = select_nodes_by_mask_( layer_nc, { anchor }, mask )[ 0 ];
 
   i->OStack.pop( 3 );
   i->OStack.push( mask_node_ids );
   i->EStack.pop();
 }
 
+void
+NestModule::SelectNodesByMaskBatch_g_a_MFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 3 );
+
+  const NodeCollectionDatum layer_nc = getValue< NodeCollectionDatum >( i->OStack.pick( 2 ) );
+  const ArrayDatum anchors_datum = getValue< ArrayDatum >( i->OStack.pick( 1 ) );
+  MaskDatum mask = getValue< MaskDatum >( i->OStack.pick( 0 ) );
+
+  std::vector< std::vector< double > > anchors;
+  anchors.reserve( anchors_datum.size() );
+  for ( const Token& anchor : anchors_datum )
+  {
+    anchors.push_back( getValue< std::vector< double > >( anchor ) );
+  }
+
+  ArrayDatum result;
+  result.reserve( anchors.size() );
+  for ( const auto& mask_node_ids : select_nodes_by_mask_( layer_nc, anchors, mask ) )
+  {
+    result.push_back( Token( mask_node_ids ) );
+  }
+
+  i->OStack.pop( 3 );
+  i->OStack.push( result );
+  i->EStack.pop();
+}
+
 
 void
 NestModule::init( SLIInterpreter* i )
@@ -2190,6 +2244,7 @@ NestModule::init( SLIInterpreter* i )
   i->createcommand( "DumpLayerConnections_os_g_g_l", &dumplayerconnections_os_g_g_lfunction );
   i->createcommand( "cvdict_M", &cvdict_Mfunction );
   i->createcommand( "SelectNodesByMask_g_a_M", &selectnodesbymask_g_a_Mfunction );
+  i->createcommand( "SelectNodesByMaskBatch_g_a_M", &selectnodesbymaskbatch_g_a_Mfunction );
 
   Token statusd = i->baselookup( Name( "statusdict" ) );
   DictionaryDatum dd = getValue< DictionaryDatum >( statusd );
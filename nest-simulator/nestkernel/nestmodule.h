@@ -1853,6 +1853,12 @@ public:
     void execute( SLIInterpreter* ) const override;
   } selectnodesbymask_g_a_Mfunction;
 
+  class SelectNodesByMaskBatch_g_a_MFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const override;
+  } selectnodesbymaskbatch_g_a_Mfunction;
+
 private:
   static ParameterFactory& parameter_factory_();
   static MaskFactory& mask_factory_();
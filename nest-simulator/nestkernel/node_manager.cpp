@@ -24,6 +24,7 @@
 
 // C++ includes:
 #include <algorithm>
+#include <map>
 #include <set>
 
 // Includes from libnestutil:
@@ -35,6 +36,7 @@
 #include "model.h"
 #include "model_manager_impl.h"
 #include "node.h"
+#include "scalar_dictionary.h"
 #include "secondary_event_impl.h"
 #include "stopwatch_impl.h"
 #include "vp_manager.h"
@@ -770,6 +772,83 @@ NodeManager::set_status( size_t node_id, const DictionaryDatum& d )
   }
 }
 
+void
+NodeManager::set_status_arrays( NodeCollectionPTR node_collection,
+  const std::vector< std::string >& keys,
+  const double* values )
+{
+  const size_t num_threads = kernel().vp_manager.get_num_threads();
+  const size_t n = node_collection->size();
+  const std::vector< Name > names( keys.begin(), keys.end() );
+
+  // Constructing the end iterator is costly for composite NodeCollections, so we do it only once.
+  const auto end_it = node_collection->end();
+
+  // Create one dictionary per thread and node model. All datums are allocated
+  // here, as the datum pools must not be used concurrently.
+  std::vector< std::map< size_t, ScalarDictionary > > param_dicts( num_threads );
+  for ( auto it = node_collection->begin(); it < end_it; ++it )
+  {
+    const size_t model_id = ( *it ).model_id;
+    if ( param_dicts[ 0 ].find( model_id ) != param_dicts[ 0 ].end() )
+    {
+      continue;
+    }
+
+    Model* model = kernel().model_manager.get_node_model( model_id );
+    const DictionaryDatum model_defaults = model->get_status();
+    for ( size_t tid = 0; tid < num_threads; ++tid )
+    {
+      param_dicts[ tid ].emplace( model_id, ScalarDictionary( names, model_defaults, model->get_name() ) );
+    }
+  }
+
+  // Devices are replicated on all threads, so that all threads must visit all their nodes. Otherwise,
+  // each thread only visits its own nodes.
+  const bool has_proxies = node_collection->has_proxies();
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+
+#pragma omp parallel
+  {
+    const size_t tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      for ( auto it = has_proxies ? node_collection->thread_local_begin() : node_collection->begin(); it < end_it;
+            ++it )
+      {
+        const NodeIDTriple node_id_triple = *it;
+        Node* node = local_nodes_[ tid ].get_node_by_node_id( node_id_triple.node_id );
+        if ( not node )
+        {
+          continue;
+        }
+
+        ScalarDictionary& param_dict = param_dicts[ tid ].at( node_id_triple.model_id );
+        for ( size_t k = 0; k < keys.size(); ++k )
+        {
+          param_dict.set( k, values[ k * n + node_id_triple.nc_index ] );
+        }
+        set_status_single_node_( *node, param_dict.get_dict() );
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  // check if any exceptions have been raised
+  for ( size_t tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+}
+
 void
 NodeManager::get_status( DictionaryDatum& d )
 {
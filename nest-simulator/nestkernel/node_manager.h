@@ -76,6 +76,19 @@ public:
    */
   void set_status( size_t, const DictionaryDatum& );
 
+  /**
+   * Set scalar parameters of all nodes in a NodeCollection in one thread-parallel pass.
+   *
+   * The values of parameter `keys[ k ]` are stored contiguously starting at
+   * `values[ k * n ]`, where n is the size of the NodeCollection. Each thread
+   * sets the parameters of its own nodes, reusing one dictionary per node model
+   * whose datums are changed in place.
+   *
+   * @throws BadParameter if a node model does not have a parameter in `keys` or
+   * an integer or boolean parameter is given a non-integral value.
+   */
+  void set_status_arrays( NodeCollectionPTR, const std::vector< std::string >& keys, const double* values );
+
   /**
    * Add a number of nodes to the network.
    *
@@ -0,0 +1,184 @@
+/*
+ *  phase_profiler.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#include "phase_profiler.h"
+
+namespace nest
+{
+
+PhaseProfiler::PhaseProfiler()
+  : enabled_( false )
+  , tracing_( false )
+  , origin_( std::chrono::steady_clock::now() )
+  , num_runs_( 0 )
+  , run_begin_()
+  , run_end_()
+  , update_cycles_()
+  , update_cycle_runs_()
+  , totals_()
+  , intervals_()
+  , num_dropped_()
+{
+}
+
+void
+PhaseProfiler::initialize( const size_t num_threads )
+{
+  num_runs_ = 0;
+  run_begin_.clear();
+  run_end_.clear();
+  update_cycles_.clear();
+  update_cycle_runs_.clear();
+  totals_.clear();
+  totals_.resize( num_threads );
+  intervals_.clear();
+  intervals_.resize( num_threads );
+  num_dropped_.assign( num_threads, 0 );
+  origin_ = std::chrono::steady_clock::now();
+}
+
+void
+PhaseProfiler::set_enabled( const bool enabled )
+{
+  if ( enabled and not enabled_ )
+  {
+    initialize( intervals_.size() );
+  }
+  enabled_ = enabled;
+}
+
+void
+PhaseProfiler::set_tracing( const bool tracing )
+{
+  tracing_ = tracing;
+}
+
+void
+PhaseProfiler::begin_run()
+{
+  if ( enabled_ )
+  {
+    run_begin_.push_back( now() );
+  }
+}
+
+void
+PhaseProfiler::end_run()
+{
+  // A run that started before profiling was enabled is not counted.
+  if ( enabled_ and run_end_.size() < run_begin_.size() )
+  {
+    run_end_.push_back( now() );
+    ++num_runs_;
+  }
+}
+
+void
+PhaseProfiler::record_update_cycle( const double duration )
+{
+  if ( enabled_ and tracing_ and update_cycles_.size() < max_trace_intervals )
+  {
+    update_cycles_.push_back( duration );
+    update_cycle_runs_.push_back( num_runs_ );
+  }
+}
+
+void
+PhaseProfiler::get_profile( PhaseProfile& profile ) const
+{
+  profile.phase_names = get_phase_names();
+  profile.run_begin = run_begin_;
+  profile.run_end = run_end_;
+  profile.update_cycles = update_cycles_;
+  profile.update_cycle_runs = update_cycle_runs_;
+
+  profile.total_threads.clear();
+  profile.total_phases.clear();
+  profile.total_runs.clear();
+  profile.total_time.clear();
+  profile.total_count.clear();
+
+  const size_t num_phases = static_cast< size_t >( ProfiledPhase::NUM_PHASES );
+  for ( size_t tid = 0; tid < totals_.size(); ++tid )
+  {
+    for ( size_t index = 0; index < totals_[ tid ].size(); ++index )
+    {
+      profile.total_threads.push_back( tid );
+      profile.total_phases.push_back( index % num_phases );
+      profile.total_runs.push_back( index / num_phases );
+      profile.total_time.push_back( totals_[ tid ][ index ].time );
+      profile.total_count.push_back( totals_[ tid ][ index ].count );
+    }
+  }
+
+  profile.num_dropped = 0;
+  for ( const long num_dropped : num_dropped_ )
+  {
+    profile.num_dropped += num_dropped;
+  }
+
+  size_t num_intervals = 0;
+  for ( const auto& thread_intervals : intervals_ )
+  {
+    num_intervals += thread_intervals.size();
+  }
+
+  profile.threads.clear();
+  profile.phases.clear();
+  profile.runs.clear();
+  profile.slices.clear();
+  profile.begin.clear();
+  profile.end.clear();
+  profile.threads.reserve( num_intervals );
+  profile.phases.reserve( num_intervals );
+  profile.runs.reserve( num_intervals );
+  profile.slices.reserve( num_intervals );
+  profile.begin.reserve( num_intervals );
+  profile.end.reserve( num_intervals );
+
+  for ( size_t tid = 0; tid < intervals_.size(); ++tid )
+  {
+    for ( const auto& interval : intervals_[ tid ] )
+    {
+      profile.threads.push_back( tid );
+      profile.phases.push_back( static_cast< long >( interval.phase ) );
+      profile.runs.push_back( interval.run );
+      profile.slices.push_back( interval.slice );
+      profile.begin.push_back( interval.begin );
+      profile.end.push_back( interval.end );
+    }
+  }
+}
+
+std::vector< std::string >
+PhaseProfiler::get_phase_names()
+{
+  return { "deliver_secondary_data",
+    "deliver_spike_data",
+    "update",
+    "synchronize",
+    "gather_spike_data",
+    "gather_secondary_data",
+    "communicate_prepare" };
+}
+
+} // namespace nest
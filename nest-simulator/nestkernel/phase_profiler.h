@@ -0,0 +1,228 @@
+/*
+ *  phase_profiler.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef PHASE_PROFILER_H
+#define PHASE_PROFILER_H
+
+// C++ includes:
+#include <chrono>
+#include <string>
+#include <vector>
+
+namespace nest
+{
+
+/**
+ * Phases of the simulation loop recorded by the PhaseProfiler.
+ *
+ * The order must match the names returned by PhaseProfiler::get_phase_names().
+ */
+enum class ProfiledPhase : long
+{
+  deliver_secondary_data = 0, //!< delivery of secondary events to the nodes of a thread
+  deliver_spike_data,         //!< delivery of spikes to the ring buffers of the nodes of a thread
+  update,                     //!< update of the nodes of a thread
+  synchronize,                //!< waiting for the other threads at the end of the update
+  gather_spike_data,          //!< MPI exchange of spikes (master thread)
+  gather_secondary_data,      //!< MPI exchange of secondary events (master thread)
+  communicate_prepare,        //!< construction of the connection infrastructure of a thread
+  NUM_PHASES
+};
+
+/**
+ * Phase timings handed over by PhaseProfiler::get_profile().
+ *
+ * All times are wall-clock times in seconds since profiling was enabled. The
+ * totals per thread, run and phase and, if phases were traced, the recorded
+ * intervals of all threads are given as columns of equal length.
+ */
+struct PhaseProfile
+{
+  std::vector< std::string > phase_names; //!< names of the phases, indexed by ProfiledPhase
+  std::vector< double > run_begin;        //!< begin of each call to run()
+  std::vector< double > run_end;          //!< end of each call to run()
+  std::vector< long > total_threads;      //!< thread of each total
+  std::vector< long > total_phases;       //!< phase of each total
+  std::vector< long > total_runs;         //!< index of the run of each total
+  std::vector< double > total_time;       //!< time spent in the phase
+  std::vector< long > total_count;        //!< number of intervals in the phase
+  std::vector< double > update_cycles;    //!< duration of each traced update cycle, as for max_update_time
+  std::vector< long > update_cycle_runs;  //!< index of the run of each traced update cycle
+  std::vector< long > threads;            //!< thread of each interval
+  std::vector< long > phases;             //!< phase of each interval
+  std::vector< long > runs;               //!< index of the run during or before which the interval was recorded
+  std::vector< long > slices;             //!< slice during which the interval was recorded
+  std::vector< double > begin;            //!< begin of each interval
+  std::vector< double > end;              //!< end of each interval
+  long num_dropped;                       //!< number of intervals not traced, as the trace was full
+};
+
+/**
+ * Record the wall-clock time spent by each thread in the phases of the simulation loop.
+ *
+ * In contrast to the detailed stopwatches, the profiler is switched on at
+ * runtime and accumulates the times per thread and run, so that load
+ * imbalance between threads can be resolved per run. If tracing is enabled in
+ * addition, the profiler also records the individual intervals of each slice,
+ * at most `max_trace_intervals` per thread, and the duration of each update
+ * cycle. If the profiler is disabled, now() and record() do not access the
+ * clock.
+ *
+ * record() must only be called by thread `tid` for its own intervals, all
+ * other member functions must be called from the master thread.
+ */
+class PhaseProfiler
+{
+public:
+  //! Maximal number of traced intervals per thread and of traced update cycles
+  static constexpr size_t max_trace_intervals = 1000000;
+
+  PhaseProfiler();
+
+  /**
+   * Clear all recordings and prepare recording for the given number of threads.
+   */
+  void initialize( const size_t num_threads );
+
+  /**
+   * Enable or disable recording; enabling clears previous recordings and restarts the clock.
+   */
+  void set_enabled( const bool enabled );
+
+  bool is_enabled() const;
+
+  /**
+   * Enable or disable tracing of individual intervals while the profiler is enabled.
+   */
+  void set_tracing( const bool tracing );
+
+  bool is_tracing() const;
+
+  /**
+   * Return the time since profiling was enabled in seconds, or 0 if profiling is disabled.
+   */
+  double now() const;
+
+  /**
+   * Add the interval of thread `tid` in `phase` from `begin` to now to the totals and the trace.
+   */
+  void record( const size_t tid, const ProfiledPhase phase, const long slice, const double begin );
+
+  void begin_run();
+  void end_run();
+
+  /**
+   * Record the duration of an update cycle as measured by the master thread.
+   */
+  void record_update_cycle( const double duration );
+
+  void get_profile( PhaseProfile& profile ) const;
+
+  static std::vector< std::string > get_phase_names();
+
+private:
+  struct Total
+  {
+    double time;
+    long count;
+  };
+
+  struct Interval
+  {
+    ProfiledPhase phase;
+    long run;
+    long slice;
+    double begin;
+    double end;
+  };
+
+  bool enabled_;
+  bool tracing_;
+  std::chrono::steady_clock::time_point origin_;
+  long num_runs_; //!< number of completed runs since profiling was enabled
+  std::vector< double > run_begin_;
+  std::vector< double > run_end_;
+  std::vector< double > update_cycles_;
+  std::vector< long > update_cycle_runs_;
+  std::vector< std::vector< Total > > totals_;       //!< totals per thread, indexed by run and phase
+  std::vector< std::vector< Interval > > intervals_; //!< traced intervals per thread
+  std::vector< long > num_dropped_;                  //!< intervals per thread not traced as the trace was full
+};
+
+inline bool
+PhaseProfiler::is_enabled() const
+{
+  return enabled_;
+}
+
+inline bool
+PhaseProfiler::is_tracing() const
+{
+  return tracing_;
+}
+
+inline double
+PhaseProfiler::now() const
+{
+  if ( not enabled_ )
+  {
+    return 0.0;
+  }
+  return std::chrono::duration< double >( std::chrono::steady_clock::now() - origin_ ).count();
+}
+
+inline void
+PhaseProfiler::record( const size_t tid, const ProfiledPhase phase, const long slice, const double begin )
+{
+  if ( not enabled_ )
+  {
+    return;
+  }
+
+  const double end = now();
+
+  // Each thread only grows its own totals, as the run only changes outside of parallel regions.
+  std::vector< Total >& totals = totals_[ tid ];
+  const size_t index = num_runs_ * static_cast< size_t >( ProfiledPhase::NUM_PHASES ) + static_cast< size_t >( phase );
+  if ( index >= totals.size() )
+  {
+    totals.resize( ( num_runs_ + 1 ) * static_cast< size_t >( ProfiledPhase::NUM_PHASES ), { 0.0, 0 } );
+  }
+  totals[ index ].time += end - begin;
+  ++totals[ index ].count;
+
+  if ( tracing_ )
+  {
+    if ( intervals_[ tid ].size() < max_trace_intervals )
+    {
+      intervals_[ tid ].push_back( { phase, num_runs_, slice, begin, end } );
+    }
+    else
+    {
+      ++num_dropped_[ tid ];
+    }
+  }
+}
+
+} // namespace nest
+
+#endif /* PHASE_PROFILER_H */
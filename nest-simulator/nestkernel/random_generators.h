@@ -29,6 +29,8 @@
 #include <iterator>
 #include <memory>
 #include <random>
+#include <sstream>
+#include <string>
 #include <type_traits>
 #include <utility>
 
@@ -130,6 +132,18 @@ public:
     NodeCollection::const_iterator last,
     std::back_insert_iterator< std::vector< NodeIDTriple > > dest,
     size_t n ) = 0;
+
+  /**
+   * @brief Return the state of the wrapped RNG engine in its textual representation.
+   */
+  virtual std::string get_state() const = 0;
+
+  /**
+   * @brief Restore the state of the wrapped RNG engine from a string returned by get_state().
+   *
+   * @returns false if the string is not a valid state of the engine.
+   */
+  virtual bool set_state( const std::string& state ) = 0;
 };
 
 /**
@@ -290,6 +304,28 @@ public:
     std::sample( first, last, dest, n, rng_ );
   }
 
+  inline std::string
+  get_state() const override
+  {
+    std::ostringstream state;
+    state << rng_;
+    return state.str();
+  }
+
+  inline bool
+  set_state( const std::string& state ) override
+  {
+    std::istringstream state_stream( state );
+    RandomEngineT rng;
+    state_stream >> rng;
+    if ( state_stream.fail() )
+    {
+      return false;
+    }
+    rng_ = rng;
+    return true;
+  }
+
 private:
   RandomEngineT rng_; //!< Wrapped RNG engine.
   std::uniform_int_distribution< unsigned long > uniform_ulong_dist_;
@@ -176,6 +176,47 @@ nest::RandomManager::set_status( const DictionaryDatum& d )
   }
 }
 
+std::vector< std::string >
+nest::RandomManager::get_rng_states() const
+{
+  std::vector< std::string > states;
+  states.push_back( rank_synced_rng_->get_state() );
+  for ( const auto& rng : vp_synced_rngs_ )
+  {
+    states.push_back( rng->get_state() );
+  }
+  for ( const auto& rng : vp_specific_rngs_ )
+  {
+    states.push_back( rng->get_state() );
+  }
+  return states;
+}
+
+void
+nest::RandomManager::set_rng_states( const std::vector< std::string >& states )
+{
+  if ( states.size() != 1 + vp_synced_rngs_.size() + vp_specific_rngs_.size() )
+  {
+    throw BadProperty( "The number of RNG states does not match the number of random number generators." );
+  }
+
+  auto state = states.begin();
+  bool valid = rank_synced_rng_->set_state( *state++ );
+  for ( auto& rng : vp_synced_rngs_ )
+  {
+    valid = rng->set_state( *state++ ) and valid;
+  }
+  for ( auto& rng : vp_specific_rngs_ )
+  {
+    valid = rng->set_state( *state++ ) and valid;
+  }
+
+  if ( not valid )
+  {
+    throw BadProperty( "Invalid RNG state for RNG type " + current_rng_type_ + "." );
+  }
+}
+
 void
 nest::RandomManager::check_rng_synchrony() const
 {
@@ -100,6 +100,28 @@ public:
    */
   void check_rng_synchrony() const;
 
+  /**
+   * Return name of the RNG type currently used.
+   */
+  const std::string& get_rng_type() const;
+
+  /**
+   * Return states of all random number generators.
+   *
+   * The first state is the one of the rank-synchronized generator, followed
+   * by the states of the VP-synchronized generators and the states of the
+   * VP-specific generators of all threads.
+   */
+  std::vector< std::string > get_rng_states() const;
+
+  /**
+   * Restore states of all random number generators from get_rng_states().
+   *
+   * @throws BadProperty if the number of states does not match the number of
+   * generators or if a state is not valid for the current RNG type.
+   */
+  void set_rng_states( const std::vector< std::string >& states );
+
   /**
    * Register new random number generator type with manager.
    *
@@ -145,6 +167,12 @@ private:
   static const std::uint32_t THREAD_SPECIFIC_SEEDER_;
 };
 
+inline const std::string&
+nest::RandomManager::get_rng_type() const
+{
+  return current_rng_type_;
+}
+
 inline RngPtr
 nest::RandomManager::get_rank_synced_rng() const
 {
@@ -139,6 +139,40 @@ nest::RecordingBackendMemory::get_device_status( const RecordingDevice& device,
   }
 }
 
+bool
+nest::RecordingBackendMemory::drain_device_events( const size_t node_id, RecordedEvents& events )
+{
+  bool found = false;
+  for ( auto& thread_device_data : device_data_ )
+  {
+    const auto device_data = thread_device_data.find( node_id );
+    if ( device_data != thread_device_data.end() )
+    {
+      device_data->second.drain( events );
+      found = true;
+    }
+  }
+
+  return found;
+}
+
+bool
+nest::RecordingBackendMemory::harvest_device_events( const size_t node_id, RecordedEvents& events, const bool discard )
+{
+  bool found = false;
+  for ( auto& thread_device_data : device_data_ )
+  {
+    const auto device_data = thread_device_data.find( node_id );
+    if ( device_data != thread_device_data.end() )
+    {
+      device_data->second.harvest( events, discard );
+      found = true;
+    }
+  }
+
+  return found;
+}
+
 void
 nest::RecordingBackendMemory::post_run_hook()
 {
@@ -169,10 +203,54 @@ nest::RecordingBackendMemory::prepare()
   // nothing to do
 }
 
+nest::RecordedEvents::RecordedEvents()
+  : time_in_steps( false )
+{
+}
+
+namespace
+{
+
+/**
+ * Append the elements of source to destination and release the memory of source.
+ *
+ * If destination is empty, the vectors are swapped without copying any elements.
+ */
+template < typename T >
+void
+move_append( std::vector< T >& destination, std::vector< T >& source )
+{
+  if ( destination.empty() )
+  {
+    destination.swap( source );
+  }
+  else
+  {
+    destination.insert( destination.end(), source.begin(), source.end() );
+  }
+  std::vector< T >().swap( source );
+}
+
+/**
+ * Append the elements of source starting at index first to destination.
+ */
+template < typename T >
+void
+copy_append( std::vector< T >& destination, const std::vector< T >& source, const size_t first )
+{
+  if ( first < source.size() )
+  {
+    destination.insert( destination.end(), source.begin() + first, source.end() );
+  }
+}
+
+} // namespace
+
 /* ******************* Device meta data class DeviceInfo ******************* */
 
 nest::RecordingBackendMemory::DeviceData::DeviceData()
-  : time_in_steps_( false )
+  : n_harvested_( 0 )
+  , time_in_steps_( false )
 {
 }
 
@@ -281,9 +359,89 @@ nest::RecordingBackendMemory::DeviceData::set_status( const DictionaryDatum& d )
   }
 }
 
+void
+nest::RecordingBackendMemory::DeviceData::drain( RecordedEvents& events )
+{
+  prepare_recorded_events( events );
+
+  move_append( events.senders, senders_ );
+  move_append( events.times_ms, times_ms_ );
+  move_append( events.times_steps, times_steps_ );
+  move_append( events.times_offset, times_offset_ );
+
+  for ( size_t i = 0; i < double_values_.size(); ++i )
+  {
+    move_append( events.double_values[ i ], double_values_[ i ] );
+  }
+  for ( size_t i = 0; i < long_values_.size(); ++i )
+  {
+    move_append( events.long_values[ i ], long_values_[ i ] );
+  }
+
+  n_harvested_ = 0;
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::harvest( RecordedEvents& events, const bool discard )
+{
+  if ( discard and n_harvested_ == 0 )
+  {
+    // All events are handed over, so they can be moved instead of copied.
+    drain( events );
+    return;
+  }
+
+  prepare_recorded_events( events );
+
+  copy_append( events.senders, senders_, n_harvested_ );
+  copy_append( events.times_ms, times_ms_, n_harvested_ );
+  copy_append( events.times_steps, times_steps_, n_harvested_ );
+  copy_append( events.times_offset, times_offset_, n_harvested_ );
+
+  for ( size_t i = 0; i < double_values_.size(); ++i )
+  {
+    copy_append( events.double_values[ i ], double_values_[ i ], n_harvested_ );
+  }
+  for ( size_t i = 0; i < long_values_.size(); ++i )
+  {
+    copy_append( events.long_values[ i ], long_values_[ i ], n_harvested_ );
+  }
+
+  if ( discard )
+  {
+    clear();
+  }
+  else
+  {
+    n_harvested_ = senders_.size();
+  }
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::prepare_recorded_events( RecordedEvents& events ) const
+{
+  events.time_in_steps = time_in_steps_;
+
+  events.double_value_names.clear();
+  events.double_values.resize( double_values_.size() );
+  for ( const auto& name : double_value_names_ )
+  {
+    events.double_value_names.push_back( name.toString() );
+  }
+
+  events.long_value_names.clear();
+  events.long_values.resize( long_values_.size() );
+  for ( const auto& name : long_value_names_ )
+  {
+    events.long_value_names.push_back( name.toString() );
+  }
+}
+
 void
 nest::RecordingBackendMemory::DeviceData::clear()
 {
+  n_harvested_ = 0;
+
   senders_.clear();
   times_ms_.clear();
   times_steps_.clear();
@@ -23,6 +23,10 @@
 #ifndef RECORDING_BACKEND_MEMORY_H
 #define RECORDING_BACKEND_MEMORY_H
 
+// C++ includes:
+#include <string>
+#include <vector>
+
 // Includes from nestkernel:
 #include "recording_backend.h"
 
@@ -94,6 +98,24 @@ EndUserDocs */
 namespace nest
 {
 
+/**
+ * Events recorded by a device, as handed over by RecordingBackendMemory::drain_device_events().
+ */
+struct RecordedEvents
+{
+  RecordedEvents();
+
+  std::vector< long > senders;                        //!< sender node IDs of the events
+  std::vector< double > times_ms;                     //!< times of the events in ms, unless time_in_steps
+  std::vector< long > times_steps;                    //!< times of the events in steps, if time_in_steps
+  std::vector< double > times_offset;                 //!< offsets of the events, if time_in_steps
+  std::vector< std::string > double_value_names;      //!< names of the values of type double
+  std::vector< std::vector< double > > double_values; //!< recorded values of type double, one vector per value
+  std::vector< std::string > long_value_names;        //!< names of the values of type long
+  std::vector< std::vector< long > > long_values;     //!< recorded values of type long, one vector per value
+  bool time_in_steps;                                 //!< whether times are given in steps and offsets
+};
+
 /**
  * Memory specialization of the RecordingBackend interface.
  *
@@ -146,6 +168,31 @@ public:
   void get_device_defaults( DictionaryDatum& ) const override;
   void get_device_status( const RecordingDevice& device, DictionaryDatum& ) const override;
 
+  /**
+   * Hand over the events recorded by a device on all threads and clear them in the backend.
+   *
+   * The events of the device on each thread are appended to `events` in the
+   * order of the threads. If `events` is empty, the vectors holding the
+   * events are moved, so that no data is copied if the device only records
+   * on a single thread.
+   *
+   * @returns false if the device does not record to this backend.
+   */
+  bool drain_device_events( const size_t node_id, RecordedEvents& events );
+
+  /**
+   * Hand over the events recorded by a device since the previous harvest.
+   *
+   * Each device keeps a cursor marking the events already harvested, which
+   * is advanced to the end of the recorded events. The events are appended
+   * to `events` as in drain_device_events(). If `discard` is true, all
+   * events of the device are cleared in the backend afterwards, so that the
+   * memory used by the device stays bounded.
+   *
+   * @returns false if the device does not record to this backend.
+   */
+  bool harvest_device_events( const size_t node_id, RecordedEvents& events, const bool discard );
+
 private:
   struct DeviceData
   {
@@ -154,9 +201,13 @@ private:
     void push_back( const Event&, const std::vector< double >&, const std::vector< long >& );
     void get_status( DictionaryDatum& ) const;
     void set_status( const DictionaryDatum& );
+    void drain( RecordedEvents& );
+    void harvest( RecordedEvents&, const bool discard );
 
   private:
     void clear();
+    void prepare_recorded_events( RecordedEvents& ) const;
+    size_t n_harvested_;                                 //!< number of events already handed over by harvest()
     std::vector< long > senders_;                        //!< sender node IDs of the events
     std::vector< double > times_ms_;                     //!< times of registered events in ms
     std::vector< long > times_steps_;                    //!< times of registered events in steps
@@ -0,0 +1,591 @@
+/*
+ *  recording_backend_npy.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+// C++ includes:
+#include <cmath>
+#include <cstdint>
+#include <iomanip>
+#include <map>
+#include <sstream>
+
+// Includes from libnestutil:
+#include "compose.hpp"
+
+// Includes from nestkernel:
+#include "recording_device.h"
+#include "vp_manager_impl.h"
+
+// includes from sli:
+#include "dictutils.h"
+
+#include "recording_backend_npy.h"
+
+namespace
+{
+
+/**
+ * Size of the header of the files, including magic string, version and header length.
+ *
+ * The header is written with a fixed size, so that it can be rewritten in
+ * place when the length of the array changes.
+ */
+const size_t NPY_HEADER_SIZE = 128;
+
+/**
+ * Return the NumPy type description of T, e.g., "<f8" for double on little endian machines.
+ */
+template < typename T >
+std::string npy_descr();
+
+char
+npy_byte_order()
+{
+  const uint16_t probe = 1;
+  return *reinterpret_cast< const char* >( &probe ) == 1 ? '<' : '>';
+}
+
+template <>
+std::string
+npy_descr< double >()
+{
+  static_assert( sizeof( double ) == 8, "The npy recording backend requires 64-bit doubles." );
+  return String::compose( "%1f8", npy_byte_order() );
+}
+
+template <>
+std::string
+npy_descr< long >()
+{
+  static_assert( sizeof( long ) == 8, "The npy recording backend requires 64-bit longs." );
+  return String::compose( "%1i8", npy_byte_order() );
+}
+
+} // namespace
+
+nest::RecordingBackendNPY::RecordingBackendNPY()
+{
+}
+
+nest::RecordingBackendNPY::~RecordingBackendNPY() throw()
+{
+}
+
+void
+nest::RecordingBackendNPY::initialize()
+{
+  data_map tmp( kernel().vp_manager.get_num_threads() );
+  device_data_.swap( tmp );
+}
+
+void
+nest::RecordingBackendNPY::finalize()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendNPY::enroll( const RecordingDevice& device, const DictionaryDatum& params )
+{
+  const size_t t = device.get_thread();
+  const size_t node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data == device_data_[ t ].end() )
+  {
+    std::string vp_node_id_string = compute_vp_node_id_string_( device );
+    std::string modelname = device.get_name();
+    auto p = device_data_[ t ].insert( std::make_pair( node_id, DeviceData( modelname, vp_node_id_string ) ) );
+    device_data = p.first;
+  }
+
+  device_data->second.set_status( params );
+}
+
+void
+nest::RecordingBackendNPY::disenroll( const RecordingDevice& device )
+{
+  const size_t t = device.get_thread();
+  const size_t node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    device_data_[ t ].erase( device_data );
+  }
+}
+
+void
+nest::RecordingBackendNPY::set_value_names( const RecordingDevice& device,
+  const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  const size_t t = device.get_thread();
+  const size_t node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  assert( device_data != device_data_[ t ].end() );
+  device_data->second.set_value_names( double_value_names, long_value_names );
+}
+
+void
+nest::RecordingBackendNPY::pre_run_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendNPY::post_run_hook()
+{
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_data : inner )
+    {
+      device_data.second.flush_files();
+    }
+  }
+}
+
+void
+nest::RecordingBackendNPY::post_step_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendNPY::cleanup()
+{
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_data : inner )
+    {
+      device_data.second.close_files();
+    }
+  }
+}
+
+void
+nest::RecordingBackendNPY::write( const RecordingDevice& device,
+  const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  const size_t t = device.get_thread();
+  const size_t node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data == device_data_[ t ].end() )
+  {
+    return;
+  }
+
+  device_data->second.write( event, double_values, long_values );
+}
+
+const std::string
+nest::RecordingBackendNPY::compute_vp_node_id_string_( const RecordingDevice& device ) const
+{
+  const double num_vps = kernel().vp_manager.get_num_virtual_processes();
+  const double num_nodes = kernel().node_manager.size();
+  const int vp_digits = static_cast< int >( std::floor( std::log10( num_vps ) ) + 1 );
+  const int node_id_digits = static_cast< int >( std::floor( std::log10( num_nodes ) ) + 1 );
+
+  std::ostringstream vp_node_id_string;
+  vp_node_id_string << "-" << std::setfill( '0' ) << std::setw( node_id_digits ) << device.get_node_id() << "-"
+                    << std::setfill( '0' ) << std::setw( vp_digits ) << device.get_vp();
+
+  return vp_node_id_string.str();
+}
+
+void
+nest::RecordingBackendNPY::prepare()
+{
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_info : inner )
+    {
+      device_info.second.open_files();
+    }
+  }
+}
+
+void
+nest::RecordingBackendNPY::set_status( const DictionaryDatum& )
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendNPY::get_status( DictionaryDatum& ) const
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendNPY::check_device_status( const DictionaryDatum& params ) const
+{
+  DeviceData dd( "", "" );
+  dd.set_status( params ); // throws if params contains invalid entries
+}
+
+void
+nest::RecordingBackendNPY::get_device_defaults( DictionaryDatum& params ) const
+{
+  DeviceData dd( "", "" );
+  dd.get_status( params );
+}
+
+void
+nest::RecordingBackendNPY::get_device_status( const nest::RecordingDevice& device, DictionaryDatum& d ) const
+{
+  const size_t t = device.get_thread();
+  const size_t node_id = device.get_node_id();
+
+  data_map::value_type::const_iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    device_data->second.get_status( d );
+  }
+}
+
+/* ******************* Column of values in a NumPy file ******************* */
+
+template < typename T >
+nest::RecordingBackendNPY::Column< T >::Column( const std::string& name )
+  : name_( name )
+  , n_written_( 0 )
+{
+}
+
+template < typename T >
+const std::string&
+nest::RecordingBackendNPY::Column< T >::get_name() const
+{
+  return name_;
+}
+
+template < typename T >
+void
+nest::RecordingBackendNPY::Column< T >::open( const std::string& filename )
+{
+  std::ifstream test( filename.c_str() );
+  if ( test.good() and not kernel().io_manager.overwrite_files() )
+  {
+    std::string msg = String::compose(
+      "The file '%1' already exists and overwriting files is disabled. To overwrite files, set "
+      "the kernel property overwrite_files to true. To change the name or location of the file, "
+      "change the kernel properties data_path or data_prefix, or the device property label.",
+      filename );
+    LOG( M_ERROR, "RecordingBackendNPY::prepare()", msg );
+    throw IOError();
+  }
+  test.close();
+
+  file_ = std::ofstream( filename.c_str(), std::ios::out | std::ios::binary | std::ios::trunc );
+
+  if ( not file_.good() )
+  {
+    std::string msg = String::compose( "I/O error while opening file '%1'.", filename );
+    LOG( M_ERROR, "RecordingBackendNPY::prepare()", msg );
+    throw IOError();
+  }
+
+  buffer_.clear();
+  n_written_ = 0;
+  write_header_();
+}
+
+template < typename T >
+void
+nest::RecordingBackendNPY::Column< T >::push_back( const T value )
+{
+  buffer_.push_back( value );
+}
+
+template < typename T >
+size_t
+nest::RecordingBackendNPY::Column< T >::buffered() const
+{
+  return buffer_.size();
+}
+
+template < typename T >
+void
+nest::RecordingBackendNPY::Column< T >::flush()
+{
+  if ( not file_.is_open() or buffer_.empty() )
+  {
+    return;
+  }
+
+  file_.write( reinterpret_cast< const char* >( buffer_.data() ), buffer_.size() * sizeof( T ) );
+  n_written_ += buffer_.size();
+  buffer_.clear();
+
+  // Update the length of the array in the header, so that the file is valid after each flush.
+  file_.seekp( 0 );
+  write_header_();
+  file_.seekp( 0, std::ios::end );
+  file_.flush();
+}
+
+template < typename T >
+void
+nest::RecordingBackendNPY::Column< T >::close()
+{
+  flush();
+  file_.close();
+}
+
+template < typename T >
+void
+nest::RecordingBackendNPY::Column< T >::write_header_()
+{
+  // Magic string, format version 1.0 and the length of the header dictionary in little endian byte order.
+  const uint16_t dict_size = NPY_HEADER_SIZE - 10;
+  const char preamble[] = {
+    '\x93', 'N', 'U', 'M', 'P', 'Y', 1, 0, static_cast< char >( dict_size & 0xff ), static_cast< char >( dict_size >> 8 )
+  };
+
+  std::string dict = String::compose(
+    "{'descr': '%1', 'fortran_order': False, 'shape': (%2,), }", npy_descr< T >(), n_written_ );
+  assert( dict.size() < dict_size );
+  dict.resize( dict_size - 1, ' ' );
+  dict += '\n';
+
+  file_.write( preamble, sizeof( preamble ) );
+  file_ << dict;
+
+  if ( not file_.good() )
+  {
+    LOG( M_ERROR, "RecordingBackendNPY::write()", "I/O error while writing file." );
+    throw IOError();
+  }
+}
+
+/* ******************* Device meta data class DeviceData ******************* */
+
+nest::RecordingBackendNPY::DeviceData::DeviceData( std::string modelname, std::string vp_node_id_string )
+  : buffer_size_( 4096 )
+  , time_in_steps_( false )
+  , modelname_( modelname )
+  , vp_node_id_string_( vp_node_id_string )
+  , label_( "" )
+  , senders_( names::senders.toString() )
+  , times_ms_( names::times.toString() )
+  , times_steps_( names::times.toString() )
+  , times_offset_( names::offsets.toString() )
+{
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::set_value_names( const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  double_values_.clear();
+  for ( const auto& name : double_value_names )
+  {
+    double_values_.emplace_back( name.toString() );
+  }
+
+  long_values_.clear();
+  for ( const auto& name : long_value_names )
+  {
+    long_values_.emplace_back( name.toString() );
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::flush_files()
+{
+  senders_.flush();
+  times_ms_.flush();
+  times_steps_.flush();
+  times_offset_.flush();
+  for ( auto& column : double_values_ )
+  {
+    column.flush();
+  }
+  for ( auto& column : long_values_ )
+  {
+    column.flush();
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::open_files()
+{
+  senders_.open( compute_filename_( senders_.get_name() ) );
+  if ( time_in_steps_ )
+  {
+    times_steps_.open( compute_filename_( times_steps_.get_name() ) );
+    times_offset_.open( compute_filename_( times_offset_.get_name() ) );
+  }
+  else
+  {
+    times_ms_.open( compute_filename_( times_ms_.get_name() ) );
+  }
+  for ( auto& column : double_values_ )
+  {
+    column.open( compute_filename_( column.get_name() ) );
+  }
+  for ( auto& column : long_values_ )
+  {
+    column.open( compute_filename_( column.get_name() ) );
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::close_files()
+{
+  senders_.close();
+  times_ms_.close();
+  times_steps_.close();
+  times_offset_.close();
+  for ( auto& column : double_values_ )
+  {
+    column.close();
+  }
+  for ( auto& column : long_values_ )
+  {
+    column.close();
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::write( const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  senders_.push_back( event.get_sender_node_id() );
+
+  if ( time_in_steps_ )
+  {
+    times_steps_.push_back( event.get_stamp().get_steps() );
+    times_offset_.push_back( event.get_offset() );
+  }
+  else
+  {
+    times_ms_.push_back( event.get_stamp().get_ms() - event.get_offset() );
+  }
+
+  for ( size_t i = 0; i < double_values.size(); ++i )
+  {
+    double_values_[ i ].push_back( double_values[ i ] );
+  }
+  for ( size_t i = 0; i < long_values.size(); ++i )
+  {
+    long_values_[ i ].push_back( long_values[ i ] );
+  }
+
+  if ( senders_.buffered() >= static_cast< size_t >( buffer_size_ ) )
+  {
+    flush_files();
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::get_status( DictionaryDatum& d ) const
+{
+  ( *d )[ names::buffer_size ] = buffer_size_;
+  ( *d )[ names::time_in_steps ] = time_in_steps_;
+
+  initialize_property_array( d, names::filenames );
+  for ( const auto& column_name : get_column_names_() )
+  {
+    append_property( d, names::filenames, compute_filename_( column_name ) );
+  }
+}
+
+void
+nest::RecordingBackendNPY::DeviceData::set_status( const DictionaryDatum& d )
+{
+  long buffer_size = buffer_size_;
+  if ( updateValue< long >( d, names::buffer_size, buffer_size ) )
+  {
+    if ( buffer_size < 1 )
+    {
+      throw BadProperty( "Property buffer_size must be positive." );
+    }
+
+    buffer_size_ = buffer_size;
+  }
+
+  updateValue< std::string >( d, names::label, label_ );
+
+  bool time_in_steps = false;
+  if ( updateValue< bool >( d, names::time_in_steps, time_in_steps ) )
+  {
+    if ( kernel().simulation_manager.has_been_simulated() )
+    {
+      throw BadProperty( "Property time_in_steps cannot be set after Simulate has been called." );
+    }
+
+    time_in_steps_ = time_in_steps;
+  }
+}
+
+std::string
+nest::RecordingBackendNPY::DeviceData::compute_filename_( const std::string& column_name ) const
+{
+  std::string data_path = kernel().io_manager.get_data_path();
+  if ( not data_path.empty() and not( data_path[ data_path.size() - 1 ] == '/' ) )
+  {
+    data_path += '/';
+  }
+
+  std::string label = label_;
+  if ( label.empty() )
+  {
+    label = modelname_;
+  }
+
+  std::string data_prefix = kernel().io_manager.get_data_prefix();
+
+  return data_path + data_prefix + label + vp_node_id_string_ + "." + column_name + ".npy";
+}
+
+std::vector< std::string >
+nest::RecordingBackendNPY::DeviceData::get_column_names_() const
+{
+  std::vector< std::string > column_names;
+
+  column_names.push_back( senders_.get_name() );
+  if ( time_in_steps_ )
+  {
+    column_names.push_back( times_steps_.get_name() );
+    column_names.push_back( times_offset_.get_name() );
+  }
+  else
+  {
+    column_names.push_back( times_ms_.get_name() );
+  }
+  for ( const auto& column : double_values_ )
+  {
+    column_names.push_back( column.get_name() );
+  }
+  for ( const auto& column : long_values_ )
+  {
+    column_names.push_back( column.get_name() );
+  }
+
+  return column_names;
+}
@@ -0,0 +1,236 @@
+/*
+ *  recording_backend_npy.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef RECORDING_BACKEND_NPY_H
+#define RECORDING_BACKEND_NPY_H
+
+// C++ includes:
+#include <fstream>
+#include <string>
+#include <vector>
+
+#include "recording_backend.h"
+
+/* BeginUserDocs: NOINDEX
+
+Recording backend `npy` - Write data to binary NumPy files
+----------------------------------------------------------
+
+Description
+~~~~~~~~~~~
+
+The `npy` recording backend writes collected data persistently to
+binary files in the `NumPy format
+<https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html>`_.
+Each recorded quantity is written to a separate file holding a
+one-dimensional array, so that large data sets can be loaded lazily
+with ``numpy.load(filename, mmap_mode="r")``, and only the quantities
+of interest need to be read. Compared to the :doc:`ascii recording
+backend </models/recording_backend_ascii>`, no time is spent on
+formatting numbers as text, and the files are considerably smaller.
+
+Like the `ascii` backend, this backend writes separate files for each
+recording device on each virtual process. Filenames of data files are
+determined according to the following pattern:
+
+::
+
+   data_path/data_prefix(label|model_name)-node_id-vp.column.npy
+
+The components of the filename are the same as for the `ascii`
+backend. ``column`` is the name of the quantity stored in the file,
+i.e., ``senders`` and ``times`` for the node IDs of the senders of the
+events and the times of the events, and the names of the recorded
+floating point and integer values, such as ``V_m``.
+
+Recorded events are collected in a buffer of ``buffer_size`` events
+for each device and written to the files in chunks. The life of a file
+starts with the call to ``Prepare`` and ends with the call to
+``Cleanup``. The call to ``Run`` writes all buffered data to the files,
+so it is available for immediate inspection. If a file already exists,
+the call to ``Prepare`` fails with an ``IOError``, unless the kernel
+property ``overwrite_files`` is set to ``True``.
+
+Data format
+~~~~~~~~~~~
+
+The files are written in version 1.0 of the NumPy format. Node IDs of
+senders and other integer values are stored as 64-bit integers, times
+and other floating point values as 64-bit floating point numbers, all
+in the byte order of the machine running the simulation.
+
+If ``time_in_steps`` is *false* (which is the default), ``times``
+holds the simulation time of the events in ms. If ``time_in_steps`` is
+*true*, ``times`` holds the integer simulation time step of the events
+in units of the simulation resolution, and ``offsets`` the negative
+floating point offset in ms from the next integer grid point.
+
+Data written by the `npy` backend can be plotted with the functions
+``from_file()`` of ``nest.raster_plot`` and ``nest.voltage_trace``.
+
+Parameter summary
+~~~~~~~~~~~~~~~~~
+
+buffer_size
+    An integer (default: *4096*) that specifies the number of events
+    collected for each device on each thread before they are written to
+    the files.
+
+filenames
+    A list of the filenames where data is recorded to. This list has one
+    entry per local thread and recorded quantity and is a read-only
+    property. The names of the files for the recorded values are only
+    known after the call to ``Prepare``.
+
+label
+    A string (default: *""*) that replaces the model name component in
+    the filename if it is set.
+
+time_in_steps
+    A Boolean (default: *false*) specifying whether to write time in
+    steps, i.e., in integer multiples of the simulation resolution plus
+    a floating point number for the negative offset from the next grid
+    point in ms, or just the simulation time in ms. This property
+    cannot be set after Simulate has been called.
+
+EndUserDocs */
+
+namespace nest
+{
+
+/**
+ * NumPy specialization of the RecordingBackend interface.
+ *
+ * RecordingBackendNPY maintains a data structure mapping a set of
+ * column files to every recording device instance on every thread.
+ * The layout of the data structure and the life cycle of the files are
+ * the same as in RecordingBackendASCII, but every recorded quantity is
+ * written to a separate file in binary NumPy format.
+ */
+class RecordingBackendNPY : public RecordingBackend
+{
+public:
+  RecordingBackendNPY();
+
+  ~RecordingBackendNPY() throw() override;
+
+  void initialize() override;
+
+  void finalize() override;
+
+  void enroll( const RecordingDevice& device, const DictionaryDatum& params ) override;
+
+  void disenroll( const RecordingDevice& device ) override;
+
+  void set_value_names( const RecordingDevice& device,
+    const std::vector< Name >& double_value_names,
+    const std::vector< Name >& long_value_names ) override;
+
+  void prepare() override;
+
+  void cleanup() override;
+
+  void pre_run_hook() override;
+
+  /**
+   * Write buffered data to files after a single call to Run
+   */
+  void post_run_hook() override;
+
+  void post_step_hook() override;
+
+  void write( const RecordingDevice&, const Event&, const std::vector< double >&, const std::vector< long >& ) override;
+
+  void set_status( const DictionaryDatum& ) override;
+  void get_status( DictionaryDatum& ) const override;
+
+  void check_device_status( const DictionaryDatum& ) const override;
+  void get_device_defaults( DictionaryDatum& ) const override;
+  void get_device_status( const RecordingDevice& device, DictionaryDatum& ) const override;
+
+private:
+  const std::string compute_vp_node_id_string_( const RecordingDevice& device ) const;
+
+  /**
+   * One-dimensional array of values written to a file in NumPy format.
+   *
+   * Values are collected in a buffer and appended to the file by flush(),
+   * which also updates the length of the array in the header of the file.
+   */
+  template < typename T >
+  class Column
+  {
+  public:
+    explicit Column( const std::string& name );
+
+    const std::string& get_name() const;
+    void open( const std::string& filename );
+    void push_back( const T value );
+    size_t buffered() const;
+    void flush();
+    void close();
+
+  private:
+    void write_header_();
+
+    std::string name_;        //!< Name of the recorded quantity
+    std::ofstream file_;      //!< File stream to use for the column
+    std::vector< T > buffer_; //!< Values not yet written to the file
+    size_t n_written_;        //!< Number of values written to the file
+  };
+
+  struct DeviceData
+  {
+    DeviceData() = delete;
+    DeviceData( std::string, std::string );
+    void set_value_names( const std::vector< Name >&, const std::vector< Name >& );
+    void open_files();
+    void write( const Event&, const std::vector< double >&, const std::vector< long >& );
+    void flush_files();
+    void close_files();
+    void get_status( DictionaryDatum& ) const;
+    void set_status( const DictionaryDatum& );
+
+  private:
+    long buffer_size_;                              //!< Number of events to collect before writing to the files
+    bool time_in_steps_;                            //!< Should time be recorded in steps (ms if false)
+    std::string modelname_;                         //!< File name up to but not including the "."
+    std::string vp_node_id_string_;                 //!< The vp and node ID component of the filename
+    std::string label_;                             //!< The label of the device.
+    Column< long > senders_;                        //!< sender node IDs of the events
+    Column< double > times_ms_;                     //!< times of the events in ms, unless time_in_steps_
+    Column< long > times_steps_;                    //!< times of the events in steps, if time_in_steps_
+    Column< double > times_offset_;                 //!< offsets of the events, if time_in_steps_
+    std::vector< Column< double > > double_values_; //!< recorded values of type double, one column per value
+    std::vector< Column< long > > long_values_;     //!< recorded values of type long, one column per value
+
+    std::string compute_filename_( const std::string& column_name ) const; //!< Compose and return a filename
+    std::vector< std::string > get_column_names_() const;                  //!< Names of the columns written to files
+  };
+
+  typedef std::vector< std::map< size_t, DeviceData > > data_map;
+  data_map device_data_;
+};
+
+} // namespace
+
+#endif /* #ifndef RECORDING_BACKEND_NPY_H */
@@ -0,0 +1,113 @@
+/*
+ *  scalar_dictionary.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#include "scalar_dictionary.h"
+
+// C++ includes:
+#include <cmath>
+#include <limits>
+
+// Includes from nestkernel:
+#include "exceptions.h"
+
+// Includes from sli:
+#include "booldatum.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
+
+namespace nest
+{
+
+ScalarDictionary::ScalarDictionary( const std::vector< Name >& names,
+  const DictionaryDatum& defaults,
+  const std::string& model_name )
+  : dict_( new Dictionary )
+  , names_( names )
+{
+  for ( const auto& name : names_ )
+  {
+    const Token& default_value = defaults->lookup( name );
+    if ( default_value.empty() )
+    {
+      throw BadParameter( model_name + " does not have parameter " + name.toString() );
+    }
+
+    if ( dynamic_cast< BoolDatum* >( default_value.datum() ) )
+    {
+      ( *dict_ )[ name ] = Token( new BoolDatum( false ) );
+      kinds_.push_back( ValueKind::BOOL );
+    }
+    else if ( dynamic_cast< IntegerDatum* >( default_value.datum() ) )
+    {
+      ( *dict_ )[ name ] = Token( new IntegerDatum( 0 ) );
+      kinds_.push_back( ValueKind::INTEGER );
+    }
+    else
+    {
+      ( *dict_ )[ name ] = Token( new DoubleDatum( 0.0 ) );
+      kinds_.push_back( ValueKind::DOUBLE );
+    }
+
+    // Assigning the token may copy the datum, so we take the pointer from the dictionary.
+    datums_.push_back( ( *dict_ )[ name ].datum() );
+  }
+}
+
+void
+ScalarDictionary::set( const size_t k, const double value )
+{
+  // Change value of dictionary entry without allocating new datum.
+  if ( kinds_[ k ] == ValueKind::DOUBLE )
+  {
+    *static_cast< DoubleDatum* >( datums_[ k ] ) = value;
+    return;
+  }
+
+  // Casting a value that is not finite or out of the range of long is undefined.
+  constexpr double long_bound = -static_cast< double >( std::numeric_limits< long >::min() );
+  if ( not std::isfinite( value ) or value < -long_bound or value >= long_bound )
+  {
+    throw BadParameter( "Expected integer value for " + names_[ k ].toString() + ", but got " + std::to_string( value )
+      + "." );
+  }
+
+  const auto value_as_long = static_cast< long >( value );
+  if ( value != value_as_long )
+  {
+    throw BadParameter( "Expected integer value for " + names_[ k ].toString() + ", but got double." );
+  }
+
+  if ( kinds_[ k ] == ValueKind::INTEGER )
+  {
+    *static_cast< IntegerDatum* >( datums_[ k ] ) = value_as_long;
+  }
+  else if ( value_as_long == 0 or value_as_long == 1 )
+  {
+    *static_cast< BoolDatum* >( datums_[ k ] ) = BoolDatum( value_as_long == 1 );
+  }
+  else
+  {
+    throw BadParameter( "Expected boolean value for " + names_[ k ].toString() + ", but got integer." );
+  }
+}
+
+} // namespace nest
@@ -0,0 +1,90 @@
+/*
+ *  scalar_dictionary.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef SCALAR_DICTIONARY_H
+#define SCALAR_DICTIONARY_H
+
+// C++ includes:
+#include <string>
+#include <vector>
+
+// Includes from sli:
+#include "datum.h"
+#include "dictdatum.h"
+#include "name.h"
+
+namespace nest
+{
+
+/**
+ * Dictionary of scalar parameters for setting status from arrays of values.
+ *
+ * The type of each parameter, boolean, integer or double, is taken from a
+ * dictionary of defaults. All datums are allocated on construction and
+ * changed in place by set(), so that bulk setters can construct one
+ * ScalarDictionary per thread and model before entering a parallel section,
+ * where the datum pools must not be used.
+ */
+class ScalarDictionary
+{
+public:
+  /**
+   * Create dictionary for parameters `names`, with types given by `defaults`.
+   *
+   * @throws BadParameter if `defaults` does not contain a parameter in `names`.
+   */
+  ScalarDictionary( const std::vector< Name >& names, const DictionaryDatum& defaults, const std::string& model_name );
+
+  /**
+   * Set value of the k-th parameter.
+   *
+   * @throws BadParameter if an integer or boolean parameter is given a
+   * non-integral, non-finite or out of range value or a boolean parameter a
+   * value other than 0 or 1.
+   */
+  void set( const size_t k, const double value );
+
+  const DictionaryDatum& get_dict() const;
+
+private:
+  enum class ValueKind
+  {
+    BOOL,
+    INTEGER,
+    DOUBLE
+  };
+
+  DictionaryDatum dict_;
+  std::vector< Name > names_;
+  std::vector< Datum* > datums_; //!< datums of the parameters in dict_, in the order of names_
+  std::vector< ValueKind > kinds_;
+};
+
+inline const DictionaryDatum&
+ScalarDictionary::get_dict() const
+{
+  return dict_;
+}
+
+} // namespace nest
+
+#endif /* SCALAR_DICTIONARY_H */
@@ -26,6 +26,8 @@
 #include <sys/time.h>
 
 // C++ includes:
+#include <array>
+#include <chrono>
 #include <limits>
 #include <vector>
 
@@ -63,6 +65,7 @@ nest::SimulationManager::SimulationManager()
   , update_time_limit_( std::numeric_limits< double >::infinity() )
   , min_update_time_( std::numeric_limits< double >::infinity() )
   , max_update_time_( -std::numeric_limits< double >::infinity() )
+  , phase_profiler_()
   , eprop_update_interval_( 1000. )
   , eprop_learning_window_( 1000. )
   , eprop_reset_neurons_on_update_( true )
@@ -72,6 +75,13 @@ nest::SimulationManager::SimulationManager()
 void
 nest::SimulationManager::initialize( const bool adjust_number_of_threads_or_rng_only )
 {
+  if ( not adjust_number_of_threads_or_rng_only )
+  {
+    phase_profiler_.set_enabled( false );
+    phase_profiler_.set_tracing( false );
+  }
+  phase_profiler_.initialize( kernel().vp_manager.get_num_threads() );
+
   if ( adjust_number_of_threads_or_rng_only )
   {
     return;
@@ -445,6 +455,18 @@ nest::SimulationManager::set_status( const DictionaryDatum& d )
   }
 
   updateValue< bool >( d, names::eprop_reset_neurons_on_update, eprop_reset_neurons_on_update_ );
+
+  bool profile_phases;
+  if ( updateValue< bool >( d, names::profile_phases, profile_phases ) )
+  {
+    phase_profiler_.set_enabled( profile_phases );
+  }
+
+  bool trace_phases;
+  if ( updateValue< bool >( d, names::trace_phases, trace_phases ) )
+  {
+    phase_profiler_.set_tracing( trace_phases );
+  }
 }
 
 void
@@ -473,6 +495,8 @@ nest::SimulationManager::get_status( DictionaryDatum& d )
   def< double >( d, names::update_time_limit, update_time_limit_ );
   def< double >( d, names::min_update_time, min_update_time_ );
   def< double >( d, names::max_update_time, max_update_time_ );
+  def< bool >( d, names::profile_phases, phase_profiler_.is_enabled() );
+  def< bool >( d, names::trace_phases, phase_profiler_.is_tracing() );
 
   sw_simulate_.get_status( d, names::time_simulate, names::time_simulate_cpu );
   sw_communicate_prepare_.get_status( d, names::time_communicate_prepare, names::time_communicate_prepare_cpu );
@@ -623,6 +647,7 @@ nest::SimulationManager::run( Time const& t )
   kernel().event_delivery_manager.reset_counters();
 
   sw_simulate_.start();
+  phase_profiler_.begin_run();
 
   // from_step_ is not touched here.  If we are at the beginning
   // of a simulation, it has been reset properly elsewhere.  If
@@ -652,6 +677,7 @@ nest::SimulationManager::run( Time const& t )
   kernel().io_manager.post_run_hook();
   kernel().random_manager.check_rng_synchrony();
 
+  phase_profiler_.end_run();
   sw_simulate_.stop();
 }
 
@@ -739,11 +765,23 @@ nest::SimulationManager::update_connection_infrastructure( const size_t tid )
   kernel().get_omp_synchronization_construction_stopwatch().stop();
 
   sw_communicate_prepare_.start();
+  const double t_communicate_prepare = phase_profiler_.now();
+
+  // Wall-clock times of the phases for the construction log
+  using Clock = std::chrono::steady_clock;
+  std::array< double, ConstructionLog::NUM_INFRASTRUCTURE_PHASES > construction_times;
+  Clock::time_point t_begin = Clock::now();
 
   kernel().connection_manager.sort_connections( tid );
+  construction_times[ ConstructionLog::SORT_CONNECTIONS ] =
+    std::chrono::duration< double >( Clock::now() - t_begin ).count();
+
   sw_gather_target_data_.start();
+  t_begin = Clock::now();
   kernel().connection_manager.restructure_connection_tables( tid );
   kernel().connection_manager.collect_compressed_spike_data( tid );
+  construction_times[ ConstructionLog::BUILD_TARGET_TABLES ] =
+    std::chrono::duration< double >( Clock::now() - t_begin ).count();
   sw_gather_target_data_.stop();
 
   kernel().get_omp_synchronization_construction_stopwatch().start();
@@ -781,6 +819,7 @@ nest::SimulationManager::update_connection_infrastructure( const size_t tid )
   }
 
   sw_gather_target_data_.start();
+  t_begin = Clock::now();
 
   // communicate connection information from postsynaptic to
   // presynaptic side
@@ -798,6 +837,9 @@ nest::SimulationManager::update_connection_infrastructure( const size_t tid )
     kernel().event_delivery_manager.gather_target_data( tid );
   }
 
+  construction_times[ ConstructionLog::GATHER_TARGET_DATA ] =
+    std::chrono::duration< double >( Clock::now() - t_begin ).count();
+  kernel().connection_manager.get_construction_log().add_infrastructure_times( tid, construction_times );
   sw_gather_target_data_.stop();
 
   if ( kernel().connection_manager.secondary_connections_exist() )
@@ -814,6 +856,7 @@ nest::SimulationManager::update_connection_infrastructure( const size_t tid )
     kernel().node_manager.set_have_nodes_changed( false );
     kernel().connection_manager.unset_connections_have_changed();
   }
+  phase_profiler_.record( tid, ProfiledPhase::communicate_prepare, slice_, t_communicate_prepare );
   sw_communicate_prepare_.stop();
 }
 
@@ -867,16 +910,20 @@ nest::SimulationManager::update_()
           if ( kernel().connection_manager.secondary_connections_exist() )
           {
             sw_deliver_secondary_data_.start();
+            const double t_deliver = phase_profiler_.now();
             kernel().event_delivery_manager.deliver_secondary_events( tid, false );
+            phase_profiler_.record( tid, ProfiledPhase::deliver_secondary_data, slice_, t_deliver );
             sw_deliver_secondary_data_.stop();
           }
 
           if ( kernel().connection_manager.has_primary_connections() )
           {
             sw_deliver_spike_data_.start();
+            const double t_deliver = phase_profiler_.now();
             // Deliver spikes from receive buffer to ring buffers.
             kernel().event_delivery_manager.deliver_events( tid );
 
+            phase_profiler_.record( tid, ProfiledPhase::deliver_spike_data, slice_, t_deliver );
             sw_deliver_spike_data_.stop();
           }
 
@@ -1039,6 +1086,7 @@ nest::SimulationManager::update_()
         } // of structural plasticity
 
         sw_update_.start();
+        const double t_update = phase_profiler_.now();
         const SparseNodeArray& thread_local_nodes = kernel().node_manager.get_local_nodes( tid );
 
         for ( SparseNodeArray::const_iterator n = thread_local_nodes.begin(); n != thread_local_nodes.end(); ++n )
@@ -1051,11 +1099,14 @@ nest::SimulationManager::update_()
         }
 
         sw_update_.stop();
+        phase_profiler_.record( tid, ProfiledPhase::update, slice_, t_update );
+        const double t_synchronize = phase_profiler_.now();
 
         // parallel section ends, wait until all threads are done -> synchronize
         kernel().get_omp_synchronization_simulation_stopwatch().start();
 #pragma omp barrier
         kernel().get_omp_synchronization_simulation_stopwatch().stop();
+        phase_profiler_.record( tid, ProfiledPhase::synchronize, slice_, t_synchronize );
 
         // the following block is executed by the master thread only
         // the other threads are enforced to wait at the end of the block
@@ -1067,13 +1118,17 @@ nest::SimulationManager::update_()
             if ( kernel().connection_manager.has_primary_connections() )
             {
               sw_gather_spike_data_.start();
+              const double t_gather = phase_profiler_.now();
               kernel().event_delivery_manager.gather_spike_data();
+              phase_profiler_.record( tid, ProfiledPhase::gather_spike_data, slice_, t_gather );
               sw_gather_spike_data_.stop();
             }
             if ( kernel().connection_manager.secondary_connections_exist() )
             {
               sw_gather_secondary_data_.start();
+              const double t_gather = phase_profiler_.now();
               kernel().event_delivery_manager.gather_secondary_events( true );
+              phase_profiler_.record( tid, ProfiledPhase::gather_secondary_data, slice_, t_gather );
               sw_gather_secondary_data_.stop();
             }
           }
@@ -1093,6 +1148,7 @@ nest::SimulationManager::update_()
 
           min_update_time_ = std::min( min_update_time_, update_time );
           max_update_time_ = std::max( max_update_time_, update_time );
+          phase_profiler_.record_update_cycle( update_time );
 
           // If the simulation slowed down excessively, we cannot throw an exception here
           // in the master section, as it will not be caught by our mechanism for handling
@@ -36,6 +36,7 @@
 // Includes from nestkernel:
 #include "nest_time.h"
 #include "nest_types.h"
+#include "phase_profiler.h"
 
 // Includes from sli:
 #include "dictdatum.h"
@@ -185,6 +186,11 @@ public:
    */
   virtual void reset_timers_for_dynamics();
 
+  /**
+   * Copy the phase timings recorded since profile_phases was enabled into `profile`.
+   */
+  void get_phase_profile( PhaseProfile& profile ) const;
+
   Time get_eprop_update_interval() const;
   Time get_eprop_learning_window() const;
   bool get_eprop_reset_neurons_on_update() const;
@@ -238,11 +244,20 @@ private:
   Stopwatch< StopwatchGranularity::Detailed, StopwatchParallelism::Threaded > sw_deliver_spike_data_;
   Stopwatch< StopwatchGranularity::Detailed, StopwatchParallelism::Threaded > sw_deliver_secondary_data_;
 
+  //! per-thread timings of the phases of the simulation loop, enabled by profile_phases
+  PhaseProfiler phase_profiler_;
+
   double eprop_update_interval_;
   double eprop_learning_window_;
   bool eprop_reset_neurons_on_update_;
 };
 
+inline void
+SimulationManager::get_phase_profile( PhaseProfile& profile ) const
+{
+  phase_profiler_.get_profile( profile );
+}
+
 inline Time const&
 SimulationManager::get_slice_origin() const
 {
@@ -25,8 +25,14 @@
 
 #ifdef HAVE_HDF5
 
+// C includes:
+#include <unistd.h>
+
 // C++ includes:
-#include <cstdlib> // for div()
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <future>
 
 // Includes from nestkernel:
 #include "kernel_manager.h"
@@ -44,7 +50,7 @@ namespace nest
 
 SonataConnector::SonataConnector( const DictionaryDatum& graph_specs, const long hyperslab_size )
   : graph_specs_( graph_specs )
-  , hyperslab_size_( hyperslab_size )
+  , hyperslab_size_( hyperslab_size > 0 ? hyperslab_size : 0 )
   , weight_dataset_exist_( false )
   , delay_dataset_exist_( false )
 {
@@ -351,57 +357,148 @@ SonataConnector::sequential_chunkwise_connector_()
 {
   // Retrieve number of connections described by datasets
   const auto num_conn = get_nrows_( tgt_node_id_dset_ );
+  if ( num_conn == 0 )
+  {
+    return;
+  }
+
+  const auto hyperslab_size = get_hyperslab_size_( num_conn );
+  ConstructionLog& construction_log = kernel().connection_manager.get_construction_log();
+
+  // Two blocks alternate: the connections of one block are created while the next block is read in the background
+  std::array< EdgeBlock, 2 > blocks;
+
+  auto wait_begin = std::chrono::steady_clock::now();
+  double read_time = read_block_( blocks[ 0 ], std::min( hyperslab_size, num_conn ), 0 );
+  double wait_time = std::chrono::duration< double >( std::chrono::steady_clock::now() - wait_begin ).count();
 
-  //  Adjust if hyperslab (chunk) size is too large
-  if ( num_conn < hyperslab_size_ )
+  for ( size_t k = 0; blocks[ k % 2 ].offset < num_conn; ++k )
   {
-    hyperslab_size_ = num_conn;
+    const EdgeBlock& block = blocks[ k % 2 ];
+    EdgeBlock& next_block = blocks[ ( k + 1 ) % 2 ];
+    const hsize_t next_offset = block.offset + block.size;
+
+    // The future of std::async waits for the read to finish on destruction, also if connect_block_() throws
+    std::future< double > prefetch;
+    if ( next_offset < num_conn )
+    {
+      prefetch = std::async( std::launch::async,
+        [ this, &next_block, hyperslab_size, next_offset, num_conn ]
+        { return read_block_( next_block, std::min( hyperslab_size, num_conn - next_offset ), next_offset ); } );
+    }
+    else
+    {
+      next_block.offset = num_conn;
+    }
+
+    const auto connect_begin = std::chrono::steady_clock::now();
+    connect_block_( block );
+    wait_begin = std::chrono::steady_clock::now();
+    const double connect_time = std::chrono::duration< double >( wait_begin - connect_begin ).count();
+
+    construction_log.add_io_block( cur_fname_, block.offset, block.size, read_time, wait_time, connect_time );
+
+    // Rethrows exceptions of the background read
+    read_time = prefetch.valid() ? prefetch.get() : 0.0;
+    wait_time = std::chrono::duration< double >( std::chrono::steady_clock::now() - wait_begin ).count();
   }
+}
 
-  // organize chunks; dv.quot = integral quotient, dv.rem = reaminder
-  auto dv = std::div( static_cast< long long >( num_conn ), static_cast< long long >( hyperslab_size_ ) );
+hsize_t
+SonataConnector::get_hyperslab_size_( const hsize_t num_conn ) const
+{
+  if ( hyperslab_size_ > 0 )
+  {
+    return std::min( hyperslab_size_, num_conn );
+  }
 
-  // Iterate chunks
-  hsize_t offset = 0; // start coordinates of data selection
-  for ( long long i = 0; i < dv.quot; i++ )
+  hsize_t row_size = 3 * sizeof( unsigned long );
+  hsize_t chunk_size = std::max( { get_chunk_size_( src_node_id_dset_ ),
+    get_chunk_size_( tgt_node_id_dset_ ),
+    get_chunk_size_( edge_type_id_dset_ ) } );
+  if ( weight_dataset_exist_ )
   {
-    connect_chunk_( hyperslab_size_, offset );
-    offset += hyperslab_size_;
+    row_size += sizeof( double );
+    chunk_size = std::max( chunk_size, get_chunk_size_( syn_weight_dset_ ) );
+  }
+  if ( delay_dataset_exist_ )
+  {
+    row_size += sizeof( double );
+    chunk_size = std::max( chunk_size, get_chunk_size_( delay_dset_ ) );
   }
 
-  // Handle remainder
-  if ( dv.rem > 0 )
+  // Fall back to the default size of SonataNetwork if the available memory cannot be determined
+  hsize_t hyperslab_size = 1 << 20;
+#ifdef _SC_AVPHYS_PAGES
+  const long available_pages = sysconf( _SC_AVPHYS_PAGES );
+  const long page_size = sysconf( _SC_PAGESIZE );
+  if ( available_pages > 0 and page_size > 0 )
   {
-    connect_chunk_( dv.rem, offset );
+    const hsize_t available_memory = static_cast< hsize_t >( available_pages ) * static_cast< hsize_t >( page_size );
+    hyperslab_size = available_memory / ( 8 * 2 * row_size );
   }
+#endif
+
+  // Read whole chunks only, so that no chunk is read and decompressed twice
+  hyperslab_size = std::max( hyperslab_size - hyperslab_size % chunk_size, chunk_size );
+
+  return std::min( hyperslab_size, num_conn );
 }
 
-void
-SonataConnector::connect_chunk_( const hsize_t hyperslab_size, const hsize_t offset )
+hsize_t
+SonataConnector::get_chunk_size_( const H5::DataSet& dataset ) const
+{
+  hsize_t chunk_size = 1;
+  try
+  {
+    H5::DSetCreatPropList plist = dataset.getCreatePlist();
+    if ( plist.getLayout() == H5D_CHUNKED )
+    {
+      plist.getChunk( 1, &chunk_size );
+    }
+    plist.close();
+  }
+  catch ( const H5::Exception& e )
+  {
+    throw KernelException( "Unable to get chunk size of dataset in " + cur_fname_ + ": " + e.getDetailMsg() );
+  }
+  return chunk_size;
+}
+
+double
+SonataConnector::read_block_( EdgeBlock& block, const hsize_t hyperslab_size, const hsize_t offset )
 {
+  const auto begin = std::chrono::steady_clock::now();
+
+  block.offset = offset;
+  block.size = hyperslab_size;
 
   // Read subsets
-  std::vector< unsigned long > src_node_id_data_subset( hyperslab_size );
-  std::vector< unsigned long > tgt_node_id_data_subset( hyperslab_size );
-  std::vector< unsigned long > edge_type_id_data_subset( hyperslab_size );
-  std::vector< double > syn_weight_data_subset;
-  std::vector< double > delay_data_subset;
+  block.src_node_ids.resize( hyperslab_size );
+  block.tgt_node_ids.resize( hyperslab_size );
+  block.edge_type_ids.resize( hyperslab_size );
 
-  read_subset_( src_node_id_dset_, src_node_id_data_subset, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
-  read_subset_( tgt_node_id_dset_, tgt_node_id_data_subset, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
-  read_subset_( edge_type_id_dset_, edge_type_id_data_subset, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
+  read_subset_( src_node_id_dset_, block.src_node_ids, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
+  read_subset_( tgt_node_id_dset_, block.tgt_node_ids, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
+  read_subset_( edge_type_id_dset_, block.edge_type_ids, H5::PredType::NATIVE_LONG, hyperslab_size, offset );
 
   if ( weight_dataset_exist_ )
   {
-    syn_weight_data_subset.resize( hyperslab_size );
-    read_subset_( syn_weight_dset_, syn_weight_data_subset, H5::PredType::NATIVE_DOUBLE, hyperslab_size, offset );
+    block.syn_weights.resize( hyperslab_size );
+    read_subset_( syn_weight_dset_, block.syn_weights, H5::PredType::NATIVE_DOUBLE, hyperslab_size, offset );
   }
   if ( delay_dataset_exist_ )
   {
-    delay_data_subset.resize( hyperslab_size );
-    read_subset_( delay_dset_, delay_data_subset, H5::PredType::NATIVE_DOUBLE, hyperslab_size, offset );
+    block.delays.resize( hyperslab_size );
+    read_subset_( delay_dset_, block.delays, H5::PredType::NATIVE_DOUBLE, hyperslab_size, offset );
   }
 
+  return std::chrono::duration< double >( std::chrono::steady_clock::now() - begin ).count();
+}
+
+void
+SonataConnector::connect_block_( const EdgeBlock& block )
+{
   std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised_( kernel().vp_manager.get_num_threads() );
 
   // Retrieve the correct NodeCollections
@@ -440,15 +537,16 @@ SonataConnector::connect_chunk_( const hsize_t hyperslab_size, const hsize_t off
 #pragma omp parallel
   {
     const auto tid = kernel().vp_manager.get_thread_id();
+    ConstructionLog::ThreadTimer timer( kernel().connection_manager.get_construction_log(), tid );
     RngPtr rng = get_vp_specific_rng( tid );
 
     try
     {
       // Iterate the datasets and create the connections
-      for ( hsize_t i = 0; i < hyperslab_size; ++i )
+      for ( hsize_t i = 0; i < block.size; ++i )
       {
 
-        const auto sonata_tgt_id = tgt_node_id_data_subset[ i ];
+        const auto sonata_tgt_id = block.tgt_node_ids[ i ];
         const size_t tnode_id = ( *( tnode_begin + sonata_tgt_id ) ).node_id;
 
         if ( not kernel().vp_manager.is_node_id_vp_local( tnode_id ) )
@@ -456,17 +554,17 @@ SonataConnector::connect_chunk_( const hsize_t hyperslab_size, const hsize_t off
           continue;
         }
 
-        const auto sonata_src_id = src_node_id_data_subset[ i ];
+        const auto sonata_src_id = block.src_node_ids[ i ];
         const size_t snode_id = ( *( snode_begin + sonata_src_id ) ).node_id;
 
         Node* target = kernel().node_manager.get_node_or_proxy( tnode_id, tid );
         const size_t target_thread = target->get_thread();
 
-        const auto edge_type_id = edge_type_id_data_subset[ i ];
+        const auto edge_type_id = block.edge_type_ids[ i ];
         const auto syn_spec = getValue< DictionaryDatum >( cur_edge_params_->lookup( std::to_string( edge_type_id ) ) );
         const double weight =
-          get_syn_property_( syn_spec, i, weight_dataset_exist_, syn_weight_data_subset, names::weight );
-        const double delay = get_syn_property_( syn_spec, i, delay_dataset_exist_, delay_data_subset, names::delay );
+          get_syn_property_( syn_spec, i, weight_dataset_exist_, block.syn_weights, names::weight );
+        const double delay = get_syn_property_( syn_spec, i, delay_dataset_exist_, block.delays, names::delay );
 
         get_synapse_params_( snode_id, *target, target_thread, rng, edge_type_id );
 
@@ -498,7 +596,7 @@ SonataConnector::connect_chunk_( const hsize_t hyperslab_size, const hsize_t off
     }
   }
 
-} // end create_connections_()
+} // end connect_block_()
 
 hsize_t
 SonataConnector::get_nrows_( H5::DataSet dataset )
@@ -662,7 +760,7 @@ double
 SonataConnector::get_syn_property_( const DictionaryDatum& syn_spec,
   hsize_t index,
   const bool dataset_exists,
-  std::vector< double >& data,
+  const std::vector< double >& data,
   const Name& name )
 {
   if ( dataset_exists )
@@ -56,12 +56,15 @@ namespace nest
  *
  * @note Files representing large-scale networks need to be read in chunks due
  * to memory constraints; we implement this using HDF5 hyperslabs of
- * configurable size. HDF5 files can only read with concurrency in an MPI
- * parallel context. Although the HDF5 library can be compiled with
- * thread-safety, it is not thread-efficient as the usage of locks effectively
- * serialize function calls. Since HDF5 does not provide support for
+ * configurable size. If no size is given, it is derived from the available
+ * memory and the chunking of the datasets. HDF5 files can only read with
+ * concurrency in an MPI parallel context. Although the HDF5 library can be
+ * compiled with thread-safety, it is not thread-efficient as the usage of locks
+ * effectively serialize function calls. Since HDF5 does not provide support for
  * thread-parallel reading, only one thread per MPI process reads connectivity
- * data, before all threads create connections in parallel.
+ * data. This thread reads the next block of edges in the background while all
+ * threads create the connections of the current block in parallel. No other
+ * thread calls the HDF5 library during a background read.
  */
 class SonataConnector
 {
@@ -71,6 +74,7 @@ public:
    *
    * @param graph_specs Specification dictionary, see PyNEST `SonataNetwork._create_graph_specs` for details.
    * @param hyperslab_size Size of the hyperslab to read in one read operation, applies to all HDF5 datasets.
+   * If not positive, the size is chosen adaptively for each edge population, see get_hyperslab_size_().
    */
   SonataConnector( const DictionaryDatum& graph_specs, const long hyperslab_size );
 
@@ -197,20 +201,63 @@ private:
   double get_syn_property_( const DictionaryDatum& syn_spec,
     hsize_t index,
     const bool dataset_exists,
-    std::vector< double >& data,
+    const std::vector< double >& data,
     const Name& name );
 
+  //! Edge data of one hyperslab of the datasets
+  struct EdgeBlock
+  {
+    hsize_t offset;
+    hsize_t size;
+    std::vector< unsigned long > src_node_ids;
+    std::vector< unsigned long > tgt_node_ids;
+    std::vector< unsigned long > edge_type_ids;
+    std::vector< double > syn_weights;
+    std::vector< double > delays;
+  };
+
   /**
    * @brief Manage the sequential chunkwise connections to be created.
+   *
+   * Reads the datasets in blocks of hyperslabs. While the connections of one
+   * block are created, the next block is read by a background thread. The
+   * times of reading, waiting for and connecting each block are added to the
+   * construction log.
    */
   void sequential_chunkwise_connector_();
 
   /**
-   * @brief Create connections in chunks.
+   * @brief Choose the size of the hyperslabs for the current datasets.
+   *
+   * Returns the size given to the constructor if it is positive. Otherwise,
+   * the two blocks in memory at the same time may take up to an eighth of
+   * the available memory, rounded down to a multiple of the largest chunk
+   * size of the datasets.
+   *
+   * @param num_conn Number of rows of the datasets.
+   * @return Size of hyperslab, at most num_conn.
+   */
+  hsize_t get_hyperslab_size_( const hsize_t num_conn ) const;
+
+  /**
+   * @brief Get the number of rows of a chunk of a dataset, 1 if the dataset is not chunked.
+   */
+  hsize_t get_chunk_size_( const H5::DataSet& dataset ) const;
+
+  /**
+   * @brief Read a block of edges from the datasets.
+   * @param block Block to store the edge data in
    * @param hyperslab_size Size of hyperslab (chunk) to be read from datasets
    * @param offset Offset from start coordinate of data selection
+   * @return Wall-clock time of reading in seconds.
+   */
+  double read_block_( EdgeBlock& block, const hsize_t hyperslab_size, const hsize_t offset );
+
+  /**
+   * @brief Create the connections of a block of edges in parallel.
+   * @param block Edge data read by read_block_()
    */
-  void connect_chunk_( const hsize_t hyperslab_size, const hsize_t offset );
+  void connect_block_( const EdgeBlock& block );
 
   /**
    * @brief Read subset of dataset into memory.
@@ -270,6 +317,7 @@ private:
   DictionaryDatum graph_specs_;
 
   //! Size of hyperslab that is read into memory in one read operation. Applies to all relevant HDF5 datasets.
+  //! Zero if the size is chosen adaptively.
   hsize_t hyperslab_size_;
 
   //! Indicates whether weights are given as HDF5 dataset
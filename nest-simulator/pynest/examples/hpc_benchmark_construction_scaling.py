@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# hpc_benchmark_construction_scaling.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+r"""
+Scaling of network construction in the HPC benchmark
+----------------------------------------------------
+
+This script measures how the construction of the network of the
+:doc:`hpc_benchmark` scales with the number of threads. It builds the network
+with ``build_network()`` of the HPC benchmark for each number of threads,
+followed by :py:func:`.Prepare`, which sorts the connections, builds the
+target tables and gathers the target data.
+
+* For *strong scaling*, the size of the network is fixed, and the time should
+  ideally decrease in proportion to the number of threads.
+* For *weak scaling*, the size of the network grows in proportion to the
+  number of threads, and the time should ideally stay constant.
+
+The times are taken from :py:func:`.GetConstructionLog`, which, with the
+kernel attribute ``log_construction`` enabled, holds for each call to
+:py:func:`.Connect` the wall-clock time of the call, the time each thread
+spent in the connection rule and the number of connections each thread
+created, and for each update of the connection infrastructure the time each
+thread spent in its phases. The difference
+between the time of a call and the time of its slowest thread is spent
+outside of the parallel sections, e.g., in drawing the numbers of connections
+per thread on the master thread.
+
+The script reports, per number of threads,
+
+* ``connect``: total time of all calls to :py:func:`.Connect`,
+* ``serial``: part of ``connect`` spent outside of the parallel sections,
+* ``imbalance``: ratio of the slowest to the average thread in the connection
+  rules,
+* ``sort``, ``tables`` and ``gather``: time of the slowest thread for sorting
+  connections, building target tables and gathering target data in
+  :py:func:`.Prepare`,
+* ``efficiency``: parallel efficiency of the total construction time,
+* ``memory``: growth of the resident memory of the process during the calls
+  to :py:func:`.Connect` in MB.
+
+The default scale of the network is small, so that the script finishes within
+minutes. Use a scale of 1 or more and thread counts up to the number of cores
+of a compute node for meaningful results.
+"""
+
+import time
+
+import hpc_benchmark
+import nest
+
+###############################################################################
+# Parameter section
+# Define all relevant parameters: changes should be made here
+
+scaling_params = {
+    "threads": [1, 2, 4],  # numbers of threads to measure
+    "scale": 0.02,  # network size for strong scaling and per thread for weak scaling
+}
+
+
+class ConstructionLogger:
+    """Logger collecting the messages of ``hpc_benchmark.build_network``"""
+
+    def __init__(self):
+        self.lines = []
+
+    def log(self, value):
+        self.lines.append(value)
+
+
+def construct(num_threads, scale):
+    """Build the HPC benchmark network and return the construction times
+
+    Returns a dictionary with the times in seconds and the memory growth in MB.
+    """
+
+    hpc_benchmark.params["num_threads"] = num_threads
+    hpc_benchmark.params["scale"] = scale
+    hpc_benchmark.params["record_spikes"] = False
+    hpc_benchmark.brunel_params["NE"] = int(9000 * scale)
+    hpc_benchmark.brunel_params["NI"] = int(2250 * scale)
+
+    nest.ResetKernel()
+    nest.set_verbosity("M_WARNING")
+    nest.log_construction = True
+
+    tic = time.time()
+    hpc_benchmark.build_network(ConstructionLogger())
+    nest.Prepare()
+    nest.Cleanup()
+    total = time.time() - tic
+
+    log = nest.GetConstructionLog()
+    thread_times = [max(times) for times in log["thread_times"]]
+    mean_thread_times = [sum(times) / len(times) for times in log["thread_times"]]
+    prepare = log["connection_infrastructure"]
+
+    return {
+        "total": total,
+        "connect": sum(log["time"]),
+        "serial": sum(log["time"]) - sum(thread_times),
+        "imbalance": sum(thread_times) / sum(mean_thread_times) if sum(mean_thread_times) else 1.0,
+        "sort": sum(max(times) for times in prepare["time_sort_connections"]),
+        "tables": sum(max(times) for times in prepare["time_build_target_tables"]),
+        "gather": sum(max(times) for times in prepare["time_gather_target_data"]),
+        "memory": sum(log["memory"]) / 2**20,
+    }
+
+
+def report(title, results, weak):
+    """Print the construction times with the parallel efficiency relative to the first number of threads"""
+
+    print(f"\n{title}")
+    header = ["threads", "connect", "serial", "imbalance", "sort", "tables", "gather", "efficiency", "memory"]
+    print("".join(f"{name:>11}" for name in header))
+
+    reference_threads, reference = results[0]
+    for num_threads, times in results:
+        speedup = reference["total"] / times["total"]
+        efficiency = speedup if weak else speedup * reference_threads / num_threads
+        values = [times[key] for key in ["connect", "serial", "imbalance", "sort", "tables", "gather"]]
+        print(
+            f"{num_threads:>11}"
+            + "".join(f"{value:>11.3f}" for value in values)
+            + f"{efficiency:>11.2f}{times['memory']:>11.1f}"
+        )
+
+
+###############################################################################
+# Only numbers of threads supported by this NEST installation are measured.
+
+threads = scaling_params["threads"] if nest.ll_api.sli_func("is_threaded") else [1]
+
+strong = [(n, construct(n, scaling_params["scale"])) for n in threads]
+report("Strong scaling of network construction", strong, weak=False)
+
+weak = [(n, construct(n, scaling_params["scale"] * n)) for n in threads]
+report("Weak scaling of network construction", weak, weak=True)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# sli_call_overhead.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+r"""
+Overhead of frequently used PyNEST calls
+----------------------------------------
+
+This script measures the time per call of PyNEST functions that are often
+called many times in a loop on small objects, so that their time is dominated
+by the overhead of passing through the SLI interpreter rather than by the
+work done in the kernel:
+
+* ``get``: reading a parameter of a single node,
+* ``set``: setting a parameter of a single node,
+* ``Connect``: connecting a single pair of nodes,
+* ``GetConnections``: obtaining the connections between two nodes,
+* ``len``: the number of nodes in a `NodeCollection`.
+
+Each call is timed with and without the cache of parsed SLI procedures of the
+low-level API, which spares the interpreter from parsing the same command
+text on every call. The script reports the time per call in microseconds for
+both and the speedup due to the cache.
+
+The timings depend on the machine and on the build of NEST, so that they are
+only meaningful in comparison, e.g., before and after a change to the
+low-level API.
+"""
+
+import time
+
+import nest
+from nest.ll_api import engine
+
+###############################################################################
+# Parameter section
+# Define all relevant parameters: changes should be made here
+
+overhead_params = {
+    "n_calls": 2000,  # number of timed calls of each function
+    "n_nodes": 10,  # number of nodes in the network
+}
+
+###############################################################################
+# The functions to time. Each takes the nodes of the network and makes a
+# single call.
+
+calls = {
+    "get": lambda nodes: nodes[3].get("V_m"),
+    "set": lambda nodes: nodes[3].set(V_m=-60.0),
+    "Connect": lambda nodes: nest.Connect(nodes[0], nodes[1], "one_to_one"),
+    "GetConnections": lambda nodes: nest.GetConnections(nodes[2], nodes[3]),
+    "len": lambda nodes: len(nodes),
+}
+
+
+def build_network():
+    """Create a small network, in which all nodes are connected to each other."""
+
+    nest.ResetKernel()
+    nest.set_verbosity("M_WARNING")
+    nodes = nest.Create("iaf_psc_alpha", overhead_params["n_nodes"])
+    nest.Connect(nodes, nodes, "all_to_all")
+    return nodes
+
+
+def time_per_call(call, cached):
+    """Return the time per call of the given function in seconds.
+
+    The network is built anew, so that all measurements start from the same
+    state. The first call is not timed, it fills the cache if enabled.
+    """
+
+    engine.clear_procedure_cache()
+    engine.max_cached_procedures = max_cached_procedures if cached else 0
+
+    nodes = build_network()
+    calls[call](nodes)
+
+    n_calls = overhead_params["n_calls"]
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        calls[call](nodes)
+    return (time.perf_counter() - start) / n_calls
+
+
+###############################################################################
+# Time all calls and report the results. The size of the cache is restored
+# afterwards.
+
+max_cached_procedures = engine.max_cached_procedures
+
+print(f"{'call':>16} {'cached [us]':>12} {'uncached [us]':>14} {'speedup':>8}")
+try:
+    for call in calls:
+        cached_time = time_per_call(call, cached=True)
+        uncached_time = time_per_call(call, cached=False)
+        speedup = uncached_time / cached_time
+        print(f"{call:>16} {cached_time * 1e6:12.1f} {uncached_time * 1e6:14.1f} {speedup:8.2f}")
+finally:
+    engine.max_cached_procedures = max_cached_procedures
+    engine.clear_procedure_cache()
@@ -42,7 +42,10 @@ the same network using the stored weights.
    clear to all which aspects of a network are carried from one simulation
    to another and thus contributes to good scientific practice.
 
-   Storing and restoring is currently not supported for MPI-parallel simulations.
+   The approach shown here is not supported for MPI-parallel simulations.
+   To store the scalar state of all nodes and connections, including MPI-parallel
+   simulations, use ``nest.Checkpoint()`` and ``nest.Restore()``, which write
+   and read one binary file per MPI process.
 
 """
 
@@ -326,6 +326,33 @@ class NestModule(types.ModuleType):
         "Whether to print progress information during the simulation",
         default=False,
     )
+    log_construction = KernelAttribute(
+        "bool",
+        (
+            "Whether to log the wall-clock time and memory of network construction."
+            + " Enabling discards previous entries. See :py:func:`.GetConstructionLog`"
+            + " to obtain the log"
+        ),
+        default=False,
+    )
+    profile_phases = KernelAttribute(
+        "bool",
+        (
+            "Whether to record the wall-clock time spent by each thread in the phases"
+            + " of each run. Enabling discards previous recordings. See"
+            + " :py:func:`.profile` to obtain the recordings"
+        ),
+        default=False,
+    )
+    trace_phases = KernelAttribute(
+        "bool",
+        (
+            "Whether to record the individual intervals of each update cycle while"
+            + " `profile_phases` is enabled. At most one million intervals are"
+            + " recorded per thread"
+        ),
+        default=False,
+    )
     network_size = KernelAttribute("int", "The number of nodes in the network", readonly=True)
     num_connections = KernelAttribute(
         "int",
@@ -23,10 +23,23 @@
 Functions for connection handling
 """
 
+import json
+import numbers
+import os
+
 import numpy
 
 from .. import pynestkernel as kernel
-from ..ll_api import check_stack, connect_arrays, spp, sps, sr
+from ..ll_api import (
+    check_stack,
+    connect_arrays,
+    connect_arrays_partitioned,
+    connections_chunk,
+    construction_log,
+    spp,
+    sps,
+    sr,
+)
 from .hl_api_connection_helpers import (
     _connect_layers_needed,
     _connect_spatial,
@@ -35,16 +48,30 @@ from .hl_api_connection_helpers import (
     _process_spatial_projections,
     _process_syn_spec,
 )
-from .hl_api_helper import is_string
+from .hl_api_helper import (
+    get_connection_parameters_array,
+    is_iterable,
+    is_literal,
+    is_string,
+)
+from .hl_api_parallel_computing import NumProcesses, Rank
+from .hl_api_simulation import GetKernelStatus
 from .hl_api_types import CollocatedSynapses, NodeCollection, SynapseCollection
 
 __all__ = [
     "Connect",
+    "ConnectEdgeShards",
     "TripartiteConnect",
     "Disconnect",
     "GetConnections",
+    "GetConstructionLog",
+    "IterConnections",
+    "WriteEdgeShards",
 ]
 
+_EDGE_SHARDS_METADATA = "metadata.json"
+_EDGE_SHARDS_OFFSETS = "offsets.npy"
+
 
 @check_stack
 def GetConnections(source=None, target=None, synapse_model=None, synapse_label=None):
@@ -103,7 +130,7 @@ def GetConnections(source=None, target=None, synapse_model=None, synapse_label=N
         params["synapse_label"] = synapse_label
 
     sps(params)
-    sr("GetConnections")
+    sr("GetConnections", cached=True)
 
     conns = spp()
 
@@ -113,6 +140,98 @@ def GetConnections(source=None, target=None, synapse_model=None, synapse_label=N
     return conns
 
 
+def IterConnections(source=None, target=None, synapse_model=None, synapse_label=None, keys=None, chunk_size=100000):
+    """Iterate over connections in chunks of NumPy arrays of their parameters.
+
+    Connections are selected as by :py:func:`.GetConnections`, but instead of
+    collecting all connections at once, they are extracted chunk by chunk,
+    thread by thread. Only one chunk is held in memory at a time, so that
+    statistics like weight histograms or in-degrees can be accumulated over
+    the chunks of networks whose connections would not fit into memory as a
+    whole, and each chunk can be processed before the next one is extracted.
+
+    Parameters
+    ----------
+    source : NodeCollection, optional
+        Only connections from these pre-synaptic nodes are returned
+    target : NodeCollection, optional
+        Only connections to these postsynaptic nodes are returned
+    synapse_model : str, optional
+        Only connections with this synapse type are returned
+    synapse_label : int, optional
+        (non-negative) only connections with this synapse label are returned
+    keys : str or list, optional
+        Names of the connection parameters to extract, as for
+        ``SynapseCollection.get()`` with ``output='numpy'``. Defaults to
+        source, target, weight and delay.
+    chunk_size : int, optional
+        Maximal number of connections per chunk. Connections from and to
+        devices are added to the chunk in which the other connections of their
+        synapse model end and may exceed this number.
+
+    Yields
+    ------
+    dict or numpy.ndarray:
+        Dictionary with an array of values of the connections in the chunk for
+        each key, or a single array if `keys` is a string
+
+    Raises
+    ------
+    TypeError
+        If `source` or `target` is not a NodeCollection, or `keys` is not
+        a string or an iterable of strings.
+    ValueError
+        If `chunk_size` is not a positive integer.
+    NESTError
+        If connections are created or deleted during the iteration.
+
+    Notes
+    -----
+    Only connections with targets on the MPI process executing the
+    command are returned, statistics across processes have to be combined
+    by the user.
+
+    Example
+    -------
+    ::
+
+        in_degrees = numpy.zeros(nest.network_size + 1, dtype=int)
+        for targets in nest.IterConnections(keys="target", chunk_size=10**6):
+            in_degrees += numpy.bincount(targets, minlength=len(in_degrees))
+    """
+
+    for nodes, name in ((source, "source"), (target, "target")):
+        if nodes is not None and not isinstance(nodes, NodeCollection):
+            raise TypeError(f"{name} must be NodeCollection.")
+    if keys is None:
+        keys = ["source", "target", "weight", "delay"]
+    elif not (is_literal(keys) or (is_iterable(keys) and all(is_literal(key) for key in keys))):
+        raise TypeError("keys should be either a string or an iterable of strings")
+    if not isinstance(chunk_size, numbers.Integral) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    chunk_size = int(chunk_size)
+
+    key_list = [str(keys)] if is_literal(keys) else [str(key) for key in keys]
+    sources = source._datum if source is not None else None
+    targets = target._datum if target is not None else None
+    synapse_label = synapse_label if synapse_label is not None else -1
+
+    # The kernel raises an error if connections change between chunks, as the position of the
+    # next chunk refers to the connections as they were sorted for the previous one.
+    change_count = -1
+    for tid in range(GetKernelStatus("local_num_threads")):
+        syn_id, lcid = 0, 0
+        while syn_id >= 0:
+            connection_ids, syn_id, lcid, change_count = connections_chunk(
+                sources, targets, synapse_model, synapse_label, tid, syn_id, lcid, chunk_size, change_count
+            )
+            if len(connection_ids[0]) == 0:
+                continue
+
+            chunk = get_connection_parameters_array(connection_ids, key_list)
+            yield chunk[key_list[0]] if is_literal(keys) else chunk
+
+
 @check_stack
 def Connect(pre, post, conn_spec=None, syn_spec=None, return_synapsecollection=False):
     """
@@ -286,7 +405,7 @@ def Connect(pre, post, conn_spec=None, syn_spec=None, return_synapsecollection=F
         sps(processed_conn_spec)
         if processed_syn_spec is not None:
             sps(processed_syn_spec)
-        sr("Connect")
+        sr("Connect", cached=True)
 
     if return_synapsecollection:
         return GetConnections(pre, post)
@@ -500,3 +619,220 @@ def Disconnect(*args, conn_spec=None, syn_spec=None):
         sr("Disconnect_g_g_D_D")
     else:
         raise TypeError("Arguments must be either a SynapseCollection or two NodeCollections")
+
+
+def _edge_shard_keys(targets, num_processes, local_num_threads):
+    """Return the shard of each connection, numbering the threads of all ranks consecutively."""
+
+    vps = targets % (num_processes * local_num_threads)
+    return (vps % num_processes) * local_num_threads + vps // num_processes
+
+
+def WriteEdgeShards(
+    path, sources, targets, syn_spec=None, num_processes=None, local_num_threads=None, chunk_size=2**22
+):
+    """Write connections to files partitioned by the virtual process of their targets.
+
+    The connections are written to the directory `path` for :py:func:`.ConnectEdgeShards`,
+    which creates them in a simulation with the given number of MPI processes and threads
+    per process. Each property of the connections is written to a separate file in NumPy
+    format, with the connections ordered by the rank and the thread of their targets, so
+    that each rank only reads a contiguous part of the files, and each thread a contiguous
+    part of that.
+
+    The connections are processed in chunks of `chunk_size` connections, so that `sources`,
+    `targets` and the arrays in `syn_spec` can be memory-mapped arrays larger than the
+    available memory, e.g., loaded with ``numpy.load(filename, mmap_mode="r")``.
+
+    This function does not change the state of the kernel and should only be called on a
+    single process.
+
+    Parameters
+    ----------
+    path : str
+        Directory to write the files to, created if it does not exist. Existing files are
+        overwritten.
+    sources : numpy.ndarray
+        Node IDs of the sources of the connections
+    targets : numpy.ndarray
+        Node IDs of the targets of the connections, which must not be devices
+    syn_spec : dict, optional
+        Synapse model and parameters of the connections, with arrays or scalars as values,
+        as for :py:func:`.Connect` with arrays of node IDs. The synapse model defaults to
+        `static_synapse`.
+    num_processes : int, optional
+        Number of MPI processes of the simulation, defaults to the current number of MPI
+        processes
+    local_num_threads : int, optional
+        Number of threads per MPI process of the simulation, defaults to the current number
+        of threads
+    chunk_size : int, optional
+        Number of connections processed at once
+
+    Raises
+    ------
+    ValueError
+        If the arrays do not have the same length.
+
+    See Also
+    ---------
+    ConnectEdgeShards
+    """
+
+    if num_processes is None:
+        num_processes = NumProcesses()
+    if local_num_threads is None:
+        local_num_threads = GetKernelStatus("local_num_threads")
+    num_shards = num_processes * local_num_threads
+
+    sources = numpy.asarray(sources)
+    targets = numpy.asarray(targets)
+    if sources.ndim != 1 or sources.shape != targets.shape:
+        raise ValueError("Sources and targets must be 1-dimensional arrays of the same length.")
+    n = len(sources)
+
+    syn_spec = dict(syn_spec) if syn_spec is not None else {}
+    synapse_model = syn_spec.pop("synapse_model", "static_synapse")
+
+    columns = {"sources": (sources, numpy.int64), "targets": (targets, numpy.int64)}
+    for key, value in syn_spec.items():
+        value = numpy.asarray(value)
+        if value.ndim == 0:
+            value = numpy.broadcast_to(value, n)
+        elif value.shape != (n,):
+            raise ValueError(f"'{key}' must be a scalar or an array of the same length as sources and targets.")
+        columns[key] = (value, numpy.double)
+
+    # The connections are sorted by shard with a counting sort: the first pass counts the
+    # connections of each shard, the second pass moves each connection to its place.
+    counts = numpy.zeros(num_shards, dtype=numpy.int64)
+    for start in range(0, n, chunk_size):
+        chunk_targets = targets[start : start + chunk_size].astype(numpy.int64)
+        keys = _edge_shard_keys(chunk_targets, num_processes, local_num_threads)
+        counts += numpy.bincount(keys, minlength=num_shards)
+    offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+
+    os.makedirs(path, exist_ok=True)
+    files = {
+        key: numpy.lib.format.open_memmap(os.path.join(path, key + ".npy"), mode="w+", dtype=dtype, shape=(n,))
+        for key, (_, dtype) in columns.items()
+    }
+
+    positions = offsets[:-1].copy()
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        keys = _edge_shard_keys(targets[start:stop].astype(numpy.int64), num_processes, local_num_threads)
+        order = numpy.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        chunk_counts = numpy.bincount(keys, minlength=num_shards)
+        chunk_starts = numpy.cumsum(chunk_counts) - chunk_counts
+        destinations = positions[sorted_keys] + numpy.arange(stop - start) - chunk_starts[sorted_keys]
+        for key, (values, _) in columns.items():
+            files[key][destinations] = values[start:stop][order]
+        positions += chunk_counts
+
+    for array in files.values():
+        array.flush()
+    del files
+
+    numpy.save(os.path.join(path, _EDGE_SHARDS_OFFSETS), offsets)
+    with open(os.path.join(path, _EDGE_SHARDS_METADATA), "w") as metadata_file:
+        json.dump(
+            {
+                "num_processes": num_processes,
+                "local_num_threads": local_num_threads,
+                "synapse_model": synapse_model,
+                "syn_params": list(syn_spec.keys()),
+            },
+            metadata_file,
+        )
+
+
+def ConnectEdgeShards(path):
+    """Create connections written to files by :py:func:`.WriteEdgeShards`.
+
+    Each MPI process only reads the connections to its own targets, from memory-mapped
+    files, and each thread creates the connections to the targets it is responsible for.
+    In contrast to :py:func:`.Connect` with arrays of node IDs, no process holds all
+    connections in memory, and no thread has to consider connections to the targets of
+    other threads.
+
+    The number of MPI processes and threads per process must be the same as when the files
+    were written. This function must be called on all MPI processes.
+
+    Parameters
+    ----------
+    path : str
+        Directory the files were written to
+
+    Raises
+    ------
+    ValueError
+        If the number of MPI processes or threads differs from the one the files were
+        written for.
+
+    See Also
+    ---------
+    WriteEdgeShards
+    """
+
+    with open(os.path.join(path, _EDGE_SHARDS_METADATA)) as metadata_file:
+        metadata = json.load(metadata_file)
+
+    num_processes = NumProcesses()
+    local_num_threads = GetKernelStatus("local_num_threads")
+    if (metadata["num_processes"], metadata["local_num_threads"]) != (num_processes, local_num_threads):
+        raise ValueError(
+            f"The connections in '{path}' are partitioned for {metadata['num_processes']} MPI processes with "
+            f"{metadata['local_num_threads']} threads each, but the simulation uses {num_processes} MPI processes "
+            f"with {local_num_threads} threads each."
+        )
+
+    first_shard = Rank() * local_num_threads
+    offsets = numpy.load(os.path.join(path, _EDGE_SHARDS_OFFSETS))[first_shard : first_shard + local_num_threads + 1]
+    begin, end = offsets[0], offsets[-1]
+
+    def load(key):
+        return numpy.load(os.path.join(path, key + ".npy"), mmap_mode="r")[begin:end]
+
+    syn_params = metadata["syn_params"]
+    weights = load("weight") if "weight" in syn_params else None
+    delays = load("delay") if "delay" in syn_params else None
+    param_keys = [key for key in syn_params if key not in ("weight", "delay")]
+    param_values = numpy.array([load(key) for key in param_keys]) if param_keys else None
+
+    connect_arrays_partitioned(
+        load("sources"),
+        load("targets"),
+        weights,
+        delays,
+        metadata["synapse_model"],
+        param_keys,
+        param_values,
+        offsets - begin,
+    )
+
+
+@check_stack
+def GetConstructionLog():
+    """Return the log of network construction of this MPI process.
+
+    Entries are only recorded while the kernel attribute ``log_construction`` is ``True``.
+    Each part of the log holds at most 10000 entries, the oldest entries are discarded.
+
+    Returns
+    -------
+    dict:
+        For each call to :py:func:`.Connect`, the ``rule``, the ``synapse_models``,
+        ``num_sources`` and ``num_targets``, the wall-clock ``time`` in seconds, the growth
+        of the resident ``memory`` of the process in bytes, and the ``thread_times`` and
+        ``thread_connections`` spent and created by each thread. The entry
+        ``connection_infrastructure`` contains for each update of the connection
+        infrastructure the time each thread spent sorting connections, building target
+        tables and gathering target data. The entry ``io_blocks`` contains for each block
+        of edges read from a SONATA edge file the ``edges_file``, ``offset`` and ``size``
+        of the block, and the times ``time_read``, ``time_wait`` and ``time_connect`` of
+        reading, waiting for and connecting the block.
+    """
+
+    return construction_log()
@@ -32,13 +32,26 @@ import textwrap
 import warnings
 from string import Template
 
+import numpy
+
 from .. import pynestkernel as kernel
-from ..ll_api import sli_func, spp, sps, sr
+from ..ll_api import (
+    get_connection_arrays,
+    get_node_arrays,
+    set_connection_arrays,
+    set_node_arrays,
+    sli_func,
+    spp,
+    sps,
+    sr,
+)
 
 __all__ = [
     "broadcast",
     "deprecated",
+    "get_connection_parameters_array",
     "get_parameters",
+    "get_parameters_array",
     "get_parameters_hierarchical_addressing",
     "get_wrapped_text",
     "is_iterable",
@@ -47,8 +60,11 @@ __all__ = [
     "is_sequence_of_node_ids",
     "is_string",
     "load_help",
+    "load_npy_events",
     "model_deprecation_warning",
     "restructure_data",
+    "set_connection_parameters_array",
+    "set_parameters_array",
     "show_deprecation_warning",
     "show_help_with_pager",
     "stringify_path",
@@ -61,6 +77,9 @@ __all__ = [
 # by the @deprecated decorator, and therefore does not manually need to be placed here.
 _deprecation_warning = {"deprecated_model": {"deprecation_issued": False, "replacement": "replacement_mod"}}
 
+# Parameters of connections that are given by the connection ID, in the order of its fields.
+_connection_id_keys = ("source", "target", "target_thread", "synapse_id", "port")
+
 
 def format_Warning(message, category, filename, lineno, line=None):
     """Formats deprecation warning."""
@@ -534,6 +553,270 @@ def get_parameters(nc, param):
     return result
 
 
+def get_parameters_array(nc, param):
+    """
+    Get scalar parameters from nodes as NumPy arrays.
+
+    Used by NodeCollections `get()` function with ``output="numpy"``. All
+    requested parameters are collected in a single call to the kernel, in
+    which each thread reads the values of its own nodes. Only model-specific
+    parameters require the status dictionaries of the nodes. For nodes on
+    other MPI processes, only ``global_id``, ``model_id``, ``vp`` and
+    ``local`` are known, all other values are NaN.
+
+    Parameters
+    ----------
+    nc: NodeCollection
+        nodes to get values from
+    param: string or list of strings
+        string or list of string naming model properties.
+
+    Returns
+    -------
+    numpy.ndarray:
+        param is a string so an array with one value per node is returned
+    dict:
+        param is a list of string so a dictionary of arrays is returned
+    """
+    if is_literal(param):
+        return get_node_arrays(nc._datum, [str(param)])[str(param)]
+    elif is_iterable(param) and all(is_literal(p) for p in param):
+        return get_node_arrays(nc._datum, [str(p) for p in param])
+    else:
+        raise TypeError("Params should be either a string or an iterable of strings")
+
+
+def get_connection_parameters_array(connection_ids, keys, out=None):
+    """
+    Get scalar parameters from connections as NumPy arrays.
+
+    Used by SynapseCollections `get()` function with ``output="numpy"``. The
+    arrays of connection IDs of the SynapseCollection directly provide the
+    values of ``source``, ``target``, ``target_thread``, ``synapse_id`` and
+    ``port``, which are returned as copies of type int. All other parameters
+    are filled into arrays of doubles in a single call to the kernel, in which
+    each thread reads the connections stored on it. Weights and delays are
+    read from the connections directly, model-specific parameters such as
+    ``tau_plus`` require the status dictionaries of the connections.
+
+    Parameters
+    ----------
+    connection_ids: tuple or None
+        arrays of sources, targets, target threads, synapse IDs and ports of
+        the SynapseCollection
+    keys: list of strings
+        list of strings naming connection properties.
+    out: dict or str or path-like, optional
+        If a dictionary, the values are written into the arrays it contains
+        for each key. If a path, the values are written to memory-mapped
+        ``<key>.npy`` files in this directory, which is created if needed.
+
+    Returns
+    -------
+    dict:
+        Dictionary with an array of values for each key
+
+    Raises
+    ------
+    ValueError
+        If an array in `out` is missing or does not have one element per connection.
+    """
+    if connection_ids is None:
+        connection_ids = tuple(numpy.empty((len(_connection_id_keys), 0), dtype=int))
+    n = len(connection_ids[0])
+    ids_by_key = {key: ids.astype(int) for key, ids in zip(_connection_id_keys, connection_ids) if key in keys}
+
+    if out is None:
+        result = {key: ids_by_key[key] if key in ids_by_key else numpy.empty(n) for key in keys}
+    elif isinstance(out, dict):
+        result = {}
+        for key in keys:
+            if key not in out:
+                raise ValueError(f"out does not contain an array for '{key}'")
+            if numpy.shape(out[key]) != (n,):
+                raise ValueError(f"array for '{key}' must have shape ({n},), got {numpy.shape(out[key])}")
+            result[key] = out[key]
+    else:
+        path = stringify_path(out)
+        os.makedirs(path, exist_ok=True)
+        result = {
+            key: numpy.lib.format.open_memmap(
+                os.path.join(path, f"{key}.npy"), mode="w+", dtype=int if key in ids_by_key else float, shape=(n,)
+            )
+            for key in keys
+        }
+
+    status_keys = [key for key in keys if key not in ids_by_key]
+    buffers = []
+    for key in status_keys:
+        array = result[key]
+        is_buffer = isinstance(array, numpy.ndarray) and array.dtype == numpy.double and array.flags.c_contiguous
+        buffers.append(array if is_buffer and array.flags.writeable else numpy.empty(n))
+
+    value_types = get_connection_arrays(connection_ids, status_keys, buffers)
+
+    for key, buffer, value_type in zip(status_keys, buffers, value_types):
+        if out is None:
+            result[key] = buffer.astype(value_type, copy=False)
+        elif buffer is not result[key]:
+            result[key][...] = buffer
+    if out is not None:
+        for key in keys:
+            if key in ids_by_key:
+                result[key][...] = ids_by_key[key]
+            if isinstance(result[key], numpy.memmap):
+                result[key].flush()
+
+    return result
+
+
+def _parameters_matrix(params, n):
+    """
+    Return the values of parameters as matrix with one row per parameter.
+
+    Parameters
+    ----------
+    params: dict
+        Dictionary with parameter names as keys and scalars or arrays of
+        length `n` as values
+    n: int
+        Number of nodes or connections
+
+    Returns
+    -------
+    numpy.ndarray:
+        Array of shape ``(len(params), n)``, in which scalars are repeated
+        for all nodes or connections
+
+    Raises
+    ------
+    ValueError
+        If an array does not have length `n`.
+    """
+    values = numpy.empty((len(params), n))
+    for row, (key, vals) in zip(values, params.items()):
+        vals = numpy.asarray(vals)
+        if vals.ndim > 0 and vals.shape != (n,):
+            raise ValueError(f"'{key}' must be a scalar or an array of length {n}, got shape {vals.shape}")
+        row[:] = vals
+    return values
+
+
+def set_parameters_array(nc, params):
+    """
+    Set scalar parameters of nodes from NumPy arrays.
+
+    Used by NodeCollections `set()` function if parameters are given as
+    NumPy arrays. The lengths of all arrays are checked before the values
+    are passed to the kernel, which writes them into the nodes in a single
+    thread-parallel pass without constructing status dictionaries for the
+    individual nodes.
+
+    Parameters
+    ----------
+    nc: NodeCollection
+        nodes to set values of
+    params: dict
+        Dictionary with parameter names as keys and scalars or arrays with
+        one value per node as values
+
+    Raises
+    ------
+    ValueError
+        If an array does not have one value per node.
+    """
+    values = _parameters_matrix(params, len(nc))
+    set_node_arrays(nc._datum, [str(key) for key in params], values)
+
+
+def set_connection_parameters_array(connection_ids, params):
+    """
+    Set scalar parameters of connections from NumPy arrays.
+
+    Used by SynapseCollections `set()` function if parameters are given as
+    NumPy arrays. The lengths of all arrays are checked before the values
+    are passed to the kernel, which sets them in a single thread-parallel
+    pass without constructing status dictionaries for the individual
+    connections.
+
+    Parameters
+    ----------
+    connection_ids: tuple
+        arrays of sources, targets, target threads, synapse IDs and ports of
+        the SynapseCollection
+    params: dict
+        Dictionary with parameter names as keys and scalars or arrays with
+        one value per connection as values
+
+    Raises
+    ------
+    ValueError
+        If an array does not have one value per connection.
+    """
+    values = _parameters_matrix(params, len(connection_ids[0]))
+    set_connection_arrays(connection_ids, [str(key) for key in params], values)
+
+
+def load_npy_events(filenames, concatenate=True):
+    """
+    Load events written by the `npy` recording backend.
+
+    The files are memory-mapped, so that data is only read from disk when it
+    is accessed. If the files stem from several recordings, i.e., were written
+    by different threads or MPI processes, and `concatenate` is `True`, the
+    files of the same column are concatenated. This copies all data into
+    memory. To keep the data memory-mapped, pass `concatenate=False`.
+
+    Parameters
+    ----------
+    filenames : str or list(str)
+        Name or list of names of files written by the `npy` recording
+        backend, as given by the `filenames` property of recording devices.
+    concatenate : bool, optional
+        Whether to concatenate the recordings into a single dictionary.
+
+    Returns
+    -------
+    dict or list(dict):
+        Dictionary with the column names, such as `senders`, `times` and the
+        names of the recorded values, as keys and arrays as values. If
+        `concatenate` is `False`, a list of such dictionaries with
+        memory-mapped arrays, one for each recording.
+
+    Raises
+    ------
+    ValueError
+        If a file name does not have the form ``<base>.<column>.npy``, or if
+        the columns differ between the recordings.
+    """
+    if isinstance(filenames, (str, os.PathLike)):
+        filenames = [filenames]
+
+    # Group the column files by recording, keeping the order of the recordings.
+    recordings = {}
+    for filename in filenames:
+        parts = os.fspath(filename).rsplit(".", 2)
+        if len(parts) != 3 or parts[2] != "npy" or not parts[1]:
+            raise ValueError(f"'{filename}' is not a file written by the npy recording backend.")
+        base, column, _ = parts
+        recordings.setdefault(base, {})[column] = numpy.load(filename, mmap_mode="r")
+
+    if not recordings:
+        raise ValueError("No files given.")
+
+    recordings = list(recordings.values())
+    columns = list(recordings[0].keys())
+    if any(recording.keys() != recordings[0].keys() for recording in recordings):
+        raise ValueError("All recordings must contain the same columns.")
+
+    if not concatenate:
+        return recordings
+    if len(recordings) == 1:
+        return recordings[0]
+
+    return {column: numpy.concatenate([recording[column] for recording in recordings]) for column in columns}
+
+
 def get_parameters_hierarchical_addressing(nc, params):
     """
     Get parameters from nodes, hierarchical case.
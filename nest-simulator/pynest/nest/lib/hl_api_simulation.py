@@ -23,26 +23,39 @@
 Functions for simulation control
 """
 
+import json
+import os
+import sys
 import warnings
 from contextlib import contextmanager
 
-from ..ll_api import check_stack, spp, sps, sr
+import numpy
+
+from ..ll_api import check_stack, checkpoint, phase_profile, restore, spp, sps, sr
 from .hl_api_helper import is_iterable, is_literal
+from .hl_api_parallel_computing import NumProcesses, Rank
 
 __all__ = [
+    "Checkpoint",
     "Cleanup",
     "DisableStructuralPlasticity",
     "EnableStructuralPlasticity",
     "GetKernelStatus",
     "Install",
+    "PhaseProfile",
     "Prepare",
     "ResetKernel",
+    "Restore",
     "Run",
     "RunManager",
     "SetKernelStatus",
     "Simulate",
+    "profile",
 ]
 
+# Number of calls to ResetKernel, so that kernel state cached in Python objects can be invalidated
+_reset_count = 0
+
 
 @check_stack
 def Simulate(t):
@@ -62,7 +75,7 @@ def Simulate(t):
     """
 
     sps(float(t))
-    sr("ms Simulate")
+    sr("ms Simulate", cached=True)
 
 
 @check_stack
@@ -101,7 +114,7 @@ def Run(t):
     """
 
     sps(float(t))
-    sr("ms Run")
+    sr("ms Run", cached=True)
 
 
 @check_stack
@@ -199,7 +212,83 @@ def ResetKernel():
 
     """
 
+    global _reset_count
+
     sr("ResetKernel")
+    _reset_count += 1
+
+
+def Checkpoint(path):
+    """Write the state of the network to binary files in a directory.
+
+    Each MPI process writes the nodes and connections it holds to a separate
+    file in the directory `path`, which is created if it does not exist:
+
+    * the models of all nodes, so that the network can be recreated with the same
+      node IDs,
+    * the scalar parameters and state variables of the local nodes,
+    * the node IDs and scalar parameters of the local connections, including the
+      state of plastic synapses, such as weights and traces,
+    * the states of all random number generators.
+
+    The network can be recreated from the files with :py:func:`.Restore`. This
+    function must be called on all MPI processes.
+
+    Parameters
+    ----------
+    path : str
+        Directory to write the checkpoint to
+
+    Notes
+    -----
+    Array-valued parameters, such as spike times of spike generators, recorded
+    events, spatial properties, kernel parameters and model defaults are not part
+    of the checkpoint. Spikes in transit and the spike history of neurons are not
+    stored either, so that the restored network starts at time 0 without any
+    pending spikes. The receptor type of each connection is determined from its
+    receptor port and the models of its source and target. Checkpointing fails
+    if the receptor type cannot be determined.
+
+    See Also
+    --------
+    Restore
+    """
+
+    path = os.fspath(path)
+    os.makedirs(path, exist_ok=True)
+    checkpoint(path)
+
+
+def Restore(path):
+    """Restore a network from a checkpoint written by :py:func:`.Checkpoint`.
+
+    Creates the nodes and connections of the checkpoint and restores their state
+    and the states of the random number generators. Each MPI process reads its own
+    file of the checkpoint, and each thread restores its own nodes and connections.
+
+    The kernel must not contain any nodes, e.g., after a call to :py:func:`.ResetKernel`,
+    and must have the same number of MPI processes, threads, the same resolution
+    and RNG type as when the checkpoint was written. Models created with
+    :py:func:`.CopyModel` and modified model defaults must be set up again before
+    restoring. This function must be called on all MPI processes.
+
+    Parameters
+    ----------
+    path : str
+        Directory the checkpoint was written to
+
+    Raises
+    ------
+    NESTError
+        If the kernel contains nodes, or if its configuration does not match the
+        checkpoint.
+
+    See Also
+    --------
+    Checkpoint
+    """
+
+    restore(os.fspath(path))
 
 
 @check_stack
@@ -249,7 +338,7 @@ def SetKernelStatus(params):
                 del params[key]
 
     sps(params)
-    sr("SetKernelStatus")
+    sr("SetKernelStatus", cached=True)
 
 
 @check_stack
@@ -288,7 +377,7 @@ def GetKernelStatus(keys=None):
 
     """
 
-    sr("GetKernelStatus")
+    sr("GetKernelStatus", cached=True)
     status_root = spp()
 
     if keys is None:
@@ -354,3 +443,367 @@ def DisableStructuralPlasticity():
 
     """
     sr("DisableStructuralPlasticity")
+
+
+class PhaseProfile:
+    """Wall-clock times of the phases of the simulation loop, as recorded by :py:func:`.profile`.
+
+    Each thread of each MPI process records the total time spent in each phase
+    per run. If phases are traced, each thread also records one interval per
+    phase and update cycle. The phases are
+
+    * ``deliver_secondary_data`` and ``deliver_spike_data``: delivery of the events
+      received in the previous cycle to the nodes of the thread,
+    * ``update``: update of the nodes of the thread,
+    * ``synchronize``: waiting for the other threads to finish their update,
+    * ``gather_spike_data`` and ``gather_secondary_data``: exchange of events
+      between MPI processes, on the master thread only,
+    * ``communicate_prepare``: construction of the connection infrastructure,
+      e.g., in :py:func:`.Prepare`.
+
+    Times are given in seconds since profiling was enabled on the respective MPI
+    process. Runs are numbered in the order of the calls to :py:func:`.Run`
+    within the profiling context, intervals recorded before a run, e.g., during
+    :py:func:`.Prepare`, belong to the following run.
+
+    Attributes
+    ----------
+    phase_names : list of str
+        Names of the phases, in the order of the phase indices of the intervals
+    traced : bool
+        Whether the individual intervals were recorded
+    """
+
+    _work_phases = ["deliver_secondary_data", "deliver_spike_data", "update"]
+
+    def __init__(self, traced=False):
+        self.phase_names = []
+        self.traced = traced
+        self._ranks = []
+
+    def _set_ranks(self, ranks):
+        self.phase_names = ranks[0]["phase_names"]
+        self._ranks = ranks
+
+    def _check_traced(self):
+        if not self.traced:
+            raise ValueError("Intervals are only available if phases are traced, use nest.profile(trace=True).")
+
+    @property
+    def num_ranks(self):
+        """Number of MPI processes with recorded phases"""
+        return len(self._ranks)
+
+    @property
+    def num_threads(self):
+        """Number of threads per MPI process"""
+        return max(
+            (int(rank["total_threads"].max()) + 1 for rank in self._ranks if len(rank["total_threads"])), default=0
+        )
+
+    @property
+    def num_runs(self):
+        """Number of calls to :py:func:`.Run` within the profiling context"""
+        return max((len(rank["run_end"]) for rank in self._ranks), default=0)
+
+    @property
+    def num_dropped(self):
+        """Number of intervals of all MPI processes that were not traced, as the trace was full"""
+        return sum(rank["num_dropped"] for rank in self._ranks)
+
+    def run_times(self, rank=0):
+        """Return the begin and end times of the runs on MPI process `rank` as arrays."""
+        return self._ranks[rank]["run_begin"], self._ranks[rank]["run_end"]
+
+    def intervals(self, phase=None, run=None):
+        """Return the traced intervals, optionally restricted to one phase and run.
+
+        Parameters
+        ----------
+        phase : str, optional
+            Name of the phase
+        run : int, optional
+            Index of the run
+
+        Returns
+        -------
+        dict
+            Arrays ``rank``, ``thread``, ``phase``, ``run``, ``slice``, ``begin``,
+            ``end`` and ``duration`` with one entry per interval
+
+        Raises
+        ------
+        ValueError
+            If phases were not traced
+        """
+
+        self._check_traced()
+        columns = {
+            "rank": numpy.concatenate(
+                [numpy.full(len(rank["threads"]), rank["rank"], dtype=int) for rank in self._ranks]
+            ),
+            "thread": numpy.concatenate([rank["threads"] for rank in self._ranks]),
+            "phase": numpy.concatenate([rank["phases"] for rank in self._ranks]),
+            "run": numpy.concatenate([rank["runs"] for rank in self._ranks]),
+            "slice": numpy.concatenate([rank["slices"] for rank in self._ranks]),
+            "begin": numpy.concatenate([rank["begin"] for rank in self._ranks]),
+            "end": numpy.concatenate([rank["end"] for rank in self._ranks]),
+        }
+        columns["duration"] = columns["end"] - columns["begin"]
+
+        selected = numpy.ones(len(columns["begin"]), dtype=bool)
+        if phase is not None:
+            selected &= columns["phase"] == self.phase_names.index(phase)
+        if run is not None:
+            selected &= columns["run"] == run
+
+        return {key: column[selected] for key, column in columns.items()}
+
+    def _totals(self, key, run):
+        dtype = self._ranks[0][key].dtype if self._ranks else float
+        totals = numpy.zeros((self.num_ranks, self.num_threads, len(self.phase_names)), dtype=dtype)
+        for rank_totals, rank in zip(totals, self._ranks):
+            selected = numpy.ones(len(rank[key]), dtype=bool) if run is None else rank["total_runs"] == run
+            numpy.add.at(
+                rank_totals, (rank["total_threads"][selected], rank["total_phases"][selected]), rank[key][selected]
+            )
+        return totals
+
+    def phase_times(self, run=None):
+        """Return the total time spent in each phase per MPI process and thread.
+
+        Parameters
+        ----------
+        run : int, optional
+            Index of the run, all runs by default
+
+        Returns
+        -------
+        numpy.ndarray
+            Times in seconds, with shape ``(num_ranks, num_threads, len(phase_names))``
+        """
+
+        return self._totals("total_time", run)
+
+    def phase_counts(self, run=None):
+        """Return the number of intervals spent in each phase per MPI process and thread.
+
+        Parameters
+        ----------
+        run : int, optional
+            Index of the run, all runs by default
+
+        Returns
+        -------
+        numpy.ndarray
+            Numbers of intervals, with shape ``(num_ranks, num_threads, len(phase_names))``
+        """
+
+        return self._totals("total_count", run)
+
+    def update_cycle_histograms(self, bins=10, run=None):
+        """Return histograms of the work of the fastest and the slowest thread per update cycle.
+
+        The work of a thread in an update cycle is the time it spends delivering
+        events to and updating its nodes, excluding the time waiting for other
+        threads and communication. The difference between the ``min`` and ``max``
+        histograms shows the load imbalance between the threads of all MPI processes.
+        The ``cycle`` histogram holds the wall-clock durations of the update cycles,
+        including synchronization and communication, which also determine
+        ``min_update_time`` and ``max_update_time``.
+
+        Parameters
+        ----------
+        bins : int or sequence of float, optional
+            Number of bins or bin edges in seconds, as for :py:func:`numpy.histogram`
+        run : int, optional
+            Index of the run, all runs by default
+
+        Returns
+        -------
+        dict
+            ``bin_edges`` and the counts ``min``, ``max`` and ``cycle`` per bin
+
+        Raises
+        ------
+        ValueError
+            If phases were not traced
+        """
+
+        intervals = self.intervals(run=run)
+        work = numpy.isin(intervals["phase"], [self.phase_names.index(phase) for phase in self._work_phases])
+        intervals = {key: column[work] for key, column in intervals.items()}
+
+        # Sum the work per update cycle and thread, sorted by cycle.
+        keys = numpy.stack([intervals["run"], intervals["slice"], intervals["rank"], intervals["thread"]], axis=1)
+        thread_keys, index = numpy.unique(keys, axis=0, return_inverse=True)
+        thread_work = numpy.zeros(len(thread_keys))
+        numpy.add.at(thread_work, index.ravel(), intervals["duration"])
+
+        _, first = numpy.unique(thread_keys[:, :2], axis=0, return_index=True)
+        min_work = numpy.minimum.reduceat(thread_work, first) if len(first) else thread_work
+        max_work = numpy.maximum.reduceat(thread_work, first) if len(first) else thread_work
+
+        # All processes go through the same update cycles, the slowest one determines the duration.
+        cycles = [
+            rank["update_cycles"] if run is None else rank["update_cycles"][rank["update_cycle_runs"] == run]
+            for rank in self._ranks
+        ]
+        cycles = numpy.max(cycles, axis=0) if cycles else numpy.zeros(0)
+
+        bin_edges = numpy.histogram_bin_edges(numpy.concatenate([min_work, max_work, cycles]), bins)
+        return {
+            "bin_edges": bin_edges,
+            "min": numpy.histogram(min_work, bin_edges)[0],
+            "max": numpy.histogram(max_work, bin_edges)[0],
+            "cycle": numpy.histogram(cycles, bin_edges)[0],
+        }
+
+    def trace_events(self):
+        """Return the intervals in the Trace Event Format.
+
+        Each MPI process is shown as a process and each thread as a thread. Runs
+        are shown on the master thread, enclosing the phases of the run.
+
+        Returns
+        -------
+        dict
+            Trace with times in microseconds, which can be written to a JSON file
+            and loaded into ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_
+
+        Raises
+        ------
+        ValueError
+            If phases were not traced
+        """
+
+        self._check_traced()
+        events = []
+        for rank in self._ranks:
+            pid = int(rank["rank"])
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"rank {pid}"}})
+            for tid in numpy.unique(rank["threads"]):
+                events.append(
+                    {"name": "thread_name", "ph": "M", "pid": pid, "tid": int(tid), "args": {"name": f"thread {tid}"}}
+                )
+            for run, (begin, end) in enumerate(zip(rank["run_begin"], rank["run_end"])):
+                events.append(
+                    {
+                        "name": f"Run {run}",
+                        "cat": "run",
+                        "ph": "X",
+                        "pid": pid,
+                        "tid": 0,
+                        "ts": 1e6 * begin,
+                        "dur": 1e6 * (end - begin),
+                    }
+                )
+            for tid, phase, run, slice_, begin, end in zip(
+                rank["threads"].tolist(),
+                rank["phases"].tolist(),
+                rank["runs"].tolist(),
+                rank["slices"].tolist(),
+                rank["begin"].tolist(),
+                rank["end"].tolist(),
+            ):
+                events.append(
+                    {
+                        "name": self.phase_names[phase],
+                        "cat": "phase",
+                        "ph": "X",
+                        "pid": pid,
+                        "tid": tid,
+                        "ts": 1e6 * begin,
+                        "dur": 1e6 * (end - begin),
+                        "args": {"run": run, "slice": slice_},
+                    }
+                )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, filename):
+        """Write the intervals to a JSON file in the Trace Event Format.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file
+
+        See Also
+        --------
+        trace_events
+        """
+
+        with open(filename, "w") as trace_file:
+            json.dump(self.trace_events(), trace_file)
+
+
+def _gather_phase_profiles(local_profile):
+    """Collect the phase profiles of all MPI processes, if mpi4py is available."""
+
+    local_profile["rank"] = Rank()
+    if NumProcesses() == 1:
+        return [local_profile]
+
+    if "mpi4py" not in sys.modules:
+        warnings.warn("profile: mpi4py is not loaded, only phases of the local MPI process are reported.")
+        return [local_profile]
+
+    from mpi4py import MPI
+
+    return sorted(MPI.COMM_WORLD.allgather(local_profile), key=lambda profile: profile["rank"])
+
+
+@contextmanager
+def profile(trace=False):
+    """Context manager recording the time spent in the phases of the simulation loop.
+
+    Enables the kernel attribute ``profile_phases`` while in the context. When
+    the context is left, the recorded times of all threads and MPI processes are
+    collected in the :py:class:`.PhaseProfile` returned by the context manager.
+    Recording requires no detailed timers and adds two clock readings per phase,
+    thread and update cycle, which is negligible unless the network is very small.
+
+    By default, only the total times per phase, thread and run are kept, so that
+    the memory needed does not grow with the simulated time. With ``trace=True``,
+    the kernel attribute ``trace_phases`` is enabled as well and each interval is
+    recorded, at most one million per thread.
+
+    For example:
+
+    ::
+
+        with nest.profile() as phases:
+            nest.Simulate(1000.0)
+
+        print(phases.phase_times().sum(axis=0))
+
+        with nest.profile(trace=True) as phases:
+            nest.Simulate(100.0)
+
+        phases.write_trace("trace.json")
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Whether to record the individual intervals, which are needed for
+        :py:meth:`.PhaseProfile.intervals`, the histograms and the trace
+
+    Notes
+    -----
+    Times of other MPI processes are only collected if :py:mod:`mpi4py` is
+    loaded. The context must then be left on all MPI processes.
+
+    See Also
+    --------
+    PhaseProfile
+    """
+
+    phases = PhaseProfile(traced=trace)
+    SetKernelStatus({"profile_phases": True, "trace_phases": trace})
+    try:
+        yield phases
+    finally:
+        SetKernelStatus({"profile_phases": False, "trace_phases": False})
+
+    phases._set_ranks(_gather_phase_profiles(phase_profile()))
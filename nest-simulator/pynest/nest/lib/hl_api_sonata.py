@@ -24,9 +24,10 @@ Functions to build and simulate networks with the SONATA format
 """
 
 
-import itertools
+import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
 
 import numpy as np
@@ -34,8 +35,15 @@ import numpy as np
 from .. import pynestkernel as kernel
 from ..ll_api import sli_func, sps, sr
 from .hl_api_models import GetDefaults
-from .hl_api_nodes import Create
-from .hl_api_simulation import SetKernelStatus, Simulate
+from .hl_api_nodes import Create, GetNodes
+from .hl_api_parallel_computing import NumProcesses, Rank, SyncProcesses
+from .hl_api_simulation import (
+    Checkpoint,
+    GetKernelStatus,
+    Restore,
+    SetKernelStatus,
+    Simulate,
+)
 from .hl_api_types import NodeCollection
 
 try:
@@ -82,6 +90,11 @@ class SonataNetwork:
         String or pathlib object describing the path to a JSON configuration
         file containing simulation parameters. This is only needed if simulation
         parameters are given in a separate configuration file.
+    num_parse_threads : int, optional
+        Number of Python threads used to read the node and edge type CSV files
+        and the JSON files with model parameters concurrently. This pays off
+        for networks with many such files on a parallel file system.
+        Default: 1, reading all files sequentially.
 
     Example
     -------
@@ -105,7 +118,7 @@ class SonataNetwork:
             sonata_net.Simulate()
     """
 
-    def __init__(self, config, sim_config=None):
+    def __init__(self, config, sim_config=None, num_parse_threads=1):
         if not have_hdf5:
             msg = "SonataNetwork unavailable because NEST was compiled without HDF5 support"
             raise kernel.NESTError(msg)
@@ -116,9 +129,22 @@ class SonataNetwork:
             msg = "SonataNetwork unavailable because pandas is not installed or could not be imported"
             raise kernel.NESTError(msg)
 
+        if not isinstance(num_parse_threads, int) or num_parse_threads < 1:
+            raise ValueError("num_parse_threads must be a strictly positive int")
+
         self._node_collections = {}
         self._edges_maps = []
         self._hyperslab_size_default = 2**20
+        self._build_cache_version = 1
+        self._num_parse_threads = num_parse_threads
+
+        # Caches of the settable parameters of NEST models and of the
+        # parameters in JSON files, shared by all node and edge types
+        self._settable_params_cache = {}
+        self._params_file_cache = {}
+
+        # Parameters of the created nodes by population, stored in the build cache
+        self._node_params = {}
 
         self._are_nodes_created = False
         self._is_network_built = False
@@ -211,10 +237,12 @@ class SonataNetwork:
             for each population. The population names are keys.
         """
 
+        nodes_confs = self._conf["networks"]["nodes"]
+        nodes_dfs = self._map_files(self._read_node_types, nodes_confs)
+
         # Iterate node config files
-        for nodes_conf in self._conf["networks"]["nodes"]:
+        for nodes_conf, nodes_df in zip(nodes_confs, nodes_dfs):
             csv_fn = nodes_conf["node_types_file"]
-            nodes_df = pd.read_csv(csv_fn, sep=r"\s+")
 
             # Require only one model type per CSV file
             model_types_arr = nodes_df["model_type"].to_numpy()
@@ -262,44 +290,35 @@ class SonataNetwork:
             for pop_name in nodes_h5f["nodes"]:
                 node_type_id_dset = nodes_h5f["nodes"][pop_name]["node_type_id"][:]
 
+                node_type_params = {}
+
                 if is_one_model:
                     nest_nodes = Create(one_model_name, n=node_type_id_dset.size)
                     node_type_ids, inv_ind = np.unique(node_type_id_dset, return_inverse=True)
 
                     # Extract node parameters
                     for i, node_type_id in enumerate(node_type_ids):
-                        params_path = PurePath(
-                            self._conf["components"]["point_neuron_models_dir"],
-                            node_types_map[node_type_id]["dynamics_params"],
+                        params = self._load_params_file(
+                            "point_neuron_models_dir", node_types_map[node_type_id]["dynamics_params"]
                         )
-
-                        with open(params_path) as fp:
-                            params = json.load(fp)
-
+                        node_type_params[int(node_type_id)] = params
                         nest_nodes[inv_ind == i].set(params)
                 else:
-                    # More than one NEST neuron model in CSV file
-
-                    # TODO: Utilizing np.unique(node_type_id_dset, return_<foo>=...)
-                    # with the different return options might be more efficient
+                    # More than one NEST neuron model in CSV file; create the
+                    # nodes of each run of consecutive equal node type ids at once
+                    run_starts = np.flatnonzero(np.diff(node_type_id_dset, prepend=np.nan))
+                    run_lengths = np.diff(run_starts, append=node_type_id_dset.size)
 
                     nest_nodes = NodeCollection()
-                    for k, g in itertools.groupby(node_type_id_dset):
+                    for k, n_nrns in zip(node_type_id_dset[run_starts], run_lengths):
                         # k is a node_type_id key
-                        # g is an itertools group object
-                        # len(list(g)) gives the number of consecutive occurrences of the current k
                         model = node_types_map[k]["model_template"]
-                        n_nrns = len(list(g))
-                        params_path = PurePath(
-                            self._conf["components"]["point_neuron_models_dir"],
-                            node_types_map[k]["dynamics_params"],
-                        )
-                        with open(params_path) as fp:
-                            params = json.load(fp)
-
-                        nest_nodes += Create(model, n=n_nrns, params=params)
+                        params = self._load_params_file("point_neuron_models_dir", node_types_map[k]["dynamics_params"])
+                        node_type_params[int(k)] = params
+                        nest_nodes += Create(model, n=int(n_nrns), params=params)
 
                 self._node_collections[pop_name] = nest_nodes
+                self._node_params[pop_name] = {"node_type_id": node_type_id_dset, "params": node_type_params}
 
     def _create_spike_train_injectors(self, nodes_conf):
         """Create spike train injector nodes.
@@ -366,6 +385,7 @@ class SonataNetwork:
                 # Create and store NC
                 nest_nodes = Create("spike_train_injector", n=n_nodes, params=params_lst)
                 self._node_collections[pop_name] = nest_nodes
+                self._node_params[pop_name] = {"spike_times": [spikes_map[node_id] for node_id in range(n_nodes)]}
 
     def _create_node_type_parameter_map(self, nodes_df, csv_fn):
         """Create map between node type id and node properties.
@@ -420,14 +440,24 @@ class SonataNetwork:
         their entirety. In the NEST kernel, the edge HDF5 datasets are therefore
         read sequentially as blocks of contiguous hyperslabs. The hyperslab size
         is modifiable so that the user is able to achieve a balance between
-        the number of read operations and memory overhead.
+        the number of read operations and memory overhead. With
+        ``hdf5_hyperslab_size="auto"``, the kernel chooses the size for each
+        edge population from the available memory and rounds it to whole
+        chunks of the datasets.
+
+        While the connections of one block are created, the next block is read
+        in the background. If the kernel attribute ``log_construction`` is
+        ``True``, :py:func:`.GetConstructionLog` holds the times of reading,
+        waiting for and connecting each block in the entry ``io_blocks``. If
+        ``time_wait`` is large compared to ``time_connect``, loading the edges
+        is limited by the file system.
 
         Parameters
         ----------
-        hdf5_hyperslab_size : int, optional
-            Size of the hyperslab to read in one read operation. The hyperslab
-            size is applied to all HDF5 datasets that need to be read in order
-            to create the connections. Default: ``2**20``.
+        hdf5_hyperslab_size : [int | str], optional
+            Size of the hyperslab to read in one read operation, or ``"auto"``.
+            The hyperslab size is applied to all HDF5 datasets that need to be
+            read in order to create the connections. Default: ``2**20``.
         """
 
         if not self._are_nodes_created:
@@ -450,7 +480,8 @@ class SonataNetwork:
                 raise BlockingIOError(f"{err.strerror} for {os.path.realpath(d['edges_file'])}") from None
 
         sps(graph_specs)
-        sps(hdf5_hyperslab_size)
+        # A hyperslab size of zero lets the kernel choose the size
+        sps(0 if hdf5_hyperslab_size == "auto" else hdf5_hyperslab_size)
         sr("ConnectSonata")
 
         self._is_network_built = True
@@ -458,8 +489,10 @@ class SonataNetwork:
     def _verify_hyperslab_size(self, hyperslab_size):
         """Check if provided hyperslab size is valid."""
 
+        if hyperslab_size == "auto":
+            return
         if not isinstance(hyperslab_size, int):
-            raise TypeError("hdf5_hyperslab_size must be passed as int")
+            raise TypeError("hdf5_hyperslab_size must be passed as int or 'auto'")
         if hyperslab_size <= 0:
             raise ValueError("hdf5_hyperslab_size must be strictly positive")
 
@@ -513,96 +546,159 @@ class SonataNetwork:
         the map as well.
         """
 
+        edges_confs = self._conf["networks"]["edges"]
+        edges_dfs = self._map_files(self._read_edge_types, edges_confs)
+
         # Iterate edge config files
-        for edges_conf in self._conf["networks"]["edges"]:
+        for edges_conf, edges_df in zip(edges_confs, edges_dfs):
             edges_map = {}
-            edges_csv_fn = edges_conf["edge_types_file"]
-            edges_df = pd.read_csv(edges_csv_fn, sep=r"\s+")
-
-            if "model_template" not in edges_df.columns:
-                msg = f"Missing the required 'model_template' header specifying NEST synapse models in {edges_csv_fn}."
-                raise ValueError(msg)
-
-            # Rename column labels to names used by NEST. Note that rename
-            # don't throw an error for extra labels (we want this behavior)
-            edges_df.rename(
-                columns={"model_template": "synapse_model", "syn_weight": "weight"},
-                inplace=True,
-            )
-
             edges_df_cols = set(edges_df.columns)
 
+            # Extract the syn_specs of all edge types with the same synapse
+            # model at once, with the settable parameters of that model
+            syn_specs = {}
+            for synapse_model, model_df in edges_df.groupby("synapse_model", sort=False, dropna=False):
+                # Parameters to extract (elements common to both sets)
+                extract_cols = list(self._get_settable_params(synapse_model) & edges_df_cols)
+                syn_specs.update(model_df.set_index("edge_type_id")[extract_cols].to_dict(orient="index"))
+
             # If 'dynamics_params' is specified, additional synapse
             # parameters may be given in a .json file
-            have_dynamics = "dynamics_params" in edges_df.columns
+            if "dynamics_params" in edges_df_cols:
+                for edge_type_id, params_fn in zip(edges_df["edge_type_id"], edges_df["dynamics_params"]):
+                    syn_specs[edge_type_id].update(self._load_params_file("synaptic_models_dir", params_fn))
+
+            # Create edges map, keeping the order of the edge types in the CSV file
+            edges_map["syn_specs"] = {
+                edge_type_id: syn_specs[edge_type_id] for edge_type_id in edges_df["edge_type_id"]
+            }
+            edges_map["edges_file"] = edges_conf["edges_file"]
+            self._edges_maps.append(edges_map)
 
-            # Extract synapse models in the edge CSV file and check if
-            # only one model is present; we can then use a more efficient
-            # procedure for extracting the syn_specs.
-            models_arr = edges_df["synapse_model"].to_numpy()
-            is_one_model = (models_arr[0] == models_arr).all()
+    def _read_edge_types(self, edges_conf):
+        """Read an edge types CSV file.
 
-            if is_one_model:
-                # Only one model in the edge CSV file
+        Reads the edge types CSV file, renames its column labels to the names
+        used by NEST and loads the JSON files with synapse parameters. This
+        function does not call into the NEST kernel and may thus run
+        concurrently for several files.
 
-                synapse_model = models_arr[0]
-                # Find set of settable parameters for synapse model
-                settable_params = set([*GetDefaults(synapse_model)])
-                # Parameters to extract (elements common to both sets)
-                extract_cols = list(settable_params & edges_df_cols)
-                if have_dynamics:
-                    extract_cols.append("dynamics_params")
-
-                # Extract syn_spec for each edge type
-                syn_specs = edges_df.set_index("edge_type_id")[extract_cols].to_dict(orient="index")
-
-                if have_dynamics:
-                    # Include parameters from JSON file in the syn_spec
-                    for edge_type_id, syn_spec in syn_specs.copy().items():
-                        params_path = PurePath(
-                            self._conf["components"]["synaptic_models_dir"],
-                            syn_spec["dynamics_params"],
-                        )
-                        with open(params_path) as fp:
-                            params = json.load(fp)
+        Parameters
+        ----------
+        edges_conf : dict
+            Config as dictionary specifying filenames
 
-                        syn_specs[edge_type_id].update(params)
-                        syn_specs[edge_type_id].pop("dynamics_params")
-            else:
-                # More than one synapse model in CSV file; in this case we
-                # must iterate each row in the CSV table. For each row,
-                # we extract the syn_spec associated with the specified model
-
-                syn_specs = {}
-                idx_map = {k: i for i, k in enumerate(list(edges_df), start=1)}
-
-                for row in edges_df.itertuples(name=None):
-                    # Set of settable parameters
-                    settable_params = set([*GetDefaults(row[idx_map["synapse_model"]])])
-                    # Parameters to extract (elements common to both sets)
-                    extract_cols = list(settable_params & edges_df_cols)
-                    syn_spec = {k: row[idx_map[k]] for k in extract_cols}
-
-                    if have_dynamics:
-                        # Include parameters from JSON file in the map
-                        params_path = PurePath(
-                            self._conf["components"]["synaptic_models_dir"],
-                            row[idx_map["dynamics_params"]],
-                        )
+        Returns
+        -------
+        pandas.DataFrame :
+            Edge types CSV table as dataframe.
+        """
 
-                        with open(params_path) as fp:
-                            params = json.load(fp)
+        edges_csv_fn = edges_conf["edge_types_file"]
+        edges_df = pd.read_csv(edges_csv_fn, sep=r"\s+")
 
-                        syn_spec.update(params)
+        if "model_template" not in edges_df.columns:
+            msg = f"Missing the required 'model_template' header specifying NEST synapse models in {edges_csv_fn}."
+            raise ValueError(msg)
 
-                    syn_specs[row[idx_map["edge_type_id"]]] = syn_spec
+        # Rename column labels to names used by NEST. Note that rename
+        # don't throw an error for extra labels (we want this behavior)
+        edges_df.rename(
+            columns={"model_template": "synapse_model", "syn_weight": "weight"},
+            inplace=True,
+        )
 
-            # Create edges map
-            edges_map["syn_specs"] = syn_specs
-            edges_map["edges_file"] = edges_conf["edges_file"]
-            self._edges_maps.append(edges_map)
+        if "dynamics_params" in edges_df.columns:
+            for params_fn in edges_df["dynamics_params"].unique():
+                self._load_params_file("synaptic_models_dir", params_fn)
+
+        return edges_df
+
+    def _read_node_types(self, nodes_conf):
+        """Read a node types CSV file.
+
+        Reads the node types CSV file and, for neuron nodes, loads the JSON
+        files with neuron parameters. This function does not call into the
+        NEST kernel and may thus run concurrently for several files.
+
+        Parameters
+        ----------
+        nodes_conf : dict
+            Config as dictionary specifying filenames
+
+        Returns
+        -------
+        pandas.DataFrame :
+            Node types CSV table as dataframe.
+        """
+
+        nodes_df = pd.read_csv(nodes_conf["node_types_file"], sep=r"\s+")
+
+        is_neuron = nodes_df["model_type"].isin(["point_neuron", "point_process"]).all()
+        if is_neuron and "dynamics_params" in nodes_df.columns:
+            for params_fn in nodes_df["dynamics_params"].unique():
+                self._load_params_file("point_neuron_models_dir", params_fn)
+
+        return nodes_df
+
+    def _map_files(self, func, confs):
+        """Apply a file parsing function to each config.
+
+        The configs are processed by a pool of ``num_parse_threads`` threads
+        if more than one thread was requested in the constructor.
+
+        Returns
+        -------
+        list :
+            Results of ``func`` in the order of ``confs``.
+        """
+
+        if self._num_parse_threads > 1 and len(confs) > 1:
+            with ThreadPoolExecutor(max_workers=self._num_parse_threads) as executor:
+                return list(executor.map(func, confs))
+
+        return [func(conf) for conf in confs]
+
+    def _load_params_file(self, models_dir, params_fn):
+        """Return the model parameters in a JSON file.
+
+        Each file is parsed only once; the parameters are cached for all node
+        and edge types referring to the same file.
+
+        Parameters
+        ----------
+        models_dir : str
+            Key of the directory containing the file in the ``components``
+            section of the configuration.
+        params_fn : str
+            Name of the JSON file.
 
-    def BuildNetwork(self, hdf5_hyperslab_size=None):
+        Returns
+        -------
+        dict :
+            Model parameters. The dictionary is shared and must not be modified.
+        """
+
+        params_path = PurePath(self._conf["components"][models_dir], params_fn)
+
+        if params_path not in self._params_file_cache:
+            with open(params_path) as fp:
+                self._params_file_cache[params_path] = json.load(fp)
+
+        return self._params_file_cache[params_path]
+
+    def _get_settable_params(self, model):
+        """Return the set of settable parameters of a NEST model.
+
+        The defaults of each model are retrieved from the kernel only once.
+        """
+
+        if model not in self._settable_params_cache:
+            self._settable_params_cache[model] = set([*GetDefaults(model)])
+
+        return self._settable_params_cache[model]
+
+    def BuildNetwork(self, hdf5_hyperslab_size=None, cache_dir=None):
         """Build SONATA network.
 
         Convenience function for building the SONATA network. The function
@@ -612,12 +708,28 @@ class SonataNetwork:
 
         For more details, see :py:func:`Create()` and :py:func:`Connect()`.
 
+        If a cache directory is given, the built network is stored there with
+        :py:func:`.Checkpoint`, together with the parameters of the nodes that
+        are not part of the checkpoint, such as the spike times of spike train
+        injectors. Subsequent builds of the same network
+        restore it with :py:func:`.Restore` instead, without parsing any CSV or
+        JSON files or reading the edge HDF5 files. The cache entry is keyed by
+        the configuration, the contents of all files of the network, the number
+        of MPI processes and threads, the resolution and the RNG type and
+        seed, so that a change of any of them leads to a new build. Computing
+        the key reads all files of the network once.
+
         Parameters
         ----------
-        hdf5_hyperslab_size : int, optional
-            Size of hyperslab that is read into memory in one read operation.
+        hdf5_hyperslab_size : [int | str], optional
+            Size of hyperslab that is read into memory in one read operation,
+            or ``"auto"`` to choose it from the available memory.
             Applies to all HDF5 datasets relevant for creating the connections.
             Default: ``2**20``.
+        cache_dir : [str | pathlib.Path | pathlib.PurePath], optional
+            Directory of the build cache, which must be shared by all MPI
+            processes. The kernel must not contain any nodes if a cache
+            directory is given. Default: ``None``, no caching.
 
         Returns
         -------
@@ -631,10 +743,147 @@ class SonataNetwork:
             # to save computational resources in case of wrong input
             self._verify_hyperslab_size(hdf5_hyperslab_size)
 
-        node_collections = self.Create()
-        self.Connect(hdf5_hyperslab_size=hdf5_hyperslab_size)
+        if cache_dir is None:
+            node_collections = self.Create()
+            self.Connect(hdf5_hyperslab_size=hdf5_hyperslab_size)
+
+            return node_collections
+
+        if GetKernelStatus("network_size") > 0:
+            msg = "The kernel must not contain any nodes when building a SONATA network with a cache directory"
+            raise kernel.NESTError(msg)
+
+        cache_path = Path(cache_dir).joinpath(self._build_cache_key())
+
+        if cache_path.joinpath("manifest.json").is_file():
+            self._restore_build(cache_path)
+        else:
+            self.Create()
+            self.Connect(hdf5_hyperslab_size=hdf5_hyperslab_size)
+            self._store_build(cache_path)
+
+        return self._node_collections
+
+    def _build_cache_key(self):
+        """Return the key of the network in the build cache.
+
+        Returns
+        -------
+        str :
+            Hash of the configuration, the kernel settings relevant for a
+            checkpoint and the contents of all files of the network.
+        """
+
+        kernel_keys = ["local_num_threads", "resolution", "rng_type", "rng_seed"]
+        settings = {
+            "cache_version": self._build_cache_version,
+            "num_processes": NumProcesses(),
+            "kernel": dict(zip(kernel_keys, GetKernelStatus(kernel_keys))),
+            "config": self._conf,
+        }
+
+        hasher = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode())
+        for fn in self._network_files():
+            hasher.update(fn.encode())
+            with open(fn, "rb") as fp:
+                for chunk in iter(lambda: fp.read(2**24), b""):
+                    hasher.update(chunk)
 
-        return node_collections
+        return hasher.hexdigest()
+
+    def _network_files(self):
+        """Return the paths of all files describing the network.
+
+        These are the node and edge files, the input spike files and all files
+        in the directories of model parameters.
+        """
+
+        files = []
+        for conf in self._conf["networks"]["nodes"] + self._conf["networks"]["edges"]:
+            files += [conf[key] for key in sorted(conf) if key.endswith("_file")]
+
+        files += [inputs["input_file"] for inputs in self._conf.get("inputs", {}).values() if "input_file" in inputs]
+
+        for models_dir in ["point_neuron_models_dir", "synaptic_models_dir"]:
+            if models_dir in self._conf.get("components", {}):
+                dir_path = Path(self._conf["components"][models_dir])
+                files += sorted(path.as_posix() for path in dir_path.rglob("*") if path.is_file())
+
+        return files
+
+    def _store_build(self, cache_path):
+        """Store the built network in the build cache.
+
+        Each MPI process writes its nodes and connections with
+        :py:func:`.Checkpoint`. The first process then writes the node
+        parameters and, last, the manifest marking the cache entry as complete.
+        """
+
+        Checkpoint(cache_path)
+        SyncProcesses()
+
+        if Rank() == 0:
+            populations = []
+            arrays = {}
+            for i, (pop_name, nodes) in enumerate(self._node_collections.items()):
+                node_params = self._node_params[pop_name]
+                population = {"name": pop_name, "first_node_id": nodes[0].global_id, "size": len(nodes)}
+
+                if "spike_times" in node_params:
+                    spike_times = node_params["spike_times"]
+                    arrays[f"spike_times_{i}"] = np.concatenate([[], *spike_times])
+                    arrays[f"spike_offsets_{i}"] = np.cumsum([0] + [len(times) for times in spike_times])
+                else:
+                    arrays[f"node_type_id_{i}"] = node_params["node_type_id"]
+                    population["params"] = {str(k): params for k, params in node_params["params"].items()}
+
+                populations.append(population)
+
+            np.savez(cache_path.joinpath("nodes.npz"), **arrays)
+
+            manifest_tmp = cache_path.joinpath("manifest.json.tmp")
+            with open(manifest_tmp, "w") as fp:
+                json.dump({"populations": populations}, fp)
+            os.replace(manifest_tmp, cache_path.joinpath("manifest.json"))
+
+        SyncProcesses()
+
+    def _restore_build(self, cache_path):
+        """Restore the network from the build cache.
+
+        Restores the nodes and connections with :py:func:`.Restore` and sets
+        the node parameters that are not part of the checkpoint.
+        """
+
+        with open(cache_path.joinpath("manifest.json")) as fp:
+            manifest = json.load(fp)
+
+        Restore(cache_path)
+        all_nodes = GetNodes()
+
+        with np.load(cache_path.joinpath("nodes.npz")) as arrays:
+            for i, population in enumerate(manifest["populations"]):
+                first = population["first_node_id"] - 1
+                nest_nodes = all_nodes[first : first + population["size"]]
+
+                if "params" in population:
+                    node_type_ids, inv_ind = np.unique(arrays[f"node_type_id_{i}"], return_inverse=True)
+                    for j, node_type_id in enumerate(node_type_ids):
+                        nest_nodes[inv_ind == j].set(population["params"][str(node_type_id)])
+                else:
+                    spike_times = arrays[f"spike_times_{i}"]
+                    offsets = arrays[f"spike_offsets_{i}"]
+                    nest_nodes.set(
+                        [
+                            {"spike_times": spike_times[offsets[j] : offsets[j + 1]], "allow_offgrid_times": True}
+                            for j in range(population["size"])
+                        ]
+                    )
+
+                self._node_collections[population["name"]] = nest_nodes
+
+        self._are_nodes_created = True
+        self._is_network_built = True
 
     def Simulate(self):
         """Simulate the SONATA network.
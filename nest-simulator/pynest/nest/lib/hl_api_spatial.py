@@ -27,8 +27,7 @@ import os
 
 import numpy as np
 
-from ..ll_api import sli_func
-from .hl_api_connections import GetConnections
+from ..ll_api import connection_adjacency, sli_func
 from .hl_api_helper import is_iterable, stringify_path
 from .hl_api_parallel_computing import NumProcesses, Rank
 from .hl_api_types import NodeCollection
@@ -42,6 +41,13 @@ try:
 except ImportError:
     HAVE_MPL = False
 
+try:
+    from scipy.spatial import cKDTree
+
+    HAVE_SCIPY = True
+except ImportError:
+    HAVE_SCIPY = False
+
 __all__ = [
     "CreateMask",
     "Displacement",
@@ -60,8 +66,12 @@ __all__ = [
     "PlotTargets",
     "PlotSources",
     "SelectNodesByMask",
+    "SpatialIndex",
 ]
 
+# Maximum number of distances computed at once if SciPy is not available.
+_MAX_DISTANCES_PER_CHUNK = 2**22
+
 
 def CreateMask(masktype, specs, anchor=None):
     """
@@ -381,7 +391,201 @@ def Distance(from_arg, to_arg):
     return sli_func("Distance", from_arg, to_arg)
 
 
-def FindNearestElement(layer, locations, find_all=False):
+class SpatialIndex:
+    """
+    Spatial index over the positions of the nodes of a spatially distributed population.
+
+    The index is built once from the positions of the nodes and can then answer
+    batches of nearest-neighbour and radius queries. Distances take periodic
+    boundary conditions into account if the layer has `edge_wrap` set. If SciPy
+    is available, queries use a k-d tree and take O(log N) time per location
+    for N nodes, otherwise distances to all nodes are computed with NumPy.
+
+    Queries return indices into the layer, so that ``layer[indices]`` yields the
+    corresponding nodes.
+
+    Parameters
+    ----------
+    layer : NodeCollection
+        `NodeCollection` of spatially distributed node IDs
+
+    Notes
+    -----
+    - Like :py:func:`.GetPosition`, the index only covers nodes local to the
+      current MPI process, if used in an MPI-parallel simulation.
+    - The index is not updated if the positions of the nodes change or the
+      kernel is reset.
+
+    Example
+    -------
+        ::
+
+            import nest
+
+            # create a spatial population
+            s_nodes = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[100, 100]))
+
+            index = nest.SpatialIndex(s_nodes)
+
+            # indices of the nodes closest to many locations
+            nearest = index.nearest([[0.1, 0.2], [-0.3, 0.25], [0.0, 0.0]])
+
+            # indices of all nodes within a radius of 0.1 around each location
+            neighbours = index.within([[0.1, 0.2], [-0.3, 0.25]], 0.1)
+    """
+
+    def __init__(self, layer):
+        if not isinstance(layer, NodeCollection):
+            raise TypeError("layer must be a NodeCollection")
+
+        if not len(layer) > 0:
+            raise ValueError("layer cannot be empty")
+
+        spatial = layer.spatial
+        if spatial is None:
+            raise TypeError("layer must be a NodeCollection with spatial extent")
+
+        self.layer = layer
+        self._positions = np.asarray(GetPosition(layer), dtype=float).reshape(len(layer), -1)
+        self._periodic = bool(spatial["edge_wrap"])
+        self._extent = np.asarray(spatial["extent"], dtype=float)
+        self._lower_left = np.asarray(spatial["center"], dtype=float) - self._extent / 2
+
+        self._tree = None
+        if HAVE_SCIPY:
+            if self._periodic:
+                self._tree = cKDTree(self._wrap(self._positions), boxsize=self._extent)
+            else:
+                self._tree = cKDTree(self._positions)
+
+    def _wrap(self, points):
+        """Map points into the periodic domain of the layer, shifted to the origin."""
+
+        wrapped = np.mod(points - self._lower_left, self._extent)
+        # Round-off may map points just below the lower left corner onto the upper boundary.
+        return np.where(wrapped < self._extent, wrapped, 0.0)
+
+    def _as_points(self, locations):
+        """Convert locations to a two-dimensional array of points."""
+
+        points = np.asarray(locations, dtype=float)
+        if points.ndim == 1:
+            points = points[np.newaxis, :]
+
+        if points.ndim != 2 or points.shape[1] != self._positions.shape[1]:
+            raise ValueError(f"locations must be {self._positions.shape[1]}-dimensional coordinates")
+
+        return points
+
+    def _distance_chunks(self, points):
+        """Yield chunks of points with the distances from each point to all nodes."""
+
+        chunk_size = max(1, _MAX_DISTANCES_PER_CHUNK // len(self._positions))
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start : start + chunk_size]
+            displacements = self._positions[np.newaxis, :, :] - chunk[:, np.newaxis, :]
+            if self._periodic:
+                displacements -= self._extent * np.round(displacements / self._extent)
+            yield chunk, np.sqrt((displacements**2).sum(axis=-1))
+
+    def nearest(self, locations, find_all=False):
+        """
+        Find the nodes closest to the given locations.
+
+        Parameters
+        ----------
+        locations : tuple(s)/list(s) of tuple(s)/list(s)
+            Coordinates of a single location, or list of coordinates of locations
+        find_all : bool, default: False
+            If there are several nodes with the same minimal distance, return
+            only one of them, if `False`. If `True`, return all of them.
+
+        Returns
+        -------
+        numpy.ndarray or list:
+            Array with the index of the closest node for each location, or,
+            if `find_all` is `True`, list with a sorted array of the indices of
+            the closest nodes for each location.
+        """
+
+        points = self._as_points(locations)
+
+        if self._tree is not None:
+            tree_points = self._wrap(points) if self._periodic else points
+            distances, indices = self._tree.query(tree_points)
+            if not find_all:
+                return indices
+            # Nodes are considered equally close if they agree in distance to relative precision 1e-14.
+            candidates = self._tree.query_ball_point(tree_points, distances * (1 + 1e-14))
+            return [np.sort(np.asarray(c, dtype=int)) for c in candidates]
+
+        if not find_all:
+            return np.concatenate([np.argmin(d, axis=1) for _, d in self._distance_chunks(points)])
+
+        result = []
+        for _, d in self._distance_chunks(points):
+            d_min = d.min(axis=1, keepdims=True)
+            result.extend(np.flatnonzero(row) for row in np.abs(d - d_min) <= 1e-14 * d_min)
+        return result
+
+    def within(self, locations, radius):
+        """
+        Find all nodes within a given distance from the given locations.
+
+        Parameters
+        ----------
+        locations : tuple(s)/list(s) of tuple(s)/list(s)
+            Coordinates of a single location, or list of coordinates of locations
+        radius : float
+            Maximal distance of nodes from the locations
+
+        Returns
+        -------
+        list:
+            List with a sorted array of the indices of the nodes within `radius`
+            for each location.
+        """
+
+        points = self._as_points(locations)
+
+        if self._tree is not None:
+            tree_points = self._wrap(points) if self._periodic else points
+            return [np.sort(np.asarray(c, dtype=int)) for c in self._tree.query_ball_point(tree_points, radius)]
+
+        result = []
+        for _, d in self._distance_chunks(points):
+            result.extend(np.flatnonzero(row) for row in d <= radius)
+        return result
+
+    def select_by_mask(self, anchors, mask_obj):
+        """
+        Obtain the nodes inside a mask placed at each of the given anchors.
+
+        All anchors are passed to the kernel in a single call, which builds
+        the tree of the node positions once and searches it for each anchor.
+        See :py:func:`.SelectNodesByMask`.
+
+        Parameters
+        ----------
+        anchors : tuple(s)/list(s) of tuple(s)/list(s)
+            Coordinates of a single anchor, or list of coordinates of anchors
+        mask_obj: object
+            `Mask` object specifying chosen area.
+
+        Returns
+        -------
+        list:
+            List with a `NodeCollection` of the nodes inside the mask for each anchor.
+        """
+
+        anchor_list = self._as_points(anchors).tolist()
+        node_id_lists = sli_func("SelectNodesByMaskBatch", self.layer, anchor_list, mask_obj._datum)
+
+        # When creating a NodeCollection, the input list of nodes IDs must be sorted.
+        return [NodeCollection(sorted(node_id_list)) for node_id_list in node_id_lists]
+
+
+def FindNearestElement(layer, locations, find_all=False, spatial_index=None):
     """
     Return the node(s) closest to the `locations` in the given `layer`.
 
@@ -404,6 +608,9 @@ def FindNearestElement(layer, locations, find_all=False):
         first found, if `False`.
         If `True`, instead of returning a single `NodeCollection`, return a list of `NodeCollection`
         containing all nodes with minimal distance.
+    spatial_index : SpatialIndex, optional
+        Spatial index of `layer` to use for the search. Passing an index
+        avoids building it anew when searching the same layer repeatedly.
 
     Returns
     -------
@@ -416,6 +623,7 @@ def FindNearestElement(layer, locations, find_all=False):
     --------
     FindCenterElement: Return NodeCollection of node closest to center of layers.
     GetPosition: Return the spatial locations of nodes.
+    SpatialIndex: Spatial index for batched queries of nearest nodes.
 
     Example
     -------
@@ -443,24 +651,17 @@ def FindNearestElement(layer, locations, find_all=False):
     if not is_iterable(locations[0]):
         locations = (locations,)
 
-    result = []
+    if spatial_index is None:
+        spatial_index = SpatialIndex(layer)
+    elif spatial_index.layer != layer:
+        raise ValueError("spatial_index must be an index of layer")
 
-    for loc in locations:
-        d = Distance(np.array(loc), layer)
+    nearest = spatial_index.nearest(locations, find_all)
 
-        if not find_all:
-            dx = np.argmin(d)  # finds location of one minimum
-            result.append(layer[dx])
-        else:
-            minnode = list(layer[:1])
-            minval = d[0]
-            for idx in range(1, len(layer)):
-                if d[idx] < minval:
-                    minnode = [layer[idx]]
-                    minval = d[idx]
-                elif np.abs(d[idx] - minval) <= 1e-14 * minval:
-                    minnode.append(layer[idx])
-            result.append(minnode)
+    if not find_all:
+        result = [layer[int(idx)] for idx in nearest]
+    else:
+        result = [[layer[int(idx)] for idx in indices] for indices in nearest]
 
     if len(result) == 1:
         result = result[0]
@@ -669,7 +870,7 @@ def FindCenterElement(layer):
     return layer[index : index + 1]
 
 
-def GetTargetNodes(sources, tgt_layer, syn_model=None):
+def GetTargetNodes(sources, tgt_layer, syn_model=None, as_arrays=False):
     """
     Obtain targets of `sources` in given `target` population.
 
@@ -685,12 +886,17 @@ def GetTargetNodes(sources, tgt_layer, syn_model=None):
         NodeCollection with node IDs of `tgt_layer`
     syn_model : [None | str], optional, default: None
         Return only target positions for a given synapse model.
+    as_arrays : bool, optional, default: False
+        Return the targets as arrays in compressed sparse row format instead of `NodeCollections`.
 
     Returns
     -------
     tuple of NodeCollection:
         Tuple of `NodeCollections` of target neurons fulfilling the given criteria, one `NodeCollection` per
         source node ID in `sources`.
+    tuple of numpy.ndarray:
+        If `as_arrays` is `True`, arrays `offsets` and `node_ids`, where the node IDs of the targets of the
+        i-th source in `sources` are ``node_ids[offsets[i]:offsets[i + 1]]``.
 
     See also
     --------
@@ -730,21 +936,15 @@ def GetTargetNodes(sources, tgt_layer, syn_model=None):
     if not isinstance(tgt_layer, NodeCollection):
         raise TypeError("tgt_layer must be a NodeCollection")
 
-    conns = GetConnections(sources, tgt_layer, synapse_model=syn_model)
+    offsets, node_ids = _unique_in_rows(*connection_adjacency(sources._datum, tgt_layer._datum, syn_model, False))
 
-    # Re-organize conns into one list per source, containing only target node IDs.
-    src_tgt_map = dict((snode_id, []) for snode_id in sources.tolist())
-    for src, tgt in zip(conns.sources(), conns.targets()):
-        src_tgt_map[src].append(tgt)
+    if as_arrays:
+        return offsets, node_ids
 
-    for src in src_tgt_map.keys():
-        src_tgt_map[src] = NodeCollection(list(np.unique(src_tgt_map[src])))
+    return _rows_to_node_collections(offsets, node_ids)
 
-    # convert dict to nested list in same order as sources
-    return tuple(src_tgt_map[snode_id] for snode_id in sources.tolist())
 
-
-def GetSourceNodes(src_layer, targets, syn_model=None):
+def GetSourceNodes(src_layer, targets, syn_model=None, as_arrays=False):
     """
     Obtain sources of `targets` in given `src_layer` population.
 
@@ -760,12 +960,17 @@ def GetSourceNodes(src_layer, targets, syn_model=None):
         NodeCollection with node IDs of `targets`
     syn_model : [None | str], optional, default: None
         Return only source positions for a given synapse model.
+    as_arrays : bool, optional, default: False
+        Return the sources as arrays in compressed sparse row format instead of `NodeCollections`.
 
     Returns
     -------
     tuple of NodeCollection:
         Tuple of `NodeCollections` of source neurons fulfilling the given criteria, one `NodeCollection` per
         target node ID in `target`.
+    tuple of numpy.ndarray:
+        If `as_arrays` is `True`, arrays `offsets` and `node_ids`, where the node IDs of the sources of the
+        i-th target in `targets` are ``node_ids[offsets[i]:offsets[i + 1]]``.
 
     See also
     --------
@@ -804,21 +1009,15 @@ def GetSourceNodes(src_layer, targets, syn_model=None):
     if not isinstance(targets, NodeCollection):
         raise TypeError("targets must be a NodeCollection.")
 
-    conns = GetConnections(src_layer, targets, synapse_model=syn_model)
-
-    # Re-organize conns into one list per target, containing only source node IDs.
-    tgt_src_map = dict((tnode_id, []) for tnode_id in targets.tolist())
-    for src, tgt in zip(conns.sources(), conns.targets()):
-        tgt_src_map[tgt].append(src)
+    offsets, node_ids = _unique_in_rows(*connection_adjacency(src_layer._datum, targets._datum, syn_model, True))
 
-    for tgt in tgt_src_map.keys():
-        tgt_src_map[tgt] = NodeCollection(list(np.unique(tgt_src_map[tgt])))
+    if as_arrays:
+        return offsets, node_ids
 
-    # convert dict to nested list in same order as sources
-    return tuple(tgt_src_map[tnode_id] for tnode_id in targets.tolist())
+    return _rows_to_node_collections(offsets, node_ids)
 
 
-def GetTargetPositions(sources, tgt_layer, syn_model=None):
+def GetTargetPositions(sources, tgt_layer, syn_model=None, as_arrays=False):
     """
     Obtain positions of targets to a given `NodeCollection` of `sources`.
 
@@ -834,12 +1033,17 @@ def GetTargetPositions(sources, tgt_layer, syn_model=None):
         `NodeCollection` of tgt_layer
     syn_type : [None | str], optional, default: None
         Return only target positions for a given synapse model.
+    as_arrays : bool, optional, default: False
+        Return the positions as arrays in compressed sparse row format instead of nested lists.
 
     Returns
     -------
     list of list(s) of tuple(s) of floats:
         Positions of target neurons fulfilling the given criteria as a nested
         list, containing one list of positions per node in sources.
+    tuple of numpy.ndarray:
+        If `as_arrays` is `True`, arrays `offsets` and `positions`, where the positions of the targets of the
+        i-th source in `sources` are the rows ``positions[offsets[i]:offsets[i + 1]]``.
 
     See also
     --------
@@ -875,31 +1079,19 @@ def GetTargetPositions(sources, tgt_layer, syn_model=None):
     if not isinstance(sources, NodeCollection):
         raise TypeError("sources must be a NodeCollection.")
 
-    # Find positions to all nodes in target layer
-    pos_all_tgts = GetPosition(tgt_layer)
-    first_tgt_node_id = tgt_layer[0].get("global_id")
-
-    connections = GetConnections(sources, tgt_layer, synapse_model=syn_model)
-    srcs = connections.get("source")
-    tgts = connections.get("target")
-    if isinstance(srcs, int):
-        srcs = [srcs]
-    if isinstance(tgts, int):
-        tgts = [tgts]
+    if not isinstance(tgt_layer, NodeCollection):
+        raise TypeError("tgt_layer must be a NodeCollection")
 
-    # Make dictionary where the keys are the source node_ids, which is mapped to a
-    # list with the positions of the targets connected to the source.
-    src_tgt_pos_map = dict((snode_id, []) for snode_id in sources.tolist())
+    offsets, node_ids = connection_adjacency(sources._datum, tgt_layer._datum, syn_model, False)
+    positions = _positions_of(tgt_layer, node_ids)
 
-    for i in range(len(connections)):
-        tgt_indx = tgts[i] - first_tgt_node_id
-        src_tgt_pos_map[srcs[i]].append(pos_all_tgts[tgt_indx])
+    if as_arrays:
+        return offsets, positions
 
-    # Turn dict into list in same order as sources
-    return [src_tgt_pos_map[snode_id] for snode_id in sources.tolist()]
+    return _rows_to_position_lists(offsets, positions)
 
 
-def GetSourcePositions(src_layer, targets, syn_model=None):
+def GetSourcePositions(src_layer, targets, syn_model=None, as_arrays=False):
     """
     Obtain positions of sources to a given `NodeCollection` of `targets`.
 
@@ -915,12 +1107,17 @@ def GetSourcePositions(src_layer, targets, syn_model=None):
         `NodeCollection` with node ID(s) of target neurons
     syn_type : [None | str], optional, default: None
         Return only source positions for a given synapse model.
+    as_arrays : bool, optional, default: False
+        Return the positions as arrays in compressed sparse row format instead of nested lists.
 
     Returns
     -------
     list of list(s) of tuple(s) of floats:
         Positions of source neurons fulfilling the given criteria as a nested
         list, containing one list of positions per node in targets.
+    tuple of numpy.ndarray:
+        If `as_arrays` is `True`, arrays `offsets` and `positions`, where the positions of the sources of the
+        i-th target in `targets` are the rows ``positions[offsets[i]:offsets[i + 1]]``.
 
     See also
     --------
@@ -953,30 +1150,61 @@ def GetSourcePositions(src_layer, targets, syn_model=None):
             # get the positions of the targets of a source neuron
             nest.GetSourcePositions(s_nodes, s_nodes[5])
     """
+    if not isinstance(src_layer, NodeCollection):
+        raise TypeError("src_layer must be a NodeCollection")
+
     if not isinstance(targets, NodeCollection):
         raise TypeError("targets must be a NodeCollection.")
 
-    # Find positions to all nodes in source layer
-    pos_all_srcs = GetPosition(src_layer)
-    first_src_node_id = src_layer[0].get("global_id")
+    offsets, node_ids = connection_adjacency(src_layer._datum, targets._datum, syn_model, True)
+    positions = _positions_of(src_layer, node_ids)
+
+    if as_arrays:
+        return offsets, positions
+
+    return _rows_to_position_lists(offsets, positions)
+
+
+def _unique_in_rows(offsets, node_ids):
+    """
+    Remove repeated node IDs within the rows of an adjacency in compressed sparse row format.
+
+    The node IDs must be sorted within each row, as returned by ``connection_adjacency()``.
+    Returns the offsets and node IDs of the adjacency without repetitions.
+    """
 
-    connections = GetConnections(src_layer, targets, synapse_model=syn_model)
-    srcs = connections.get("source")
-    tgts = connections.get("target")
-    if isinstance(srcs, int):
-        srcs = [srcs]
-    if isinstance(tgts, int):
-        tgts = [tgts]
+    keep = np.ones(len(node_ids), dtype=bool)
+    keep[1:] = node_ids[1:] != node_ids[:-1]
+    # The first entry of each row is kept, even if the previous row ends with the same node ID.
+    keep[offsets[:-1][offsets[:-1] < offsets[1:]]] = True
 
-    # Make dictionary where the keys are the target node_ids, which is mapped to a
-    # list with the positions of the sources connected to the targets.
-    tgt_src_pos_map = dict((tnode_id, []) for tnode_id in targets.tolist())
-    for i in range(len(connections)):
-        src_indx = srcs[i] - first_src_node_id
-        tgt_src_pos_map[tgts[i]].append(pos_all_srcs[src_indx])
+    n_kept = np.concatenate(([0], np.cumsum(keep)))
+    return n_kept[offsets], node_ids[keep]
 
-    # Turn dict into list in same order as target
-    return [tgt_src_pos_map[tnode_id] for tnode_id in targets.tolist()]
+
+def _rows_to_node_collections(offsets, node_ids):
+    """Convert an adjacency in compressed sparse row format to a tuple of one `NodeCollection` per row."""
+
+    return tuple(
+        NodeCollection(node_ids[begin:end].tolist()) for begin, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    )
+
+
+def _positions_of(layer, node_ids):
+    """Return the positions of the given node IDs in `layer` as rows of an array."""
+
+    layer_node_ids = np.asarray(layer.tolist())
+    layer_positions = np.asarray(GetPosition(layer), dtype=float).reshape(len(layer), -1)
+
+    return layer_positions[np.searchsorted(layer_node_ids, node_ids)]
+
+
+def _rows_to_position_lists(offsets, positions):
+    """Convert positions in compressed sparse row format to one list of position tuples per row."""
+
+    position_tuples = [tuple(position) for position in positions.tolist()]
+
+    return [position_tuples[begin:end] for begin, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
 
 
 def SelectNodesByMask(layer, anchor, mask_obj):
@@ -1001,6 +1229,10 @@ def SelectNodesByMask(layer, anchor, mask_obj):
     -------
     NodeCollection:
         `NodeCollection` of nodes/elements inside the mask.
+
+    See also
+    --------
+    SpatialIndex: Spatial index for batched queries, including masks placed at several anchors.
     """
 
     if not isinstance(layer, NodeCollection):
@@ -23,6 +23,8 @@
 Classes defining the different PyNEST types
 """
 
+import bisect
+import itertools
 import json
 import numbers
 from math import floor, log
@@ -30,14 +32,30 @@ from math import floor, log
 import numpy
 
 from .. import pynestkernel as kernel
-from ..ll_api import sli_func, spp, sps, sr, take_array_index
+from ..ll_api import (
+    connection_id_arrays,
+    drain_events,
+    harvest_events,
+    node_collection_layout,
+    node_collection_models,
+    sli_func,
+    spp,
+    sps,
+    sr,
+    take_array_index,
+)
+from . import hl_api_simulation
 from .hl_api_helper import (
     broadcast,
+    get_connection_parameters_array,
     get_parameters,
+    get_parameters_array,
     get_parameters_hierarchical_addressing,
     is_iterable,
     is_literal,
     restructure_data,
+    set_connection_parameters_array,
+    set_parameters_array,
 )
 from .hl_api_parallel_computing import Rank
 from .hl_api_simulation import GetKernelStatus
@@ -145,11 +163,61 @@ class NodeCollectionIterator:
         if self._increment > len(self._nc) - 1:
             raise StopIteration
 
-        val = sli_func("Take_g_a", self._nc._datum, [self._increment, self._increment + 1, 1])
+        val = self._nc[self._increment]
         self._increment += 1
         return val
 
 
+class _NodeCollectionLayout:
+    """
+    Node IDs of a `NodeCollection` as arithmetic runs.
+
+    The node IDs are, in order, ``firsts[k] + j * step`` for ``j`` in
+    ``range(counts[k])`` for all runs ``k``, with node IDs increasing from
+    run to run. This allows to answer queries about the node IDs without
+    calls to the kernel.
+    """
+
+    __slots__ = ("firsts", "offsets", "step", "reset_count")
+
+    def __init__(self, firsts, counts, step):
+        self.firsts = list(firsts)
+        self.offsets = list(itertools.accumulate(counts, initial=0))
+        self.step = step
+        self.reset_count = hl_api_simulation._reset_count
+
+    def __len__(self):
+        return self.offsets[-1]
+
+    def node_id(self, index):
+        """Return the node ID at the given non-negative index."""
+
+        k = bisect.bisect_right(self.offsets, index) - 1
+        return self.firsts[k] + (index - self.offsets[k]) * self.step
+
+    def index(self, node_id):
+        """Return the index of the given node ID, or -1 if it is not in the `NodeCollection`."""
+
+        k = bisect.bisect_right(self.firsts, node_id) - 1
+        if k < 0:
+            return -1
+
+        j, remainder = divmod(node_id - self.firsts[k], self.step)
+        if remainder != 0 or j >= self.offsets[k + 1] - self.offsets[k]:
+            return -1
+
+        return self.offsets[k] + j
+
+    def tolist(self):
+        """Return a list of all node IDs."""
+
+        return [
+            first + j * self.step
+            for first, begin, end in zip(self.firsts, self.offsets, self.offsets[1:])
+            for j in range(end - begin)
+        ]
+
+
 class NodeCollection:
     """
     Class for `NodeCollection`.
@@ -198,7 +266,13 @@ class NodeCollection:
             6 in new_nc
     """
 
-    _datum = None
+    _nc_datum = None
+
+    # Arguments of Take_g_a to create the datum from a parent NodeCollection on first use
+    _take = None
+
+    # Cached _NodeCollectionLayout, see _get_layout()
+    _layout = None
 
     def __init__(self, data=None):
         if data is None:
@@ -214,6 +288,44 @@ class NodeCollection:
             nc = sli_func("cvnodecollection", data)
             self._datum = nc._datum
 
+    @property
+    def _datum(self):
+        # Elements of a NodeCollection are created without calling the kernel, their datum is taken
+        # from the parent NodeCollection only when it is needed.
+        if self._take is not None:
+            parent, take = self._take
+            super().__setattr__("_nc_datum", sli_func("Take_g_a", parent._datum, take)._datum)
+            super().__setattr__("_take", None)
+        return self._nc_datum
+
+    @_datum.setter
+    def _datum(self, datum):
+        super().__setattr__("_nc_datum", datum)
+
+    def _get_layout(self):
+        """
+        Return the layout of the node IDs, which is obtained from the kernel only once.
+
+        The layout does not change during the lifetime of a `NodeCollection`, but is obtained
+        anew after :py:func:`.ResetKernel`, as the `NodeCollection` is then no longer valid.
+        """
+
+        layout = self._layout
+        if layout is None or layout.reset_count != hl_api_simulation._reset_count:
+            layout = _NodeCollectionLayout(*node_collection_layout(self._datum))
+            super().__setattr__("_layout", layout)
+        return layout
+
+    def _element(self, index):
+        """Return the element at the given non-negative index, without calling the kernel."""
+
+        element = NodeCollection.__new__(NodeCollection)
+        super(NodeCollection, element).__setattr__("_take", (self, [index, index + 1, 1]))
+        super(NodeCollection, element).__setattr__(
+            "_layout", _NodeCollectionLayout([self._get_layout().node_id(index)], [1], 1)
+        )
+        return element
+
     def __iter__(self):
         return NodeCollectionIterator(self)
 
@@ -251,7 +363,7 @@ class NodeCollection:
         elif isinstance(key, (int, numpy.integer)):
             if key >= self.__len__() or key + self.__len__() < 0:
                 raise IndexError("index value outside of the NodeCollection")
-            return sli_func("Take_g_a", self._datum, [key, key + 1, 1])
+            return self._element(int(key) if key >= 0 else int(key) + self.__len__())
         elif isinstance(key, (list, tuple)):
             if len(key) == 0:
                 return NodeCollection([])
@@ -285,6 +397,8 @@ class NodeCollection:
             raise IndexError("only integers, slices, lists, tuples, and numpy arrays are valid indices")
 
     def __contains__(self, node_id):
+        if isinstance(node_id, (int, numpy.integer)):
+            return self._get_layout().index(node_id) != -1
         return sli_func("InCollection", self._datum, node_id)
 
     def __eq__(self, other):
@@ -303,7 +417,7 @@ class NodeCollection:
         return not self == other
 
     def __len__(self):
-        return sli_func("size", self._datum)
+        return len(self._get_layout())
 
     def __str__(self):
         return sli_func("pcvs", self._datum)
@@ -324,9 +438,13 @@ class NodeCollection:
             - A list of strings.
             - One or more strings, followed by a string or list of strings.
               This is for hierarchical addressing.
-        output : str, ['pandas','json'], optional
-             If the returned data should be in a Pandas DataFrame or in a
-             JSON string format.
+        output : str, ['pandas','json','numpy'], optional
+             If the returned data should be in a Pandas DataFrame, in a
+             JSON string format, or in NumPy arrays. With ``'numpy'``, `params`
+             must be a single string or a list of strings naming parameters
+             with scalar values. All parameters are then read in a single call
+             to the kernel and returned as one array per parameter, with NaN
+             for nodes that do not have the parameter.
 
         Returns
         -------
@@ -342,6 +460,8 @@ class NodeCollection:
             for all nodes is returned.
         DataFrame:
             Pandas Data frame if output should be in pandas format.
+        numpy.ndarray or dict:
+            One array, or a dictionary of arrays, if output should be in NumPy format.
 
         Raises
         ------
@@ -378,6 +498,9 @@ class NodeCollection:
 
         >>>    voltmeter.get('events', 'senders')
                array([...], dtype=int64)
+
+        >>>    nodes.get(['V_m', 'global_id'], output='numpy')
+               {'V_m': array([-70., -70., -70.]), 'global_id': array([1, 2, 3])}
         """
 
         if not self:
@@ -397,6 +520,11 @@ class NodeCollection:
 
         pandas_output = output == "pandas"
 
+        if output == "numpy":
+            if len(params) != 1:
+                raise TypeError("output='numpy' requires a parameter name or a list of parameter names")
+            return get_parameters_array(self, params[0])
+
         if len(params) == 0:
             # get() is called without arguments
             result = sli_func("get", self._datum)
@@ -437,11 +565,15 @@ class NodeCollection:
         If `kwargs` is given, it has to be names and values of an attribute as keyword argument pairs. The values
         can be single values or list of the same size as the `NodeCollection`.
 
+        If any value is a NumPy array and the model of the nodes has a scalar value for each given parameter, all
+        parameters are written into the nodes in a single bulk operation in the kernel. In this case, all values must
+        be scalars or one-dimensional arrays of the same size as the `NodeCollection`.
+
         Parameters
         ----------
         params : str or dict or list
-            Dictionary of parameters (either lists or single values) or list of dictionaries of parameters
-            of same length as the `NodeCollection`.
+            Dictionary of parameters (either lists, NumPy arrays or single values) or list of dictionaries of
+            parameters of same length as the `NodeCollection`.
         kwargs : keyword argument pairs
             Named arguments of parameters of the elements in the `NodeCollection`.
 
@@ -451,6 +583,8 @@ class NodeCollection:
             If the input params are of the wrong form.
         KeyError
             If the specified parameter does not exist for the nodes.
+        ValueError
+            If a NumPy array does not have the same size as the `NodeCollection`.
 
         See Also
         --------
@@ -482,6 +616,19 @@ class NodeCollection:
                 # Adding receptors has been handled by the += operator, so we can remove the entry.
                 params.pop("receptors")
 
+        if isinstance(params, dict) and any(isinstance(vals, numpy.ndarray) for vals in params.values()):
+            # Parameters with array values, such as spike_times, are set on each node as a whole below.
+            # The models are taken from the NodeCollection, as the status of non-local nodes only holds
+            # the model of their proxies.
+            array_valued = False
+            for model in node_collection_models(self._datum):
+                sr("/{0} GetDefaults".format(model))
+                model_defaults = spp()
+                array_valued = array_valued or any(is_iterable(model_defaults.get(key)) for key in params)
+            if not array_valued:
+                set_parameters_array(self, params)
+                return
+
         if isinstance(params, dict) and all(local_nodes):
             node_params = self[0].get()
             contains_list = [
@@ -506,14 +653,76 @@ class NodeCollection:
 
         sli_func("SetStatus", self._datum, params)
 
+    def drain_events(self):
+        """
+        Take the events recorded by recording devices in memory, removing them from the devices.
+
+        The events are returned as NumPy arrays, which take over the data recorded by the devices without copying
+        it. Afterwards, the devices hold no events and `n_events` is 0, so that repeated calls only return the
+        events recorded since the previous call. This allows to fetch data from long simulations in chunks, without
+        recorded data accumulating in the devices.
+
+        Returns
+        -------
+        dict or tuple:
+            Dictionary with the same entries as the `events` of the device if the `NodeCollection` has a single
+            element, otherwise a tuple of such dictionaries, one for each device.
+
+        Raises
+        ------
+        NESTErrors.BadProperty
+            If a node is not a recording device with `record_to` set to ``"memory"``.
+
+        See Also
+        --------
+        :py:func:`get`,
+        :py:func:`harvest_events`
+        """
+
+        result = tuple(drain_events(node_id) for node_id in self.tolist())
+
+        return result[0] if len(result) == 1 else result
+
+    def harvest_events(self, discard=False):
+        """
+        Take the events recorded by recording devices in memory since the previous harvest.
+
+        Each device keeps track of the events already harvested, so that each call only returns new events. This
+        allows to fetch data between calls to :py:func:`.Run` in time proportional to the number of new events,
+        while the `events` of the devices still hold all recorded events. If `discard` is `True`, all events are
+        removed from the devices after harvesting, and `n_events` is reset to 0, so that the memory used by the
+        devices stays bounded during long simulations.
+
+        Parameters
+        ----------
+        discard : bool, optional
+            Whether to remove the events from the devices.
+
+        Returns
+        -------
+        dict or tuple:
+            Dictionary with the same entries as the `events` of the device if the `NodeCollection` has a single
+            element, otherwise a tuple of such dictionaries, one for each device.
+
+        Raises
+        ------
+        NESTErrors.BadProperty
+            If a node is not a recording device with `record_to` set to ``"memory"``.
+
+        See Also
+        --------
+        :py:func:`drain_events`
+        """
+
+        result = tuple(harvest_events(node_id, discard) for node_id in self.tolist())
+
+        return result[0] if len(result) == 1 else result
+
     def tolist(self):
         """
         Convert `NodeCollection` to list.
         """
-        if self.__len__() == 0:
-            return []
-
-        return list(self.get("global_id")) if len(self) > 1 else [self.get("global_id")]
+        return self._get_layout().tolist()
 
     def _to_array(self, selection="all"):
         """
@@ -563,7 +772,10 @@ class NodeCollection:
         ValueError
             If the node ID is not in the `NodeCollection`.
         """
-        index = sli_func("Find", self._datum, node_id)
+        if isinstance(node_id, (int, numpy.integer)):
+            index = self._get_layout().index(node_id)
+        else:
+            index = sli_func("Find", self._datum, node_id)
 
         if index == -1:
             raise ValueError("{} is not in NodeCollection".format(node_id))
@@ -619,13 +831,23 @@ class SynapseCollectionIterator:
     """
 
     def __init__(self, synapse_collection):
-        self._iter = iter(synapse_collection._datum)
+        self._synapse_collection = synapse_collection
+        self._index = 0
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return SynapseCollection(next(self._iter))
+        if self._index >= len(self._synapse_collection):
+            raise StopIteration
+
+        self._index += 1
+        return self._synapse_collection[self._index - 1]
+
+
+# Types of the arrays of source, target, target_thread, synapse_id and port in a SynapseCollection. The
+# thread, synapse ID and port are limited by the bits reserved for them in the kernel, 24 bytes per connection.
+_connection_id_dtypes = (numpy.int64, numpy.int64, numpy.uint16, numpy.uint16, numpy.uint32)
 
 
 class SynapseCollection:
@@ -637,25 +859,40 @@ class SynapseCollection:
     :py:func:`set()`. By using the membership function :py:func:`sources()` you get an iterator over
     source nodes, while :py:func:`targets()` returns an interator over the target nodes of the connections.
 
+    The identifiers of the connections, consisting of source, target, target thread, synapse ID and port, are
+    stored in parallel NumPy arrays, and are only converted to connection identifiers of the kernel when the
+    kernel is called. Besides integers and slices, a `SynapseCollection` can be indexed with arrays of indices
+    or boolean masks.
+
     A SynapseCollection is created by the :py:func:`.GetConnections` function.
     """
 
-    _datum = None
+    _connection_ids = None
 
     def __init__(self, data):
-        if isinstance(data, list):
+        if isinstance(data, tuple):
+            if len(data) != len(_connection_id_dtypes):
+                raise TypeError("Expected a tuple of {} arrays of connection IDs.".format(len(_connection_id_dtypes)))
+            connection_ids = data
+        elif isinstance(data, list):
             for datum in data:
                 if not isinstance(datum, kernel.SLIDatum) or datum.dtype != "connectiontype":
                     raise TypeError("Expected Connection Datum.")
-            self._datum = data
+            connection_ids = connection_id_arrays(data) if data else ((),) * len(_connection_id_dtypes)
         elif data is None:
             # We can have an empty SynapseCollection if there are no connections.
-            self._datum = data
+            connection_ids = ((),) * len(_connection_id_dtypes)
         else:
             if not isinstance(data, kernel.SLIDatum) or data.dtype != "connectiontype":
                 raise TypeError("Expected Connection Datum.")
-            # self._datum needs to be a list of Connection datums.
-            self._datum = [data]
+            connection_ids = connection_id_arrays([data])
+
+        # Arrays of the right types, e.g., created by the kernel, are not copied
+        self._connection_ids = tuple(
+            numpy.asarray(ids, dtype=dtype) for ids, dtype in zip(connection_ids, _connection_id_dtypes)
+        )
+        if any(ids.shape != self._connection_ids[0].shape or ids.ndim != 1 for ids in self._connection_ids):
+            raise ValueError("The arrays of connection IDs must be one-dimensional and of the same length.")
 
         self.print_full = False
 
@@ -663,21 +900,15 @@ class SynapseCollection:
         return SynapseCollectionIterator(self)
 
     def __len__(self):
-        if self._datum is None:
-            return 0
-        return len(self._datum)
+        return len(self._connection_ids[0])
 
     def __eq__(self, other):
         if not isinstance(other, SynapseCollection):
             raise NotImplementedError()
 
-        if self.__len__() != other.__len__():
-            return False
-        self_get = self.get(["source", "target", "target_thread", "synapse_id", "port"])
-        other_get = other.get(["source", "target", "target_thread", "synapse_id", "port"])
-        if self_get != other_get:
-            return False
-        return True
+        return all(
+            numpy.array_equal(ids, other_ids) for ids, other_ids in zip(self._connection_ids, other._connection_ids)
+        )
 
     def __neq__(self, other):
         if not isinstance(other, SynapseCollection):
@@ -685,10 +916,14 @@ class SynapseCollection:
         return not self == other
 
     def __getitem__(self, key):
-        if isinstance(key, slice):
-            return SynapseCollection(self._datum[key])
-        else:
-            return SynapseCollection([self._datum[key]])
+        if isinstance(key, (numbers.Integral, numpy.integer)):
+            # Indexing with a list keeps the dimension and checks the bounds
+            key = [key]
+        elif not isinstance(key, slice):
+            key = numpy.asarray(key)
+            if key.dtype != bool and not numpy.issubdtype(key.dtype, numpy.integer):
+                raise TypeError("indices must be integers, slices, integer arrays or boolean masks")
+        return SynapseCollection(tuple(ids[key] for ids in self._connection_ids))
 
     def __str__(self):
         """
@@ -773,35 +1008,35 @@ class SynapseCollection:
 
     def __getattr__(self, attr):
         if attr == "distance":
-            dist = sli_func("Distance", self._datum)
+            dist = sli_func("Distance", self)
             super().__setattr__(attr, dist)
             return self.distance
 
         return self.get(attr)
 
     def __setattr__(self, attr, value):
-        # `_datum` is the only property of SynapseCollection that should not be
-        # interpreted as a property of the model
-        if attr == "_datum" or attr == "print_full":
+        # `_connection_ids` and `print_full` are the only properties of SynapseCollection that
+        # should not be interpreted as a property of the model
+        if attr == "_connection_ids" or attr == "print_full":
             super().__setattr__(attr, value)
         else:
             self.set({attr: value})
 
     def sources(self):
         """Returns iterator containing the source node IDs of the `SynapseCollection`."""
-        sources = self.get("source")
-        if not isinstance(sources, (list, tuple)):
-            sources = (sources,)
-        return iter(sources)
+        # The connections of an invalidated SynapseCollection no longer exist after a reset of the kernel.
+        if GetKernelStatus("network_size") == 0:
+            return iter(())
+        return iter(self._connection_ids[0].tolist())
 
     def targets(self):
         """Returns iterator containing the target node IDs of the `SynapseCollection`."""
-        targets = self.get("target")
-        if not isinstance(targets, (list, tuple)):
-            targets = (targets,)
-        return iter(targets)
+        # The connections of an invalidated SynapseCollection no longer exist after a reset of the kernel.
+        if GetKernelStatus("network_size") == 0:
+            return iter(())
+        return iter(self._connection_ids[1].tolist())
 
-    def get(self, keys=None, output=""):
+    def get(self, keys=None, output="", out=None):
         """
         Return a parameter dictionary of the connections.
 
@@ -816,9 +1051,16 @@ class SynapseCollection:
             String or a list of strings naming model properties. get
             then returns a single value or a dictionary with lists of values
             belonging to the given `keys`.
-        output : str, ['pandas','json'], optional
-            If the returned data should be in a Pandas DataFrame or in a
-            JSON string format.
+        output : str, ['pandas','json','numpy'], optional
+            If the returned data should be in a Pandas DataFrame, in a
+            JSON string format or in NumPy arrays. With ``'numpy'``, only
+            parameters with boolean, integer or double values can be
+            requested, and `keys` defaults to source, target, weight and delay.
+        out : dict or str or path-like, optional
+            Only with ``output='numpy'``: a dictionary of arrays with one
+            element per connection, into which the values are written for
+            each key, or a directory in which the values are written to
+            memory-mapped ``<key>.npy`` files.
 
         Returns
         -------
@@ -827,6 +1069,10 @@ class SynapseCollection:
             lists of corresponding parameters
         type:
             If keys is a string, the corresponding parameter(s) is returned
+        numpy.ndarray:
+            If output is ``'numpy'`` and keys is a string, an array with one value
+            per connection is returned. Values of connections that do not have
+            the parameter are NaN.
 
 
         Raises
@@ -857,12 +1103,34 @@ class SynapseCollection:
         >>>    nodes.get(['source', 'weight'])
                {'source': [1, 1, 1, 2, 2, 2, 3, 3, 3],
                 'weight': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]}
+
+        >>>    conns.get('weight', output='numpy')
+               array([1., 1., 1., 1., 1., 1., 1., 1., 1.])
+
+        >>>    conns.get(['source', 'weight'], output='numpy', out='weights_snapshot')
+               {'source': memmap([1, 1, 1, 2, 2, 2, 3, 3, 3]),
+                'weight': memmap([1., 1., 1., 1., 1., 1., 1., 1., 1.])}
         """
 
         pandas_output = output == "pandas"
         if pandas_output and not HAVE_PANDAS:
             raise ImportError("Pandas could not be imported")
 
+        if output == "numpy":
+            if keys is None:
+                keys = ["source", "target", "weight", "delay"]
+            elif not (is_literal(keys) or (is_iterable(keys) and all(is_literal(key) for key in keys))):
+                raise TypeError("keys should be either a string or an iterable of strings")
+
+            # As below, an empty or invalidated SynapseCollection yields empty arrays.
+            connection_ids = self._connection_ids if GetKernelStatus("network_size") > 0 else None
+            result = get_connection_parameters_array(
+                connection_ids, [str(keys)] if is_literal(keys) else [str(key) for key in keys], out
+            )
+            return result[str(keys)] if is_literal(keys) else result
+        elif out is not None:
+            raise TypeError("out can only be given with output='numpy'")
+
         # Return empty dictionary if we have no connections
         # We also return if the network is empty after a ResetKernel.
         # This avoids problems with invalid SynapseCollections.
@@ -887,7 +1155,7 @@ class SynapseCollection:
         else:
             raise TypeError("keys should be either a string or an iterable")
 
-        sps(self._datum)
+        sps(self)
         sr(cmd)
         result = spp()
 
@@ -913,11 +1181,15 @@ class SynapseCollection:
         If `kwargs` is given, it has to be names and values of an attribute as keyword argument pairs. The values
         can be single values or list of the same size as the `SynapseCollection`.
 
+        If any value is a NumPy array, all parameters are set in a single bulk operation in the kernel. In this
+        case, all values must be scalars or one-dimensional arrays of the same size as the `SynapseCollection`,
+        and only parameters with boolean, integer or double values can be set.
+
         Parameters
         ----------
         params : str or dict or list
-            Dictionary of parameters (either lists or single values) or list of dictionaries of parameters
-            of same length as `SynapseCollection`.
+            Dictionary of parameters (either lists, NumPy arrays or single values) or list of dictionaries of
+            parameters of same length as `SynapseCollection`.
         kwargs : keyword argument pairs
             Named arguments of parameters of the elements in the `SynapseCollection`.
 
@@ -927,6 +1199,8 @@ class SynapseCollection:
             If input params are of the wrong form.
         KeyError
             If the specified parameter does not exist for the connections.
+        ValueError
+            If a NumPy array does not have the same size as the `SynapseCollection`.
 
         See Also
         --------
@@ -949,6 +1223,10 @@ class SynapseCollection:
         elif kwargs and params:
             raise TypeError("must either provide params or kwargs, but not both.")
 
+        if isinstance(params, dict) and any(isinstance(vals, numpy.ndarray) for vals in params.values()):
+            set_connection_parameters_array(self._connection_ids, params)
+            return
+
         if isinstance(params, dict):
             node_params = self[0].get()
             contains_list = [
@@ -970,7 +1248,7 @@ class SynapseCollection:
 
         params = broadcast(params, self.__len__(), (dict,), "params")
 
-        sps(self._datum)
+        sps(self)
         sps(params)
 
         sr("2 arraystore")
@@ -980,7 +1258,7 @@ class SynapseCollection:
         """
         Disconnect the connections in the `SynapseCollection`.
         """
-        sps(self._datum)
+        sps(self)
         sr("Disconnect_a")
 
 
@@ -1271,12 +1549,15 @@ class Receptors(CmBase):
     pass
 
 
-def serialize_data(data):
+def serialize_data(data, keep_arrays=False):
     """Serialize data for JSON.
 
     Parameters
     ----------
     data : any
+    keep_arrays : bool, optional
+        If True, NumPy arrays are kept instead of being converted to
+        lists, e.g., for encoding the data in a binary format.
 
     Returns
     -------
@@ -1284,20 +1565,22 @@ def serialize_data(data):
         Data can be encoded to JSON
     """
 
+    if keep_arrays and isinstance(data, numpy.ndarray):
+        return data
     if isinstance(data, (numpy.ndarray, NodeCollection)):
         return data.tolist()
     if isinstance(data, (numpy.integer)):
         return int(data)
     elif isinstance(data, SynapseCollection):
         # Get full information from SynapseCollection
-        return serialize_data(data.get())
+        return serialize_data(data.get(), keep_arrays)
     elif isinstance(data, kernel.SLILiteral):
         # Get name of SLILiteral.
         return data.name
     elif isinstance(data, (list, tuple)):
-        return [serialize_data(d) for d in data]
+        return [serialize_data(d, keep_arrays) for d in data]
     elif isinstance(data, dict):
-        return dict([(key, serialize_data(value)) for key, value in data.items()])
+        return dict([(key, serialize_data(value, keep_arrays)) for key, value in data.items()])
     return data
 
 
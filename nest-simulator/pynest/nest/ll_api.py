@@ -54,8 +54,24 @@ from . import pynestkernel as kernel  # noqa pylint: disable=no-name-in-module
 
 __all__ = [
     "check_stack",
+    "checkpoint",
     "connect_arrays",
+    "connect_arrays_partitioned",
+    "connection_adjacency",
+    "connection_id_arrays",
+    "connections_chunk",
+    "construction_log",
+    "drain_events",
+    "get_connection_arrays",
+    "get_node_arrays",
+    "harvest_events",
+    "node_collection_layout",
+    "node_collection_models",
+    "phase_profile",
+    "restore",
     "set_communicator",
+    "set_connection_arrays",
+    "set_node_arrays",
     "get_debug",
     "set_debug",
     "sli_func",
@@ -76,9 +92,25 @@ sli_push = sps = engine.push
 sli_pop = spp = engine.pop
 take_array_index = engine.take_array_index
 connect_arrays = engine.connect_arrays
-
-
-def catching_sli_run(cmd):
+connect_arrays_partitioned = engine.connect_arrays_partitioned
+connection_adjacency = engine.connection_adjacency
+get_node_arrays = engine.get_node_arrays
+set_node_arrays = engine.set_node_arrays
+connection_id_arrays = engine.connection_id_arrays
+connections_chunk = engine.connections_chunk
+get_connection_arrays = engine.get_connection_arrays
+set_connection_arrays = engine.set_connection_arrays
+drain_events = engine.drain_events
+harvest_events = engine.harvest_events
+node_collection_layout = engine.node_collection_layout
+node_collection_models = engine.node_collection_models
+checkpoint = engine.checkpoint
+restore = engine.restore
+phase_profile = engine.phase_profile
+construction_log = engine.construction_log
+
+
+def catching_sli_run(cmd, cached=False):
     """Send a command string to the NEST kernel to be executed, catch
     SLI errors and re-raise them in Python.
 
@@ -86,13 +118,20 @@ def catching_sli_run(cmd):
     ----------
     cmd : str
         The SLI command to be executed.
+    cached : bool, optional
+        Whether to parse the command only on the first call and reuse the
+        parsed procedure on subsequent calls. Only use this for fixed
+        command strings, as each distinct command occupies the cache.
     Raises
     ------
     kernel.NESTError
         SLI errors are bubbled to the Python API as NESTErrors.
     """
 
-    engine.run("{%s} runprotected" % cmd)
+    if cached:
+        engine.run_cached("{%s} runprotected" % cmd)
+    else:
+        engine.run("{%s} runprotected" % cmd)
     if not sli_pop():
         errorname = sli_pop()
         message = sli_pop()
@@ -148,8 +187,8 @@ def sli_func(func, *args, **kwargs):
         raise kernel.NESTErrors.PyNESTError("'namespace' and 'litconv' are the only valid keyword arguments.")
 
     sli_push(args)  # push array of arguments on SLI stack
-    sli_push(func)  # push command string
-    sli_run(slifun)  # SLI support code to execute func on args
+    engine.push_procedure(func)  # push command, parsed only on first use
+    sli_run(slifun, cached=True)  # SLI support code to execute func on args
     result = sli_pop()  # return value is an array
 
     if not result:
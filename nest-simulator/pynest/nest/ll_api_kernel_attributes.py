@@ -52,7 +52,7 @@ class KernelAttribute:
         if instance is None:
             return self
 
-        sr("GetKernelStatus")
+        sr("GetKernelStatus", cached=True)
         status_root = spp()
 
         if self._full_status:
@@ -66,4 +66,4 @@ class KernelAttribute:
             msg = f"`{self._name}` is a read only kernel attribute."
             raise AttributeError(msg)
         sps({self._name: value})
-        sr("SetKernelStatus")
+        sr("SetKernelStatus", cached=True)
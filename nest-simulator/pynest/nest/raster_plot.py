@@ -23,8 +23,17 @@
 
 import nest
 import numpy
+from nest.lib.hl_api_helper import load_npy_events
 
-__all__ = ["extract_events", "from_data", "from_device", "from_file", "from_file_numpy", "from_file_pandas"]
+__all__ = [
+    "extract_events",
+    "from_data",
+    "from_device",
+    "from_file",
+    "from_file_npy",
+    "from_file_numpy",
+    "from_file_pandas",
+]
 
 
 def extract_events(data, time=None, sel=None):
@@ -53,23 +62,27 @@ def extract_events(data, time=None, sel=None):
     numpy.array
         List of events as (node_id, t) tuples
     """
-    val = []
+    data = numpy.asarray(data)
+
+    if len(data) == 0:
+        return numpy.empty((0, 2))
+
+    mask = None
 
-    t_min, t_max = 0, float("inf")
     if time:
         t_max = time[-1]
-        if len(time) > 1:
-            t_min = time[0]
+        t_min = time[0] if len(time) > 1 else 0
+        t = data[:, 1]
+        mask = (t_min <= t) & (t < t_max)
 
-    for v in data:
-        t = v[1]
-        node_id = v[0]
-        if not (t_min <= t < t_max):
-            continue
-        if not sel or node_id in sel:
-            val.append(v)
+    if sel is not None and len(sel) > 0:
+        sel_mask = numpy.isin(data[:, 0], sel)
+        mask = sel_mask if mask is None else mask & sel_mask
 
-    return numpy.array(val)
+    if mask is None:
+        return data
+
+    return data[mask]
 
 
 def from_data(data, sel=None, **kwargs):
@@ -108,7 +121,8 @@ def from_file(fname, **kwargs):
 
         If a list of files is given, the data from them is concatenated as if
         it had been stored in a single file - useful when MPI is enabled and
-        data is logged separately for each MPI rank, for example.
+        data is logged separately for each MPI rank, for example. Files
+        written by the `npy` recording backend are read with `from_file_npy`.
     kwargs:
         Parameters passed to _make_plot
     """
@@ -116,6 +130,8 @@ def from_file(fname, **kwargs):
         fname = [fname]
 
     if isinstance(fname, (list, tuple)):
+        if all(f.endswith(".npy") for f in fname):
+            return from_file_npy(fname, **kwargs)
         try:
             global pandas
             pandas = __import__("pandas")
@@ -128,30 +144,39 @@ def from_file(fname, **kwargs):
 
 def from_file_pandas(fname, **kwargs):
     """Use pandas."""
-    data = None
-    for f in fname:
-        # pylint: disable=possibly-used-before-assignment
-        dataFrame = pandas.read_table(f, header=2, skipinitialspace=True)
-        newdata = dataFrame.values
-
-        if data is None:
-            data = newdata
-        else:
-            data = numpy.concatenate((data, newdata))
+    # pylint: disable=possibly-used-before-assignment
+    data = numpy.concatenate([pandas.read_table(f, header=2, skipinitialspace=True).values for f in fname])
 
     return from_data(data, **kwargs)
 
 
 def from_file_numpy(fname, **kwargs):
     """Use numpy."""
-    data = None
-    for f in fname:
-        newdata = numpy.loadtxt(f, skiprows=3)
+    data = numpy.concatenate([numpy.loadtxt(f, skiprows=3, ndmin=2) for f in fname])
 
-        if data is None:
-            data = newdata
-        else:
-            data = numpy.concatenate((data, newdata))
+    return from_data(data, **kwargs)
+
+
+def from_file_npy(fname, **kwargs):
+    """Plot raster from files written by the `npy` recording backend.
+
+    The files are memory-mapped, so that only the senders and times of the
+    events are read.
+
+    Parameters
+    ----------
+    fname : str or list(str)
+        File name or list of file names, as given by the `filenames` property
+        of the spike recorder. Files of columns other than `senders` and
+        `times` are ignored.
+    kwargs:
+        Parameters passed to _make_plot
+    """
+    if isinstance(fname, str):
+        fname = [fname]
+
+    events = load_npy_events([f for f in fname if f.endswith((".senders.npy", ".times.npy"))])
+    data = numpy.column_stack((events["senders"], events["times"]))
 
     return from_data(data, **kwargs)
 
@@ -196,10 +221,14 @@ def from_device(detec, **kwargs):
         fname = detec.get("filenames")
         return from_file(fname, **kwargs)
 
+    elif detec.get("record_to") == "npy":
+        fname = detec.get("filenames")
+        return from_file_npy(fname, **kwargs)
+
     else:
         raise nest.kernel.NESTError(
             "No data to plot. Make sure that \
-            record_to is set to either 'ascii' or 'memory'."
+            record_to is set to either 'ascii', 'npy' or 'memory'."
         )
 
 
@@ -208,7 +237,9 @@ def _from_memory(detec):
     return ev["times"], ev["senders"]
 
 
-def _make_plot(ts, ts1, node_ids, neurons, hist=True, hist_binwidth=5.0, grayscale=False, title=None, xlabel=None):
+def _make_plot(
+    ts, ts1, node_ids, neurons, hist=True, hist_binwidth=5.0, grayscale=False, title=None, xlabel=None, decimate=None
+):
     """Generic plotting routine.
 
     Constructs a raster plot along with an optional histogram (common part in
@@ -234,9 +265,18 @@ def _make_plot(ts, ts1, node_ids, neurons, hist=True, hist_binwidth=5.0, graysca
         Plot title
     xlabel : str, optional
         Label for x-axis
+    decimate : int, optional
+        Number of time bins, e.g., the width of the plot in pixels. If given,
+        spikes are binned in time and a single marker is drawn for each node
+        ID and bin with spikes, so that the number of markers is bounded
+        independently of the number of spikes.
     """
     import matplotlib.pyplot as plt
 
+    ts = numpy.asarray(ts)
+    if decimate is not None:
+        ts1, node_ids = _decimate(ts1, node_ids, (numpy.amin(ts), numpy.amax(ts)), decimate)
+
     plt.figure()
 
     if grayscale:
@@ -287,6 +327,38 @@ def _make_plot(ts, ts1, node_ids, neurons, hist=True, hist_binwidth=5.0, graysca
     return plotid
 
 
+def _decimate(ts, node_ids, t_range, n_bins):
+    """Bin spikes in time, keeping a single spike per node ID and bin.
+
+    Parameters
+    ----------
+    ts : list
+        Timestamps of the spikes
+    node_ids : list
+        Global ids corresponding to ts
+    t_range : tuple
+        Start and end of the binned time interval
+    n_bins : int
+        Number of bins
+
+    Returns
+    -------
+    tuple(numpy.array, numpy.array)
+        Bin centers and node IDs of all bins containing spikes
+    """
+    ts = numpy.asarray(ts)
+    node_ids = numpy.asarray(node_ids).astype(numpy.int64)
+
+    t_min, t_max = t_range
+    bin_width = (t_max - t_min) / n_bins if t_max > t_min else 1.0
+    bin_ids = numpy.clip(((ts - t_min) // bin_width).astype(numpy.int64), 0, n_bins - 1)
+
+    # Each occupied bin of each node is represented by a single key.
+    keys = numpy.unique(node_ids * n_bins + bin_ids)
+
+    return t_min + (keys % n_bins + 0.5) * bin_width, keys // n_bins
+
+
 def _histogram(a, bins=10, bin_range=None, normed=False):
     """Calculate histogram for data.
 
@@ -326,12 +398,10 @@ def _histogram(a, bins=10, bin_range=None, normed=False):
         if (bins[1:] - bins[:-1] < 0).any():
             raise ValueError("bins must increase monotonically")
 
-    # best block size probably depends on processor cache size
-    block = 65536
-    n = sort(a[:block]).searchsorted(bins)
-    for i in range(block, a.size, block):
-        n += sort(a[i : i + block]).searchsorted(bins)
-    n = concatenate([n, [len(a)]])
+    # Spike times are often already sorted, e.g., if recorded on a single thread.
+    if a.size > 1 and (a[1:] < a[:-1]).any():
+        a = sort(a)
+    n = concatenate([a.searchsorted(bins), [len(a)]])
     n = n[1:] - n[:-1]
 
     if normed:
@@ -32,12 +32,20 @@ from copy import deepcopy
 
 import flask
 import nest
+import numpy
 import RestrictedPython
 from flask import Flask, jsonify, request
 from flask.logging import default_handler
 from flask_cors import CORS
 from nest.lib.hl_api_exceptions import NESTError
 
+try:
+    import msgpack
+
+    HAVE_MSGPACK = True
+except ImportError:
+    HAVE_MSGPACK = False
+
 # This ensures that the logging information shows up in the console running the server,
 # even when Flask's event loop is running.
 logger = logging.getLogger()
@@ -57,11 +65,15 @@ CORS_ORIGINS = os.environ.get("NEST_SERVER_CORS_ORIGINS", _default_origins).spli
 EXEC_CALL_ENABLED = get_boolean_environ("NEST_SERVER_ENABLE_EXEC_CALL")
 MODULES = os.environ.get("NEST_SERVER_MODULES", "import nest")
 RESTRICTION_DISABLED = get_boolean_environ("NEST_SERVER_DISABLE_RESTRICTION")
+SORT_EVENTS = get_boolean_environ("NEST_SERVER_SORT_EVENTS")
 EXCEPTION_ERROR_STATUS = 400
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
 
 __all__ = [
     "app",
     "do_exec",
+    "gather_response",
     "set_mpi_comm",
     "run_mpi_app",
     "nestify",
@@ -215,7 +227,7 @@ def do_exec(args, kwargs):
         else:
             data = locals_.get(kwargs["return"], None)
 
-        response["data"] = get_or_error(nest.serialize_data)(data)
+        response["data"] = get_or_error(nest.serialize_data)(data, keep_arrays=True)
     return response
 
 
@@ -261,10 +273,10 @@ def do_call(call_name, args=[], kwargs={}):
         log(call_name, f"local call, args={args}, kwargs={kwargs}")
         master_response = call(*args, **kwargs)
 
-    response = [nest.serialize_data(master_response)]
     if mpi_comm is not None:
         log(call_name, "waiting for response gather")
-        response = mpi_comm.gather(response[0], root=0)
+    response = gather_response(master_response)
+    if mpi_comm is not None:
         log(call_name, f"received response gather, data={response}")
 
     return combine(call_name, response)
@@ -277,7 +289,7 @@ def route_exec():
     if EXEC_CALL_ENABLED:
         args, kwargs = get_arguments(request)
         response = do_call("exec", args, kwargs)
-        return jsonify(nest.serialize_data(response))
+        return encode_response(response)
     else:
         flask.abort(
             403,
@@ -307,7 +319,7 @@ def route_api_call(call):
     args, kwargs = get_arguments(request)
     log("route_api_call", f"call={call}, args={args}, kwargs={kwargs}")
     response = api_client(call, args, kwargs)
-    return jsonify(nest.serialize_data(response))
+    return encode_response(response)
 
 
 # ----------------------
@@ -368,6 +380,104 @@ def clean_code(source):
     return "\n".join(codes_cleaned)
 
 
+def encode_response(data):
+    """Encode the response data in the format accepted by the client.
+
+    The data is encoded in JSON, unless the client prefers MessagePack
+    in the `Accept` header of the request, e.g. with
+    `Accept: application/msgpack`, and the package `msgpack` is
+    installed. In MessagePack, NumPy arrays are not converted to lists
+    but sent as raw bytes, see `pack_array()`.
+    """
+
+    mimetypes = [JSON_MIMETYPE, MSGPACK_MIMETYPE] if HAVE_MSGPACK else [JSON_MIMETYPE]
+    if request.accept_mimetypes.best_match(mimetypes) == MSGPACK_MIMETYPE:
+        response = flask.Response(msgpack.packb(data, default=pack_array), mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = jsonify(nest.serialize_data(data))
+    response.vary.add("Accept")
+    return response
+
+
+def event_columns(response):
+    """Get the events of recorders recording to memory in a response.
+
+    Returns a list of pairs of the index of the status dictionary of
+    the recorder in the response and the key of the events, for all
+    events that are one-dimensional NumPy arrays.
+    """
+
+    columns = []
+    if not isinstance(response, list):
+        return columns
+    for index, status in enumerate(response):
+        if not isinstance(status, dict) or "events" not in status:
+            continue
+        if status.get("element_type") != "recorder" or status.get("record_to") != "memory":
+            continue
+        for key, value in status["events"].items():
+            if isinstance(value, numpy.ndarray) and value.ndim == 1:
+                columns.append((index, key))
+    return columns
+
+
+def gather_response(response):
+    """Gather the responses of all MPI processes on the master process.
+
+    This function has to be called by the master and all workers. The
+    events of recorders are gathered as typed arrays with one call to
+    `Gatherv` per data type into preallocated buffers, while the rest
+    of the response is gathered as Python objects. If the processes do
+    not report the same events, all of the response is gathered as
+    Python objects.
+
+    Returns the list of responses of all processes on the master and
+    None on the workers. If the server is run serially (i.e., without
+    MPI), the list only contains the given response.
+    """
+
+    response = nest.serialize_data(response, keep_arrays=True)
+    if mpi_comm is None:
+        return [response]
+
+    columns = event_columns(response)
+    arrays = [response[index]["events"][key] for index, key in columns]
+    layout = [(index, key, array.dtype.str, array.size) for (index, key), array in zip(columns, arrays)]
+    layouts = mpi_comm.allgather(layout)
+
+    # All processes take the same decision here, as they all know the layouts of all processes.
+    if any([entry[:2] for entry in rank_layout] != columns for rank_layout in layouts):
+        columns = []
+
+    # The events are grouped by their data type common to all processes.
+    groups = {}
+    for column in range(len(columns)):
+        dtypes = [numpy.dtype(rank_layout[column][2]) for rank_layout in layouts if rank_layout[column][3] > 0]
+        dtype = numpy.result_type(*dtypes) if dtypes else numpy.dtype(layouts[0][column][2])
+        groups.setdefault(dtype.str, []).append(column)
+
+    for index, key in columns:
+        response[index]["events"][key] = None
+    responses = mpi_comm.gather(response, root=0)
+    is_master = mpi_comm.Get_rank() == 0
+
+    for dtype, group in groups.items():
+        sendbuf = numpy.concatenate([arrays[column].astype(dtype, copy=False) for column in group])
+        counts = [sum(rank_layout[column][3] for column in group) for rank_layout in layouts]
+        recvbuf = numpy.empty(sum(counts), dtype) if is_master else None
+        mpi_comm.Gatherv(sendbuf, (recvbuf, counts) if is_master else None, root=0)
+
+        if is_master:
+            offset = 0
+            for rank_layout, rank_response in zip(layouts, responses):
+                for column in group:
+                    index, key, _, size = rank_layout[column]
+                    rank_response[index]["events"][key] = recvbuf[offset : offset + size]
+                    offset += size
+
+    return responses
+
+
 def get_arguments(request):
     """Get arguments from the request."""
     args, kwargs = [], {}
@@ -514,6 +624,32 @@ def nestify(call_name, args, kwargs):
     return call, args, kwargs
 
 
+def pack_array(obj):
+    """Convert NumPy arrays and scalars for MessagePack.
+
+    Arrays of booleans, integers and floats are converted to maps with
+    the keys `__ndarray__`, `dtype`, `shape` and `data`, where `data`
+    holds the elements in C order as raw bytes. Clients can read them
+    without parsing, e.g. in Python with
+    `numpy.frombuffer(data, dtype).reshape(shape)` or in JavaScript
+    with a typed array.
+    """
+
+    if isinstance(obj, numpy.ndarray):
+        if obj.dtype.kind not in "biuf":
+            return nest.serialize_data(obj)
+        array = numpy.ascontiguousarray(obj)
+        return {
+            "__ndarray__": True,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "data": array.data,
+        }
+    if isinstance(obj, numpy.generic):
+        return obj.item()
+    return nest.serialize_data(obj)
+
+
 @get_or_error
 def api_client(call_name, args, kwargs):
     """API Client to call function in NEST."""
@@ -528,7 +664,7 @@ def api_client(call_name, args, kwargs):
     else:
         response = call
 
-    return nest.serialize_data(response)
+    return nest.serialize_data(response, keep_arrays=True)
 
 
 def set_mpi_comm(comm):
@@ -570,9 +706,9 @@ def combine(call_name, response):
       * for calls to GetStatus on recording devices, the combined
         response will be a merged dictionary in the sense that all
         fields that contain a single value in the individual responsed
-        are kept as a single values, while lists will be appended in
-        order of appearance; dictionaries in the response are
-        recursively treated in the same way
+        are kept as a single values, while events will be concatenated
+        in order of appearance, or sorted by time if the environment
+        variable NEST_SERVER_SORT_EVENTS is set
       * for calls to GetStatus on neurons, the combined response is just
         the single dictionary returned by the process on which the
         neuron is actually allocated
@@ -600,8 +736,12 @@ def combine(call_name, response):
     if all(type(v[0]) is dict for v in response):
         return merge_dicts(response)
 
-    # return a flattened list if the response only consists of lists
-    if all(type(v) is list for v in response):
+    # return a single array if the response only consists of arrays
+    if all(isinstance(v, numpy.ndarray) for v in response):
+        return numpy.concatenate(response)
+
+    # return a flattened list if the response only consists of lists or arrays
+    if all(type(v) is list or isinstance(v, numpy.ndarray) for v in response):
         return [item for lst in response for item in lst]
 
     log("combine()", f"ERROR: cannot combine response={response}")
@@ -616,7 +756,8 @@ def merge_dicts(response):
     following steps:
       * sum up all n_events fields
       * if recording to memory: merge the event dictionaries by joining
-        all contained arrays
+        all contained arrays, and sort the events by time if
+        NEST_SERVER_SORT_EVENTS is set
       * if recording to ascii: join filenames arrays
       * take all other values directly from the device on the first
         process
@@ -642,7 +783,10 @@ def merge_dicts(response):
             result.append(tmp[0])
 
         if element_type == "recorder":
-            tmp = deepcopy(device_dicts[0])
+            # The events are joined below, so that only the other values are copied.
+            tmp = deepcopy({key: value for key, value in device_dicts[0].items() if key != "events"})
+            if "events" in device_dicts[0]:
+                tmp["events"] = dict(device_dicts[0]["events"])
             tmp["n_events"] = 0
 
             for device_dict in device_dicts:
@@ -654,12 +798,14 @@ def merge_dicts(response):
                 raise Exception(msg)  # pylint: disable=W0719
 
             if record_to == "memory":
-                event_keys = tmp["events"].keys()
-                for key in event_keys:
-                    tmp["events"][key] = []
-                for device_dict in device_dicts:
-                    for key in event_keys:
-                        tmp["events"][key].extend(device_dict["events"][key])
+                for key in tmp["events"]:
+                    events = [device_dict["events"][key] for device_dict in device_dicts]
+                    tmp["events"][key] = concatenate_events(events)
+                if SORT_EVENTS and "times" in tmp["events"]:
+                    order = numpy.argsort(tmp["events"]["times"], kind="stable")
+                    for key, events in tmp["events"].items():
+                        if len(events) == len(order):
+                            tmp["events"][key] = events[order]
 
             if record_to == "ascii":
                 tmp["filenames"] = []
@@ -674,5 +820,19 @@ def merge_dicts(response):
     return result
 
 
+def concatenate_events(events):
+    """Concatenate the events of one kind from all processes.
+
+    The events are given as arrays or lists. Empty ones are skipped, so
+    that they do not change the data type of the result.
+    """
+
+    arrays = [numpy.asarray(values) for values in events]
+    non_empty = [array for array in arrays if array.size > 0]
+    if len(non_empty) == 0:
+        return arrays[0]
+    return numpy.concatenate(non_empty)
+
+
 if __name__ == "__main__":
     app.run()
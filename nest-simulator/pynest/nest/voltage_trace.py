@@ -23,22 +23,117 @@
 Functions to plot voltage traces.
 """
 
+import itertools
+
 import nest
 import numpy
+from nest.lib.hl_api_helper import load_npy_events
 
 __all__ = [
     "from_device",
     "from_file",
+    "split_by_sender",
 ]
 
 
+def split_by_sender(senders, *columns):
+    """Split recorded data into traces of the individual senders.
+
+    The data is grouped by a stable sort of the senders, so that the samples
+    of each sender keep their order.
+
+    Parameters
+    ----------
+    senders : numpy.array
+        Node IDs of the senders of the samples
+    columns : numpy.array
+        Arrays of the same length as senders, such as times or recorded values
+
+    Returns
+    -------
+    tuple
+        Array of the unique senders, followed by the split columns. If all
+        senders have the same number of samples, each column is split into a
+        two-dimensional array of shape `(n_senders, n_samples)`, otherwise
+        into a list of arrays, one per sender.
+    """
+    senders = numpy.asarray(senders)
+    order = numpy.argsort(senders, kind="stable")
+    unique_senders, counts = numpy.unique(senders[order], return_counts=True)
+
+    split_columns = []
+    for column in columns:
+        column = numpy.asarray(column)[order]
+        if len(counts) > 0 and numpy.all(counts == counts[0]):
+            split_columns.append(column.reshape(len(counts), counts[0]))
+        else:
+            split_columns.append(numpy.split(column, numpy.cumsum(counts)[:-1]))
+
+    return (unique_senders, *split_columns)
+
+
+def _read_text_chunks(fname, chunk_size):
+    """Read a text file with recorded data in chunks of rows.
+
+    Comment lines and the line with column names written by the `ascii`
+    recording backend are skipped.
+    """
+    with open(fname) as f:
+        lines = (line for line in f if line.strip() and not line.startswith(("#", "sender")))
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield numpy.loadtxt(chunk, ndmin=2)
+
+
+def _read_traces(fnames, chunk_size=100000):
+    """Read traces from text files, splitting them by sender chunk by chunk.
+
+    Returns the number of columns in the files and, for one column, the
+    concatenated values, for two columns, a dictionary mapping senders to
+    values, and for three columns, a dictionary mapping senders to times and
+    values.
+    """
+    n_columns = None
+    traces = {}
+    for fname in fnames:
+        for chunk in _read_text_chunks(fname, chunk_size):
+            if n_columns is None:
+                n_columns = chunk.shape[1]
+            elif chunk.shape[1] != n_columns:
+                raise ValueError("All files must have the same number of columns.")
+
+            if n_columns == 1:
+                traces.setdefault(None, []).append(chunk[:, 0])
+            elif n_columns in (2, 3):
+                senders, *split_columns = split_by_sender(chunk[:, 0], *chunk[:, 1:].T)
+                for k, sender in enumerate(senders):
+                    traces.setdefault(sender, []).append([column[k] for column in split_columns])
+            else:
+                raise ValueError("Inappropriate data shape %i!" % n_columns)
+
+    if n_columns is None:
+        raise ValueError("No data found in files.")
+
+    if n_columns == 1:
+        return n_columns, numpy.concatenate(traces[None])
+
+    return n_columns, {
+        sender: tuple(numpy.concatenate(column) for column in zip(*chunks)) for sender, chunks in traces.items()
+    }
+
+
 def from_file(fname, title=None, grayscale=False):
     """Plot voltage trace from file.
 
     Parameters
     ----------
     fname : str or list
-        Filename or list of filenames to load from
+        Filename or list of filenames to load from. Files written by the
+        `npy` recording backend are memory-mapped, and only the senders,
+        times and membrane potentials are read. Text files are read in
+        chunks, which are split by sender as they are read.
     title : str, optional
         Plot title
     grayscale : bool, optional
@@ -50,71 +145,51 @@ def from_file(fname, title=None, grayscale=False):
     """
     import matplotlib.pyplot as plt
 
-    if isinstance(fname, (list, tuple)):
-        data = None
-        for file in fname:
-            if data is None:
-                data = numpy.loadtxt(file)
-            else:
-                data = numpy.concatenate((data, numpy.loadtxt(file)))
+    fnames = [fname] if isinstance(fname, str) else fname
+    if all(f.endswith(".npy") for f in fnames):
+        events = load_npy_events([f for f in fnames if f.endswith((".senders.npy", ".times.npy", ".V_m.npy"))])
+        if "V_m" not in events:
+            raise ValueError("No membrane potential found in files.")
+        senders, times, potentials = split_by_sender(events["senders"], events["times"], events["V_m"])
+        n_columns = 3
+        traces = {sender: (times[k], potentials[k]) for k, sender in enumerate(senders)}
     else:
-        data = numpy.loadtxt(fname)
+        n_columns, traces = _read_traces(fnames)
 
     if grayscale:
         line_style = "k"
     else:
         line_style = ""
 
-    if len(data.shape) == 1:
+    if n_columns == 1:
         print(
             "INFO: only found 1 column in the file. \
             Assuming that only one neuron was recorded."
         )
-        plotid = plt.plot(data, line_style)
+        plotid = plt.plot(traces, line_style)
         plt.xlabel("Time (steps of length interval)")
 
-    elif data.shape[1] == 2:
+    elif n_columns == 2:
         print(
             "INFO: found 2 columns in the file. Assuming \
             them to be node ID, pot."
         )
 
         plotid = []
-        data_dict = {}
-        for dat in data:
-            if not dat[0] in data_dict:
-                data_dict[dat[0]] = [dat[1]]
-            else:
-                data_dict[dat[0]].append(dat[1])
-
-        for dat in data_dict:
-            plotid.append(plt.plot(data_dict[dat], line_style, label="Neuron %i" % dat))
+        for sender, (potentials,) in traces.items():
+            plotid.append(plt.plot(potentials, line_style, label="Neuron %i" % sender))
 
         plt.xlabel("Time (steps of length interval)")
         plt.legend()
 
-    elif data.shape[1] == 3:
+    else:
         plotid = []
-        data_dict = {}
-        g = data[0][0]
-        t = []
-        for d in data:
-            if not d[0] in data_dict:
-                data_dict[d[0]] = [d[2]]
-            else:
-                data_dict[d[0]].append(d[2])
-            if d[0] == g:
-                t.append(d[1])
-
-        for d in data_dict:
-            plotid.append(plt.plot(t, data_dict[d], line_style, label="Neuron %i" % d))
+        for sender, (times, potentials) in traces.items():
+            plotid.append(plt.plot(times, potentials, line_style, label="Neuron %i" % sender))
 
         plt.xlabel("Time (ms)")
         plt.legend()
 
-    else:
-        raise ValueError("Inappropriate data shape %i!" % data.shape)
-
     if not title:
         title = "Membrane potential from file '%s'" % fname
 
@@ -164,7 +239,7 @@ def from_device(detec, neurons=None, title=None, grayscale=False, timeunit="ms")
                 "Please provide a multimeter \
                 measuring V_m."
             )
-        elif not detec.get("record_to") == "memory" and len(detec.get("record_from")) > 1:
+        elif detec.get("record_to") not in ("memory", "npy") and len(detec.get("record_from")) > 1:
             raise nest.kernel.NESTError(
                 "Please provide a multimeter \
                 measuring only V_m or record to memory!"
@@ -216,13 +291,13 @@ def from_device(detec, neurons=None, title=None, grayscale=False, timeunit="ms")
 
         return plotids
 
-    elif detec.get("record_to") == "ascii":
+    elif detec.get("record_to") in ("ascii", "npy"):
         fname = detec.get("filenames")
         return from_file(fname, title, grayscale)
     else:
         raise nest.kernel.NESTError(
             "Provided devices neither record to \
-            ascii file, nor to memory."
+            ascii or npy file, nor to memory."
         )
 
 
@@ -232,37 +307,23 @@ def _from_memory(detec):
     detec : list
         Global id of voltmeter or multimeter
     """
-    import array
-
     ev = detec.get("events")
     potentials = ev["V_m"]
     senders = ev["senders"]
 
-    v = {}
-    t = {}
-
     if "times" in ev:
-        times = ev["times"]
-        for s, currentsender in enumerate(senders):
-            if currentsender not in v:
-                v[currentsender] = array.array("f")
-                t[currentsender] = array.array("f")
-
-            v[currentsender].append(float(potentials[s]))
-            t[currentsender].append(float(times[s]))
+        senders_uniq, times, potentials = split_by_sender(senders, ev["times"], potentials)
+        t = {sender: times[k] for k, sender in enumerate(senders_uniq)}
     else:
         # reconstruct the time vector, if not stored explicitly
         origin = detec.get("origin")
         start = detec.get("start")
         interval = detec.get("interval")
-        senders_uniq = numpy.unique(senders)
-        num_intvls = len(senders) / len(senders_uniq)
-        times_s = origin + start + interval + interval * numpy.array(range(num_intvls))
-
-        for s, currentsender in enumerate(senders):
-            if currentsender not in v:
-                v[currentsender] = array.array("f")
-                t[currentsender] = times_s
-            v[currentsender].append(float(potentials[s]))
+        senders_uniq, potentials = split_by_sender(senders, potentials)
+        num_intvls = len(senders) // len(senders_uniq) if len(senders_uniq) else 0
+        times_s = origin + start + interval + interval * numpy.arange(num_intvls)
+        t = {sender: times_s for sender in senders_uniq}
+
+    v = {sender: potentials[k] for k, sender in enumerate(senders_uniq)}
 
     return t, v
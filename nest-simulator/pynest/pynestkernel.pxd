@@ -32,9 +32,12 @@ cdef extern from "name.h":
 cdef extern from "datum.h":
     cppclass Datum:
         Name gettypename() except +
+        unsigned int numReferences()
 
 cdef extern from "token.h":
     cppclass Token:
+        Token() except +
+        Token(const Token&) except +
         Datum* datum() except +
 
 cdef extern from "namedatum.h":
@@ -95,6 +98,7 @@ cdef extern from "arraydatum.h":
     cppclass ArrayDatum:
         ArrayDatum() except +
         size_t size()
+        size_t references()
         void reserve(size_t) except +
         void push_back(Datum*) except +
         Token* begin()
@@ -102,9 +106,13 @@ cdef extern from "arraydatum.h":
 
     cppclass IntVectorDatum:
         IntVectorDatum(vector[long]*) except +
+        size_t references()
+        cbool deletable()
 
     cppclass DoubleVectorDatum:
         DoubleVectorDatum(vector[double]*) except +
+        size_t references()
+        cbool deletable()
 
 cdef extern from "dict.h":
     cppclass Dictionary:
@@ -120,6 +128,7 @@ cdef extern from "dictdatum.h":
 
     cppclass DictionaryDatum:
         DictionaryDatum(Dictionary *) except +
+        size_t references()
         void insert(const string&, Datum*) except +
         TokenMap.const_iterator begin()
         TokenMap.const_iterator end()
@@ -127,6 +136,7 @@ cdef extern from "dictdatum.h":
 cdef extern from "tokenstack.h":
     cppclass TokenStack:
         void push(Datum*) except +
+        void push_token "push"(const Token&) except +
         void pop()
         cbool empty()
 
@@ -137,6 +147,7 @@ cdef extern from "interpret.h":
     cppclass SLIInterpreter:
         SLIInterpreter() except +
         int execute(const string&) except +
+        int execute_token "execute"(const Token&) except +
         TokenStack OStack
 
 cdef extern from "neststartup.h":
@@ -145,10 +156,59 @@ cdef extern from "neststartup.h":
     cbool nest_has_mpi4py()
     void c_set_communicator "set_communicator" (object) with gil
 
+cdef extern from "recording_backend_memory.h" namespace "nest":
+    cppclass RecordedEvents:
+        RecordedEvents() except +
+        vector[long] senders
+        vector[double] times_ms
+        vector[long] times_steps
+        vector[double] times_offset
+        vector[string] double_value_names
+        vector[vector[double]] double_values
+        vector[string] long_value_names
+        vector[vector[long]] long_values
+        cbool time_in_steps
+
+cdef extern from "phase_profiler.h" namespace "nest":
+    cppclass PhaseProfile:
+        PhaseProfile() except +
+        vector[string] phase_names
+        vector[double] run_begin
+        vector[double] run_end
+        vector[long] total_threads
+        vector[long] total_phases
+        vector[long] total_runs
+        vector[double] total_time
+        vector[long] total_count
+        vector[double] update_cycles
+        vector[long] update_cycle_runs
+        vector[long] threads
+        vector[long] phases
+        vector[long] runs
+        vector[long] slices
+        vector[double] begin
+        vector[double] end
+        long num_dropped
+
 cdef extern from "nest.h" namespace "nest":
     Datum* node_collection_array_index(const Datum* node_collection, const long* array, unsigned long n) except +
     Datum* node_collection_array_index(const Datum* node_collection, const cbool* array, unsigned long n) except +
     void connect_arrays( long* sources, long* targets, double* weights, double* delays, vector[string]& p_keys, double* p_values, size_t n, string syn_model ) except +
+    void connect_arrays_partitioned( long* sources, long* targets, double* weights, double* delays, vector[string]& p_keys, double* p_values, size_t n, const vector[size_t]& thread_offsets, string syn_model ) except +
+    void get_node_status_arrays( const Datum* node_collection, const vector[string]& keys, vector[double]& values, vector[string]& value_types ) except +
+    void get_node_collection_layout( const Datum* node_collection, vector[long]& firsts, vector[long]& counts, long& step ) except +
+    void get_node_collection_models( const Datum* node_collection, vector[string]& models ) except +
+    void checkpoint( const string& path ) except +
+    void restore( const string& path ) except +
+    void get_phase_profile( PhaseProfile& profile ) except +
+    void get_construction_log( DictionaryDatum& log ) except +
+    void set_node_status_arrays( const Datum* node_collection, const vector[string]& keys, const double* values, size_t n ) except +
+    void get_connection_status_arrays( const long* sources, const long* targets, const long* threads, const long* synapse_ids, const long* ports, size_t n, const vector[string]& keys, const vector[double*]& values, vector[string]& value_types ) except +
+    void set_connection_status_arrays( const long* sources, const long* targets, const long* threads, const long* synapse_ids, const long* ports, size_t n, const vector[string]& keys, const double* values ) except +
+    void get_connection_adjacency( const Datum* sources, const Datum* targets, const string& synapse_model, cbool by_target, vector[long]& offsets, vector[long]& indices ) except +
+    void get_connections_chunk( const Datum* sources, const Datum* targets, const string& synapse_model, long synapse_label, size_t tid, long& syn_id, long& lcid, long& change_count, size_t max_num_connections, vector[long]& source_ids, vector[long]& target_ids, vector[long]& target_threads, vector[long]& synapse_ids, vector[long]& ports ) except +
+    void drain_recorded_events( size_t node_id, RecordedEvents& events ) except +
+    void harvest_recorded_events( size_t node_id, RecordedEvents& events, cbool discard ) except +
 
 cdef extern from *:
 
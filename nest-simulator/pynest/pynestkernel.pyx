@@ -28,10 +28,14 @@ from cpython cimport array
 from cpython.object cimport Py_EQ, Py_GE, Py_GT, Py_LE, Py_LT, Py_NE
 from cpython.ref cimport PyObject
 from cython.operator cimport dereference as deref
+from cython.operator cimport predecrement as dec
 from cython.operator cimport preincrement as inc
 from libc.stdlib cimport free, malloc
 from libc.string cimport memcpy
+from libcpp.list cimport list as cpplist
+from libcpp.map cimport map
 from libcpp.string cimport string
+from libcpp.utility cimport pair
 from libcpp.vector cimport vector
 
 import nest
@@ -50,6 +54,7 @@ cdef string SLI_TYPE_VECTOR_INT = b"intvectortype"
 cdef string SLI_TYPE_VECTOR_DOUBLE = b"doublevectortype"
 cdef string SLI_TYPE_MASK = b"masktype"
 cdef string SLI_TYPE_PARAMETER = b"parametertype"
+cdef string SLI_TYPE_PROCEDURE = b"proceduretype"
 cdef string SLI_TYPE_NODECOLLECTION = b"nodecollectiontype"
 cdef string SLI_TYPE_NODECOLLECTIONITERATOR = b"nodecollectioniteratortype"
 
@@ -148,18 +153,126 @@ cdef class SLILiteral:
             return self.name >= obj
 
 
+cdef class DoubleVectorBuffer:
+    """Exposes the contents of a vector of doubles via the buffer protocol, without copying"""
+
+    cdef vector[double] vec
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        self.shape[0] = self.vec.size()
+        self.strides[0] = sizeof(double)
+
+        buffer.buf = <char*> self.vec.data()
+        buffer.format = 'd'
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(double)
+        buffer.len = self.vec.size() * sizeof(double)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.shape
+        buffer.strides = self.strides
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+
+cdef class LongVectorBuffer:
+    """Exposes the contents of a vector of longs via the buffer protocol, without copying"""
+
+    cdef vector[long] vec
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        self.shape[0] = self.vec.size()
+        self.strides[0] = sizeof(long)
+
+        buffer.buf = <char*> self.vec.data()
+        buffer.format = 'l'
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(long)
+        buffer.len = self.vec.size() * sizeof(long)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.shape
+        buffer.strides = self.strides
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+
+cdef object double_vector_to_array(vector[double]& vec):
+    """Moves the contents of vec into a NumPy array, leaving vec empty"""
+
+    cdef DoubleVectorBuffer buffer = DoubleVectorBuffer()
+    buffer.vec.swap(vec)
+    return numpy.asarray(buffer)
+
+
+cdef object long_vector_to_array(vector[long]& vec):
+    """Moves the contents of vec into a NumPy array, leaving vec empty"""
+
+    cdef LongVectorBuffer buffer = LongVectorBuffer()
+    buffer.vec.swap(vec)
+    return numpy.asarray(buffer)
+
+
+cdef object recorded_events_to_dict(RecordedEvents& events):
+    """Moves recorded events into a dictionary of NumPy arrays, with the entries of the `events` of a device"""
+
+    result = {"senders": long_vector_to_array(events.senders)}
+    if events.time_in_steps:
+        result["times"] = long_vector_to_array(events.times_steps)
+        result["offsets"] = double_vector_to_array(events.times_offset)
+    else:
+        result["times"] = double_vector_to_array(events.times_ms)
+
+    cdef size_t i
+    for i in range(events.double_value_names.size()):
+        result[events.double_value_names[i].decode()] = double_vector_to_array(events.double_values[i])
+    for i in range(events.long_value_names.size()):
+        result[events.long_value_names[i].decode()] = long_vector_to_array(events.long_values[i])
+
+    return result
+
+
 cdef class NESTEngine:
 
     cdef SLIInterpreter* pEngine
 
+    # Procedures parsed from SLI code, keyed by the code, with their position in procedure_order,
+    # see get_procedure()
+    cdef map[string, pair[Token, cpplist[string].iterator]] procedures
+
+    # Codes of the cached procedures, least recently used first
+    cdef cpplist[string] procedure_order
+
+    # Maximal number of cached procedures, caching is disabled if 0
+    cdef public size_t max_cached_procedures
+
+    # Number of procedures taken from and added to the cache
+    cdef public size_t procedure_cache_hits
+    cdef public size_t procedure_cache_misses
+
     def __cinit__(self):
 
         self.pEngine = NULL
+        self.max_cached_procedures = 1024
+        self.procedure_cache_hits = 0
+        self.procedure_cache_misses = 0
 
     def __dealloc__(self):
 
         nestshutdown( 0 )
 
+        self.procedures.clear()
+        self.procedure_order.clear()
         del self.pEngine
 
         self.pEngine = NULL
@@ -221,6 +334,76 @@ cdef class NESTEngine:
         cmd_bytes = cmd.encode('utf-8')
         self.pEngine.execute(cmd_bytes)
 
+    cdef Token* get_procedure(self, const string& code) except NULL:
+        """Return the procedure for the given SLI code, parsing the code only on first use.
+
+        If the cache is full, the least recently used procedure is evicted.
+        """
+
+        cdef map[string, pair[Token, cpplist[string].iterator]].iterator it = self.procedures.find(code)
+        if it != self.procedures.end():
+            self.procedure_cache_hits += 1
+            # Move the code to the end of the usage order, its position stays valid.
+            self.procedure_order.splice(self.procedure_order.end(), self.procedure_order, deref(it).second.second)
+            return &deref(it).second.first
+
+        self.procedure_cache_misses += 1
+        while not self.procedure_order.empty() and self.procedures.size() >= self.max_cached_procedures:
+            self.procedures.erase(self.procedure_order.front())
+            self.procedure_order.pop_front()
+
+        # The interpreter parses a procedure in braces and leaves it on the stack.
+        self.pEngine.execute(b"{" + code + b"}")
+        if self.pEngine.OStack.empty() or \
+           (addr_tok(self.pEngine.OStack.top())).datum().gettypename().toString() != SLI_TYPE_PROCEDURE:
+            raise NESTErrors.PyNESTError("could not parse SLI code: {0}".format(code.decode('utf-8')))
+
+        self.procedure_order.push_back(code)
+        cdef pair[Token, cpplist[string].iterator]* entry = &self.procedures[code]
+        entry.first = deref(addr_tok(self.pEngine.OStack.top()))
+        entry.second = self.procedure_order.end()
+        dec(entry.second)
+        self.pEngine.OStack.pop()
+
+        return &entry.first
+
+    def run_cached(self, cmd):
+        """Execute SLI code like run(), but parse it only on the first call with the same code."""
+
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        cdef string cmd_bytes
+        cmd_bytes = cmd.encode('utf-8')
+        if self.max_cached_procedures == 0:
+            self.pEngine.execute(cmd_bytes)
+        else:
+            self.pEngine.execute_token(deref(self.get_procedure(cmd_bytes)))
+
+    def push_procedure(self, code):
+        """Push the procedure for the given SLI code, which is parsed only on the first call with the same code.
+
+        If caching is disabled, the code is pushed as a string.
+        """
+
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        cdef string code_bytes
+        code_bytes = code.encode('utf-8')
+        if self.max_cached_procedures == 0:
+            self.pEngine.OStack.push(<Datum*> new StringDatum(code_bytes))
+        else:
+            self.pEngine.OStack.push_token(deref(self.get_procedure(code_bytes)))
+
+    def clear_procedure_cache(self):
+
+        self.procedures.clear()
+        self.procedure_order.clear()
+
+    def procedure_cache_size(self):
+        """Return the number of cached procedures."""
+
+        return self.procedures.size()
+
     def push(self, obj):
 
         if self.pEngine is NULL:
@@ -237,7 +420,9 @@ cdef class NESTEngine:
 
         cdef Datum* dat = (addr_tok(self.pEngine.OStack.top())).datum()
 
-        ret = sli_datum_to_object(dat)
+        # The datum is destroyed by the pop below if the stack holds the only reference,
+        # so that its vectors can be handed over to NumPy without copying.
+        ret = sli_datum_to_object(dat, dat.numReferences() == 1)
 
         self.pEngine.OStack.pop()
 
@@ -350,6 +535,509 @@ cdef class NESTEngine:
             exceptionCls = getattr(NESTErrors, str(e))
             raise exceptionCls('connect_arrays', '') from None
 
+    def connect_arrays_partitioned(self, sources, targets, weights, delays, synapse_model, syn_param_keys, syn_param_values, thread_offsets):
+        """Calls connect_arrays_partitioned, creating the connections of each thread from a slice of the arrays
+
+        The arrays hold the connections to targets on this MPI process only, ordered by the
+        local thread of the targets. The connections of thread t are those with indices from
+        thread_offsets[t] to thread_offsets[t + 1] - 1. The arrays may be empty, but the function
+        must be called on all MPI processes.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        if not (isinstance(sources, numpy.ndarray) and sources.ndim == 1) or not numpy.issubdtype(sources.dtype, numpy.integer):
+            raise TypeError('sources must be a 1-dimensional NumPy array of integers')
+        if not (isinstance(targets, numpy.ndarray) and targets.ndim == 1) or not numpy.issubdtype(targets.dtype, numpy.integer):
+            raise TypeError('targets must be a 1-dimensional NumPy array of integers')
+        if weights is not None and not (isinstance(weights, numpy.ndarray) and weights.ndim == 1):
+            raise TypeError('weights must be a 1-dimensional NumPy array')
+        if delays is not None and not (isinstance(delays, numpy.ndarray) and delays.ndim == 1):
+            raise TypeError('delays must be a 1-dimensional NumPy array')
+        if syn_param_values is not None and not ((isinstance(syn_param_values, numpy.ndarray) and syn_param_values.ndim == 2)):
+            raise TypeError('syn_param_values must be a 2-dimensional NumPy array')
+
+        cdef size_t n = len(sources)
+        if len(targets) != n:
+            raise ValueError('Sources and targets must be arrays of the same length.')
+        if weights is not None and len(weights) != n:
+            raise ValueError('weights must be an array of the same length as sources and targets.')
+        if delays is not None and len(delays) != n:
+            raise ValueError('delays must be an array of the same length as sources and targets.')
+        if syn_param_values is not None:
+            if not len(syn_param_keys) == syn_param_values.shape[0]:
+                raise ValueError('syn_param_values must be a matrix with one array per key in syn_param_keys.')
+            if not syn_param_values.shape[1] == n:
+                raise ValueError('syn_param_values must be a matrix with arrays of the same length as sources and targets.')
+
+        # Contiguous arrays of the right type are passed without copying, which keeps
+        # memory-mapped arrays from being read into memory all at once. Empty arrays
+        # are passed as NULL pointers.
+        cdef long[::1] sources_mv = numpy.ascontiguousarray(sources, dtype=int)
+        cdef long[::1] targets_mv = numpy.ascontiguousarray(targets, dtype=int)
+        cdef long* sources_ptr = NULL
+        cdef long* targets_ptr = NULL
+        if n > 0:
+            sources_ptr = &sources_mv[0]
+            targets_ptr = &targets_mv[0]
+
+        cdef double[::1] weights_mv
+        cdef double* weights_ptr = NULL
+        if weights is not None and n > 0:
+            weights_mv = numpy.ascontiguousarray(weights, dtype=numpy.double)
+            weights_ptr = &weights_mv[0]
+
+        cdef double[::1] delays_mv
+        cdef double* delays_ptr = NULL
+        if delays is not None and n > 0:
+            delays_mv = numpy.ascontiguousarray(delays, dtype=numpy.double)
+            delays_ptr = &delays_mv[0]
+
+        cdef vector[string] param_keys_ptr
+        if syn_param_keys is not None:
+            for key in syn_param_keys:
+                param_keys_ptr.push_back(key.encode('utf8'))
+
+        cdef double[:, ::1] param_values_mv
+        cdef double* param_values_ptr = NULL
+        if syn_param_values is not None and n > 0:
+            param_values_mv = numpy.ascontiguousarray(syn_param_values, dtype=numpy.double)
+            param_values_ptr = &param_values_mv[0][0]
+
+        cdef vector[size_t] thread_offsets_vec
+        for offset in thread_offsets:
+            thread_offsets_vec.push_back(offset)
+
+        cdef string syn_model_string = synapse_model.encode('UTF-8')
+
+        try:
+            connect_arrays_partitioned( sources_ptr, targets_ptr, weights_ptr, delays_ptr, param_keys_ptr, param_values_ptr, n, thread_offsets_vec, syn_model_string )
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('connect_arrays_partitioned', '') from None
+
+    def get_node_arrays(self, node_collection, keys):
+        """Calls get_node_status_arrays, bypassing SLI to collect scalar node parameters in NumPy arrays"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        if not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('node_collection must be a NodeCollection, got {}'.format(type(node_collection)))
+
+        cdef vector[string] keys_vec
+        for key in keys:
+            keys_vec.push_back(key.encode('utf8'))
+
+        cdef vector[double] values
+        cdef vector[string] value_types
+
+        try:
+            get_node_status_arrays((<SLIDatum> node_collection).thisptr, keys_vec, values, value_types)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('get_node_arrays', '') from None
+
+        # All values are copied in one go, then split into one contiguous row per key
+        cdef size_t n_keys = keys_vec.size()
+        cdef size_t n = values.size() // n_keys if n_keys > 0 else 0
+        cdef double[::1] result_mv
+        result = numpy.empty(n_keys * n, dtype=numpy.double)
+        if values.size() > 0:
+            result_mv = result
+            memcpy(&result_mv[0], &values.front(), values.size() * sizeof(double))
+        result = result.reshape(n_keys, n)
+
+        return {key: result[k].astype(value_types[k].decode(), copy=False) for k, key in enumerate(keys)}
+
+    def node_collection_layout(self, node_collection):
+        """Calls get_node_collection_layout, bypassing SLI to obtain the node IDs of a NodeCollection as arithmetic runs
+
+        Returns the lists of the first node IDs and the lengths of the runs, and the step within runs.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        if not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('node_collection must be a NodeCollection, got {}'.format(type(node_collection)))
+
+        cdef vector[long] firsts
+        cdef vector[long] counts
+        cdef long step = 1
+
+        try:
+            get_node_collection_layout((<SLIDatum> node_collection).thisptr, firsts, counts, step)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('node_collection_layout', '') from None
+
+        return firsts, counts, step
+
+    def node_collection_models(self, node_collection):
+        """Calls get_node_collection_models, bypassing SLI to obtain the names of the models of a NodeCollection
+
+        Returns the list of model names, each listed once in the order of its first node.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        if not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('node_collection must be a NodeCollection, got {}'.format(type(node_collection)))
+
+        cdef vector[string] models
+
+        try:
+            get_node_collection_models((<SLIDatum> node_collection).thisptr, models)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('node_collection_models', '') from None
+
+        return [model.decode() for model in models]
+
+    def checkpoint(self, path):
+        """Calls checkpoint, bypassing SLI to write the state of the network to binary files in the directory path"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        try:
+            checkpoint(path.encode('utf-8'))
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('checkpoint', '') from None
+
+    def restore(self, path):
+        """Calls restore, bypassing SLI to restore the network from the binary files in the directory path"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        try:
+            restore(path.encode('utf-8'))
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('restore', '') from None
+
+    def set_node_arrays(self, node_collection, keys, values):
+        """Calls set_node_status_arrays, bypassing SLI to set scalar node parameters from NumPy arrays
+
+        `values` is a two-dimensional array holding one row of values per key.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        if not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('node_collection must be a NodeCollection, got {}'.format(type(node_collection)))
+
+        cdef double[:, ::1] values_mv = numpy.ascontiguousarray(values, dtype=numpy.double)
+        if values_mv.shape[0] != len(keys):
+            raise ValueError('values must have one row per key.')
+        cdef size_t n = values_mv.shape[1]
+        if n == 0 or len(keys) == 0:
+            return
+
+        cdef vector[string] keys_vec
+        for key in keys:
+            keys_vec.push_back(key.encode('utf8'))
+
+        try:
+            set_node_status_arrays((<SLIDatum> node_collection).thisptr, keys_vec, &values_mv[0, 0], n)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('set_node_arrays', '') from None
+
+    def connection_id_arrays(self, connections):
+        """Extracts the connection ID fields of a list of connection datums into NumPy arrays
+
+        Returns a tuple of five integer arrays holding the sources, targets, target threads,
+        synapse model IDs and ports of the connections.
+        """
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        ids = numpy.empty((CONN_ELMS, len(connections)), dtype=int)
+        cdef long[:, ::1] ids_mv = ids
+        cdef ConnectionDatum* conn_datum
+        cdef size_t i
+        for i, datum in enumerate(connections):
+            if not (isinstance(datum, SLIDatum) and (<SLIDatum> datum).dtype == SLI_TYPE_CONNECTION.decode()):
+                raise TypeError('connections must be a list of connection datums, got {}'.format(type(datum)))
+            conn_datum = <ConnectionDatum*> (<SLIDatum> datum).thisptr
+            ids_mv[0, i] = conn_datum.get_source_node_id()
+            ids_mv[1, i] = conn_datum.get_target_node_id()
+            ids_mv[2, i] = conn_datum.get_target_thread()
+            ids_mv[3, i] = conn_datum.get_synapse_model_id()
+            ids_mv[4, i] = conn_datum.get_port()
+
+        return tuple(ids)
+
+    def get_connection_arrays(self, connection_ids, keys, buffers):
+        """Calls get_connection_status_arrays, bypassing SLI to fill NumPy arrays with connection parameters
+
+        `connection_ids` is a tuple of five integer arrays as returned by `connection_id_arrays`,
+        `buffers` holds one contiguous array of doubles per key, which is filled in place.
+        Returns the names of the narrowest types representing the values of each key.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        if len(connection_ids) != CONN_ELMS:
+            raise TypeError('connection_ids must be a tuple of {} arrays'.format(CONN_ELMS))
+        if len(keys) != len(buffers):
+            raise ValueError('buffers must contain one array per key')
+
+        cdef long[::1] sources_mv = numpy.ascontiguousarray(connection_ids[0], dtype=int)
+        cdef long[::1] targets_mv = numpy.ascontiguousarray(connection_ids[1], dtype=int)
+        cdef long[::1] threads_mv = numpy.ascontiguousarray(connection_ids[2], dtype=int)
+        cdef long[::1] synapse_ids_mv = numpy.ascontiguousarray(connection_ids[3], dtype=int)
+        cdef long[::1] ports_mv = numpy.ascontiguousarray(connection_ids[4], dtype=int)
+
+        cdef size_t n = sources_mv.shape[0]
+        if not (targets_mv.shape[0] == threads_mv.shape[0] == synapse_ids_mv.shape[0] == ports_mv.shape[0] == n):
+            raise ValueError('All connection ID arrays must have the same length.')
+        if n == 0 or len(keys) == 0:
+            return ["double"] * len(keys)
+
+        cdef vector[string] keys_vec
+        cdef vector[double*] values_vec
+        cdef double[::1] buffer_mv
+        for key, buffer in zip(keys, buffers):
+            buffer_mv = buffer
+            if buffer_mv.shape[0] != n:
+                raise ValueError('buffer for {} must have the same length as the connection ID arrays.'.format(key))
+            keys_vec.push_back(key.encode('utf8'))
+            values_vec.push_back(&buffer_mv[0])
+
+        cdef vector[string] value_types
+
+        try:
+            get_connection_status_arrays(&sources_mv[0], &targets_mv[0], &threads_mv[0], &synapse_ids_mv[0], &ports_mv[0], n, keys_vec, values_vec, value_types)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('get_connection_arrays', '') from None
+
+        return [value_type.decode() for value_type in value_types]
+
+    def set_connection_arrays(self, connection_ids, keys, values):
+        """Calls set_connection_status_arrays, bypassing SLI to set connection parameters from NumPy arrays
+
+        `connection_ids` is a tuple of five integer arrays as returned by `connection_id_arrays`,
+        `values` is a two-dimensional array holding one row of values per key.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        if len(connection_ids) != CONN_ELMS:
+            raise TypeError('connection_ids must be a tuple of {} arrays'.format(CONN_ELMS))
+
+        cdef long[::1] sources_mv = numpy.ascontiguousarray(connection_ids[0], dtype=int)
+        cdef long[::1] targets_mv = numpy.ascontiguousarray(connection_ids[1], dtype=int)
+        cdef long[::1] threads_mv = numpy.ascontiguousarray(connection_ids[2], dtype=int)
+        cdef long[::1] synapse_ids_mv = numpy.ascontiguousarray(connection_ids[3], dtype=int)
+        cdef long[::1] ports_mv = numpy.ascontiguousarray(connection_ids[4], dtype=int)
+        cdef double[:, ::1] values_mv = numpy.ascontiguousarray(values, dtype=numpy.double)
+
+        cdef size_t n = sources_mv.shape[0]
+        if not (targets_mv.shape[0] == threads_mv.shape[0] == synapse_ids_mv.shape[0] == ports_mv.shape[0] == n):
+            raise ValueError('All connection ID arrays must have the same length.')
+        if values_mv.shape[0] != len(keys) or values_mv.shape[1] != n:
+            raise ValueError('values must have one row per key and one column per connection.')
+        if n == 0 or len(keys) == 0:
+            return
+
+        cdef vector[string] keys_vec
+        for key in keys:
+            keys_vec.push_back(key.encode('utf8'))
+
+        try:
+            set_connection_status_arrays(&sources_mv[0], &targets_mv[0], &threads_mv[0], &synapse_ids_mv[0], &ports_mv[0], n, keys_vec, &values_mv[0, 0])
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('set_connection_arrays', '') from None
+
+    def connection_adjacency(self, sources, targets, synapse_model, by_target):
+        """Calls get_connection_adjacency, bypassing SLI to obtain connections as adjacency in CSR format
+
+        Returns a tuple of two NumPy arrays, the offsets of the rows and the node IDs in the rows.
+        Rows belong to the nodes in `sources`, or in `targets` if `by_target` is true.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        for node_collection in (sources, targets):
+            if not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+                raise TypeError('sources and targets must be NodeCollections, got {}'.format(type(node_collection)))
+
+        cdef string synapse_model_bytes = synapse_model.encode('utf-8') if synapse_model is not None else b""
+        cdef vector[long] offsets
+        cdef vector[long] indices
+
+        try:
+            get_connection_adjacency((<SLIDatum> sources).thisptr, (<SLIDatum> targets).thisptr,
+                                     synapse_model_bytes, by_target, offsets, indices)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('connection_adjacency', '') from None
+
+        return long_vector_to_array(offsets), long_vector_to_array(indices)
+
+    def connections_chunk(self, sources, targets, synapse_model, synapse_label, tid, syn_id, lcid, max_num_connections,
+                          change_count=-1):
+        """Calls get_connections_chunk, bypassing SLI to obtain a chunk of the connections of a thread as arrays
+
+        `sources` and `targets` are NodeCollections or None to select all nodes, `syn_id` and `lcid`
+        give the position of the chunk in the connections of thread `tid`. Returns a tuple of the five
+        arrays of connection IDs, the position of the next chunk, where `syn_id` is -1 once all
+        connections of the thread have been visited, and the change count of the connections, which
+        must be passed with the next chunk to detect changes in between.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        for node_collection in (sources, targets):
+            if node_collection is not None and not (isinstance(node_collection, SLIDatum) and (<SLIDatum> node_collection).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+                raise TypeError('sources and targets must be NodeCollections or None, got {}'.format(type(node_collection)))
+
+        cdef Datum* sources_datum = (<SLIDatum> sources).thisptr if sources is not None else NULL
+        cdef Datum* targets_datum = (<SLIDatum> targets).thisptr if targets is not None else NULL
+
+        cdef string synapse_model_bytes = synapse_model.encode('utf-8') if synapse_model is not None else b""
+        cdef long next_syn_id = syn_id
+        cdef long next_lcid = lcid
+        cdef long next_change_count = change_count
+        cdef vector[long] source_ids
+        cdef vector[long] target_ids
+        cdef vector[long] target_threads
+        cdef vector[long] synapse_ids
+        cdef vector[long] ports
+
+        try:
+            get_connections_chunk(sources_datum, targets_datum, synapse_model_bytes, synapse_label, tid,
+                                  next_syn_id, next_lcid, next_change_count, max_num_connections,
+                                  source_ids, target_ids, target_threads, synapse_ids, ports)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('connections_chunk', '') from None
+
+        connection_ids = tuple(long_vector_to_array(ids) for ids in (source_ids, target_ids, target_threads, synapse_ids, ports))
+        return connection_ids, next_syn_id, next_lcid, next_change_count
+
+    def drain_events(self, node_id):
+        """Calls drain_recorded_events, handing the events recorded by a device over to NumPy arrays
+
+        Returns a dictionary with the same entries as the `events` of the device. The arrays
+        take ownership of the recorded data, which is removed from the device.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        cdef RecordedEvents events
+
+        try:
+            drain_recorded_events(node_id, events)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('drain_events', '') from None
+
+        return recorded_events_to_dict(events)
+
+    def harvest_events(self, node_id, discard):
+        """Calls harvest_recorded_events, handing the events recorded by a device since the previous harvest over to NumPy arrays
+
+        Returns a dictionary with the same entries as the `events` of the device. If `discard`
+        is true, all events are removed from the device.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        cdef RecordedEvents events
+
+        try:
+            harvest_recorded_events(node_id, events, discard)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('harvest_events', '') from None
+
+        return recorded_events_to_dict(events)
+
+    def phase_profile(self):
+        """Calls get_phase_profile, handing the phase timings recorded on this process over to NumPy arrays
+
+        Returns a dictionary with the list of `phase_names`, the `run_begin` and `run_end` times,
+        the columns `total_threads`, `total_phases`, `total_runs`, `total_time` and `total_count` of
+        the totals, and, if phases were traced, the `update_cycles` durations with their
+        `update_cycle_runs`, the columns `threads`, `phases`, `runs`, `slices`, `begin` and `end` of
+        the recorded intervals and the number of intervals `num_dropped` from the full trace.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        cdef PhaseProfile profile
+
+        try:
+            get_phase_profile(profile)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('phase_profile', '') from None
+
+        return {
+            "phase_names": [name.decode() for name in profile.phase_names],
+            "run_begin": double_vector_to_array(profile.run_begin),
+            "run_end": double_vector_to_array(profile.run_end),
+            "total_threads": long_vector_to_array(profile.total_threads),
+            "total_phases": long_vector_to_array(profile.total_phases),
+            "total_runs": long_vector_to_array(profile.total_runs),
+            "total_time": double_vector_to_array(profile.total_time),
+            "total_count": long_vector_to_array(profile.total_count),
+            "update_cycles": double_vector_to_array(profile.update_cycles),
+            "update_cycle_runs": long_vector_to_array(profile.update_cycle_runs),
+            "threads": long_vector_to_array(profile.threads),
+            "phases": long_vector_to_array(profile.phases),
+            "runs": long_vector_to_array(profile.runs),
+            "slices": long_vector_to_array(profile.slices),
+            "begin": double_vector_to_array(profile.begin),
+            "end": double_vector_to_array(profile.end),
+            "num_dropped": profile.num_dropped,
+        }
+
+    def construction_log(self):
+        """Calls get_construction_log, returning the log of network construction of this process as dictionary
+
+        The dictionary holds the `rule`, `synapse_models`, `time`, `memory` and further columns of the
+        calls to Connect, the `connection_infrastructure` times of each thread and the `io_blocks` read
+        from SONATA edge files.
+        """
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        cdef DictionaryDatum* log = new DictionaryDatum(new Dictionary())
+
+        try:
+            get_construction_log(deref(log))
+            return sli_dict_to_object(log)
+        except RuntimeError as e:
+            exceptionCls = getattr(NESTErrors, str(e))
+            raise exceptionCls('construction_log', '') from None
+        finally:
+            del log
+
 cdef inline Datum* python_object_to_datum(obj) except NULL:
 
     cdef Datum* ret = NULL
@@ -411,37 +1099,35 @@ cdef inline Datum* python_object_to_datum(obj) except NULL:
             raise NESTErrors.PyNESTError("failed to unpack passed connection generator object")
     elif isinstance(obj, nest.CollocatedSynapses):
         ret = python_object_to_datum(obj.syn_specs)
+    elif isinstance(obj, nest.SynapseCollection):
+        ret = connection_ids_to_datum(obj._connection_ids)
+    elif HAVE_NUMPY and isinstance(obj, numpy.ndarray) and obj.ndim == 1:
+        ret = numpy_array_to_datum(obj)
     else:
 
+        # Other objects supporting the buffer protocol, e.g., array.array
         try:
             ret = python_buffer_to_datum[buffer_int_1d_t, long](obj)
         except (ValueError, TypeError):
             pass
 
-        try:
-            ret = python_buffer_to_datum[buffer_long_1d_t, long](obj)
-        except (ValueError, TypeError):
-            pass
-
-        try:
-            ret = python_buffer_to_datum[buffer_float_1d_t, double](obj)
-        except (ValueError, TypeError):
-            pass
+        if ret is NULL:
+            try:
+                ret = python_buffer_to_datum[buffer_long_1d_t, long](obj)
+            except (ValueError, TypeError):
+                pass
 
-        try:
-            ret = python_buffer_to_datum[buffer_double_1d_t, double](obj)
-        except (ValueError, TypeError):
-            pass
+        if ret is NULL:
+            try:
+                ret = python_buffer_to_datum[buffer_float_1d_t, double](obj)
+            except (ValueError, TypeError):
+                pass
 
-        # NumPy < 1.5.0 doesn't support PEP-3118 buffer interface
-        #
-        if ret is NULL and HAVE_NUMPY and isinstance(obj, numpy.ndarray) and obj.ndim == 1:
-            if numpy.issubdtype(obj.dtype, numpy.integer):
-                ret = python_buffer_to_datum[object, long](obj)
-            elif numpy.issubdtype(obj.dtype, numpy.floating):
-                ret = python_buffer_to_datum[object, double](obj)
-            else:
-                raise NESTErrors.PyNESTError("only vectors of integers or floats are supported")
+        if ret is NULL:
+            try:
+                ret = python_buffer_to_datum[buffer_double_1d_t, double](obj)
+            except (ValueError, TypeError):
+                pass
 
         if ret is NULL:
             try:
@@ -485,7 +1171,60 @@ cdef inline Datum* python_buffer_to_datum(numeric_buffer_t buff, vector_value_t
     return <Datum*> dat
 
 
-cdef inline object sli_datum_to_object(Datum* dat):
+cdef inline Datum* numpy_array_to_datum(object arr) except NULL:
+    """Copy a one-dimensional NumPy array of integers or floats into a vector datum in a single block
+
+    Arrays that are not contiguous or not of type long or double are converted by NumPy first.
+    """
+
+    cdef const long[::1] long_mv
+    cdef const double[::1] double_mv
+    cdef vector[long]* long_vector_ptr = NULL
+    cdef vector[double]* double_vector_ptr = NULL
+    cdef size_t n = arr.shape[0]
+
+    if numpy.issubdtype(arr.dtype, numpy.integer):
+        long_mv = numpy.ascontiguousarray(arr, dtype=int)
+        long_vector_ptr = new vector[long](n)
+        if n > 0:
+            memcpy(long_vector_ptr.data(), &long_mv[0], n * sizeof(long))
+        return <Datum*> new IntVectorDatum(long_vector_ptr)
+    elif numpy.issubdtype(arr.dtype, numpy.floating):
+        double_mv = numpy.ascontiguousarray(arr, dtype=numpy.double)
+        double_vector_ptr = new vector[double](n)
+        if n > 0:
+            memcpy(double_vector_ptr.data(), &double_mv[0], n * sizeof(double))
+        return <Datum*> new DoubleVectorDatum(double_vector_ptr)
+    else:
+        raise NESTErrors.PyNESTError("only vectors of integers or floats are supported")
+
+
+cdef inline Datum* connection_ids_to_datum(object connection_ids) except NULL:
+    """Create an array of connection datums from the five connection ID arrays of a SynapseCollection"""
+
+    cdef long[::1] sources_mv = numpy.ascontiguousarray(connection_ids[0], dtype=int)
+    cdef long[::1] targets_mv = numpy.ascontiguousarray(connection_ids[1], dtype=int)
+    cdef long[::1] threads_mv = numpy.ascontiguousarray(connection_ids[2], dtype=int)
+    cdef long[::1] synapse_ids_mv = numpy.ascontiguousarray(connection_ids[3], dtype=int)
+    cdef long[::1] ports_mv = numpy.ascontiguousarray(connection_ids[4], dtype=int)
+
+    cdef size_t i
+    cdef size_t n = sources_mv.shape[0]
+    cdef ArrayDatum* ad = new ArrayDatum()
+    ad.reserve(n)
+    for i in range(n):
+        ad.push_back(<Datum*> new ConnectionDatum(
+            ConnectionID(sources_mv[i], targets_mv[i], threads_mv[i], synapse_ids_mv[i], ports_mv[i])))
+
+    return <Datum*> ad
+
+
+cdef inline object sli_datum_to_object(Datum* dat, cbool owned=False):
+    """Convert a datum to a Python object
+
+    If `owned` is true, the datum is only referenced from a datum that is about to be destroyed,
+    and the contents of vectors are moved into the returned NumPy arrays instead of being copied.
+    """
 
     if dat is NULL:
         raise NESTErrors.PyNESTError("datum is a null pointer")
@@ -511,17 +1250,17 @@ cdef inline object sli_datum_to_object(Datum* dat):
             ret = None
             ignore_none = True
     elif datum_type == SLI_TYPE_ARRAY:
-        ret = sli_array_to_object(<ArrayDatum*> dat)
+        ret = sli_array_to_object(<ArrayDatum*> dat, owned)
     elif datum_type == SLI_TYPE_DICTIONARY:
-        ret = sli_dict_to_object(<DictionaryDatum*> dat)
+        ret = sli_dict_to_object(<DictionaryDatum*> dat, owned)
     elif datum_type == SLI_TYPE_CONNECTION:
         datum = SLIDatum()
         (<SLIDatum> datum)._set_datum(<Datum*> new ConnectionDatum(deref(<ConnectionDatum*> dat)), SLI_TYPE_CONNECTION.decode())
         ret = nest.SynapseCollection(datum)
     elif datum_type == SLI_TYPE_VECTOR_INT:
-        ret = sli_vector_to_object[sli_vector_int_ptr_t, long](<IntVectorDatum*> dat)
+        ret = sli_vector_to_object[sli_vector_int_ptr_t, long](<IntVectorDatum*> dat, owned)
     elif datum_type == SLI_TYPE_VECTOR_DOUBLE:
-        ret = sli_vector_to_object[sli_vector_double_ptr_t, double](<DoubleVectorDatum*> dat)
+        ret = sli_vector_to_object[sli_vector_double_ptr_t, double](<DoubleVectorDatum*> dat, owned)
     elif datum_type == SLI_TYPE_MASK:
         datum = SLIDatum()
         (<SLIDatum> datum)._set_datum(<Datum*> new MaskDatum(deref(<MaskDatum*> dat)), SLI_TYPE_MASK.decode())
@@ -545,22 +1284,37 @@ cdef inline object sli_datum_to_object(Datum* dat):
 
     return ret
 
-cdef inline object sli_array_to_object(ArrayDatum* dat):
-
-    # the size of dat has to be explicitly cast to int to avoid
-    # compiler warnings (#1318) during cythonization
-    cdef tmp = [None] * int(dat.size())
+cdef inline object sli_array_to_object(ArrayDatum* dat, cbool owned=False):
 
     # i and n have to be cast to size_t (unsigned long int) to avoid
     # compiler warnings (#1318) in the for loop below
-    cdef size_t i, n
+    cdef size_t i
+    cdef size_t n = dat.size()
     cdef Token* tok = dat.begin()
 
-    n = len(tmp)
     if not n:
         return ()
 
     if tok.datum().gettypename().toString() == SLI_TYPE_CONNECTION:
+        return sli_connection_array_to_object(tok, n)
+
+    # the size of dat has to be explicitly cast to int to avoid
+    # compiler warnings (#1318) during cythonization
+    cdef tmp = [None] * int(n)
+    owned = owned and dat.references() == 1
+    for i in range(n):
+        tmp[i] = sli_datum_to_object(tok.datum(), owned and tok.datum().numReferences() == 1)
+        inc(tok)
+    return tuple(tmp)
+
+cdef inline object sli_connection_array_to_object(Token* tok, size_t n):
+    """Create a SynapseCollection from `n` tokens holding connection datums"""
+
+    cdef size_t i
+    cdef ConnectionDatum* conn_datum
+
+    if not HAVE_NUMPY:
+        tmp = [None] * int(n)
         for i in range(n):
             datum = SLIDatum()
             (<SLIDatum> datum)._set_datum(<Datum*> new ConnectionDatum(deref(<ConnectionDatum*> tok.datum())), SLI_TYPE_CONNECTION.decode())
@@ -568,13 +1322,34 @@ cdef inline object sli_array_to_object(ArrayDatum* dat):
             # Increment
             inc(tok)
         return nest.SynapseCollection(tmp)
-    else:
-        for i in range(n):
-            tmp[i] = sli_datum_to_object(tok.datum())
-            inc(tok)
-        return tuple(tmp)
 
-cdef inline object sli_dict_to_object(DictionaryDatum* dat):
+    # Only the fields of the connection IDs are stored, without a Python object per connection. The types
+    # of the arrays are those of SynapseCollection, so that the arrays are not copied.
+    connection_ids = (
+        numpy.empty(n, dtype=int),
+        numpy.empty(n, dtype=int),
+        numpy.empty(n, dtype=numpy.uint16),
+        numpy.empty(n, dtype=numpy.uint16),
+        numpy.empty(n, dtype=numpy.uint32),
+    )
+    cdef long[::1] sources_mv = connection_ids[0]
+    cdef long[::1] targets_mv = connection_ids[1]
+    cdef unsigned short[::1] threads_mv = connection_ids[2]
+    cdef unsigned short[::1] synapse_ids_mv = connection_ids[3]
+    cdef unsigned int[::1] ports_mv = connection_ids[4]
+
+    for i in range(n):
+        conn_datum = <ConnectionDatum*> tok.datum()
+        sources_mv[i] = conn_datum.get_source_node_id()
+        targets_mv[i] = conn_datum.get_target_node_id()
+        threads_mv[i] = conn_datum.get_target_thread()
+        synapse_ids_mv[i] = conn_datum.get_synapse_model_id()
+        ports_mv[i] = conn_datum.get_port()
+        inc(tok)
+
+    return nest.SynapseCollection(connection_ids)
+
+cdef inline object sli_dict_to_object(DictionaryDatum* dat, cbool owned=False):
 
     cdef tmp = {}
 
@@ -583,43 +1358,55 @@ cdef inline object sli_dict_to_object(DictionaryDatum* dat):
 
     cdef TokenMap.const_iterator dt = deref_dict(dat).begin()
 
+    owned = owned and dat.references() == 1
     while dt != deref_dict(dat).end():
         key_str = deref_tmap(dt).first.toString()
         tok = &deref_tmap(dt).second
-        tmp[key_str.decode()] = sli_datum_to_object(tok.datum())
+        tmp[key_str.decode()] = sli_datum_to_object(tok.datum(), owned and tok.datum().numReferences() == 1)
         inc(dt)
 
     return tmp
 
-cdef inline object sli_vector_to_object(sli_vector_ptr_t dat, vector_value_t _ = 0):
+cdef inline object sli_vector_to_object(sli_vector_ptr_t dat, cbool owned=False, vector_value_t _ = 0):
 
     cdef vector_value_t* array_data = NULL
     cdef vector[vector_value_t]* vector_ptr = NULL
+    cdef vector_value_t[::1] array_mv
 
     if sli_vector_ptr_t is sli_vector_int_ptr_t and vector_value_t is long:
         vector_ptr = deref_ivector(dat)
-        arr = array.clone(ARRAY_LONG, vector_ptr.size(), False)
-        array_data = arr.data.as_longs
         if HAVE_NUMPY:
             ret_dtype = int
     elif sli_vector_ptr_t is sli_vector_double_ptr_t and vector_value_t is double:
         vector_ptr = deref_dvector(dat)
-        arr = array.clone(ARRAY_DOUBLE, vector_ptr.size(), False)
-        array_data = arr.data.as_doubles
         if HAVE_NUMPY:
             ret_dtype = float
     else:
         raise NESTErrors.PyNESTError("unsupported specialization")
 
+    if HAVE_NUMPY:
+        # A vector that is only referenced by a datum about to be destroyed is moved into the array.
+        if owned and dat.references() == 1 and dat.deletable():
+            if vector_value_t is long:
+                return long_vector_to_array(deref(vector_ptr))
+            else:
+                return double_vector_to_array(deref(vector_ptr))
+
+        result = numpy.empty(vector_ptr.size(), dtype=ret_dtype)
+        if vector_ptr.size() > 0:
+            array_mv = result
+            memcpy(&array_mv[0], &vector_ptr.front(), vector_ptr.size() * sizeof(vector_value_t))
+        return result
+
+    if vector_value_t is long:
+        arr = array.clone(ARRAY_LONG, vector_ptr.size(), False)
+        array_data = arr.data.as_longs
+    else:
+        arr = array.clone(ARRAY_DOUBLE, vector_ptr.size(), False)
+        array_data = arr.data.as_doubles
+
     # skip when vector_ptr points to an empty vector
     if vector_ptr.size() > 0:
         memcpy(array_data, &vector_ptr.front(), vector_ptr.size() * sizeof(vector_value_t))
 
-    if HAVE_NUMPY:
-        if vector_ptr.size() > 0:
-            return numpy.frombuffer(arr, dtype=ret_dtype)
-        else:
-            # Compatibility with NumPy < 1.7.0
-            return numpy.array([], dtype=ret_dtype)
-    else:
-        return arr
+    return arr
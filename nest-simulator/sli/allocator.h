@@ -103,9 +103,14 @@ class pool
 
   bool initialized_; //!< True if the pool is initialized.
 
+  static bool concurrent_; //!< True if pools may be used by several threads at once.
+
   void grow( size_t ); //!< make pool larger by n elements
   void grow();         //!< make pool larger
 
+  inline void* alloc_();
+  inline void free_( void* p );
+
 
 public:
   /** Create pool for objects of size n. Initial is the initial allocation
@@ -140,6 +145,15 @@ public:
 
   inline void* alloc();        //!< allocate one element
   inline void free( void* p ); //!< put element back into the pool
+
+  /**
+   * Allow or forbid the use of all pools by several threads at once.
+   *
+   * While allowed, alloc() and free() are serialized, so that datums can be
+   * created in parallel regions, e.g., for reading the status of the nodes of
+   * each thread. This must only be changed outside of parallel regions.
+   */
+  static void set_concurrent( const bool concurrent );
   size_t
   size_of() const
   {
@@ -154,7 +168,37 @@ public:
 inline void*
 pool::alloc()
 {
+  if ( concurrent_ )
+  {
+    void* p;
+#pragma omp critical( sli_pool )
+    p = alloc_();
+    return p;
+  }
+  return alloc_();
+}
+
+inline void
+pool::free( void* elp )
+{
+  if ( concurrent_ )
+  {
+#pragma omp critical( sli_pool )
+    free_( elp );
+    return;
+  }
+  free_( elp );
+}
 
+inline void
+pool::set_concurrent( const bool concurrent )
+{
+  concurrent_ = concurrent;
+}
+
+inline void*
+pool::alloc_()
+{
   if ( not head )
   {
     grow( block_size );
@@ -170,7 +214,7 @@ pool::alloc()
 }
 
 inline void
-pool::free( void* elp )
+pool::free_( void* elp )
 {
   link* p = static_cast< link* >( elp );
   p->next = head;
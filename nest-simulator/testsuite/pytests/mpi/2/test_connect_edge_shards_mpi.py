@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# test_connect_edge_shards_mpi.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Test that ConnectEdgeShards only creates the connections of each rank and
+that the connections of all ranks equal those created by Connect with arrays.
+"""
+
+import nest
+import numpy as np
+import pytest
+
+try:
+    from mpi4py import MPI
+
+    HAVE_MPI4PY = True
+except ImportError:
+    HAVE_MPI4PY = False
+
+HAVE_OPENMP = nest.ll_api.sli_func("is_threaded")
+
+N_NODES = 20
+N_CONNS = 300
+
+
+def gather_connections(comm):
+    """Return the connections of all ranks on rank 0 as sorted array of rows (source, target, weight, delay)."""
+
+    conns = nest.GetConnections()
+    local = np.array([conns.source, conns.target, conns.weight, conns.delay], dtype=float).T.reshape(-1, 4)
+    recv = comm.gather(local, root=0)
+    if comm.Get_rank() != 0:
+        return None
+    connections = np.concatenate(recv)
+    return connections[np.lexsort(connections.T[::-1])]
+
+
+@pytest.mark.skipif(not HAVE_OPENMP, reason="NEST was compiled without multi-threading")
+@pytest.mark.skipif(not HAVE_MPI4PY, reason="mpi4py is not available")
+def test_connect_edge_shards_mpi(tmp_path):
+    comm = MPI.COMM_WORLD.Clone()
+    rank = comm.Get_rank()
+
+    rng = np.random.default_rng(1234)
+    sources = rng.integers(1, N_NODES + 1, N_CONNS)
+    targets = rng.integers(1, N_NODES + 1, N_CONNS)
+    weights = rng.uniform(0.5, 2.0, N_CONNS)
+    delays = rng.choice([1.0, 1.5, 2.0], N_CONNS)
+    syn_spec = {"weight": weights, "delay": delays}
+
+    # The files are written once by rank 0 into its directory, which all ranks read.
+    path = comm.bcast(str(tmp_path) if rank == 0 else None, root=0)
+
+    nest.ResetKernel()
+    nest.local_num_threads = 2
+    nest.Create("iaf_psc_alpha", N_NODES)
+    if rank == 0:
+        nest.WriteEdgeShards(path, sources, targets, syn_spec)
+    comm.Barrier()
+    nest.ConnectEdgeShards(path)
+
+    # Each rank only created the connections of its own slice, all of them to local targets.
+    local_targets = set(nest.GetLocalNodeCollection(nest.NodeCollection(list(range(1, N_NODES + 1)))).tolist())
+    conns = nest.GetConnections()
+    assert set(conns.target) <= local_targets
+    assert len(conns) == np.isin(targets, list(local_targets)).sum()
+    shards = gather_connections(comm)
+
+    nest.ResetKernel()
+    nest.local_num_threads = 2
+    nest.Create("iaf_psc_alpha", N_NODES)
+    nest.Connect(sources, targets, "one_to_one", syn_spec)
+    reference = gather_connections(comm)
+
+    if rank == 0:
+        expected = np.array([sources, targets, weights, delays], dtype=float).T
+        expected = expected[np.lexsort(expected.T[::-1])]
+        np.testing.assert_array_equal(shards[:, :2], reference[:, :2])
+        np.testing.assert_allclose(shards[:, 2:], reference[:, 2:])
+        np.testing.assert_array_equal(shards[:, :2], expected[:, :2])
+        np.testing.assert_allclose(shards[:, 2:], expected[:, 2:])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# test_get_numpy_mpi.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Test that getting node parameters as NumPy arrays covers the nodes on other
+MPI processes.
+"""
+
+import nest
+import numpy as np
+import pytest
+
+try:
+    from mpi4py import MPI
+
+    HAVE_MPI4PY = True
+except ImportError:
+    HAVE_MPI4PY = False
+
+HAVE_OPENMP = nest.ll_api.sli_func("is_threaded")
+
+N_NODES = 10
+
+
+@pytest.mark.skipif(not HAVE_OPENMP, reason="NEST was compiled without multi-threading")
+@pytest.mark.skipif(not HAVE_MPI4PY, reason="mpi4py is not available")
+def test_get_numpy_mpi():
+    comm = MPI.COMM_WORLD.Clone()
+
+    nest.ResetKernel()
+    nest.local_num_threads = 2
+    nodes = nest.Create("iaf_psc_alpha", N_NODES)
+    v_m = -70.0 + np.arange(N_NODES)
+    nodes.set({"V_m": v_m})
+
+    values = nodes.get(["global_id", "model_id", "vp", "local", "V_m"], output="numpy")
+
+    # Properties that the kernel keeps for all nodes are known on all ranks.
+    np.testing.assert_array_equal(values["global_id"], nodes.tolist())
+    np.testing.assert_array_equal(values["model_id"], nest.GetDefaults("iaf_psc_alpha", "model_id"))
+    total_num_virtual_procs = nest.total_num_virtual_procs
+    np.testing.assert_array_equal(values["vp"], np.array(nodes.tolist()) % total_num_virtual_procs)
+
+    # Model-specific parameters are only known for local nodes.
+    local = values["local"]
+    assert local.dtype == bool
+    assert local.any() and not local.all()
+    np.testing.assert_array_equal(values["V_m"][local], v_m[local])
+    assert np.isnan(values["V_m"][~local]).all()
+
+    # Each node is local on exactly one rank.
+    assert (comm.allreduce(local.astype(int), op=MPI.SUM) == 1).all()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# test_nest_server_gather_mpi.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Test that NEST Server gathers the responses of all MPI processes on the
+master, both with typed buffers and with the fallback used if the
+processes report different events.
+"""
+
+import numpy as np
+import pytest
+
+try:
+    from mpi4py import MPI
+
+    HAVE_MPI4PY = True
+except ImportError:
+    HAVE_MPI4PY = False
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+pytest.importorskip("RestrictedPython")
+
+from nest.server import hl_api_server  # noqa: E402
+
+
+@pytest.fixture
+def comm(monkeypatch):
+    comm = MPI.COMM_WORLD.Clone()
+    monkeypatch.setattr(hl_api_server, "mpi_comm", comm)
+    yield comm
+    comm.Free()
+
+
+def recorder_response(events):
+    return [{"element_type": "recorder", "record_to": "memory", "n_events": len(events["times"]), "events": events}]
+
+
+def local_events(rank):
+    """Return rank + 1 events, so that the processes send different amounts of data."""
+
+    times = np.arange(rank + 1, dtype=float) + 10.0 * rank
+    senders = np.full(rank + 1, rank + 1, dtype=np.int64)
+    return {"times": times, "senders": senders}
+
+
+def check_gathered(responses, comm, extra_keys_rank_1=()):
+    if comm.Get_rank() != 0:
+        assert responses is None
+        return
+
+    assert len(responses) == comm.Get_size()
+    for rank, response in enumerate(responses):
+        expected = local_events(rank)
+        events = response[0]["events"]
+        assert response[0]["n_events"] == rank + 1
+        assert set(events) == set(expected).union(extra_keys_rank_1 if rank == 1 else [])
+        for key, values in expected.items():
+            assert events[key].dtype == values.dtype
+            np.testing.assert_array_equal(events[key], values)
+
+
+@pytest.mark.skipif(not HAVE_MPI4PY, reason="mpi4py is not available")
+def test_gather_response_same_layout(comm):
+    """Test that events are gathered with their data types if all processes report the same events."""
+
+    responses = hl_api_server.gather_response(recorder_response(local_events(comm.Get_rank())))
+
+    check_gathered(responses, comm)
+
+
+@pytest.mark.skipif(not HAVE_MPI4PY, reason="mpi4py is not available")
+def test_gather_response_different_layouts(comm):
+    """Test that the responses are gathered as Python objects if the processes report different events."""
+
+    events = local_events(comm.Get_rank())
+    if comm.Get_rank() == 1:
+        events["weights"] = np.ones(2)
+
+    responses = hl_api_server.gather_response(recorder_response(events))
+
+    check_gathered(responses, comm, extra_keys_rank_1=["weights"])
+
+
+@pytest.mark.skipif(not HAVE_MPI4PY, reason="mpi4py is not available")
+def test_gather_response_empty_events(comm):
+    """Test that processes without events do not change the data type of the events of the others."""
+
+    rank = comm.Get_rank()
+    events = local_events(rank) if rank == 0 else {"times": np.array([]), "senders": np.array([])}
+
+    responses = hl_api_server.gather_response(recorder_response(events))
+
+    if rank == 0:
+        merged = hl_api_server.merge_dicts(responses)[0]
+        assert merged["n_events"] == 1
+        assert merged["events"]["senders"].dtype == np.int64
+        np.testing.assert_array_equal(merged["events"]["times"], [0.0])
+    else:
+        assert responses is None
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+#
+# test_checkpoint.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for ``Checkpoint`` and ``Restore``, comparing the restored network with the original one.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+
+CONN_KEYS = ["source", "target", "weight", "delay", "Kplus", "Wmax"]
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+def build_network(n_threads):
+    nest.local_num_threads = n_threads
+    nest.rng_seed = 12
+
+    neurons = nest.Create("iaf_psc_alpha", 20, params={"V_m": nest.random.uniform(-70.0, -55.0)})
+    parrots = nest.Create("parrot_neuron", 5)
+    generator = nest.Create("poisson_generator", params={"rate": 20000.0})
+    recorder = nest.Create("spike_recorder")
+
+    nest.Connect(generator, parrots)
+    nest.Connect(
+        parrots,
+        neurons,
+        "all_to_all",
+        {"synapse_model": "stdp_synapse", "weight": nest.random.uniform(10.0, 50.0), "Wmax": 200.0},
+    )
+    nest.Connect(neurons, neurons, {"rule": "fixed_indegree", "indegree": 3}, {"weight": 5.0, "delay": 1.5})
+    nest.Connect(neurons, recorder)
+
+
+def network_state():
+    nodes = nest.GetNodes()
+    node_state = {
+        "models": nodes.get("model"),
+        "V_m": nest.GetNodes({"model": "iaf_psc_alpha"}).get("V_m"),
+        "rate": nest.GetNodes({"model": "poisson_generator"}).get("rate"),
+    }
+
+    conns = nest.GetConnections(synapse_model="stdp_synapse").get(CONN_KEYS)
+    table = np.array([conns[key] for key in CONN_KEYS], dtype=float)
+    n_static = len(nest.GetConnections(synapse_model="static_synapse"))
+    return node_state, table[:, np.lexsort(table[::-1])], n_static
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+def test_restore_equals_checkpoint(tmp_path, n_threads):
+    """Test that the restored network has the same nodes, connections and RNG states as the original one."""
+
+    build_network(n_threads)
+    nest.Simulate(50.0)
+    nest.Checkpoint(tmp_path)
+
+    expected_nodes, expected_conns, expected_n_static = network_state()
+    expected_draws = [nest.random.uniform().GetValue() for _ in range(5)]
+
+    nest.ResetKernel()
+    nest.local_num_threads = n_threads
+    nest.Restore(tmp_path)
+
+    nodes, conns, n_static = network_state()
+    assert nodes["models"] == expected_nodes["models"]
+    # Membrane potentials are stored relative to the resting potential, which may change the last digit.
+    nptest.assert_allclose(nodes["V_m"], expected_nodes["V_m"], rtol=1e-14)
+    nptest.assert_array_equal(nodes["rate"], expected_nodes["rate"])
+    nptest.assert_array_equal(conns, expected_conns)
+    assert n_static == expected_n_static
+    assert [nest.random.uniform().GetValue() for _ in range(5)] == expected_draws
+
+    # The restored network can be simulated.
+    nest.Simulate(10.0)
+
+
+def test_restore_requires_empty_kernel(tmp_path):
+    """Test that a checkpoint cannot be restored into a kernel with nodes."""
+
+    build_network(1)
+    nest.Checkpoint(tmp_path)
+
+    with pytest.raises(nest.kernel.NESTErrors.KernelException):
+        nest.Restore(tmp_path)
+
+
+@pytest.mark.skipif_missing_threads
+def test_restore_requires_same_number_of_threads(tmp_path):
+    """Test that a checkpoint can only be restored with the number of threads it was written with."""
+
+    build_network(2)
+    nest.Checkpoint(tmp_path)
+
+    nest.ResetKernel()
+    with pytest.raises(nest.kernel.NESTErrors.BadProperty):
+        nest.Restore(tmp_path)
+
+
+def test_restore_missing_checkpoint(tmp_path):
+    """Test that restoring from a directory without checkpoint fails."""
+
+    with pytest.raises(nest.kernel.NESTErrors.IOError):
+        nest.Restore(tmp_path)
+
+
+def test_restore_receptor_types(tmp_path):
+    """Test that connections are restored with the receptor types they were created with.
+
+    The receptor ports of ht_neuron and iaf_cond_alpha_mc differ from the receptor types,
+    and the receptor ports of connections from multimeters are indices of the multimeters.
+    """
+
+    ht_receptors = nest.GetDefaults("ht_neuron")["receptor_types"]
+    mc_receptors = nest.GetDefaults("iaf_cond_alpha_mc")["receptor_types"]
+    ht_neurons = nest.Create("ht_neuron", 2)
+    mc_neuron = nest.Create("iaf_cond_alpha_mc")
+    multimeters = nest.Create("multimeter", 2, {"record_from": ["V_m"]})
+
+    nest.Connect(ht_neurons[0], ht_neurons[1], syn_spec={"receptor_type": ht_receptors["NMDA"]})
+    nest.Connect(ht_neurons[1], ht_neurons[0], syn_spec={"receptor_type": ht_receptors["AMPA"]})
+    nest.Connect(ht_neurons, mc_neuron, syn_spec={"receptor_type": mc_receptors["distal_inh"]})
+    nest.Connect(multimeters, ht_neurons)
+
+    ht_ids = ht_neurons.tolist()
+    multimeter_ids = multimeters.tolist()
+
+    def receptors(source_ids):
+        conns = nest.GetConnections(source=nest.NodeCollection(source_ids)).get(["source", "target", "receptor"])
+        table = np.array([conns["source"], conns["target"], conns["receptor"]])
+        return table[:, np.lexsort(table[::-1])]
+
+    expected = receptors(ht_ids)
+    assert sorted(expected[2]) == sorted(
+        [ht_receptors["AMPA"] - 1, ht_receptors["NMDA"] - 1] + 2 * [mc_receptors["distal_inh"] - 1]
+    )
+    nest.Checkpoint(tmp_path)
+
+    nest.ResetKernel()
+    nest.Restore(tmp_path)
+
+    nptest.assert_array_equal(receptors(ht_ids), expected)
+    assert len(nest.GetConnections(source=nest.NodeCollection(multimeter_ids))) == 4
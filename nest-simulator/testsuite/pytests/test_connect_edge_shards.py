@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# test_connect_edge_shards.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for ``WriteEdgeShards`` and ``ConnectEdgeShards``, comparing with ``Connect`` with arrays of node IDs.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+
+N_NODES = 20
+N_CONNS = 500
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+def random_edges(seed=1234):
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(1, N_NODES + 1, N_CONNS)
+    targets = rng.integers(1, N_NODES + 1, N_CONNS)
+    syn_spec = {
+        "synapse_model": "stdp_synapse",
+        "weight": rng.uniform(1.0, 2.0, N_CONNS),
+        "delay": rng.choice([1.0, 1.5, 2.0], N_CONNS),
+        "alpha": rng.uniform(0.5, 1.0, N_CONNS),
+        "Wmax": 50.0,
+    }
+    return sources, targets, syn_spec
+
+
+def sorted_connections():
+    keys = ["source", "target", "weight", "delay", "alpha", "Wmax"]
+    conns = nest.GetConnections().get(keys)
+    table = np.array([conns[key] for key in keys], dtype=float)
+    return table[:, np.lexsort(table[::-1])]
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+@pytest.mark.parametrize("chunk_size", [7, 2**22])
+def test_connect_edge_shards_equals_connect(tmp_path, n_threads, chunk_size):
+    """Test that connections created from edge shards equal those created from the arrays."""
+
+    sources, targets, syn_spec = random_edges()
+
+    nest.local_num_threads = n_threads
+    nest.Create("iaf_psc_alpha", N_NODES)
+    nest.Connect(sources, targets, conn_spec="one_to_one", syn_spec=syn_spec)
+    expected = sorted_connections()
+
+    nest.ResetKernel()
+    nest.local_num_threads = n_threads
+    nest.Create("iaf_psc_alpha", N_NODES)
+    nest.WriteEdgeShards(tmp_path, sources, targets, syn_spec, chunk_size=chunk_size)
+    nest.ConnectEdgeShards(tmp_path)
+
+    nptest.assert_array_equal(sorted_connections(), expected)
+
+
+def test_edge_shards_ordered_by_thread(tmp_path):
+    """Test that the connections are stored ordered by the rank and thread of their targets."""
+
+    sources, targets, syn_spec = random_edges()
+    nest.WriteEdgeShards(tmp_path, sources, targets, syn_spec, num_processes=2, local_num_threads=3, chunk_size=64)
+
+    offsets = np.load(tmp_path / "offsets.npy")
+    stored_sources = np.load(tmp_path / "sources.npy")
+    stored_targets = np.load(tmp_path / "targets.npy")
+    stored_weights = np.load(tmp_path / "weight.npy")
+
+    assert offsets[-1] == N_CONNS
+    for rank in range(2):
+        for thread in range(3):
+            shard = rank * 3 + thread
+            vps = stored_targets[offsets[shard] : offsets[shard + 1]] % 6
+            assert np.all(vps % 2 == rank)
+            assert np.all(vps // 2 == thread)
+
+    # No connection is lost or duplicated by sorting.
+    original = sorted(zip(sources, targets, syn_spec["weight"]))
+    stored = sorted(zip(stored_sources, stored_targets, stored_weights))
+    assert original == stored
+
+
+def test_connect_edge_shards_wrong_number_of_threads(tmp_path):
+    """Test that connecting fails if the number of threads differs from the one the shards were written for."""
+
+    sources, targets, syn_spec = random_edges()
+    nest.Create("iaf_psc_alpha", N_NODES)
+    nest.WriteEdgeShards(tmp_path, sources, targets, syn_spec, local_num_threads=4)
+
+    with pytest.raises(ValueError):
+        nest.ConnectEdgeShards(tmp_path)
+
+
+def test_connect_edge_shards_device_target(tmp_path):
+    """Test that connecting to devices, which are replicated on all threads, fails."""
+
+    neuron = nest.Create("iaf_psc_alpha")
+    recorder = nest.Create("spike_recorder")
+    nest.WriteEdgeShards(tmp_path, np.array(neuron.tolist()), np.array(recorder.tolist()))
+
+    with pytest.raises(nest.kernel.NESTErrors.BadProperty):
+        nest.ConnectEdgeShards(tmp_path)
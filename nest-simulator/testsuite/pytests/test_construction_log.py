@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# test_construction_log.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the construction log enabled by the kernel attribute ``log_construction``.
+"""
+
+import nest
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+    nest.log_construction = True
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+def test_one_entry_per_connect(n_threads):
+    """Test that each call to ``Connect`` adds an entry with the connections created by each thread."""
+
+    nest.local_num_threads = n_threads
+    neurons = nest.Create("iaf_psc_alpha", 20)
+
+    nest.Connect(neurons, neurons, {"rule": "fixed_indegree", "indegree": 3})
+    n_first = nest.num_connections
+    nest.Connect(neurons[:5], neurons, "all_to_all", {"synapse_model": "stdp_synapse"})
+
+    log = nest.GetConstructionLog()
+    assert list(log["rule"]) == ["fixed_indegree", "all_to_all"]
+    assert [list(models) for models in log["synapse_models"]] == [["static_synapse"], ["stdp_synapse"]]
+    assert list(log["num_sources"]) == [20, 5]
+    assert list(log["num_targets"]) == [20, 20]
+    assert all(time >= 0.0 for time in log["time"])
+    assert [len(times) for times in log["thread_times"]] == [n_threads, n_threads]
+    assert [sum(conns) for conns in log["thread_connections"]] == [n_first, nest.num_connections - n_first]
+
+
+def test_connect_arrays_is_logged():
+    """Test that connecting arrays of node IDs adds an entry with the rule ``arrays``."""
+
+    neurons = nest.Create("iaf_psc_alpha", 10)
+    sources = np.array(neurons.tolist()[:5])
+    targets = np.array(neurons.tolist()[5:])
+
+    nest.Connect(sources, targets, "one_to_one", {"weight": 2.0, "delay": 1.0})
+
+    log = nest.GetConstructionLog()
+    assert list(log["rule"]) == ["arrays"]
+    assert list(log["num_sources"]) == [5]
+    assert [sum(conns) for conns in log["thread_connections"]] == [5]
+
+
+def test_connection_infrastructure_is_logged():
+    """Test that the times of each update of the connection infrastructure are logged per thread."""
+
+    neurons = nest.Create("iaf_psc_alpha", 10)
+    nest.Connect(neurons, neurons)
+
+    assert len(nest.GetConstructionLog()["connection_infrastructure"]["time_sort_connections"]) == 0
+
+    nest.Simulate(1.0)
+
+    infrastructure = nest.GetConstructionLog()["connection_infrastructure"]
+    for key in ["time_sort_connections", "time_build_target_tables", "time_gather_target_data"]:
+        assert len(infrastructure[key]) == 1
+        assert len(infrastructure[key][0]) == nest.local_num_threads
+
+
+def test_reset_clears_and_disables_log():
+    """Test that ``ResetKernel`` clears and disables the log."""
+
+    neurons = nest.Create("iaf_psc_alpha", 2)
+    nest.Connect(neurons, neurons)
+    nest.ResetKernel()
+
+    assert not nest.log_construction
+    assert len(nest.GetConstructionLog()["rule"]) == 0
+
+
+def test_disabled_log_records_nothing():
+    """Test that nothing is logged while ``log_construction`` is disabled."""
+
+    nest.log_construction = False
+    neurons = nest.Create("iaf_psc_alpha", 10)
+    nest.Connect(neurons, neurons)
+    nest.Simulate(1.0)
+
+    log = nest.GetConstructionLog()
+    assert len(log["rule"]) == 0
+    assert len(log["connection_infrastructure"]["time_sort_connections"]) == 0
+
+
+def test_enabling_discards_previous_entries():
+    """Test that enabling the log discards previous entries."""
+
+    neurons = nest.Create("iaf_psc_alpha", 2)
+    nest.Connect(neurons, neurons)
+    nest.log_construction = False
+    nest.log_construction = True
+
+    assert len(nest.GetConstructionLog()["rule"]) == 0
+
+
+def test_log_not_in_kernel_status():
+    """Test that the log is not part of the kernel status."""
+
+    neurons = nest.Create("iaf_psc_alpha", 2)
+    nest.Connect(neurons, neurons)
+
+    status = nest.GetKernelStatus()
+    assert status["log_construction"]
+    assert "construction_log" not in status
@@ -454,6 +454,62 @@ class TestNodeCollectionGetSet(unittest.TestCase):
             multi_sr_ref_element = [list(element) for element in multi_sr_ref[key]]
             self.assertEqual(multi_sr_ref_element, multi_sr_dict[key])
 
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_get_numpy(self):
+        """
+        Test that get function with NumPy output works as expected.
+        """
+        nodes = nest.Create("iaf_psc_alpha", 10)
+        nodes.set(V_m=[-70.0 + i for i in range(10)])
+
+        # Single parameter
+        V_m = nodes.get("V_m", output="numpy")
+        self.assertIsInstance(V_m, np.ndarray)
+        self.assertEqual(V_m.dtype, np.float64)
+        np.testing.assert_array_equal(V_m, nodes.get("V_m"))
+
+        # Multiple parameters, with integer and boolean values
+        values = nodes.get(["V_m", "C_m", "global_id", "frozen"], output="numpy")
+        self.assertEqual(sorted(values.keys()), ["C_m", "V_m", "frozen", "global_id"])
+        np.testing.assert_array_equal(values["C_m"], nodes.get("C_m"))
+        np.testing.assert_array_equal(values["global_id"], np.arange(1, 11))
+        self.assertTrue(np.issubdtype(values["global_id"].dtype, np.integer))
+        self.assertEqual(values["frozen"].dtype, bool)
+
+        # Single node still gives arrays
+        np.testing.assert_array_equal(nodes[3].get("V_m", output="numpy"), [-67.0])
+
+        # Sliced NodeCollection
+        np.testing.assert_array_equal(nodes[2:9:3].get("V_m", output="numpy"), [-68.0, -65.0, -62.0])
+
+        with self.assertRaises(TypeError):
+            nodes.get(output="numpy")
+        with self.assertRaises(TypeError):
+            nodes.get("events", "senders", output="numpy")
+        with self.assertRaises(nest.kernel.NESTError):
+            nodes.get("no_such_parameter", output="numpy")
+
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_get_numpy_composite(self):
+        """
+        Test that get function with NumPy output works on composite NodeCollections.
+        """
+        n1 = nest.Create("iaf_psc_alpha", 2, {"C_m": 251.0})
+        n2 = nest.Create("iaf_psc_delta", 2, {"C_m": 252.0})
+        n3 = nest.Create("iaf_psc_alpha", 3, {"C_m": 253.0})
+
+        nodes = n1 + n2 + n3
+        values = nodes.get(["C_m", "tau_syn_ex", "global_id"], output="numpy")
+
+        np.testing.assert_array_equal(values["C_m"], [251.0, 251.0, 252.0, 252.0, 253.0, 253.0, 253.0])
+        np.testing.assert_array_equal(values["global_id"], nodes.tolist())
+
+        # NaN where the parameter does not exist for the node
+        np.testing.assert_array_equal(values["tau_syn_ex"], [2.0, 2.0, np.nan, np.nan, 2.0, 2.0, 2.0])
+
+        # Slice of a composite NodeCollection
+        np.testing.assert_array_equal(nodes[1:6:2].get("C_m", output="numpy"), [251.0, 252.0, 253.0])
+
     def test_set(self):
         """
         Test that set function works as expected.
@@ -507,6 +563,55 @@ class TestNodeCollectionGetSet(unittest.TestCase):
         with self.assertRaises(nest.kernel.NESTError):
             nodes.set({"vp": 2})
 
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_set_numpy(self):
+        """
+        Test that set function works with NumPy arrays.
+        """
+        nodes = nest.Create("iaf_psc_alpha", 10)
+
+        V_m = np.linspace(-80.0, -60.0, 10)
+        nodes.set(V_m=V_m, I_e=np.arange(10.0), C_m=200.0)
+        np.testing.assert_array_equal(nodes.get("V_m"), V_m)
+        np.testing.assert_array_equal(nodes.get("I_e"), np.arange(10.0))
+        self.assertEqual(nodes.get("C_m"), (200.0,) * 10)
+
+        # Boolean values
+        frozen = np.array([True, False] * 5)
+        nodes.set({"frozen": frozen})
+        np.testing.assert_array_equal(nodes.get("frozen"), frozen)
+
+        # Sliced NodeCollection
+        nodes[1:8:3].set(V_m=np.array([1.0, 2.0, 3.0]))
+        self.assertEqual(nodes[1:8:3].get("V_m"), (1.0, 2.0, 3.0))
+        self.assertEqual(nodes[0].get("V_m"), -80.0)
+
+        with self.assertRaises(ValueError):
+            nodes.set(V_m=np.zeros(9))
+        with self.assertRaises(nest.kernel.NESTErrors.BadParameter):
+            nodes.set(no_such_parameter=np.zeros(10))
+        with self.assertRaises(nest.kernel.NESTErrors.BadParameter):
+            nodes.set(frozen=np.full(10, 0.5))
+
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_set_numpy_composite(self):
+        """
+        Test that set function works with NumPy arrays on composite NodeCollections and devices.
+        """
+        nodes = nest.Create("iaf_psc_alpha", 2) + nest.Create("iaf_psc_delta", 3)
+        nodes.set(V_m=np.arange(5.0))
+        self.assertEqual(nodes.get("V_m"), (0.0, 1.0, 2.0, 3.0, 4.0))
+
+        generators = nest.Create("dc_generator", 3)
+        generators.set(amplitude=np.array([10.0, 20.0, 30.0]))
+        self.assertEqual(generators.get("amplitude"), (10.0, 20.0, 30.0))
+
+        # Array-valued parameters are still set on each node as a whole
+        spike_generators = nest.Create("spike_generator", 3)
+        spike_generators.set(spike_times=np.array([1.0, 2.0, 3.0]))
+        for spike_times in spike_generators.get("spike_times"):
+            np.testing.assert_array_equal(spike_times, [1.0, 2.0, 3.0])
+
     def test_set_composite(self):
         """
         Test that set works on composite NodeCollections
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# test_iter_connections.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for ``IterConnections``, comparing the chunks with the connections returned by ``GetConnections``.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+
+KEYS = ["source", "target", "synapse_id", "weight"]
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+def build_network(n_threads):
+    nest.local_num_threads = n_threads
+
+    neurons = nest.Create("iaf_psc_alpha", 20)
+    generator = nest.Create("poisson_generator")
+    recorder = nest.Create("spike_recorder")
+
+    nest.Connect(neurons, neurons, {"rule": "fixed_indegree", "indegree": 5}, {"weight": nest.random.uniform()})
+    nest.Connect(neurons[:10], neurons[10:], "all_to_all", {"synapse_model": "stdp_synapse", "weight": 2.0})
+    nest.Connect(generator, neurons)
+    nest.Connect(neurons, recorder)
+
+    return neurons, recorder
+
+
+def sorted_table(columns):
+    table = np.array([columns[key] for key in KEYS], dtype=float)
+    return table[:, np.lexsort(table[::-1])]
+
+
+def concatenate(chunks):
+    chunks = list(chunks)
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in KEYS}
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+@pytest.mark.parametrize(
+    "selection",
+    [
+        {},
+        {"source": slice(5, 15)},
+        {"target": slice(0, 8)},
+        {"source": slice(0, 10), "target": slice(10, 20)},
+        {"synapse_model": "stdp_synapse"},
+    ],
+)
+def test_chunks_equal_get_connections(n_threads, chunk_size, selection):
+    """Test that the chunks together hold the connections selected by ``GetConnections``."""
+
+    neurons, _ = build_network(n_threads)
+    selection = {key: neurons[value] if isinstance(value, slice) else value for key, value in selection.items()}
+
+    expected = nest.GetConnections(**selection).get(KEYS, output="numpy")
+    actual = concatenate(nest.IterConnections(**selection, keys=KEYS, chunk_size=chunk_size))
+
+    nptest.assert_array_equal(sorted_table(actual), sorted_table(expected))
+
+
+def test_chunk_size_bounds_chunks():
+    """Test that chunks without connections to or from devices hold at most ``chunk_size`` connections."""
+
+    neurons, _ = build_network(1)
+
+    chunks = list(nest.IterConnections(source=neurons, target=neurons, keys=KEYS, chunk_size=7))
+
+    assert all(len(chunk["source"]) <= 7 for chunk in chunks)
+    assert sum(len(chunk["source"]) for chunk in chunks) == len(nest.GetConnections(neurons, neurons))
+
+
+def test_numpy_integer_chunk_size():
+    """Test that NumPy integers are accepted as chunk size."""
+
+    neurons, _ = build_network(1)
+
+    chunks = list(nest.IterConnections(source=neurons, target=neurons, keys=KEYS, chunk_size=np.int64(7)))
+
+    assert all(len(chunk["source"]) <= 7 for chunk in chunks)
+    assert sum(len(chunk["source"]) for chunk in chunks) == len(nest.GetConnections(neurons, neurons))
+
+
+def test_connections_to_devices():
+    """Test that connections to devices are yielded when selecting the device as target."""
+
+    neurons, recorder = build_network(1)
+
+    sources = np.concatenate(list(nest.IterConnections(target=recorder, keys="source")))
+
+    nptest.assert_array_equal(np.sort(sources), neurons.tolist())
+
+
+def test_empty_network():
+    """Test that no chunks are yielded without connections."""
+
+    nest.Create("iaf_psc_alpha", 2)
+
+    assert list(nest.IterConnections()) == []
+
+
+def test_connect_during_iteration_raises():
+    """Test that changing the connections while iterating over them raises an error."""
+
+    neurons, _ = build_network(1)
+    chunks = nest.IterConnections(chunk_size=10)
+    next(chunks)
+    nest.Connect(neurons[0], neurons[1])
+
+    with pytest.raises(nest.kernel.NESTError):
+        next(chunks)
+
+
+def test_disconnect_and_connect_during_iteration_raises():
+    """Test that replacing a connection while iterating raises an error, although the number of connections is kept."""
+
+    neurons, _ = build_network(1)
+    chunks = nest.IterConnections(chunk_size=10)
+    next(chunks)
+
+    num_connections = nest.num_connections
+    conn = nest.GetConnections(neurons[:10], neurons[10:], synapse_model="stdp_synapse")[0]
+    source, target = conn.source, conn.target
+    conn.disconnect()
+    nest.Connect(nest.NodeCollection([source]), nest.NodeCollection([target]), syn_spec="stdp_synapse")
+    assert nest.num_connections == num_connections
+
+    with pytest.raises(nest.kernel.NESTError, match="ConnectionsChanged"):
+        next(chunks)
+
+
+def test_invalid_chunk_size_raises():
+    """Test that chunk sizes that are not positive integers are rejected."""
+
+    with pytest.raises(ValueError):
+        next(nest.IterConnections(chunk_size=0))
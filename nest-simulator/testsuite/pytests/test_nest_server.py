@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+#
+# test_nest_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the encoding and combination of responses of NEST Server.
+"""
+
+import nest
+import numpy as np
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+pytest.importorskip("RestrictedPython")
+
+from nest.server import hl_api_server  # noqa: E402
+
+# The server removes the app from its module on the first request, so that we keep our own reference.
+APP = hl_api_server.app
+MSGPACK_HEADERS = {"Accept": hl_api_server.MSGPACK_MIMETYPE}
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(hl_api_server, "AUTH_DISABLED", True)
+    return APP.test_client()
+
+
+def unpack_arrays(obj):
+    """Convert the maps written by pack_array() back to NumPy arrays."""
+
+    if isinstance(obj, dict) and obj.get("__ndarray__"):
+        return np.frombuffer(obj["data"], obj["dtype"]).reshape(obj["shape"])
+    if isinstance(obj, dict):
+        return {key: unpack_arrays(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [unpack_arrays(value) for value in obj]
+    return obj
+
+
+DATA = {
+    "times": np.array([0.5, 1.5, 2.5]),
+    "senders": np.array([[1, 2], [3, 4]], dtype=np.int32),
+    "flags": np.array([True, False]),
+    "n_events": np.int64(3),
+    "label": "spikes",
+}
+
+
+def test_json_is_default():
+    """Test that responses are encoded in JSON unless the client accepts MessagePack."""
+
+    with APP.test_request_context("/"):
+        response = hl_api_server.encode_response(DATA)
+
+    assert response.mimetype == hl_api_server.JSON_MIMETYPE
+    assert "Accept" in response.vary
+    assert response.get_json() == {
+        "times": [0.5, 1.5, 2.5],
+        "senders": [[1, 2], [3, 4]],
+        "flags": [True, False],
+        "n_events": 3,
+        "label": "spikes",
+    }
+
+
+def test_msgpack_round_trip():
+    """Test that arrays keep their data type, shape and data in MessagePack responses."""
+
+    msgpack = pytest.importorskip("msgpack")
+
+    with APP.test_request_context("/", headers=MSGPACK_HEADERS):
+        response = hl_api_server.encode_response(DATA)
+
+    assert response.mimetype == hl_api_server.MSGPACK_MIMETYPE
+    data = unpack_arrays(msgpack.unpackb(response.get_data(), raw=False))
+
+    assert data.keys() == DATA.keys()
+    for key in ["times", "senders", "flags"]:
+        assert data[key].dtype == DATA[key].dtype
+        np.testing.assert_array_equal(data[key], DATA[key])
+    assert data["n_events"] == 3
+    assert data["label"] == "spikes"
+
+
+def test_json_without_msgpack(monkeypatch):
+    """Test that responses are encoded in JSON if msgpack is not installed, even if the client prefers it."""
+
+    monkeypatch.setattr(hl_api_server, "HAVE_MSGPACK", False)
+
+    with APP.test_request_context("/", headers=MSGPACK_HEADERS):
+        response = hl_api_server.encode_response(DATA)
+
+    assert response.mimetype == hl_api_server.JSON_MIMETYPE
+    assert response.get_json()["times"] == [0.5, 1.5, 2.5]
+
+
+def test_api_call_content_negotiation(client):
+    """Test that API calls are answered in the format accepted by the client."""
+
+    response = client.post("/api/GetKernelStatus", json=["resolution"])
+    assert response.mimetype == hl_api_server.JSON_MIMETYPE
+    assert response.get_json() == nest.resolution
+
+    msgpack = pytest.importorskip("msgpack")
+
+    response = client.post("/api/GetKernelStatus", json=["resolution"], headers=MSGPACK_HEADERS)
+    assert response.mimetype == hl_api_server.MSGPACK_MIMETYPE
+    assert msgpack.unpackb(response.get_data(), raw=False) == nest.resolution
+
+
+def recorder_status(record_to="memory", **events):
+    """Return a status dictionary of a recorder as reported by one MPI process."""
+
+    status = {"element_type": "recorder", "record_to": record_to, "label": "spikes"}
+    if record_to == "memory":
+        status["events"] = events
+        status["n_events"] = len(events.get("times", []))
+    else:
+        status["filenames"] = events["filenames"]
+        status["n_events"] = 1
+    return status
+
+
+def test_merge_dicts_memory():
+    """Test that the events of recorders are concatenated and their numbers summed up."""
+
+    response = [
+        [recorder_status(times=np.array([1.0, 3.0]), senders=np.array([1, 2]))],
+        [recorder_status(times=np.array([2.0]), senders=np.array([3]))],
+    ]
+
+    (merged,) = hl_api_server.merge_dicts(response)
+
+    assert merged["n_events"] == 3
+    assert merged["label"] == "spikes"
+    np.testing.assert_array_equal(merged["events"]["times"], [1.0, 3.0, 2.0])
+    np.testing.assert_array_equal(merged["events"]["senders"], [1, 2, 3])
+
+
+def test_merge_dicts_does_not_modify_response():
+    """Test that the status dictionaries of the processes are left untouched."""
+
+    response = [
+        [recorder_status(times=np.array([1.0]))],
+        [recorder_status(times=np.array([2.0]))],
+    ]
+
+    hl_api_server.merge_dicts(response)
+
+    assert response[0][0]["n_events"] == 1
+    np.testing.assert_array_equal(response[0][0]["events"]["times"], [1.0])
+
+
+def test_merge_dicts_sort_events(monkeypatch):
+    """Test that all events are sorted by time if NEST_SERVER_SORT_EVENTS is set."""
+
+    monkeypatch.setattr(hl_api_server, "SORT_EVENTS", True)
+    response = [
+        [recorder_status(times=np.array([1.0, 3.0]), senders=np.array([1, 2]))],
+        [recorder_status(times=np.array([2.0, 3.0]), senders=np.array([3, 4]))],
+    ]
+
+    (merged,) = hl_api_server.merge_dicts(response)
+
+    np.testing.assert_array_equal(merged["events"]["times"], [1.0, 2.0, 3.0, 3.0])
+    np.testing.assert_array_equal(merged["events"]["senders"], [1, 3, 2, 4])
+
+
+def test_merge_dicts_ascii():
+    """Test that the file names of recorders writing to files are joined."""
+
+    response = [
+        [recorder_status("ascii", filenames=["spikes-0.dat"])],
+        [recorder_status("ascii", filenames=["spikes-1.dat"])],
+    ]
+
+    (merged,) = hl_api_server.merge_dicts(response)
+
+    assert merged["filenames"] == ["spikes-0.dat", "spikes-1.dat"]
+    assert merged["n_events"] == 2
+
+
+def test_merge_dicts_neuron():
+    """Test that the status of a neuron is taken from the process it is local to."""
+
+    response = [
+        [{"element_type": "neuron", "local": False, "V_m": None}],
+        [{"element_type": "neuron", "local": True, "V_m": -70.0}],
+    ]
+
+    assert hl_api_server.merge_dicts(response) == [response[1][0]]
+
+
+@pytest.mark.parametrize(
+    "events, expected",
+    [
+        ([np.array([1, 2]), np.array([]), np.array([3])], np.array([1, 2, 3])),
+        ([[], np.array([0.5])], np.array([0.5])),
+        ([[1, 2], [3]], np.array([1, 2, 3])),
+        ([np.array([]), np.array([])], np.array([])),
+    ],
+)
+def test_concatenate_events(events, expected):
+    """Test that empty events are skipped, so that they do not change the data type of the result."""
+
+    result = hl_api_server.concatenate_events(events)
+
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_gather_response_serial(monkeypatch):
+    """Test that the response is returned as the only one if the server is run without MPI."""
+
+    monkeypatch.setattr(hl_api_server, "mpi_comm", None)
+    times = np.array([1.0, 2.0])
+
+    (response,) = hl_api_server.gather_response([recorder_status(times=times)])
+
+    assert response[0]["events"]["times"].dtype == times.dtype
+    np.testing.assert_array_equal(response[0]["events"]["times"], times)
@@ -410,3 +410,58 @@ def test_node_collection_erroneous_bool_array_indexing_raises(indices, expected_
         indices_numpy = np.array(indices)
         with pytest.raises(expected_error):
             nc[indices_numpy]
+
+
+@pytest.mark.parametrize(
+    "make_nc",
+    [
+        lambda nc_a, nc_c: nc_a,
+        lambda nc_a, nc_c: nc_a[2:8],
+        lambda nc_a, nc_c: nc_a + nc_c,
+        lambda nc_a, nc_c: (nc_a + nc_c)[1:37:3],
+        lambda nc_a, nc_c: (nc_a + nc_c)[::2][3],
+    ],
+)
+def test_node_collection_layout_matches_kernel(make_nc):
+    """Test that length, membership, index and node IDs answered in Python agree with the kernel."""
+
+    nc_a = nest.Create("iaf_psc_exp", 10)
+    nest.Create("iaf_psc_alpha", 15)  # will not be part of composite
+    nc_c = nest.Create("iaf_psc_delta", 30)
+    nc = make_nc(nc_a, nc_c)
+
+    assert len(nc) == nest.ll_api.sli_func("size", nc._datum)
+    assert nc.tolist() == list(nest.ll_api.sli_func("cva", nc._datum))
+    assert [node.tolist() for node in nc] == [[node_id] for node_id in nc.tolist()]
+    for node_id in range(0, 60):
+        assert (node_id in nc) == nest.ll_api.sli_func("InCollection", nc._datum, node_id)
+        if node_id in nc:
+            assert nc.index(node_id) == nest.ll_api.sli_func("Find", nc._datum, node_id)
+
+
+def test_node_collection_element_has_model_of_parent():
+    """Test that elements created from the layout take their properties from the parent NodeCollection."""
+
+    nc = nest.Create("iaf_psc_exp", 3) + nest.Create("iaf_psc_delta", 3)
+
+    elements = list(nc)
+
+    assert [element.get("model") for element in elements] == ["iaf_psc_exp"] * 3 + ["iaf_psc_delta"] * 3
+    assert elements[4] == nest.NodeCollection([5])
+
+
+def test_node_collection_layout_invalid_after_reset():
+    """Test that the cached layout of a NodeCollection is not used after ResetKernel."""
+
+    nc = nest.Create("iaf_psc_alpha", 5)
+    element = nc[2]
+    layout = nc._get_layout()
+    assert nc._get_layout() is layout
+
+    nest.ResetKernel()
+
+    for use in [len, lambda nc: nc.tolist(), lambda nc: 3 in nc, lambda nc: nc.index(3)]:
+        with pytest.raises(nest.kernel.NESTError, match="InvalidNodeCollection"):
+            use(nc)
+        with pytest.raises(nest.kernel.NESTError, match="InvalidNodeCollection"):
+            use(element)
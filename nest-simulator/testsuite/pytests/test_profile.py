@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# test_profile.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the phase profiling with ``nest.profile``.
+"""
+
+import json
+
+import nest
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+def build_network(n_threads):
+    nest.local_num_threads = n_threads
+    neurons = nest.Create("iaf_psc_alpha", 10, params={"I_e": 500.0})
+    nest.Connect(neurons, neurons, syn_spec={"delay": 1.0})
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+def test_profile_records_phases_per_thread_and_run(n_threads):
+    """Test that each thread records one update interval per update cycle and run."""
+
+    build_network(n_threads)
+    with nest.profile(trace=True) as phases:
+        with nest.RunManager():
+            nest.Run(10.0)
+            nest.Run(5.0)
+
+    assert not nest.profile_phases
+    assert not nest.trace_phases
+    assert phases.num_runs == 2
+    assert phases.num_threads == n_threads
+
+    for run, n_cycles in enumerate([10, 5]):
+        update = phases.intervals(phase="update", run=run)
+        assert len(update["begin"]) == n_threads * n_cycles
+        assert np.all(update["duration"] >= 0.0)
+        for thread in range(n_threads):
+            assert np.sum(update["thread"] == thread) == n_cycles
+
+        begin, end = phases.run_times()
+        assert np.all(update["begin"] >= begin[run])
+        assert np.all(update["end"] <= end[run])
+
+    times = phases.phase_times()
+    assert times.shape == (1, n_threads, len(phases.phase_names))
+    assert np.all(times[0, :, phases.phase_names.index("update")] > 0.0)
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+def test_profile_totals_without_trace(n_threads):
+    """Test that the totals per phase, thread and run are recorded without tracing the intervals."""
+
+    build_network(n_threads)
+    with nest.profile() as phases:
+        with nest.RunManager():
+            nest.Run(10.0)
+            nest.Run(5.0)
+
+    assert not phases.traced
+    assert phases.num_runs == 2
+    assert phases.num_threads == n_threads
+
+    update = phases.phase_names.index("update")
+    for run, n_cycles in enumerate([10, 5]):
+        assert np.all(phases.phase_counts(run=run)[0, :, update] == n_cycles)
+    assert np.all(phases.phase_counts()[0, :, update] == 15)
+    assert np.all(phases.phase_times()[0, :, update] > 0.0)
+
+    with pytest.raises(ValueError):
+        phases.intervals()
+    with pytest.raises(ValueError):
+        phases.trace_events()
+
+
+def test_profile_totals_match_trace():
+    """Test that the totals equal the sums over the traced intervals."""
+
+    build_network(1)
+    with nest.profile(trace=True) as phases:
+        nest.Simulate(10.0)
+
+    assert phases.num_dropped == 0
+
+    intervals = phases.intervals()
+    times = np.zeros(phases.phase_times().shape)
+    np.add.at(times, (intervals["rank"], intervals["thread"], intervals["phase"]), intervals["duration"])
+    np.testing.assert_allclose(phases.phase_times(), times)
+
+
+def test_profile_update_cycle_histograms():
+    """Test that the histograms count every update cycle once."""
+
+    build_network(1)
+    with nest.profile(trace=True) as phases:
+        nest.Simulate(20.0)
+
+    histograms = phases.update_cycle_histograms(bins=5)
+    assert len(histograms["bin_edges"]) == 6
+    for key in ["min", "max", "cycle"]:
+        assert histograms[key].sum() == 20
+
+    # With a single thread, the fastest and the slowest thread are the same.
+    np.testing.assert_array_equal(histograms["min"], histograms["max"])
+
+
+def test_profile_restarts_recording():
+    """Test that phases recorded in a previous profiling context are discarded."""
+
+    build_network(1)
+    with nest.profile():
+        nest.Simulate(10.0)
+
+    nest.Simulate(10.0)
+
+    with nest.profile(trace=True) as phases:
+        nest.Simulate(5.0)
+
+    assert phases.num_runs == 1
+    assert len(phases.intervals(phase="update")["begin"]) == 5
+
+
+def test_profile_write_trace(tmp_path):
+    """Test that the trace holds one complete event per interval and run."""
+
+    build_network(1)
+    with nest.profile(trace=True) as phases:
+        nest.Simulate(5.0)
+
+    trace_file = tmp_path / "trace.json"
+    phases.write_trace(trace_file)
+    with open(trace_file) as f:
+        trace = json.load(f)
+
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert len(complete) == len(phases.intervals()["begin"]) + phases.num_runs
+    assert {event["name"] for event in complete} >= {"update", "Run 0"}
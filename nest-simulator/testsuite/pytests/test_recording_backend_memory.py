@@ -22,6 +22,7 @@
 import unittest
 
 import nest
+import numpy as np
 
 HAVE_OPENMP = nest.ll_api.sli_func("is_threaded")
 
@@ -122,6 +123,133 @@ class TestRecordingBackendMemory(unittest.TestCase):
         with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
             mm.time_in_steps = False
 
+    def testDrainEvents(self):
+        """Test that drain_events hands over the recorded events and clears the device."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"record_to": "memory", "interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        nest.Simulate(15)
+        events = mm.get("events")
+        drained = mm.drain_events()
+
+        self.assertEqual(sorted(drained.keys()), sorted(events.keys()))
+        for key in events:
+            np.testing.assert_array_equal(drained[key], events[key])
+            self.assertEqual(drained[key].dtype, events[key].dtype)
+        self.assertEqual(mm.get("n_events"), 0)
+        self.assertEqual(mm.get("events")["times"].size, 0)
+
+        # Only events recorded after the first drain are returned
+        nest.Simulate(1)
+        drained = mm.drain_events()
+        self.assertEqual(drained["times"].size, 10)
+        self.assertTrue(np.all(drained["times"] > 15.0))
+
+        # Draining again without simulating yields no events
+        self.assertEqual(mm.drain_events()["times"].size, 0)
+
+    def testDrainEventsMultithreaded(self):
+        """Test that drain_events collects the events recorded on all threads."""
+
+        nest.ResetKernel()
+        nest.local_num_threads = 2
+
+        sr = nest.Create("spike_recorder", params={"record_to": "memory", "time_in_steps": True})
+        nest.Connect(nest.Create("poisson_generator", params={"rate": 1000.0}), nest.Create("parrot_neuron", 4))
+        nest.Connect(nest.GetNodes({"model": "parrot_neuron"}), sr)
+
+        nest.Simulate(100)
+        events = sr.get("events")
+        drained = sr.drain_events()
+
+        self.assertEqual(sr.get("n_events"), 0)
+        self.assertEqual(drained["times"].size, events["times"].size)
+        order = np.lexsort((drained["senders"], drained["times"]))
+        expected_order = np.lexsort((events["senders"], events["times"]))
+        for key in ("senders", "times", "offsets"):
+            np.testing.assert_array_equal(drained[key][order], events[key][expected_order])
+
+    def testDrainEventsFromSeveralDevices(self):
+        """Test that drain_events returns one dictionary per device."""
+
+        nest.ResetKernel()
+
+        mms = nest.Create("multimeter", 2, params={"record_to": "memory", "record_from": ["V_m"]})
+        nest.Connect(mms, nest.Create("iaf_psc_alpha", 2), "one_to_one")
+
+        nest.Simulate(10)
+        drained = mms.drain_events()
+
+        self.assertEqual(len(drained), 2)
+        for mm_events in drained:
+            self.assertEqual(mm_events["times"].size, 9)
+
+    def testDrainEventsRequiresMemoryBackend(self):
+        """Test that drain_events raises an error for devices not recording to memory."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"record_to": "ascii"})
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            mm.drain_events()
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("iaf_psc_alpha").drain_events()
+
+    def testHarvestEvents(self):
+        """Test that harvest_events only returns events recorded since the previous harvest."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"record_to": "memory", "interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        with nest.RunManager():
+            nest.Run(10)
+            first = mm.harvest_events()
+            nest.Run(5)
+            second = mm.harvest_events()
+            third = mm.harvest_events()
+
+        self.assertEqual(first["times"].size, 90)
+        self.assertEqual(second["times"].size, 50)
+        self.assertEqual(third["times"].size, 0)
+
+        # Harvested events are kept in the device
+        events = mm.get("events")
+        self.assertEqual(mm.get("n_events"), 140)
+        for key in events:
+            np.testing.assert_array_equal(np.concatenate((first[key], second[key])), events[key])
+
+    def testHarvestEventsDiscard(self):
+        """Test that harvest_events with discard removes all events from the device."""
+
+        nest.ResetKernel()
+        nest.local_num_threads = 2
+
+        mm = nest.Create("multimeter", params={"record_to": "memory", "interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha", 2))
+
+        with nest.RunManager():
+            nest.Run(10)
+            first = mm.harvest_events()
+            nest.Run(5)
+            second = mm.harvest_events(discard=True)
+
+            self.assertEqual(mm.get("n_events"), 0)
+            self.assertEqual(mm.get("events")["times"].size, 0)
+
+            nest.Run(5)
+            third = mm.harvest_events(discard=True)
+
+        self.assertEqual(first["times"].size, 180)
+        self.assertEqual(second["times"].size, 100)
+        self.assertEqual(third["times"].size, 100)
+        self.assertTrue(np.all(third["times"] > 15.0))
+
 
 def suite():
     suite = unittest.TestLoader()
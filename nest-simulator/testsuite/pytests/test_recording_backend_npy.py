@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# test_recording_backend_npy.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the ``npy`` recording backend, comparing the data written to files with the ``memory`` backend.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+from nest.lib.hl_api_helper import load_npy_events
+
+
+@pytest.fixture(autouse=True)
+def prepare_kernel(tmp_path):
+    nest.ResetKernel()
+    nest.data_path = str(tmp_path)
+    nest.overwrite_files = True
+
+
+def create_recorders(model, params):
+    """Create one device recording to npy and one recording to memory."""
+
+    npy_rec = nest.Create(model, params=dict(params, record_to="npy"))
+    mem_rec = nest.Create(model, params=dict(params, record_to="memory"))
+
+    return npy_rec, mem_rec
+
+
+def assert_events_equal(npy_rec, mem_rec):
+    """Assert that the files of npy_rec contain the same events as the memory of mem_rec."""
+
+    npy_events = load_npy_events(npy_rec.filenames)
+    mem_events = mem_rec.events
+
+    assert sorted(npy_events.keys()) == sorted(mem_events.keys())
+
+    # Events of different threads are stored in different files, so the order of the events may differ.
+    npy_order = np.lexsort((npy_events["senders"], npy_events["times"]))
+    mem_order = np.lexsort((mem_events["senders"], mem_events["times"]))
+    for key in mem_events:
+        assert npy_events[key].dtype == mem_events[key].dtype
+        nptest.assert_array_equal(npy_events[key][npy_order], mem_events[key][mem_order])
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+@pytest.mark.parametrize("time_in_steps", [False, True])
+def test_spike_recorder(n_threads, time_in_steps):
+    """Test that spikes written to files equal those recorded in memory."""
+
+    nest.local_num_threads = n_threads
+
+    npy_sr, mem_sr = create_recorders("spike_recorder", {"time_in_steps": time_in_steps})
+    parrots = nest.Create("parrot_neuron", 4)
+    nest.Connect(nest.Create("poisson_generator", params={"rate": 500.0}), parrots)
+    nest.Connect(parrots, npy_sr)
+    nest.Connect(parrots, mem_sr)
+
+    nest.Simulate(200)
+
+    assert len(npy_sr.filenames) == n_threads * (3 if time_in_steps else 2)
+    assert_events_equal(npy_sr, mem_sr)
+
+
+def test_multimeter():
+    """Test that values recorded by a multimeter are written to one file per value."""
+
+    npy_mm, mem_mm = create_recorders("multimeter", {"interval": 0.1, "record_from": ["V_m", "I_syn_ex"]})
+    neurons = nest.Create("iaf_psc_alpha", 2, params={"I_e": 400.0})
+    nest.Connect(npy_mm, neurons)
+    nest.Connect(mem_mm, neurons)
+
+    nest.Simulate(50)
+
+    assert any(fname.endswith(".V_m.npy") for fname in npy_mm.filenames)
+    assert any(fname.endswith(".I_syn_ex.npy") for fname in npy_mm.filenames)
+    assert_events_equal(npy_mm, mem_mm)
+
+
+def test_data_available_after_run():
+    """Test that the files are valid and hold all events after each call to Run."""
+
+    npy_mm, mem_mm = create_recorders("multimeter", {"interval": 0.1, "record_from": ["V_m"]})
+    npy_mm.buffer_size = 7
+    neuron = nest.Create("iaf_psc_alpha")
+    nest.Connect(npy_mm, neuron)
+    nest.Connect(mem_mm, neuron)
+
+    with nest.RunManager():
+        for _ in range(3):
+            nest.Run(10.0)
+            assert_events_equal(npy_mm, mem_mm)
+
+
+@pytest.mark.skipif_missing_threads
+def test_load_without_concatenation():
+    """Test that the recordings of each thread can be loaded as memory-mapped arrays without concatenation."""
+
+    nest.local_num_threads = 2
+
+    npy_sr, mem_sr = create_recorders("spike_recorder", {})
+    parrots = nest.Create("parrot_neuron", 4)
+    nest.Connect(nest.Create("poisson_generator", params={"rate": 500.0}), parrots)
+    nest.Connect(parrots, npy_sr)
+    nest.Connect(parrots, mem_sr)
+
+    nest.Simulate(200)
+
+    recordings = load_npy_events(npy_sr.filenames, concatenate=False)
+    assert len(recordings) == 2
+    assert all(isinstance(recording["times"], np.memmap) for recording in recordings)
+
+    concatenated = load_npy_events(npy_sr.filenames)
+    for key in ["senders", "times"]:
+        nptest.assert_array_equal(np.concatenate([recording[key] for recording in recordings]), concatenated[key])
+
+
+def test_invalid_buffer_size():
+    """Test that buffer_size must be positive."""
+
+    with pytest.raises(nest.kernel.NESTErrors.BadProperty):
+        nest.Create("spike_recorder", params={"record_to": "npy", "buffer_size": 0})
+
+
+def test_overwrite_files():
+    """Test that existing files are only overwritten if overwrite_files is set."""
+
+    data_path = nest.data_path
+    nest.overwrite_files = False
+    nest.Create("spike_recorder", params={"record_to": "npy"})
+    nest.Simulate(10)
+
+    nest.ResetKernel()
+    nest.data_path = data_path
+    nest.Create("spike_recorder", params={"record_to": "npy"})
+
+    with pytest.raises(nest.kernel.NESTErrors.IOError):
+        nest.Simulate(10)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# test_set_arrays.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of setting node parameters from NumPy arrays against the per-node dictionary path.
+"""
+
+import nest
+import numpy as np
+import pytest
+
+N_NODES = 1000
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+@pytest.mark.parametrize("n_threads", [1, pytest.param(2, marks=pytest.mark.skipif_missing_threads)])
+def test_set_arrays_matches_dicts(n_threads):
+    """Test that setting from arrays gives the same result as setting from lists."""
+
+    nest.local_num_threads = n_threads
+    nodes = nest.Create("iaf_psc_alpha", N_NODES)
+
+    rng = np.random.default_rng(12345)
+    V_m = rng.uniform(-70.0, -55.0, N_NODES)
+    I_e = rng.uniform(0.0, 100.0, N_NODES)
+
+    # Lists take the path that constructs one dictionary per node.
+    nodes.set({"V_m": list(V_m), "I_e": list(I_e)})
+    dict_values = nodes.get(["V_m", "I_e"], output="numpy")
+
+    nodes.set(V_m=-70.0, I_e=0.0)
+    nodes.set({"V_m": V_m, "I_e": I_e})
+    array_values = nodes.get(["V_m", "I_e"], output="numpy")
+
+    np.testing.assert_array_equal(array_values["V_m"], dict_values["V_m"])
+    np.testing.assert_array_equal(array_values["I_e"], dict_values["I_e"])
+
+
+def test_node_collection_models():
+    """Test that the models of a composite NodeCollection are listed once each, in order."""
+
+    nodes = nest.Create("iaf_psc_alpha", 2) + nest.Create("spike_generator", 2) + nest.Create("iaf_psc_alpha", 2)
+
+    assert nest.ll_api.node_collection_models(nodes._datum) == ["iaf_psc_alpha", "spike_generator"]
+    assert nest.ll_api.node_collection_models(nodes[2:]._datum) == ["spike_generator", "iaf_psc_alpha"]
+
+
+@pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf, 1e30])
+def test_reject_invalid_integer_values(value):
+    """Test that non-finite and out of range values for integer and boolean parameters are rejected."""
+
+    nodes = nest.Create("iaf_psc_alpha", 2)
+
+    with pytest.raises(nest.kernel.NESTErrors.BadParameter):
+        nodes.set(frozen=np.full(2, value))
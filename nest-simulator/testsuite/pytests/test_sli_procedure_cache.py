@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# test_sli_procedure_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Tests of the cache of parsed SLI procedures of the low-level API.
+
+The cache spares the SLI interpreter from parsing the same fixed command text
+on every call of frequently used PyNEST functions.
+"""
+
+import nest
+import pytest
+from nest.ll_api import engine, sli_func, sr
+
+
+def _setup_network():
+    nest.ResetKernel()
+    nest.set_verbosity("M_WARNING")
+    nodes = nest.Create("iaf_psc_alpha", 10)
+    nest.Connect(nodes, nodes, "all_to_all")
+    return nodes
+
+
+CALLS = {
+    "get": lambda nodes: nodes[3].get("V_m"),
+    "set": lambda nodes: nodes[3].set(V_m=-60.0),
+    "Connect": lambda nodes: nest.Connect(nodes[0], nodes[1], "one_to_one"),
+    "GetConnections": lambda nodes: len(nest.GetConnections(nodes[2], nodes[3])),
+    "len": lambda nodes: len(nodes),
+}
+
+
+@pytest.fixture
+def empty_cache():
+    engine.clear_procedure_cache()
+    yield
+    engine.clear_procedure_cache()
+
+
+@pytest.mark.parametrize("call", CALLS.keys())
+def test_cached_and_uncached_results_agree(call, monkeypatch):
+    """Test that calls give the same results with and without the cache."""
+
+    nodes = _setup_network()
+    cached_results = [CALLS[call](nodes) for _ in range(3)]
+
+    monkeypatch.setattr(engine, "max_cached_procedures", 0)
+    engine.clear_procedure_cache()
+    nodes = _setup_network()
+    uncached_results = [CALLS[call](nodes) for _ in range(3)]
+
+    assert cached_results == uncached_results
+    assert engine.procedure_cache_size() == 0
+
+
+@pytest.mark.parametrize("call", [call for call in CALLS if call != "len"])
+def test_repeated_calls_hit_cache(call, empty_cache):
+    """Test that repeated calls take all their procedures from the cache."""
+
+    nodes = _setup_network()
+    CALLS[call](nodes)
+    size = engine.procedure_cache_size()
+    misses = engine.procedure_cache_misses
+    hits = engine.procedure_cache_hits
+
+    CALLS[call](nodes)
+
+    assert engine.procedure_cache_size() == size
+    assert engine.procedure_cache_misses == misses
+    assert engine.procedure_cache_hits > hits
+
+
+def test_formatted_commands_not_cached(empty_cache):
+    """Test that commands run without ``cached=True`` do not occupy the cache."""
+
+    for i in range(10):
+        sr(f"{i} pop")
+
+    assert engine.procedure_cache_size() == 0
+
+
+def test_least_recently_used_procedure_evicted(monkeypatch, empty_cache):
+    """Test that a full cache evicts only the least recently used procedure."""
+
+    monkeypatch.setattr(engine, "max_cached_procedures", 4)
+
+    # Each call caches its function and the fixed command running it.
+    for i in range(1, 4):
+        assert sli_func(f"{i} add", 1) == i + 1
+    assert engine.procedure_cache_size() == 4
+
+    assert sli_func("1 add", 1) == 2
+    assert sli_func("4 add", 1) == 5
+    assert engine.procedure_cache_size() == 4
+
+    # "1 add" was used recently and is still cached, "2 add" was evicted.
+    misses = engine.procedure_cache_misses
+    assert sli_func("1 add", 1) == 2
+    assert engine.procedure_cache_misses == misses
+    assert sli_func("2 add", 1) == 3
+    assert engine.procedure_cache_misses == misses + 1
+    assert engine.procedure_cache_size() == 4
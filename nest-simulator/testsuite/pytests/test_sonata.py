@@ -50,7 +50,8 @@ EXPECTED_NUM_SPIKES = 18828
 # Meaning of hyperslab sizes for 300_pointneurons model:
 # 2**10=1024 : Edge HDF5 files will be read in hyperslabs (chunks)
 # 2**20=1048576 : Edge files read in their entirety (default hyperslab size value)
-HYPERSLAB_SIZES = [2**10, 2**20]
+# "auto" : Hyperslab size chosen by the kernel
+HYPERSLAB_SIZES = [2**10, 2**20, "auto"]
 NUM_THREADS = [1, 2, 4]
 
 
@@ -78,3 +79,76 @@ def test_SonataNetwork(num_threads, hyperslab_size):
     spike_data = srec.events
     post_times = spike_data["times"]
     assert post_times.size == EXPECTED_NUM_SPIKES
+
+
+def test_SonataNetwork_concurrent_parsing():
+    """Test that reading the CSV and JSON files concurrently gives the same network."""
+
+    assert have_sonata_files, "SONATA files not found"
+
+    nest.ResetKernel()
+    sonata_net = nest.SonataNetwork(config, sim_config)
+    sonata_net.Create()
+    expected_edges_maps = sonata_net._create_graph_specs()["edges"]
+
+    nest.ResetKernel()
+    sonata_net = nest.SonataNetwork(config, sim_config, num_parse_threads=4)
+    sonata_net.BuildNetwork()
+
+    assert nest.network_size == EXPECTED_NUM_NODES
+    assert nest.num_connections == EXPECTED_NUM_CONNECTIONS
+    assert sonata_net._edges_maps == expected_edges_maps
+
+
+@pytest.mark.parametrize("num_parse_threads", [0, 1.5])
+def test_SonataNetwork_invalid_num_parse_threads(num_parse_threads):
+    assert have_sonata_files, "SONATA files not found"
+
+    with pytest.raises(ValueError):
+        nest.SonataNetwork(config, sim_config, num_parse_threads=num_parse_threads)
+
+
+def test_SonataNetwork_build_cache(tmp_path):
+    """Test that a network restored from the build cache equals the built network."""
+
+    assert have_sonata_files, "SONATA files not found"
+
+    num_spikes = []
+    for _ in range(2):
+        nest.ResetKernel()
+        nest.set(total_num_virtual_procs=2)
+        sonata_net = nest.SonataNetwork(config, sim_config)
+        node_collections = sonata_net.BuildNetwork(cache_dir=tmp_path)
+
+        assert nest.network_size == EXPECTED_NUM_NODES
+        assert nest.num_connections == EXPECTED_NUM_CONNECTIONS
+
+        srec = nest.Create("spike_recorder")
+        nest.Connect(node_collections["internal"], srec)
+        sonata_net.Simulate()
+        num_spikes.append(srec.n_events)
+
+    # The second build was restored from the only cache entry
+    assert len(list(tmp_path.iterdir())) == 1
+    assert num_spikes == [EXPECTED_NUM_SPIKES, EXPECTED_NUM_SPIKES]
+
+
+def test_SonataNetwork_io_blocks_logged():
+    """Test that each block of edges read from the edge files is logged."""
+
+    assert have_sonata_files, "SONATA files not found"
+
+    nest.ResetKernel()
+    nest.log_construction = True
+    sonata_net = nest.SonataNetwork(config, sim_config)
+    sonata_net.BuildNetwork(hdf5_hyperslab_size=2**10)
+
+    io_blocks = nest.GetConstructionLog()["io_blocks"]
+    assert max(io_blocks["size"]) == 2**10
+    assert sum(io_blocks["size"]) == EXPECTED_NUM_CONNECTIONS
+    assert all(time >= 0.0 for key in ["time_read", "time_wait", "time_connect"] for time in io_blocks[key])
+
+    # Each edge population is read in contiguous blocks starting at offset 0
+    for i in range(1, len(io_blocks["offset"])):
+        offset = io_blocks["offset"][i]
+        assert offset == 0 or offset == io_blocks["offset"][i - 1] + io_blocks["size"][i - 1]
@@ -379,6 +379,52 @@ class BasicsTestCase(unittest.TestCase):
         self.assertEqual(len(s), 1)
         self.assertEqual(s[0], nest.NodeCollection([5, 6, 8, 9]))
 
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_GetTargetNodes_and_GetSourceNodes_as_arrays(self):
+        """Targets and sources as arrays agree with NodeCollections and with GetConnections."""
+
+        nest.ResetKernel()
+        nest.rng_seed = 12345
+        layer = nest.Create("iaf_psc_alpha", positions=nest.spatial.grid(shape=[4, 4], extent=(2.0, 2.0)))
+        cdict = {"rule": "fixed_indegree", "indegree": 6, "allow_multapses": True}
+        nest.Connect(layer, layer, cdict)
+
+        sources = layer[1:12:2]
+        offsets, node_ids = nest.GetTargetNodes(sources, layer, as_arrays=True)
+        targets = nest.GetTargetNodes(sources, layer)
+
+        self.assertEqual(len(offsets), len(sources) + 1)
+        conns = nest.GetConnections(sources, layer)
+        conn_sources = np.array(conns.get("source"))
+        conn_targets = np.array(conns.get("target"))
+        for i, (source, target_nc) in enumerate(zip(sources.tolist(), targets)):
+            expected = np.unique(conn_targets[conn_sources == source]).tolist()
+            self.assertEqual(node_ids[offsets[i] : offsets[i + 1]].tolist(), expected)
+            self.assertEqual(target_nc.tolist(), expected)
+
+        offsets, node_ids = nest.GetSourceNodes(layer, sources, as_arrays=True)
+        for i, source_nc in enumerate(nest.GetSourceNodes(layer, sources)):
+            self.assertEqual(node_ids[offsets[i] : offsets[i + 1]].tolist(), source_nc.tolist())
+
+    @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
+    def test_GetTargetPositions_as_arrays(self):
+        """Target positions as arrays hold one row per connection, in the order of the nested lists."""
+
+        nest.ResetKernel()
+        layer = nest.Create("iaf_psc_alpha", positions=nest.spatial.grid(shape=[3, 3], extent=(3.0, 3.0)))
+        nest.Connect(layer, layer, {"rule": "pairwise_bernoulli", "p": 1.0})
+
+        offsets, positions = nest.GetTargetPositions(layer, layer, as_arrays=True)
+        nested = nest.GetTargetPositions(layer, layer)
+
+        self.assertEqual(positions.shape, (len(layer) ** 2, 2))
+        for i, row in enumerate(nested):
+            np.testing.assert_array_equal(positions[offsets[i] : offsets[i + 1]], np.array(row))
+            np.testing.assert_array_equal(positions[offsets[i] : offsets[i + 1]], np.array(nest.GetPosition(layer)))
+
+        offsets, positions = nest.GetSourcePositions(layer[::2], layer[4], as_arrays=True)
+        np.testing.assert_array_equal(positions, np.array(nest.GetPosition(layer[::2])))
+
     @unittest.skipIf(not HAVE_NUMPY, "NumPy package is not available")
     def test_GetTargetPositions(self):
         """Test that GetTargetPosition works as expected"""
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# test_spatial_index.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for ``SpatialIndex``, comparing its queries with distances computed by ``Distance``.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+from nest.lib import hl_api_spatial
+
+
+@pytest.fixture(params=[True, False], ids=["scipy", "numpy"])
+def use_scipy(request, monkeypatch):
+    """Run tests with the k-d tree, if available, and the NumPy fallback."""
+
+    if request.param and not hl_api_spatial.HAVE_SCIPY:
+        pytest.skip("SciPy is not available")
+    monkeypatch.setattr(hl_api_spatial, "HAVE_SCIPY", request.param)
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "edge_wrap"])
+def layer(request):
+    nest.ResetKernel()
+    nest.rng_seed = 123
+    return nest.Create(
+        "iaf_psc_alpha",
+        50,
+        positions=nest.spatial.free(
+            nest.random.uniform(-0.5, 0.5), extent=[1.0, 1.0], edge_wrap=request.param, num_dimensions=2
+        ),
+    )
+
+
+@pytest.fixture
+def locations():
+    return np.random.default_rng(42).uniform(-0.5, 0.5, size=(20, 2))
+
+
+def reference_distances(layer, locations):
+    """Distances from each location to all nodes of the layer, computed by the kernel."""
+
+    return np.array([nest.Distance([tuple(loc)], layer) for loc in locations])
+
+
+def test_nearest(use_scipy, layer, locations):
+    index = nest.SpatialIndex(layer)
+    distances = reference_distances(layer, locations)
+
+    nptest.assert_array_equal(index.nearest(locations), np.argmin(distances, axis=1))
+
+
+def test_within(use_scipy, layer, locations):
+    index = nest.SpatialIndex(layer)
+    distances = reference_distances(layer, locations)
+
+    for found, d in zip(index.within(locations, 0.2), distances):
+        nptest.assert_array_equal(found, np.flatnonzero(d <= 0.2))
+
+
+@pytest.mark.parametrize("edge_wrap", [False, True])
+def test_nearest_find_all_on_grid(use_scipy, edge_wrap):
+    """Test that all nodes with equal minimal distance are found, also across the periodic boundary."""
+
+    nest.ResetKernel()
+    layer = nest.Create(
+        "iaf_psc_alpha", positions=nest.spatial.grid(shape=[3, 3], extent=[3.0, 3.0], edge_wrap=edge_wrap)
+    )
+    index = nest.SpatialIndex(layer)
+
+    nearest = index.nearest([(0.5, 0.5), (1.4, 0.0)], find_all=True)
+
+    nptest.assert_array_equal(nearest[0], [3, 4, 6, 7])
+    nptest.assert_array_equal(nearest[1], [7])
+
+    if edge_wrap:
+        # Nodes on opposite edges of the layer are equally close to a location on the boundary.
+        nptest.assert_array_equal(index.nearest((1.5, 0.0), find_all=True)[0], [1, 7])
+
+
+def test_find_nearest_element_with_index(use_scipy):
+    nest.ResetKernel()
+    layer = nest.Create("iaf_psc_alpha", positions=nest.spatial.grid(shape=[3, 3], extent=[3.0, 3.0]))
+    index = nest.SpatialIndex(layer)
+
+    assert nest.FindNearestElement(layer, (0.0, 0.0), spatial_index=index) == layer[4]
+    assert nest.FindNearestElement(layer, ((0.0, 0.0), (1.0, 1.0)), spatial_index=index) == [layer[4], layer[6]]
+
+    with pytest.raises(ValueError):
+        nest.FindNearestElement(layer[:4], (0.0, 0.0), spatial_index=index)
+
+
+def test_select_by_mask():
+    nest.ResetKernel()
+    layer = nest.Create("iaf_psc_alpha", positions=nest.spatial.grid(shape=[5, 5], extent=[5.0, 5.0]))
+    mask = nest.CreateMask("circular", {"radius": 1.1})
+    anchors = [(0.0, 0.0), (-2.0, 2.0)]
+
+    selected = nest.SpatialIndex(layer).select_by_mask(anchors, mask)
+
+    assert selected == [nest.SelectNodesByMask(layer, list(anchor), mask) for anchor in anchors]
+    assert [len(nodes) for nodes in selected] == [5, 3]
+
+
+def test_select_by_mask_3d():
+    nest.ResetKernel()
+    nest.rng_seed = 123
+    layer = nest.Create(
+        "iaf_psc_alpha", 100, positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5), num_dimensions=3)
+    )
+    mask = nest.CreateMask("box", {"lower_left": [-0.2, -0.2, -0.2], "upper_right": [0.2, 0.2, 0.2]})
+    anchors = np.random.default_rng(42).uniform(-0.5, 0.5, size=(10, 3))
+
+    selected = nest.SpatialIndex(layer).select_by_mask(anchors, mask)
+
+    assert selected == [nest.SelectNodesByMask(layer, list(anchor), mask) for anchor in anchors]
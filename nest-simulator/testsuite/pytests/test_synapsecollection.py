@@ -23,9 +23,12 @@
 Tests for the SynapseCollection class
 """
 
+import os
+import tempfile
 import unittest
 
 import nest
+import numpy as np
 
 try:
     import pandas
@@ -34,6 +37,8 @@ try:
 except ImportError:
     HAVE_PANDAS = False
 
+HAVE_OPENMP = nest.ll_api.sli_func("is_threaded")
+
 
 @nest.ll_api.check_stack
 class TestSynapseCollection(unittest.TestCase):
@@ -338,6 +343,136 @@ class TestSynapseCollection(unittest.TestCase):
             )
         )
 
+    def test_getWithNumpyOutput(self):
+        """
+        Test get on SynapseCollection with NumPy output
+        """
+        nrns = nest.Create("iaf_psc_alpha", 2)
+        nest.Connect(nrns, nrns, syn_spec={"weight": nest.random.uniform(1.0, 2.0)})
+        conns = nest.GetConnections()
+
+        conns_val = conns.get(output="numpy")
+        self.assertEqual(set(conns_val), {"source", "target", "weight", "delay"})
+        np.testing.assert_array_equal(conns_val["source"], [1, 1, 2, 2])
+        np.testing.assert_array_equal(conns_val["target"], [1, 2, 1, 2])
+        np.testing.assert_array_equal(conns_val["weight"], conns.get("weight"))
+        np.testing.assert_array_equal(conns_val["delay"], [1.0, 1.0, 1.0, 1.0])
+
+        conns_port = conns.get("port", output="numpy")
+        self.assertTrue(np.issubdtype(conns_port.dtype, np.integer))
+        np.testing.assert_array_equal(conns_port, conns.get("port"))
+
+        conns_receptor = conns.get(["receptor"], output="numpy")["receptor"]
+        self.assertTrue(np.issubdtype(conns_receptor.dtype, np.integer))
+        np.testing.assert_array_equal(conns_receptor, [0, 0, 0, 0])
+
+        with self.assertRaises(nest.kernel.NESTErrors.KeyError):
+            conns.get("no_such_parameter", output="numpy")
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            conns.get("synapse_model", output="numpy")
+        with self.assertRaises(TypeError):
+            conns.get("weight", out={})
+
+    def test_getWithNumpyOutputMixedModels(self):
+        """
+        Test that get with NumPy output yields NaN for connections without the parameter
+        """
+        nrns = nest.Create("iaf_psc_alpha", 2)
+        nest.Connect(nrns[0], nrns[1], syn_spec={"synapse_model": "static_synapse"})
+        nest.Connect(nrns[1], nrns[0], syn_spec={"synapse_model": "stdp_synapse", "weight": 2.0})
+        conns = nest.GetConnections()
+
+        tau_plus = conns.get("tau_plus", output="numpy")
+        self.assertEqual(np.count_nonzero(np.isnan(tau_plus)), 1)
+        np.testing.assert_array_equal(conns.get("weight", output="numpy"), [conn.get("weight") for conn in conns])
+
+    def test_getWithNumpyOutputMatchesStatus(self):
+        """
+        Test that weights and delays read directly from the connectors equal those of the status dictionaries
+        """
+        nrns = nest.Create("iaf_psc_alpha", 3)
+        recorder = nest.Create("spike_recorder")
+        syn_spec = {"synapse_model": "stdp_synapse", "weight": nest.random.uniform(1.0, 2.0), "delay": 1.5}
+        nest.Connect(nrns, nrns, syn_spec=syn_spec)
+        nest.Connect(nrns, recorder, syn_spec={"weight": 3.0})
+        conns = nest.GetConnections()
+
+        values = conns.get(["weight", "delay", "port", "Kplus"], output="numpy")
+        for key in ["weight", "delay", "port"]:
+            np.testing.assert_array_equal(values[key], [conn.get(key) for conn in conns])
+        self.assertEqual(np.count_nonzero(np.isnan(values["Kplus"])), 3)
+
+    @unittest.skipIf(not HAVE_OPENMP, "NEST was compiled without multi-threading")
+    def test_getWithNumpyOutputThreaded(self):
+        """
+        Test that model-specific parameters read by several threads equal those of the status dictionaries
+        """
+        nest.local_num_threads = 4
+        nrns = nest.Create("iaf_psc_alpha", 8)
+        syn_spec = {"synapse_model": "stdp_synapse", "tau_plus": nest.random.uniform(10.0, 30.0)}
+        nest.Connect(nrns, nrns, syn_spec=syn_spec)
+        conns = nest.GetConnections()
+
+        values = conns.get(["tau_plus", "Kplus", "target_thread"], output="numpy")
+        for key in ["tau_plus", "Kplus", "target_thread"]:
+            np.testing.assert_array_equal(values[key], conns.get(key))
+        self.assertEqual(len(np.unique(values["target_thread"])), 4)
+
+    def test_getWithNumpyOutputBuffers(self):
+        """
+        Test get with NumPy output into caller-provided arrays and memory-mapped files
+        """
+        nrns = nest.Create("iaf_psc_alpha", 3)
+        nest.Connect(nrns, nrns, syn_spec={"weight": nest.random.uniform(1.0, 2.0)})
+        conns = nest.GetConnections()
+        weights = conns.get("weight")
+
+        out = {"source": np.zeros(9, dtype=np.int64), "weight": np.zeros(9), "delay": np.zeros(9, dtype=np.float32)}
+        result = conns.get(["source", "weight", "delay"], output="numpy", out=out)
+        for key in out:
+            self.assertIs(result[key], out[key])
+        np.testing.assert_array_equal(out["source"], conns.get("source"))
+        np.testing.assert_array_equal(out["weight"], weights)
+        np.testing.assert_array_equal(out["delay"], np.ones(9))
+
+        with self.assertRaises(ValueError):
+            conns.get("weight", output="numpy", out={"weight": np.zeros(8)})
+        with self.assertRaises(ValueError):
+            conns.get("weight", output="numpy", out={"delay": np.zeros(9)})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conns.get(["target", "weight"], output="numpy", out=tmpdir)
+            np.testing.assert_array_equal(np.load(os.path.join(tmpdir, "target.npy")), conns.get("target"))
+            np.testing.assert_array_equal(np.load(os.path.join(tmpdir, "weight.npy")), weights)
+
+    def test_setWithNumpyArrays(self):
+        """
+        Test set on SynapseCollection with NumPy arrays
+        """
+        nrns = nest.Create("iaf_psc_alpha", 3)
+        nest.Connect(nrns, nrns, syn_spec={"synapse_model": "stdp_synapse"})
+        conns = nest.GetConnections()
+
+        weights = np.linspace(1.0, 9.0, 9)
+        conns.set(weight=weights, delay=2.0, Kplus=np.arange(9))
+
+        self.assertEqual(conns.get("weight"), list(weights))
+        self.assertEqual(conns.get("delay"), [2.0] * 9)
+        self.assertEqual(conns.get("Kplus"), list(np.arange(9.0)))
+
+        conns.set({"weight": conns.get("weight", output="numpy") * 2})
+        self.assertEqual(conns.get("weight"), list(2 * weights))
+
+        with self.assertRaises(ValueError):
+            conns.set(weight=np.ones(8))
+        with self.assertRaises(ValueError):
+            conns.set(weight=np.ones((3, 3)))
+        # Lengths are validated before any value is set.
+        self.assertEqual(conns.get("weight"), list(2 * weights))
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadParameter):
+            conns.set(no_such_parameter=np.ones(9))
+
     def test_empty(self):
         """
         Test get on empty SynapseCollection and after a ResetKernel
@@ -357,6 +492,60 @@ class TestSynapseCollection(unittest.TestCase):
         conns.set(weight=10.0)
         self.assertEqual(conns.get("weight"), ())
 
+    def test_compact_connection_ids(self):
+        """
+        Test that the connection IDs are stored in compact arrays which match the connection parameters.
+        """
+        nrns = nest.Create("iaf_psc_alpha", 3)
+        nest.Connect(nrns, nrns)
+        conns = nest.GetConnections()
+
+        self.assertEqual(
+            [ids.dtype for ids in conns._connection_ids],
+            [np.int64, np.int64, np.uint16, np.uint16, np.uint32],
+        )
+        keys = ["source", "target", "target_thread", "synapse_id", "port"]
+        params = conns.get(keys)
+        for key, ids in zip(keys, conns._connection_ids):
+            self.assertEqual(ids.tolist(), params[key])
+
+        self.assertEqual(list(conns.sources()), params["source"])
+        self.assertEqual(list(conns.targets()), params["target"])
+
+    def test_indexing(self):
+        """
+        Test indexing of SynapseCollection with integers, slices, index arrays and boolean masks.
+        """
+        nrns = nest.Create("iaf_psc_alpha", 3)
+        nest.Connect(nrns, nrns)
+        conns = nest.GetConnections()
+        sources = conns.get("source")
+        targets = conns.get("target")
+
+        self.assertEqual(conns[-1].get("target"), targets[-1])
+        self.assertEqual(conns[2:7:2].get("source"), sources[2:7:2])
+        self.assertEqual(conns[[0, 4, 8]].get("target"), [targets[0], targets[4], targets[8]])
+        self.assertEqual(conns[np.array(targets) == 2].get("source"), [1, 2, 3])
+        self.assertEqual(len(conns[np.zeros(len(conns), dtype=bool)]), 0)
+
+        with self.assertRaises(IndexError):
+            conns[len(conns)]
+        with self.assertRaises(TypeError):
+            conns[0.5]
+
+    def test_equal(self):
+        """
+        Test comparison of SynapseCollections.
+        """
+        nrns = nest.Create("iaf_psc_alpha", 2)
+        nest.Connect(nrns, nrns)
+        conns = nest.GetConnections()
+
+        self.assertEqual(conns, nest.GetConnections())
+        self.assertEqual(conns[2:], nest.GetConnections(source=nrns[1:]))
+        self.assertNotEqual(conns[:2], conns[2:])
+        self.assertEqual(list(conns), [conns[i] for i in range(len(conns))])
+
     def test_string(self):
         """
         Test the str functionality of SynapseCollection
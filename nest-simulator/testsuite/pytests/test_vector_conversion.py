@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# test_vector_conversion.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the conversion of NumPy arrays to vectors of the kernel and back.
+"""
+
+import nest
+import numpy as np
+import numpy.testing as nptest
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    nest.ResetKernel()
+
+
+@pytest.mark.parametrize(
+    "values, expected_dtype",
+    [
+        (np.arange(10, dtype=np.int32), np.int64),
+        (np.arange(10, dtype=np.int64), np.int64),
+        (np.arange(20, dtype=np.uint16)[::2], np.int64),
+        (np.linspace(0.0, 1.0, 10, dtype=np.float32), np.float64),
+        (np.linspace(0.0, 1.0, 20)[::2], np.float64),
+        (np.array([], dtype=np.float64), np.float64),
+    ],
+)
+def test_round_trip(values, expected_dtype):
+    """Test that arrays of integers and floats, also strided ones, are passed to the kernel and back unchanged."""
+
+    # Both results refer to the same vector of the kernel, so that the first is copied and the second moved.
+    first, second = nest.ll_api.sli_func("dup", values)
+
+    for result in (first, second):
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == expected_dtype
+        nptest.assert_array_equal(result, values)
+
+    first[...] = 0
+    nptest.assert_array_equal(second, values)
+
+
+def test_unsupported_dtype_raises():
+    """Test that arrays which are neither integer nor floating point are rejected."""
+
+    with pytest.raises(nest.kernel.NESTErrors.PyNESTError):
+        nest.ll_api.sps(np.array([True, False]))
+
+
+def test_status_vectors_remain_in_kernel():
+    """Test that vectors in status dictionaries are not taken away from the nodes."""
+
+    times = np.array([1.0, 2.5, 4.0], dtype=np.float32)
+    generator = nest.Create("spike_generator", params={"spike_times": times})
+
+    nptest.assert_array_equal(generator.spike_times, times)
+    nptest.assert_array_equal(generator.spike_times, times)
+
+
+def test_connect_with_strided_weights():
+    """Test that a strided array of weights is passed to the kernel in the correct order."""
+
+    neurons = nest.Create("iaf_psc_alpha", 4)
+    weights = np.arange(8, dtype=np.float32)[::2] + 1.0
+
+    nest.Connect(neurons, neurons[::-1], "one_to_one", {"weight": weights})
+
+    conns = nest.GetConnections().get(["source", "weight"], output="numpy")
+    nptest.assert_array_equal(conns["weight"][np.argsort(conns["source"])], weights)
@@ -201,3 +201,76 @@ class TestVisualization:
         assert np.all(times_30_to_40_extracted[:, 1] >= 30.0)
         assert np.all(times_30_to_40_extracted[:, 1] < 40.0)
         assert len(source_2_extracted) == 0
+
+    def test_extract_events(self):
+        """Test extract_events against a reference selection of events"""
+        import nest.raster_plot
+
+        rng = np.random.default_rng(1234)
+        data = np.column_stack((rng.integers(1, 50, 10000), rng.uniform(0.0, 100.0, 10000)))
+        sel = np.arange(10, 20)
+
+        extracted = nest.raster_plot.extract_events(data, time=[20.0, 60.0], sel=sel)
+        expected = np.array([v for v in data if 20.0 <= v[1] < 60.0 and v[0] in sel])
+        assert np.array_equal(extracted, expected)
+
+        extracted = nest.raster_plot.extract_events(data, time=[60.0])
+        assert np.array_equal(extracted, data[data[:, 1] < 60.0])
+
+        assert nest.raster_plot.extract_events(np.empty((0, 2)), sel=[1]).shape == (0, 2)
+
+    def test_raster_plot_decimate(self):
+        """Test that decimation keeps one spike per node and time bin"""
+        import nest.raster_plot
+
+        rng = np.random.default_rng(1234)
+        node_ids = rng.integers(1, 11, 100000)
+        ts = rng.uniform(0.0, 1000.0, 100000)
+
+        ts_dec, node_ids_dec = nest.raster_plot._decimate(ts, node_ids, (0.0, 1000.0), 100)
+
+        assert len(ts_dec) <= 100 * 10
+        assert set(node_ids_dec) == set(node_ids)
+        for node_id in (1, 5, 10):
+            expected_bins = np.unique((ts[node_ids == node_id] // 10.0).astype(int))
+            assert np.array_equal((ts_dec[node_ids_dec == node_id] // 10.0).astype(int), expected_bins)
+
+    def test_split_by_sender(self):
+        """Test that traces are split by sender, keeping the order of samples"""
+        import nest.voltage_trace
+
+        senders = np.tile([3, 1, 2], 4)
+        times = np.repeat(np.arange(4.0), 3)
+        values = np.arange(12.0)
+
+        unique_senders, split_times, split_values = nest.voltage_trace.split_by_sender(senders, times, values)
+        assert np.array_equal(unique_senders, [1, 2, 3])
+        assert split_times.shape == (3, 4)
+        assert np.array_equal(split_times[0], np.arange(4.0))
+        assert np.array_equal(split_values[2], [0.0, 3.0, 6.0, 9.0])
+
+        # Senders with different numbers of samples yield a list of arrays
+        unique_senders, split_values = nest.voltage_trace.split_by_sender(senders[:-1], values[:-1])
+        assert [len(v) for v in split_values] == [4, 3, 4]
+
+    def test_voltage_trace_read_ascii_in_chunks(self, tmp_path):
+        """Test that traces read from ascii files in chunks equal the traces in memory"""
+        import nest.voltage_trace
+
+        nest.ResetKernel()
+        nest.data_path = str(tmp_path)
+        nodes = nest.Create("iaf_psc_alpha", 3, {"I_e": 400.0})
+        mm_mem = nest.Create("multimeter", {"record_from": ["V_m"], "interval": 0.1})
+        mm_ascii = nest.Create("multimeter", {"record_from": ["V_m"], "interval": 0.1, "record_to": "ascii"})
+        nest.Connect(mm_mem, nodes)
+        nest.Connect(mm_ascii, nodes)
+        nest.Simulate(50)
+
+        n_columns, traces = nest.voltage_trace._read_traces(mm_ascii.filenames, chunk_size=17)
+        times, voltages = nest.voltage_trace._from_memory(mm_mem)
+
+        assert n_columns == 3
+        assert sorted(traces.keys()) == sorted(voltages.keys())
+        for sender, (t, v) in traces.items():
+            assert np.allclose(t, times[sender])
+            assert np.allclose(v, voltages[sender], atol=1e-3)